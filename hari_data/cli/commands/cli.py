@@ -1,4 +1,5 @@
-from datetime import datetime
+import os
+from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 from rich.console import Console
@@ -7,32 +8,32 @@ from rich.table import Table
 from typer import Argument, Context, Exit, Option, Typer, confirm, prompt
 
 from hari_data import __version__
-from hari_data.cli.commands.contract import contract
+from hari_data.cli.commands.contract import (
+    contract,
+    import_contracts,
+    read_columns_spec,
+    spark_type_options,
+)
 from hari_data.cli.commands.project import project
-from hari_data.utils.helpers import create_yaml_from_dict, is_hari_project
+from hari_data.contract.contract_infer import infer_contract
+from hari_data.contract.contract_sla import check_contracts_sla
+from hari_data.exceptions import HariContractError
+from hari_data.utils.helpers import (
+    create_yaml_from_dict,
+    get_contract_path,
+    is_hari_project,
+)
+
+# Modules that import pyspark are imported inside the commands that use
+# them, so that commands such as `hari contract sla` start without it.
 
 console = Console()
 app = Typer()
 app_contract = Typer()
+app_session = Typer()
 
 app.add_typer(app_contract, name='contract', help='Manage data contracts.')
-
-spark_type_options = [
-    'string',
-    'boolean',
-    'byte',
-    'short',
-    'int',
-    'bigint',
-    'float',
-    'double',
-    'decimal',
-    'date',
-    'timestamp',
-    'binary',
-    'json',
-    'time',
-]
+app.add_typer(app_session, name='session', help='Manage Spark sessions.')
 
 
 def version_callback(flag: bool):
@@ -58,6 +59,10 @@ def main(
     Available commands:
 
     - [b]create[/]: Create a new project.
+    - [b]compact[/]: Compact the small files of a contract table.
+    - [b]bench[/]: Benchmark contract workloads against generated data.
+    - [b]run[/]: Run Hari jobs in a single Spark application.
+    - [b]session serve[/]: Run a local Spark Connect server.
     - [b]version[/]: Show the version of Hari CLI.
     - [b]help[/]: Show this message.
 
@@ -97,6 +102,207 @@ def app_create_project(
     console.print('Happy coding! :rocket:')
 
 
+@app.command('compact', help='Compact the small files of a contract table.')
+def app_compact(
+    contract_name: str = Argument(..., help='Name of the contract.'),
+    target_file_size_mb: Optional[float] = Option(
+        None,
+        '--target-file-size-mb',
+        help='Target size of each output file, in MB. Default is 128.',
+    ),
+    sort_by: Optional[List[str]] = Option(
+        None,
+        '--sort-by',
+        help='Column to sort the files by. Repeat for several columns. '
+        'Default is output_table.sort_by from the contract.',
+    ),
+    env: str = Option('local', help='Environment of the Spark session.'),
+    configs_path: str = Option(
+        './configs/configs.yaml', help='Path to the configs file.'
+    ),
+) -> None:
+
+    if not is_hari_project():
+        console.print(
+            '[red]This command must be run inside a Hari project.[/red]'
+        )
+        raise Exit(code=1)
+
+    from hari_data.contract.contract_compaction import compact_contract_table
+    from hari_data.contract.contract_writer import DEFAULT_TARGET_FILE_SIZE_MB
+    from hari_data.session.hari_spark_session_manager import (
+        HariSparkSessionManager,
+    )
+
+    HariSparkSessionManager().configure(env=env, configs_path=configs_path)
+
+    try:
+        result = compact_contract_table(
+            contract_name,
+            target_file_size_mb=target_file_size_mb
+            or DEFAULT_TARGET_FILE_SIZE_MB,
+            sort_by=sort_by,
+        )
+    except (HariContractError, ValueError) as e:
+        console.print(f'[red]{e}[/red]')
+        raise Exit(code=1)
+
+    table = Table(title=f"Compaction of {result['path']}")
+    table.add_column('Partition', justify='left', style='cyan')
+    table.add_column('Files Before', justify='right')
+    table.add_column('Files After', justify='right')
+    table.add_column('Status', justify='left', style='magenta')
+
+    for partition in result['partitions']:
+        table.add_row(
+            partition['name'] or '(table)',
+            str(partition['files_before']),
+            str(partition['files_after']),
+            'compacted' if partition['compacted'] else 'skipped',
+        )
+
+    console.print(table)
+    compacted = sum(p['compacted'] for p in result['partitions'])
+    console.print(
+        f'Contract [bold]{contract_name}[/] compacted: '
+        f"{compacted} of {len(result['partitions'])} partitions rewritten."
+    )
+
+
+@app.command(
+    'bench', help='Benchmark contract workloads against generated data.'
+)
+def app_bench(
+    scales: Optional[List[int]] = Option(
+        None,
+        '--scales',
+        help='Number of rows to benchmark. Repeat for several scales. '
+        'Default is 100000 and 1000000.',
+    ),
+    workloads: Optional[List[str]] = Option(
+        None,
+        '--workloads',
+        help='Workload to run: read, validate, write or compact. Repeat for '
+        'several workloads. Default is all of them.',
+    ),
+    output: str = Option(
+        'bench_results.json', help='Path of the JSON results file.'
+    ),
+    baseline: Optional[str] = Option(
+        None, help='Path of a results file to compare against.'
+    ),
+    threshold: Optional[float] = Option(
+        None,
+        help='Allowed slowdown over the baseline, as a fraction. Default is '
+        '0.1.',
+    ),
+    repeat: int = Option(1, help='Number of runs of each workload.'),
+    work_dir: Optional[str] = Option(
+        None,
+        help='Directory for the generated data. Default is a temporary '
+        'directory removed at the end.',
+    ),
+    env: str = Option('local', help='Environment of the Spark session.'),
+    configs_path: str = Option(
+        './configs/configs.yaml', help='Path to the configs file.'
+    ),
+) -> None:
+
+    if not is_hari_project():
+        console.print(
+            '[red]This command must be run inside a Hari project.[/red]'
+        )
+        raise Exit(code=1)
+
+    from hari_data.contract.contract_benchmark import (
+        BENCHMARK_WORKLOADS,
+        DEFAULT_REGRESSION_THRESHOLD,
+        DEFAULT_SCALES,
+        compare_benchmarks,
+        load_benchmark_results,
+        run_benchmarks,
+        save_benchmark_results,
+    )
+    from hari_data.session.hari_spark_session_manager import (
+        HariSparkSessionManager,
+    )
+
+    if threshold is None:
+        threshold = DEFAULT_REGRESSION_THRESHOLD
+
+    HariSparkSessionManager().configure(env=env, configs_path=configs_path)
+
+    try:
+        baseline_results = (
+            load_benchmark_results(baseline) if baseline else None
+        )
+        results = run_benchmarks(
+            scales=scales or DEFAULT_SCALES,
+            workloads=workloads or BENCHMARK_WORKLOADS,
+            work_dir=work_dir,
+            repeat=repeat,
+        )
+    except (HariContractError, ValueError, OSError) as e:
+        console.print(f'[red]{e}[/red]')
+        raise Exit(code=1)
+
+    save_benchmark_results(output, results)
+
+    comparisons = {}
+    if baseline_results:
+        comparison = compare_benchmarks(
+            results, baseline_results, threshold=threshold
+        )
+        comparisons = {
+            (c['workload'], c['rows']): c for c in comparison['comparisons']
+        }
+
+    table = Table(title='Benchmark')
+    table.add_column('Workload', justify='left', style='cyan')
+    table.add_column('Rows', justify='right')
+    table.add_column('Wall Time (s)', justify='right')
+    table.add_column('Stages', justify='right')
+    table.add_column('Tasks', justify='right')
+    table.add_column('Input (MB)', justify='right')
+    table.add_column('Output (MB)', justify='right')
+    table.add_column('Baseline (s)', justify='right')
+    table.add_column('Change', justify='right')
+
+    for result in results['results']:
+        compared = comparisons.get((result['workload'], result['rows']))
+        change = '-'
+        if compared:
+            style = 'red' if compared['regressed'] else 'green'
+            change = f"[{style}]{compared['ratio'] - 1:+.1%}[/]"
+        table.add_row(
+            result['workload'],
+            str(result['rows']),
+            f"{result['wall_time_s']:.3f}",
+            # Spark Connect sessions only report the wall time.
+            '-' if result['stages'] is None else str(result['stages']),
+            '-' if result['tasks'] is None else str(result['tasks']),
+            '-'
+            if result['input_bytes'] is None
+            else f"{result['input_bytes'] / 2**20:.1f}",
+            '-'
+            if result['output_bytes'] is None
+            else f"{result['output_bytes'] / 2**20:.1f}",
+            f"{compared['baseline_s']:.3f}" if compared else '-',
+            change,
+        )
+
+    console.print(table)
+    console.print(f'Results saved to {output}.')
+
+    regressions = [c for c in comparisons.values() if c['regressed']]
+    if regressions:
+        console.print(
+            f'[red]{len(regressions)} workloads regressed by more than '
+            f'{threshold:.0%}.[/red]'
+        )
+        raise Exit(code=1)
+
+
 def add_columns() -> List[Dict[str, str]]:
     columns = []
     while True:
@@ -130,38 +336,70 @@ def add_columns() -> List[Dict[str, str]]:
     return columns
 
 
+def _option_or_prompt(
+    value: Optional[str],
+    text: str,
+    from_spec: Optional[str],
+    default: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Return the value of an option, prompting for it when it was not passed,
+    unless the contract is created from a spec file.
+    """
+    if value is not None:
+        return value
+    if from_spec:
+        return default
+    return prompt(text, default=default)
+
+
 @app_contract.command('new')
 def app_contract_new(
     contract_name: str = Argument(..., help='Name of the contract.'),
     description: Optional[str] = Option(
-        '',
-        prompt='Description of the contract (optional)',
+        None,
         help='Description of the contract.',
     ),
     owner_email: Optional[str] = Option(
-        '',
-        prompt='Email of the contract owner (optional)',
+        None,
         help='Email of the contract owner.',
     ),
     output_table_name: Optional[str] = Option(
-        ...,
-        prompt='Name of the output table (e.g., table_name, file_name)',
+        None,
         help='Name of the output table (e.g., table_name, file_name).',
     ),
     output_table_format: Optional[str] = Option(
-        ...,
-        prompt='Format of the output table (e.g., parquet, csv)',
+        None,
         help='Format of the output table (e.g., parquet, csv).',
     ),
     output_table_path: Optional[str] = Option(
-        ...,
-        prompt='Path of the output table (e.g., uri_catalog, local_path)',
+        None,
         help='Path of the output table (e.g., uri_catalog, local_path).',
     ),
     sla: Optional[str] = Option(
-        'N',
-        prompt='Do you want to add SLA details? [y/N]',
-        help='Whether to add SLA details to the contract.',
+        None,
+        help='Whether to add SLA details to the contract (y/N).',
+    ),
+    sla_frequency: Optional[str] = Option(
+        None,
+        help='Frequency of updates of the SLA (e.g., daily, weekly).',
+    ),
+    sla_tolerance: Optional[str] = Option(
+        None,
+        help='Tolerance of the SLA (e.g., 1 hour, 30 minutes).',
+    ),
+    from_spec: Optional[str] = Option(
+        None,
+        '--from-spec',
+        help='CSV or JSON file with the column definitions. Skips the '
+        'prompts; the output table options, and the SLA options with '
+        '--sla y, must then be passed.',
+    ),
+    partitioned_by: Optional[List[str]] = Option(
+        None,
+        '--partitioned-by',
+        help='Partition column, used with --from-spec. '
+        'Repeat for several columns.',
     ),
 ) -> None:
 
@@ -171,14 +409,77 @@ def app_contract_new(
         )
         raise Exit(code=1)
 
+    if from_spec:
+        required = [
+            ('--output-table-name', output_table_name),
+            ('--output-table-format', output_table_format),
+            ('--output-table-path', output_table_path),
+        ]
+        if (sla or '').lower() == 'y':
+            required += [
+                ('--sla-frequency', sla_frequency),
+                ('--sla-tolerance', sla_tolerance),
+            ]
+        missing = [flag for flag, value in required if not value]
+        if missing:
+            console.print(
+                f"[red]Missing options with --from-spec: {', '.join(missing)}[/red]"
+            )
+            raise Exit(code=1)
+
+    description = _option_or_prompt(
+        description, 'Description of the contract (optional)', from_spec, ''
+    )
+    owner_email = _option_or_prompt(
+        owner_email, 'Email of the contract owner (optional)', from_spec, ''
+    )
+    output_table_name = _option_or_prompt(
+        output_table_name,
+        'Name of the output table (e.g., table_name, file_name)',
+        from_spec,
+    )
+    output_table_format = _option_or_prompt(
+        output_table_format,
+        'Format of the output table (e.g., parquet, csv)',
+        from_spec,
+    )
+    output_table_path = _option_or_prompt(
+        output_table_path,
+        'Path of the output table (e.g., uri_catalog, local_path)',
+        from_spec,
+    )
+    sla = _option_or_prompt(
+        sla, 'Do you want to add SLA details? [y/N]', from_spec, 'N'
+    )
+
     output_table_info = {}
 
     output_table_info['name'] = output_table_name
     output_table_info['path'] = output_table_path
     output_table_info['format'] = output_table_format
-    output_table_columns = add_columns()
 
-    if output_table_columns:
+    if from_spec:
+        try:
+            output_table_columns = read_columns_spec(from_spec)['columns']
+        except (OSError, ValueError) as e:
+            console.print(f'[red]{e}[/red]')
+            raise Exit(code=1)
+        column_names = [col['name'] for col in output_table_columns]
+        unknown = [c for c in partitioned_by or [] if c not in column_names]
+        if unknown:
+            console.print(
+                f'[red]Partition columns not in the spec: {unknown}[/red]'
+            )
+            raise Exit(code=1)
+        if partitioned_by:
+            output_table_info['partitioned_by'] = list(partitioned_by)
+        console.print(
+            f'Read {len(output_table_columns)} columns from {from_spec}.'
+        )
+    else:
+        output_table_columns = add_columns()
+
+    if output_table_columns and not from_spec:
         add_partitions = confirm(
             'Do you want to add partition columns?', default=False
         )
@@ -209,11 +510,15 @@ def app_contract_new(
 
     if sla.lower() == 'y':
         sla_info = {}
-        sla_info['frequency'] = prompt(
-            'Frequency of updates (e.g., daily, weekly, monthly)'
+        sla_info['frequency'] = _option_or_prompt(
+            sla_frequency,
+            'Frequency of updates (e.g., daily, weekly, monthly)',
+            from_spec,
         )
-        sla_info['tolerance'] = prompt(
-            'Tolerance for SLA (e.g., 1 hour, 30 minutes)'
+        sla_info['tolerance'] = _option_or_prompt(
+            sla_tolerance,
+            'Tolerance for SLA (e.g., 1 hour, 30 minutes)',
+            from_spec,
         )
     else:
         sla_info = None
@@ -236,3 +541,358 @@ def app_contract_new(
     )
     console.print(f'Contract [bold]{contract_name}[/] created successfully!')
     console.print('Happy coding! :rocket:')
+
+
+@app_contract.command(
+    'import', help='Create many contracts from a manifest file.'
+)
+def app_contract_import(
+    manifest_path: str = Argument(
+        ..., help='YAML or JSON manifest with a list of contracts.'
+    ),
+    overwrite: bool = Option(
+        False, help='Replace contracts that already exist.'
+    ),
+    max_workers: Optional[int] = Option(
+        None, help='Number of contracts written concurrently.'
+    ),
+) -> None:
+
+    if not is_hari_project():
+        console.print(
+            '[red]This command must be run inside a Hari project.[/red]'
+        )
+        raise Exit(code=1)
+
+    try:
+        result = import_contracts(
+            manifest_path,
+            version=__version__,
+            created_at=datetime.now().strftime('%Y-%m-%d'),
+            overwrite=overwrite,
+            max_workers=max_workers,
+        )
+    except (OSError, ValueError) as e:
+        console.print(f'[red]{e}[/red]')
+        raise Exit(code=1)
+
+    if result['errors']:
+        table = Table(title='Contracts Not Imported')
+        table.add_column('Contract', justify='left', style='cyan')
+        table.add_column('Error', justify='left', style='red')
+        for name, error in result['errors'].items():
+            table.add_row(name, error)
+        console.print(table)
+
+    console.print(
+        f"{len(result['contracts_created'])} contracts imported, "
+        f"{len(result['errors'])} failed."
+    )
+    if result['errors']:
+        raise Exit(code=1)
+
+
+@app_contract.command(
+    'infer', help='Create a contract from an existing Parquet dataset.'
+)
+def app_contract_infer(
+    path: str = Argument(..., help='Local path of the Parquet dataset.'),
+    contract_name: Optional[str] = Option(
+        None,
+        '--name',
+        help='Name of the contract. Default is the last part of the path.',
+    ),
+    description: Optional[str] = Option(
+        '', help='Description of the contract.'
+    ),
+    owner_email: Optional[str] = Option(
+        '', help='Email of the contract owner.'
+    ),
+    max_workers: Optional[int] = Option(
+        None, help='Number of footers read concurrently.'
+    ),
+    force: bool = Option(
+        False, '--force', help='Replace the contract if it already exists.'
+    ),
+) -> None:
+
+    if not is_hari_project():
+        console.print(
+            '[red]This command must be run inside a Hari project.[/red]'
+        )
+        raise Exit(code=1)
+
+    try:
+        inferred = infer_contract(path, max_workers=max_workers)
+    except (ImportError, OSError, ValueError) as e:
+        console.print(f'[red]{e}[/red]')
+        raise Exit(code=1)
+
+    contract_name = contract_name or inferred['output_table']['name']
+    contract_path = get_contract_path(contract_name)['contract_path']
+    if not force and os.path.exists(contract_path):
+        console.print(
+            f'[red]Contract already exists: {contract_path}. '
+            'Use --force to replace it.[/red]'
+        )
+        raise Exit(code=1)
+    partitioned_by = inferred['output_table']['partitioned_by']
+
+    table = Table(title=f'Columns Inferred from {path}')
+    table.add_column('Name', justify='left', style='cyan')
+    table.add_column('Type', justify='left', style='magenta')
+    table.add_column('Nullable', justify='left')
+    table.add_column('Partition', justify='left')
+    for column in inferred['columns']:
+        column_type = column['type']
+        if column_type == 'decimal':
+            column_type = f"decimal({column['precision']},{column['scale']})"
+        table.add_row(
+            column['name'],
+            column_type,
+            'yes' if column['is_nullable'] else 'no',
+            'yes' if column['name'] in partitioned_by else '',
+        )
+    console.print(table)
+
+    contract_data = contract(
+        version=__version__,
+        created_at=datetime.now().strftime('%Y-%m-%d'),
+        name=contract_name,
+        description=description,
+        owner_email=owner_email,
+        output_table=inferred['output_table'],
+        columns=inferred['columns'],
+    )
+    create_yaml_from_dict(
+        data=contract_data, dir='contracts', file_name=contract_name
+    )
+    console.print(f'Contract [bold]{contract_name}[/] created successfully!')
+
+
+@app_contract.command(
+    'generate', help='Generate synthetic data matching a contract.'
+)
+def app_contract_generate(
+    contract_name: str = Argument(..., help='Name of the contract.'),
+    rows: int = Option(..., '--rows', help='Number of rows to generate.'),
+    path: str = Option(..., '--path', help='Local path to write to.'),
+    null_ratio: Optional[float] = Option(
+        None, help='Fraction of nulls in nullable columns. Default is 0.1.'
+    ),
+    seed: int = Option(42, help='Seed of the generated values.'),
+    env: str = Option('local', help='Environment of the Spark session.'),
+    configs_path: str = Option(
+        './configs/configs.yaml', help='Path to the configs file.'
+    ),
+) -> None:
+
+    if not is_hari_project():
+        console.print(
+            '[red]This command must be run inside a Hari project.[/red]'
+        )
+        raise Exit(code=1)
+
+    from hari_data.contract.contract_generator import (
+        DEFAULT_NULL_RATIO,
+        generate_contract_table,
+    )
+    from hari_data.session.hari_spark_session_manager import (
+        HariSparkSessionManager,
+    )
+
+    HariSparkSessionManager().configure(env=env, configs_path=configs_path)
+
+    try:
+        result = generate_contract_table(
+            contract_name,
+            rows,
+            path,
+            null_ratio=DEFAULT_NULL_RATIO
+            if null_ratio is None
+            else null_ratio,
+            seed=seed,
+        )
+    except (HariContractError, ValueError) as e:
+        console.print(f'[red]{e}[/red]')
+        raise Exit(code=1)
+
+    console.print(
+        f"{result['num_rows']} rows of [bold]{contract_name}[/] "
+        f"written to {result['path']}."
+    )
+
+
+def format_duration(duration: Optional[timedelta]) -> str:
+    if duration is None:
+        return '-'
+    return str(timedelta(seconds=int(duration.total_seconds())))
+
+
+@app_contract.command('sla', help='Check the freshness SLA of contracts.')
+def app_contract_sla(
+    contract_names: Optional[List[str]] = Argument(
+        None, help='Names of the contracts. Default is every contract.'
+    ),
+    max_workers: Optional[int] = Option(
+        None, help='Number of contracts checked concurrently.'
+    ),
+) -> None:
+
+    if not is_hari_project():
+        console.print(
+            '[red]This command must be run inside a Hari project.[/red]'
+        )
+        raise Exit(code=1)
+
+    results = check_contracts_sla(
+        contract_names or None, max_workers=max_workers
+    )['results']
+
+    styles = {
+        'fresh': 'green',
+        'stale': 'red',
+        'missing': 'red',
+        'skipped': 'yellow',
+        'error': 'red',
+    }
+    table = Table(title='Contract SLA')
+    table.add_column('Contract', justify='left', style='cyan')
+    table.add_column('Status', justify='left')
+    table.add_column('Last Modified', justify='left')
+    table.add_column('Age', justify='right')
+    table.add_column('Max Age', justify='right')
+    table.add_column('Message', justify='left')
+
+    for result in results:
+        last_modified = result['last_modified']
+        table.add_row(
+            result['contract'],
+            f"[{styles[result['status']]}]{result['status']}[/]",
+            last_modified.strftime('%Y-%m-%d %H:%M:%S')
+            if last_modified
+            else '-',
+            format_duration(result['age']),
+            format_duration(result['max_age']),
+            result['message'],
+        )
+
+    console.print(table)
+
+    if any(r['status'] in ('stale', 'missing', 'error') for r in results):
+        raise Exit(code=1)
+
+
+@app.command(
+    'run',
+    help='Run Hari jobs in a single Spark application, enforcing their '
+    'job_timeout and job_retry_limit.',
+)
+def app_run(
+    jobs: Optional[List[str]] = Argument(
+        None,
+        help='Directories of the Hari projects to run. Default is the '
+        'current project.',
+    ),
+    parallel: bool = Option(
+        False,
+        '--parallel',
+        help='Run the jobs concurrently, sharing the executors by '
+        'job_priority.',
+    ),
+    env: str = Option('local', help='Environment of the Spark session.'),
+    configs_path: Optional[str] = Option(
+        None,
+        help='Path to the configs file of the Spark application. Default is '
+        'the configs file of the job when running one job.',
+    ),
+) -> None:
+
+    if not jobs:
+        if not is_hari_project():
+            console.print(
+                '[red]This command must be run inside a Hari project.[/red]'
+            )
+            raise Exit(code=1)
+        jobs = ['.']
+
+    from hari_data.job.job_runner import run_jobs
+
+    try:
+        results = run_jobs(
+            jobs, parallel=parallel, env=env, configs_path=configs_path
+        )['results']
+    except ValueError as e:
+        console.print(f'[red]{e}[/red]')
+        raise Exit(code=1)
+
+    table = Table(title='Jobs')
+    table.add_column('Job', justify='left', style='cyan')
+    table.add_column('Priority', justify='left')
+    table.add_column('Status', justify='left')
+    table.add_column('Attempts', justify='right')
+    table.add_column('Duration (s)', justify='right')
+    table.add_column('Error', justify='left')
+
+    for result in results:
+        style = 'green' if result['status'] == 'success' else 'red'
+        table.add_row(
+            result['job'],
+            result['priority'],
+            f"[{style}]{result['status']}[/]",
+            str(result['attempts']),
+            f"{result['duration_s']:.3f}",
+            result['error'] or '',
+        )
+
+    console.print(table)
+
+    if any(r['status'] != 'success' for r in results):
+        raise Exit(code=1)
+
+
+@app_session.command(
+    'serve',
+    help='Run a local Spark Connect server for jobs run with --env connect.',
+)
+def app_session_serve(
+    port: Optional[int] = Option(
+        None, help='Port of the server. Default is 15002.'
+    ),
+    configs_path: str = Option(
+        './configs/configs.yaml', help='Path to the configs file.'
+    ),
+) -> None:
+
+    if not is_hari_project():
+        console.print(
+            '[red]This command must be run inside a Hari project.[/red]'
+        )
+        raise Exit(code=1)
+
+    from hari_data.session.hari_spark_connect import (
+        DEFAULT_CONNECT_PORT,
+        serve_connect_server,
+    )
+
+    port = port or DEFAULT_CONNECT_PORT
+    console.print(
+        f'Starting Spark Connect server at [bold]sc://localhost:{port}[/]. '
+        'Press Ctrl+C to stop.'
+    )
+    try:
+        result = serve_connect_server(configs_path=configs_path, port=port)
+    except KeyboardInterrupt:
+        console.print('Spark Connect server stopped.')
+        return
+    except (OSError, ValueError) as e:
+        console.print(f'[red]{e}[/red]')
+        raise Exit(code=1)
+
+    if result['returncode']:
+        console.print(
+            '[red]Spark Connect server exited with code '
+            f"{result['returncode']}.[/red]"
+        )
+        raise Exit(code=result['returncode'])
+    console.print('Spark Connect server stopped.')
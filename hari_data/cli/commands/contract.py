@@ -2,6 +2,10 @@
 Module for creating data contracts in the Hari CLI.
 """
 
+import csv
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any  # Adicionado
 from typing import (
     Dict,
@@ -9,6 +13,28 @@ from typing import (
     Optional,
 )
 
+from hari_data.utils.helpers import create_yaml_from_dict, read_yaml_to_dict
+
+spark_type_options = [
+    'string',
+    'boolean',
+    'byte',
+    'short',
+    'int',
+    'bigint',
+    'float',
+    'double',
+    'decimal',
+    'date',
+    'timestamp',
+    'binary',
+    'json',
+    'time',
+]
+
+_TRUE_VALUES = ('true', 'yes', 'y', '1')
+_FALSE_VALUES = ('false', 'no', 'n', '0')
+
 
 def contract(
     version: str,
@@ -28,7 +54,8 @@ def contract(
         created_at (str): The creation date of the contract.
         name (str): The name of the contract.
         output_table (Dict[str, str]): Information about the output table, including
-                    name, path, format, and partition columns.
+                    name, path, format, partition columns and, optionally,
+                    the columns to sort files by when compacting (sort_by).
         columns (List[Dict[str, str]]): List of column definitions for the output table.
         description (Optional[str], optional): Description of the contract. Defaults to None.
         owner_email (Optional[str], optional): Email of the contract owner. Defaults to None.
@@ -101,6 +128,9 @@ def contract(
         'columns': columns,
     }
 
+    if output_table.get('sort_by'):
+        contract['output_table']['sort_by'] = output_table['sort_by']
+
     if sla:
         contract['sla'] = {
             'frequency': sla.get('frequency', ''),
@@ -108,3 +138,263 @@ def contract(
         }
 
     return contract
+
+
+def _parse_bool(value: Any, default: bool, field: str, where: str) -> bool:
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in _TRUE_VALUES:
+        return True
+    if text in _FALSE_VALUES:
+        return False
+    raise ValueError(f"Invalid {field} '{value}' for {where}.")
+
+
+def _spec_column(spec: Dict[str, Any], where: str) -> Dict[str, Any]:
+    if not isinstance(spec, dict):
+        raise ValueError(f'Column at {where} is not an object.')
+    name = str(spec.get('name') or '').strip()
+    if not name:
+        raise ValueError(f'Column without a name at {where}.')
+    where = f"column '{name}' ({where})"
+
+    column_type = str(spec.get('type') or '').strip().lower()
+    if column_type not in spark_type_options:
+        raise ValueError(
+            f"Invalid type '{spec.get('type')}' for {where}. "
+            f"Please choose from: {', '.join(spark_type_options)}."
+        )
+
+    column = {
+        'name': name,
+        'type': column_type,
+        'is_nullable': _parse_bool(
+            spec.get('is_nullable'), True, 'is_nullable', where
+        ),
+        'is_unique': _parse_bool(
+            spec.get('is_unique'), False, 'is_unique', where
+        ),
+    }
+    if column_type == 'decimal':
+        for key in ('precision', 'scale'):
+            if spec.get(key) not in (None, ''):
+                column[key] = int(spec[key])
+    if spec.get('description'):
+        column['description'] = str(spec['description'])
+    return column
+
+
+def read_columns_spec(spec_path: str) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read the column definitions of a contract from a CSV or JSON file.
+
+    CSV files need a header with at least the 'name' and 'type' columns;
+    'is_nullable', 'is_unique', 'precision', 'scale' and 'description'
+    are optional. JSON files hold a list of column objects with the same
+    keys, or an object with that list under 'columns'. Missing flags
+    default to nullable and not unique, as in the interactive prompts.
+
+    Parameters:
+        spec_path (str): The path to the '.csv' or '.json' spec file.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: A dictionary with the key
+            'columns', in the order of the file.
+
+    Raises:
+        ValueError: If the file format is not supported, the file has no
+            columns, or a column has no name, an invalid type or an
+            invalid flag, or is repeated, or a JSON file does not hold a
+            list of column objects.
+
+    Examples:
+        >>> read_columns_spec('columns.csv') # doctest: +SKIP
+        {'columns': [{'name': 'id', 'type': 'int', 'is_nullable': False, 'is_unique': True}]}
+    """
+    extension = os.path.splitext(spec_path)[1].lower()
+    if extension == '.csv':
+        with open(spec_path, 'r', newline='') as file:
+            specs = [
+                (row, f'line {line}')
+                for line, row in enumerate(csv.DictReader(file), start=2)
+            ]
+    elif extension == '.json':
+        with open(spec_path, 'r') as file:
+            data = json.load(file)
+        if isinstance(data, dict):
+            data = data.get('columns') or []
+        if not isinstance(data, list):
+            raise ValueError(
+                f"Spec file '{spec_path}' must hold a list of columns."
+            )
+        specs = [(row, f'item {i}') for i, row in enumerate(data, start=1)]
+    else:
+        raise ValueError(
+            f"Unsupported spec file '{spec_path}'. Use a .csv or .json file."
+        )
+
+    columns = [
+        _spec_column(spec, f'{spec_path}, {where}') for spec, where in specs
+    ]
+    if not columns:
+        raise ValueError(f"No columns found in '{spec_path}'.")
+
+    names = [column['name'] for column in columns]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        raise ValueError(f'Duplicated columns in {spec_path}: {duplicated}.')
+
+    return {'columns': columns}
+
+
+def _import_contract(
+    entry: Dict[str, Any],
+    base_dir: str,
+    contracts_dir: str,
+    version: str,
+    created_at: str,
+    overwrite: bool,
+) -> str:
+    if not isinstance(entry, dict):
+        raise ValueError('Manifest entry is not an object.')
+    name = entry.get('name')
+    if not name:
+        raise ValueError('Manifest entry without a name.')
+
+    file_path = os.path.join(contracts_dir, f'{name}.yaml')
+    if not overwrite and os.path.exists(file_path):
+        raise ValueError(f'Contract already exists: {file_path}')
+
+    if entry.get('columns_spec'):
+        spec_path = os.path.join(base_dir, entry['columns_spec'])
+        columns = read_columns_spec(spec_path)['columns']
+    else:
+        columns = [
+            _spec_column(spec, f'item {i}')
+            for i, spec in enumerate(entry.get('columns') or [], start=1)
+        ]
+    if not columns:
+        raise ValueError('Contract has no columns.')
+
+    output_table = dict(entry.get('output_table') or {})
+    names = [column['name'] for column in columns]
+    unknown = [
+        col
+        for col in output_table.get('partitioned_by') or []
+        if col not in names
+    ]
+    if unknown:
+        raise ValueError(f'Partition columns not in the columns: {unknown}')
+
+    contract_data = contract(
+        version=version,
+        created_at=entry.get('created_at') or created_at,
+        name=name,
+        description=entry.get('description'),
+        owner_email=entry.get('owner_email'),
+        output_table=output_table,
+        columns=columns,
+        sla=entry.get('sla'),
+    )
+    create_yaml_from_dict(
+        data=contract_data, dir=contracts_dir, file_name=name
+    )
+    return file_path
+
+
+def import_contracts(
+    manifest_path: str,
+    version: str,
+    created_at: str,
+    contracts_dir: str = 'contracts',
+    overwrite: bool = False,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Create many data contracts from a manifest file.
+
+    The manifest is a YAML or JSON file with a list of contracts under
+    'contracts'. Each entry takes the arguments of `contract()` (name,
+    description, owner_email, output_table, sla) and either a 'columns'
+    list or a 'columns_spec' path to a CSV or JSON spec file, relative to
+    the manifest. Entries are parsed and written in a thread pool, and an
+    invalid entry does not stop the others. Entries that share a name are
+    all rejected, since they would write the same file.
+
+    Parameters:
+        manifest_path (str): The path to the manifest file.
+        version (str): The version of the Hari library.
+        created_at (str): The creation date of the contracts.
+        contracts_dir (str): The directory where contracts are written.
+            Default is 'contracts'.
+        overwrite (bool): Whether to replace existing contract files.
+            Default is False.
+        max_workers (Optional[int]): Number of threads. Default is the
+            ThreadPoolExecutor default.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'contracts_created', the
+            paths of the written files, and 'errors', a mapping from
+            contract name to error message.
+
+    Raises:
+        ValueError: If the manifest has no 'contracts' list.
+
+    Examples:
+        >>> import_contracts('legacy_tables.yaml', '0.1.0', '2025-08-01') # doctest: +SKIP
+        {'contracts_created': ['contracts/sales.yaml', 'contracts/customers.yaml'], 'errors': {}}
+    """
+    manifest = read_yaml_to_dict(manifest_path)
+    entries = manifest.get('contracts') if isinstance(manifest, dict) else None
+    if not isinstance(entries, list):
+        raise ValueError(f"Manifest has no 'contracts' list: {manifest_path}")
+
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    os.makedirs(contracts_dir, exist_ok=True)
+
+    def run(index_entry):
+        index, entry = index_entry
+        try:
+            return (
+                index,
+                _import_contract(
+                    entry,
+                    base_dir,
+                    contracts_dir,
+                    version,
+                    created_at,
+                    overwrite,
+                ),
+                None,
+            )
+        except Exception as e:
+            return index, None, str(e)
+
+    def entry_name(index):
+        entry = entries[index]
+        name = entry.get('name') if isinstance(entry, dict) else None
+        return name or f'entry {index + 1}'
+
+    names = [entry_name(index) for index in range(len(entries))]
+    errors = {
+        name: 'Duplicated contract name in the manifest.'
+        for name in names
+        if names.count(name) > 1
+    }
+    created = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        to_import = [
+            (index, entry)
+            for index, entry in enumerate(entries)
+            if names[index] not in errors
+        ]
+        for index, file_path, error in executor.map(run, to_import):
+            if error:
+                errors[names[index]] = error
+            else:
+                created.append(file_path)
+
+    return {'contracts_created': created, 'errors': errors}
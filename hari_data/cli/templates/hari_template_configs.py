@@ -21,15 +21,15 @@ class HariTemplateConfigs(HariTemplate):
         job_timeout: 3600  # Timeout in seconds
         job_retry_limit: 3  # Number of retries on failure
         job_resources:
-        cpu: 2  # Number of CPU cores
-        memory: "4GB"  # Memory allocation
+          cpu: 2  # Number of CPU cores
+          memory: "4GB"  # Memory allocation, e.g. "512MB", "4GB"
         logging_level: "INFO"  # Options: 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'
         input_datasets:
-        - dataset_name: ""
+          - dataset_name: ""
             dataset_path: ""  # e.g. s3_path, local_path, catalog_uri
             dataset_format: "parquet"  # e.g. 'parquet', 'json', 'csv'
         output_datasets:
-        - dataset_name: ""
+          - dataset_name: ""
             dataset_path: ""  # e.g. s3_path, local_path, catalog_uri
             dataset_format: "parquet"  # e.g. 'parquet', 'json', 'csv'
             partition_by: []  # e.g. ['year', 'month']
@@ -13,12 +13,32 @@ class HariTemplateJob(HariTemplate):
         # Used to define job configurations and execution logic
         # in data processing projects
 
-        def main():
+        from hari_data.job.job_pipeline import HariPipeline
+        from hari_data.session.hari_spark_session_manager import hari_spark_manager
+
+        # Declare the steps of the job with the DataFrames they read and
+        # produce. DataFrames read by more than one step are persisted
+        # while they are needed, e.g.:
+        #
+        # @pipeline.step(outputs=['sales'])
+        # def extract(spark):
+        #     return spark.read.parquet('/data/sales')
+        #
+        # @pipeline.step(inputs=['sales'])
+        # def load(spark, sales):
+        #     sales.write.parquet('/data/output')
+        pipeline = HariPipeline()
+
+
+        def main(spark=None):
             """
             Main function to execute the job logic.
-            This function should be implemented with the specific job requirements.
+            Runs the steps of the pipeline; `hari run` passes the Spark session.
             """
-            pass
+            if spark is None:
+                hari_spark_manager.configure(env='local')
+                spark = hari_spark_manager.get_spark_session()['spark_session']
+            pipeline.run(spark)
 
 
         if __name__ == '__main__':
@@ -0,0 +1,442 @@
+"""
+Module for benchmarking the contract read, validate, write and compaction
+paths against generated data.
+"""
+
+import json
+import os
+import platform
+import shutil
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from py4j.protocol import Py4JJavaError
+from pyspark.sql import SparkSession
+from pyspark.sql.utils import is_remote
+
+from hari_data import __version__
+from hari_data.contract.contract_compaction import compact_contract_table
+from hari_data.contract.contract_generator import generate_contract_table
+from hari_data.contract.contract_reader import read_contract_table
+from hari_data.contract.contract_schema import clear_contract_cache
+from hari_data.contract.contract_validator import validate_contract_table
+from hari_data.contract.contract_writer import write_contract_table
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+from hari_data.utils.helpers import create_yaml_from_dict
+
+BENCHMARK_WORKLOADS = ('read', 'validate', 'write', 'compact')
+DEFAULT_SCALES = (100_000, 1_000_000)
+DEFAULT_REGRESSION_THRESHOLD = 0.1
+
+# Differences below this many seconds are noise on a laptop or CI box.
+DEFAULT_MIN_DELTA_S = 0.05
+
+_STAGE_METRICS = {
+    'executor_run_time_ms': 'executorRunTime',
+    'input_bytes': 'inputBytes',
+    'output_bytes': 'outputBytes',
+    'shuffle_read_bytes': 'shuffleReadBytes',
+    'shuffle_write_bytes': 'shuffleWriteBytes',
+    'memory_bytes_spilled': 'memoryBytesSpilled',
+}
+
+# Small files per partition written before the compaction workload.
+_COMPACTION_INPUT_TASKS = 16
+
+_BENCHMARK_COLUMNS = [
+    {'name': 'sale_id', 'type': 'bigint', 'is_nullable': False},
+    {'name': 'customer_id', 'type': 'int', 'cardinality': 100_000},
+    {'name': 'city', 'type': 'string', 'cardinality': 500},
+    {'name': 'amount', 'type': 'decimal', 'precision': 12, 'scale': 2},
+    {'name': 'quantity', 'type': 'int', 'min_value': 1, 'max_value': 20},
+    {'name': 'sold_at', 'type': 'timestamp'},
+    {'name': 'sale_date', 'type': 'date', 'is_nullable': False},
+]
+
+
+def _benchmark_contract(name: str, path: str) -> Dict[str, Any]:
+    return {
+        'name': name,
+        'output_table': {
+            'name': name,
+            'path': path,
+            'format': 'parquet',
+            'partitioned_by': ['sale_date'],
+            'columns': [
+                {
+                    **column,
+                    'is_unique': column['name'] == 'sale_id',
+                }
+                for column in _BENCHMARK_COLUMNS
+            ],
+        },
+    }
+
+
+def _stage_metrics(spark: SparkSession, group_id: str) -> Dict[str, int]:
+    tracker = spark.sparkContext.statusTracker()
+    status_store = spark.sparkContext._jsc.sc().statusStore()
+
+    job_ids = tracker.getJobIdsForGroup(group_id)
+    stage_ids = set()
+    for job_id in job_ids:
+        info = tracker.getJobInfo(job_id)
+        if info:
+            stage_ids.update(info.stageIds)
+
+    metrics = {key: 0 for key in _STAGE_METRICS}
+    metrics.update({'jobs': len(job_ids), 'stages': 0, 'tasks': 0})
+    for stage_id in stage_ids:
+        try:
+            stage = status_store.lastStageAttempt(stage_id)
+        except Py4JJavaError:
+            # Stages skipped because their shuffle output was reused.
+            continue
+        metrics['stages'] += 1
+        metrics['tasks'] += stage.numTasks()
+        for key, method in _STAGE_METRICS.items():
+            metrics[key] += int(getattr(stage, method)())
+    return metrics
+
+
+def _driver_memory(spark: SparkSession) -> Dict[str, Optional[int]]:
+    heap_used = None
+    if not is_remote():
+        runtime = spark._jvm.java.lang.Runtime.getRuntime()
+        heap_used = int(runtime.totalMemory() - runtime.freeMemory())
+    try:
+        # Not available on Windows.
+        import resource
+    except ImportError:  # pragma: no cover
+        max_rss = None
+    else:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+        if platform.system() != 'Darwin':
+            max_rss *= 1024
+    return {
+        'driver_jvm_heap_used_bytes': heap_used,
+        'driver_python_max_rss_bytes': max_rss,
+    }
+
+
+def measure_workload(
+    name: str,
+    workload: Callable[[], Any],
+    repeat: int = 1,
+    setup: Optional[Callable[[], Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Run a workload and measure its wall time, Spark stage metrics and
+    driver memory.
+
+    The Spark jobs of the workload are tagged with a job group, so only
+    their stages are counted. When the workload is repeated, the wall
+    time is the median of the runs and the other metrics come from the
+    last run. Spark Connect sessions expose neither the stages of their
+    jobs nor the driver JVM, so only the wall time and the Python memory
+    are measured, and the other metrics are None.
+
+    Parameters:
+        name (str): The name of the workload.
+        workload (Callable[[], Any]): The function to measure.
+        repeat (int): Number of runs. Default is 1.
+        setup (Optional[Callable[[], Any]]): A function run before each
+            run and not measured.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'workload',
+            'wall_time_s', 'wall_times_s', 'jobs', 'stages', 'tasks', the
+            stage metrics ('executor_run_time_ms', 'input_bytes',
+            'output_bytes', 'shuffle_read_bytes', 'shuffle_write_bytes',
+            'memory_bytes_spilled') and the driver memory
+            ('driver_jvm_heap_used_bytes', 'driver_python_max_rss_bytes'),
+            or None when they cannot be measured.
+
+    Raises:
+        ValueError: If `repeat` is lower than 1 or the Spark session has
+            not been configured.
+
+    Examples:
+        >>> measure_workload('count', lambda: df.count()) # doctest: +SKIP
+        {'workload': 'count', 'wall_time_s': 0.41, 'jobs': 1, 'stages': 1, 'tasks': 4, ...}
+    """
+    if repeat < 1:
+        raise ValueError('repeat must be greater than or equal to 1.')
+
+    spark = HariSparkSessionManager().get_spark_session()['spark_session']
+    remote = is_remote()
+
+    wall_times = []
+    for run in range(repeat):
+        if setup:
+            setup()
+        group_id = f'hari-bench-{name}-{run}-{time.time_ns()}'
+        if not remote:
+            spark.sparkContext.setJobGroup(group_id, f'hari bench {name}')
+        try:
+            start = time.perf_counter()
+            workload()
+            wall_times.append(time.perf_counter() - start)
+        finally:
+            if not remote:
+                spark.sparkContext.setLocalProperty('spark.jobGroup.id', None)
+                spark.sparkContext.setLocalProperty(
+                    'spark.job.description', None
+                )
+
+    if remote:
+        stage_metrics = {
+            key: None for key in ['jobs', 'stages', 'tasks', *_STAGE_METRICS]
+        }
+    else:
+        stage_metrics = _stage_metrics(spark, group_id)
+
+    return {
+        'workload': name,
+        'wall_time_s': round(statistics.median(wall_times), 4),
+        'wall_times_s': [round(value, 4) for value in wall_times],
+        **stage_metrics,
+        **_driver_memory(spark),
+    }
+
+
+def run_benchmarks(
+    scales: List[int] = DEFAULT_SCALES,
+    workloads: List[str] = BENCHMARK_WORKLOADS,
+    work_dir: Optional[str] = None,
+    repeat: int = 1,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Run the standard contract workloads against generated data at
+    several scales.
+
+    For each scale, a partitioned Parquet table is generated from a
+    built-in contract with `generate_contract_table()` and then:
+
+    - 'read' reads every contract column with `read_contract_table()`.
+    - 'validate' runs `validate_contract_table()`.
+    - 'write' writes the table to a new path with
+      `write_contract_table()`.
+    - 'compact' compacts a copy of the table written as small files with
+      `compact_contract_table()`.
+
+    Data generation and the preparation of the compaction input are not
+    measured.
+
+    Parameters:
+        scales (List[int]): The numbers of rows to benchmark. Default is
+            100,000 and 1,000,000.
+        workloads (List[str]): The workloads to run. Default is all of
+            them.
+        work_dir (Optional[str]): The directory for the contracts and
+            data. Default is a temporary directory removed at the end.
+        repeat (int): Number of runs of each workload. Default is 1.
+        seed (int): Seed of the generated data. Default is 42.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'hari_version',
+            'spark_version', 'python_version', 'created_at' and 'results',
+            one `measure_workload()` result per workload and scale with
+            the extra key 'rows'.
+
+    Raises:
+        ValueError: If a workload is unknown or the Spark session has not
+            been configured.
+
+    Examples:
+        >>> run_benchmarks(scales=[100_000], workloads=['read']) # doctest: +SKIP
+        {'hari_version': '0.1.0', 'spark_version': '3.5.0', ..., 'results': [{'workload': 'read', 'rows': 100000, 'wall_time_s': 0.8, ...}]}
+    """
+    unknown = [name for name in workloads if name not in BENCHMARK_WORKLOADS]
+    if unknown:
+        raise ValueError(
+            f'Unknown workloads: {unknown}. '
+            f'Supported workloads: {list(BENCHMARK_WORKLOADS)}.'
+        )
+
+    spark = HariSparkSessionManager().get_spark_session()['spark_session']
+    temporary = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix='hari_bench_')
+    contracts_dir = os.path.join(work_dir, 'contracts')
+
+    results = []
+    try:
+        for rows in scales:
+            name = f'hari_bench_{rows}'
+            base = os.path.join(work_dir, name)
+            source = os.path.join(base, 'source')
+            create_yaml_from_dict(
+                data=_benchmark_contract(name, source),
+                dir=contracts_dir,
+                file_name=name,
+            )
+            clear_contract_cache()
+            generate_contract_table(
+                name, rows, source, contracts_dir=contracts_dir, seed=seed
+            )
+
+            def read():
+                read_contract_table(name, contracts_dir)[
+                    'dataframe'
+                ].write.format('noop').mode('overwrite').save()
+
+            def validate():
+                validate_contract_table(name, contracts_dir)
+
+            def write():
+                dataframe = read_contract_table(name, contracts_dir)[
+                    'dataframe'
+                ]
+                write_contract_table(
+                    dataframe,
+                    name,
+                    contracts_dir=contracts_dir,
+                    load_strategy='overwrite',
+                    path=os.path.join(base, 'write'),
+                )
+
+            compact_path = os.path.join(base, 'compact')
+
+            def prepare_compaction():
+                spark.read.parquet(source).repartition(
+                    _COMPACTION_INPUT_TASKS
+                ).write.mode('overwrite').partitionBy('sale_date').parquet(
+                    compact_path
+                )
+
+            def compact():
+                compact_contract_table(
+                    name, contracts_dir=contracts_dir, path=compact_path
+                )
+
+            runs = {
+                'read': (read, None),
+                'validate': (validate, None),
+                'write': (write, None),
+                'compact': (compact, prepare_compaction),
+            }
+            for workload in workloads:
+                function, setup = runs[workload]
+                result = measure_workload(
+                    workload, function, repeat=repeat, setup=setup
+                )
+                results.append({'rows': rows, **result})
+    finally:
+        if temporary:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'hari_version': __version__,
+        'spark_version': spark.version,
+        'python_version': platform.python_version(),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'results': results,
+    }
+
+
+def save_benchmark_results(results_path: str, results: Dict[str, Any]) -> None:
+    """
+    Save benchmark results to a JSON file.
+
+    Parameters:
+        results_path (str): The path to the results file.
+        results (Dict[str, Any]): The results of `run_benchmarks()`.
+
+    Examples:
+        >>> save_benchmark_results('bench.json', results) # doctest: +SKIP
+    """
+    directory = os.path.dirname(results_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(results_path, 'w') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def load_benchmark_results(results_path: str) -> Dict[str, Any]:
+    """
+    Load benchmark results from a JSON file.
+
+    Parameters:
+        results_path (str): The path to the results file.
+
+    Returns:
+        Dict[str, Any]: The results saved by `save_benchmark_results()`.
+
+    Examples:
+        >>> load_benchmark_results('baseline.json') # doctest: +SKIP
+        {'hari_version': '0.1.0', ..., 'results': [...]}
+    """
+    with open(results_path, 'r') as file:
+        return json.load(file)
+
+
+def compare_benchmarks(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    min_delta_s: float = DEFAULT_MIN_DELTA_S,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Compare benchmark results with a baseline.
+
+    A workload regresses when its wall time grows by more than
+    `threshold` (as a fraction of the baseline) and by more than
+    `min_delta_s` seconds. Workloads missing from the baseline are not
+    compared.
+
+    Parameters:
+        results (Dict[str, Any]): The current results.
+        baseline (Dict[str, Any]): The baseline results.
+        threshold (float): The allowed relative slowdown. Default is 0.1.
+        min_delta_s (float): The smallest slowdown, in seconds, reported
+            as a regression. Default is 0.05.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: A dictionary with the keys
+            'comparisons' and 'regressions', lists of dictionaries with
+            the keys 'workload', 'rows', 'baseline_s', 'current_s',
+            'ratio' and 'regressed'.
+
+    Examples:
+        >>> compare_benchmarks(
+        ...     {'results': [{'workload': 'read', 'rows': 10, 'wall_time_s': 1.5}]},
+        ...     {'results': [{'workload': 'read', 'rows': 10, 'wall_time_s': 1.0}]},
+        ... )['regressions']
+        [{'workload': 'read', 'rows': 10, 'baseline_s': 1.0, 'current_s': 1.5, 'ratio': 1.5, 'regressed': True}]
+    """
+    baseline_times = {
+        (item['workload'], item['rows']): item['wall_time_s']
+        for item in baseline.get('results') or []
+    }
+
+    comparisons = []
+    for item in results.get('results') or []:
+        key = (item['workload'], item['rows'])
+        if key not in baseline_times:
+            continue
+        baseline_s = baseline_times[key]
+        current_s = item['wall_time_s']
+        ratio = current_s / baseline_s if baseline_s else float('inf')
+        comparisons.append(
+            {
+                'workload': item['workload'],
+                'rows': item['rows'],
+                'baseline_s': baseline_s,
+                'current_s': current_s,
+                'ratio': round(ratio, 4),
+                'regressed': ratio > 1 + threshold
+                and current_s - baseline_s > min_delta_s,
+            }
+        )
+
+    return {
+        'comparisons': comparisons,
+        'regressions': [item for item in comparisons if item['regressed']],
+    }
@@ -0,0 +1,186 @@
+"""
+Module for compacting the small files of contract tables stored on a
+local filesystem.
+"""
+
+import math
+import os
+import shutil
+from typing import Any, Dict, List, Optional
+
+from hari_data.contract.contract_partitions import (
+    is_data_file,
+    is_local_path,
+    list_partitions,
+    partition_fingerprint,
+    recover_swaps,
+    sibling_path,
+    swap_directories,
+    to_local_path,
+)
+from hari_data.contract.contract_reader import (
+    DEFAULT_FORMAT_OPTIONS,
+    SCHEMA_ON_READ_FORMATS,
+    read_contract_table,
+)
+from hari_data.contract.contract_schema import (
+    CONTRACTS_DIR,
+    compile_contract,
+    get_contract_path,
+)
+from hari_data.contract.contract_writer import DEFAULT_TARGET_FILE_SIZE_MB
+from hari_data.exceptions import HariContractError
+
+# Staging directories start with '_' so Spark never reads them as part of
+# the table.
+COMPACTION_PREFIX = '_hari_compaction_'
+
+
+def _data_file_count(path: str) -> int:
+    return len(
+        [
+            entry
+            for entry in os.scandir(path)
+            if entry.is_file() and is_data_file(entry.name)
+        ]
+    )
+
+
+def compact_contract_table(
+    contract_name: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    target_file_size_mb: float = DEFAULT_TARGET_FILE_SIZE_MB,
+    sort_by: Optional[List[str]] = None,
+    options: Optional[Dict[str, str]] = None,
+    path: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Compact the output table of a contract partition by partition.
+
+    Each partition is rewritten into ceil(size / target file size) files.
+    Partitions that already have that many files or fewer are skipped.
+    The new files are written to a staging directory next to the
+    partition and then swapped in with directory renames, so readers
+    never see a partition with both the old and the new files. A swap
+    interrupted by a crash is recovered when the next compaction starts.
+
+    When sort columns are given, rows are range-partitioned and sorted by
+    them, so the min/max statistics of each file cover a narrow range.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        target_file_size_mb (float): Target size of each output file, in
+            MB. Default is 128.
+        sort_by (Optional[List[str]]): Columns to sort the files by.
+            Default is `output_table.sort_by` from the contract.
+        options (Optional[Dict[str, str]]): Extra writer options, e.g.
+            {'compression': 'zstd'}.
+        path (Optional[str]): Compact the table at this path instead of
+            `output_table.path`.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'path' and 'partitions',
+            a list of dictionaries with the keys 'name', 'files_before',
+            'files_after' and 'compacted'. The 'name' of an unpartitioned
+            table is ''.
+
+    Raises:
+        HariContractError: If the output table is not a file format
+            table on a local path, or a sort column is not part of the
+            contract.
+        ValueError: If the target file size is not positive or the Spark
+            session has not been configured.
+
+    Examples:
+        >>> compact_contract_table('sales', sort_by=['sale_id']) # doctest: +SKIP
+        {'path': '/data/sales', 'partitions': [{'name': 'sale_date=2025-08-01', 'files_before': 240, 'files_after': 1, 'compacted': True}]}
+    """
+    if target_file_size_mb <= 0:
+        raise ValueError('target_file_size_mb must be greater than 0.')
+
+    contract_path = get_contract_path(contract_name, contracts_dir)[
+        'contract_path'
+    ]
+    compiled = compile_contract(contract_path)
+    output_table = compiled['contract'].get('output_table') or {}
+    columns = compiled['schema'].fieldNames()
+    partitioned_by = output_table.get('partitioned_by') or []
+    sort_by = sort_by or output_table.get('sort_by') or []
+
+    path = path or output_table.get('path')
+    if not path or not is_local_path(path):
+        raise HariContractError(
+            contract_path, 'Compaction requires a local output path'
+        )
+
+    table_format = str(output_table.get('format') or 'delta').lower()
+    if table_format not in SCHEMA_ON_READ_FORMATS:
+        raise HariContractError(
+            contract_path,
+            f"Compaction is not supported for format '{table_format}'",
+        )
+
+    unknown = [col for col in sort_by if col not in columns]
+    if unknown:
+        raise HariContractError(
+            contract_path, f'Sort columns not in the contract: {unknown}'
+        )
+
+    local_path = to_local_path(path)
+    recover_swaps(local_path)
+    if partitioned_by:
+        partitions = list_partitions(local_path, partitioned_by)['partitions']
+    else:
+        partitions = [{'name': '', 'path': local_path, 'values': {}}]
+
+    data_columns = [col for col in columns if col not in partitioned_by]
+    # Partition columns are constant within each partition.
+    sort_by = [col for col in sort_by if col not in partitioned_by]
+    target_bytes = target_file_size_mb * 1024 * 1024
+    writer_options = dict(DEFAULT_FORMAT_OPTIONS.get(table_format, {}))
+    writer_options.update(options or {})
+
+    results = []
+    for partition in partitions:
+        fingerprint = partition_fingerprint(partition['path'])
+        num_files = max(1, math.ceil(fingerprint['size'] / target_bytes))
+        result = {
+            'name': partition['name'],
+            'files_before': fingerprint['files'],
+            'files_after': fingerprint['files'],
+            'compacted': False,
+        }
+        results.append(result)
+        if fingerprint['files'] <= num_files:
+            continue
+
+        dataframe = read_contract_table(
+            contract_path,
+            paths=[partition['path']] if partitioned_by else None,
+            path=local_path,
+        )['dataframe'].select(*data_columns)
+
+        if sort_by:
+            dataframe = dataframe.repartitionByRange(
+                num_files, *sort_by
+            ).sortWithinPartitions(*sort_by)
+        else:
+            dataframe = dataframe.repartition(num_files)
+
+        staging = sibling_path(partition['path'], COMPACTION_PREFIX)
+        try:
+            writer = dataframe.write.format(table_format).mode('overwrite')
+            if writer_options:
+                writer = writer.options(**writer_options)
+            writer.save(staging)
+            swap_directories(partition['path'], staging)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        result['files_after'] = _data_file_count(partition['path'])
+        result['compacted'] = True
+
+    return {'path': path, 'partitions': results}
@@ -0,0 +1,377 @@
+"""
+Module for generating synthetic data that matches a data contract, for
+load tests without production data.
+"""
+
+import math
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+from pyspark.sql import Column, DataFrame
+from pyspark.sql import functions as F
+from pyspark.sql.types import DecimalType
+
+from hari_data.contract.contract_partitions import is_local_path
+from hari_data.contract.contract_schema import (
+    CONTRACTS_DIR,
+    compile_contract,
+    get_column_type,
+    get_contract_path,
+)
+from hari_data.contract.contract_writer import (
+    DEFAULT_TARGET_FILE_SIZE_MB,
+    write_contract_table,
+)
+from hari_data.exceptions import HariContractError
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+DEFAULT_NULL_RATIO = 0.1
+
+# Distinct values of non-unique columns. Partition columns get fewer so a
+# generated table has a realistic number of partition directories.
+DEFAULT_CARDINALITY = 1_000_000
+DEFAULT_PARTITION_CARDINALITY = 10
+
+_BASE_DATE = date(2020, 1, 1)
+_BASE_TIMESTAMP = int(datetime(2020, 1, 1).timestamp())
+
+# Number of distinct values each type can hold, for unique columns.
+_CAPACITY = {
+    'boolean': 2,
+    'byte': 2**7,
+    'short': 2**15,
+    'int': 2**31 - 1,
+    'time': 86_400,
+    'date': (date(9999, 12, 31) - _BASE_DATE).days + 1,
+}
+
+_INTEGRAL_TYPES = ('byte', 'short', 'int', 'bigint')
+
+# Range of each integral type, bounding unique columns that count up from
+# min_value or down from max_value.
+_INTEGRAL_RANGES = {
+    'byte': (-(2**7), 2**7 - 1),
+    'short': (-(2**15), 2**15 - 1),
+    'int': (-(2**31), 2**31 - 1),
+    'bigint': (-(2**63), 2**63 - 1),
+}
+_FRACTIONAL_TYPES = ('float', 'double', 'decimal')
+
+_RATIO_PRECISION = 1_000_000
+
+# Unique float and double columns without a range use the row id, or the
+# row id / 100, which stay exact below these numbers of rows.
+_FLOAT_EXACT = 2**24
+_DOUBLE_EXACT = 2**44
+
+
+def _type_name(column: Dict[str, Any]) -> str:
+    column_type = str(column.get('type', '')).strip().lower()
+    if column_type.startswith('decimal'):
+        return 'decimal'
+    return {'integer': 'int', 'long': 'bigint'}.get(column_type, column_type)
+
+
+def _fractional_resolution(
+    type_name: str, data_type: Any, magnitude: float
+) -> float:
+    """
+    Smallest difference the type can represent around `magnitude`.
+    """
+    if isinstance(data_type, DecimalType):
+        return 10.0**-data_type.scale
+    if type_name == 'float':
+        # A float has 29 fewer mantissa bits than a double.
+        return math.ulp(magnitude) * 2**29
+    return math.ulp(magnitude)
+
+
+def _numeric_value(
+    column: Dict[str, Any],
+    type_name: str,
+    data_type: Any,
+    key: Column,
+    num_rows: int,
+) -> Column:
+    low = column.get('min_value')
+    high = column.get('max_value')
+    unique = bool(column.get('is_unique'))
+
+    if type_name in _INTEGRAL_TYPES:
+        if low is not None and high is not None and not unique:
+            span = int(high) - int(low) + 1
+            return F.lit(int(low)) + F.pmod(key, F.lit(span))
+        if low is not None:
+            return F.lit(int(low)) + key
+        if high is not None:
+            return F.lit(int(high)) - key
+        capacity = _CAPACITY.get(type_name)
+        return F.pmod(key, F.lit(capacity)) if capacity else key
+
+    if low is not None and high is not None:
+        span = float(high) - float(low)
+        if unique:
+            # Spread the row ids evenly over [min_value, max_value).
+            step = span / max(num_rows, 1)
+            return F.lit(float(low)) + key.cast('double') * F.lit(step)
+        fraction = F.pmod(key, F.lit(_RATIO_PRECISION + 1)) / _RATIO_PRECISION
+        return F.lit(float(low)) + fraction * F.lit(span)
+
+    value = key.cast('double')
+    if isinstance(data_type, DecimalType):
+        value = F.pmod(key, F.lit(10 ** min(data_type.precision, 18)))
+        value = value / F.lit(10**data_type.scale)
+    elif not (unique and type_name == 'float'):
+        value = value / F.lit(100)
+    if low is not None:
+        return F.lit(float(low)) + value
+    if high is not None:
+        return F.lit(float(high)) - value
+    return value
+
+
+def _value_column(
+    column: Dict[str, Any], key: Column, contract_path: str, num_rows: int
+) -> Column:
+    """
+    Build the value of a column from a non-negative long `key`: the row
+    id, below `num_rows`, for unique columns, a hash bucket otherwise.
+    """
+    name = column['name']
+    type_name = _type_name(column)
+    data_type = get_column_type(column, contract_path)
+
+    if type_name in _INTEGRAL_TYPES + _FRACTIONAL_TYPES:
+        value = _numeric_value(column, type_name, data_type, key, num_rows)
+    elif type_name in ('string', 'binary'):
+        value = F.concat(F.lit(f'{name}_'), key.cast('string'))
+    elif type_name == 'boolean':
+        value = F.pmod(key, F.lit(2)) == 0
+    elif type_name == 'date':
+        value = F.date_add(F.lit(_BASE_DATE), key.cast('int'))
+    elif type_name == 'timestamp':
+        value = F.timestamp_seconds(F.lit(_BASE_TIMESTAMP) + key)
+    elif type_name == 'time':
+        seconds = F.pmod(key, F.lit(_CAPACITY['time']))
+        value = F.format_string(
+            '%02d:%02d:%02d',
+            (seconds / 3600).cast('int'),
+            (F.pmod(seconds, F.lit(3600)) / 60).cast('int'),
+            F.pmod(seconds, F.lit(60)),
+        )
+    elif type_name == 'json':
+        value = F.concat(F.lit('{"value": '), key.cast('string'), F.lit('}'))
+    else:
+        raise HariContractError(
+            contract_path, f"Cannot generate values of type '{type_name}'"
+        )
+
+    return value.cast(data_type)
+
+
+def _unique_capacity(
+    column: Dict[str, Any], type_name: str, data_type: Any
+) -> Optional[int]:
+    low = column.get('min_value')
+    high = column.get('max_value')
+    if type_name in _INTEGRAL_TYPES and (low is not None or high is not None):
+        type_min, type_max = _INTEGRAL_RANGES[type_name]
+        low = type_min if low is None else int(low)
+        high = type_max if high is None else int(high)
+        return max(0, high - low + 1)
+    if type_name in _FRACTIONAL_TYPES and low is not None and high is not None:
+        # Consecutive values must be at least two steps of the type apart
+        # to stay distinct after rounding.
+        magnitude = max(abs(float(low)), abs(float(high)))
+        resolution = _fractional_resolution(type_name, data_type, magnitude)
+        return max(1, int((float(high) - float(low)) / (2 * resolution)))
+    if isinstance(data_type, DecimalType):
+        return 10 ** min(data_type.precision, 18)
+    if type_name == 'float':
+        bound = low if low is not None else high
+        offset = math.ceil(abs(float(bound))) if bound is not None else 0
+        return max(0, _FLOAT_EXACT // 2 - offset) if offset else _FLOAT_EXACT
+    if type_name == 'double':
+        return _DOUBLE_EXACT
+    return _CAPACITY.get(type_name)
+
+
+def generate_contract_data(
+    contract_name: str,
+    num_rows: int,
+    contracts_dir: str = CONTRACTS_DIR,
+    null_ratio: float = DEFAULT_NULL_RATIO,
+    seed: int = 42,
+    num_partitions: Optional[int] = None,
+) -> Dict[str, DataFrame]:
+    """
+    Generate a DataFrame of synthetic rows matching a contract.
+
+    Rows are derived from `spark.range`, so they are generated by the
+    executors in parallel and never built in Python. Each value is a
+    deterministic function of the row id, the seed and the column name:
+
+    - `is_unique` columns are derived from the row id, so they never
+      repeat.
+    - Other columns take one of `cardinality` values (a column key,
+      default 1,000,000, or 10 for partition columns) picked by a hash.
+    - Nullable columns are null in a `null_ratio` fraction of the rows,
+      which a column can override with its own `null_ratio` key.
+      Non-nullable columns are never null.
+    - Numeric columns honour `min_value`/`max_value`. Unique fractional
+      columns with both are spread evenly over the range.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        num_rows (int): The number of rows to generate.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        null_ratio (float): The fraction of null values in nullable
+            columns. Default is 0.1.
+        seed (int): Seed of the generated values. Default is 42.
+        num_partitions (Optional[int]): Number of partitions of the
+            generated DataFrame. Default is the Spark default parallelism.
+
+    Returns:
+        Dict[str, DataFrame]: A dictionary with the key 'dataframe'.
+
+    Raises:
+        HariContractError: If a unique column cannot hold `num_rows`
+            distinct values or a column type cannot be generated.
+        ValueError: If `num_rows` or a null ratio is out of range, or the
+            Spark session has not been configured.
+
+    Examples:
+        >>> generate_contract_data('sales', 100_000_000) # doctest: +SKIP
+        {'dataframe': DataFrame[sale_id: int, city: string, amount: double]}
+    """
+    if num_rows < 0:
+        raise ValueError('num_rows must be greater than or equal to 0.')
+
+    spark = HariSparkSessionManager().get_spark_session()['spark_session']
+
+    contract_path = get_contract_path(contract_name, contracts_dir)[
+        'contract_path'
+    ]
+    compiled = compile_contract(contract_path)
+    output_table = compiled['contract'].get('output_table') or {}
+    partitioned_by = output_table.get('partitioned_by') or []
+
+    row_id = F.col('id')
+    columns = []
+    for column in output_table.get('columns') or []:
+        name = column['name']
+        type_name = _type_name(column)
+
+        if column.get('is_unique'):
+            capacity = _unique_capacity(
+                column, type_name, get_column_type(column, contract_path)
+            )
+            if capacity is not None and num_rows > capacity:
+                raise HariContractError(
+                    contract_path,
+                    f"Unique column '{name}' of type '{type_name}' cannot "
+                    f'hold {num_rows} distinct values',
+                )
+            key = row_id
+        else:
+            default = (
+                DEFAULT_PARTITION_CARDINALITY
+                if name in partitioned_by
+                else DEFAULT_CARDINALITY
+            )
+            cardinality = int(column.get('cardinality') or default)
+            key = F.pmod(
+                F.xxhash64(row_id, F.lit(seed), F.lit(name)),
+                F.lit(cardinality),
+            )
+
+        value = _value_column(column, key, contract_path, num_rows)
+
+        ratio = column.get('null_ratio', null_ratio)
+        if not 0 <= ratio <= 1:
+            raise ValueError(f"null_ratio of '{name}' must be in [0, 1].")
+        if column.get('is_nullable', True) and ratio > 0:
+            bucket = F.pmod(
+                F.xxhash64(row_id, F.lit(seed), F.lit(f'{name}:null')),
+                F.lit(_RATIO_PRECISION),
+            )
+            value = F.when(
+                bucket >= F.lit(int(ratio * _RATIO_PRECISION)), value
+            )
+
+        columns.append(value.alias(name))
+
+    dataframe = spark.range(0, num_rows, 1, num_partitions).select(*columns)
+    return {'dataframe': dataframe}
+
+
+def generate_contract_table(
+    contract_name: str,
+    num_rows: int,
+    path: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    null_ratio: float = DEFAULT_NULL_RATIO,
+    seed: int = 42,
+    target_file_size_mb: int = DEFAULT_TARGET_FILE_SIZE_MB,
+) -> Dict[str, Any]:
+    """
+    Generate synthetic rows matching a contract and write them to a local
+    path in the contract format and partitioning.
+
+    The table is written with the 'overwrite' load strategy of
+    `write_contract_table()`, so generating again with the same seed
+    replaces the same partitions.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        num_rows (int): The number of rows to generate.
+        path (str): The local path to write to.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        null_ratio (float): The fraction of null values in nullable
+            columns. Default is 0.1.
+        seed (int): Seed of the generated values. Default is 42.
+        target_file_size_mb (int): Target size of each output file, in MB.
+            Default is 128.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'path', 'num_rows' and
+            'num_partitions'.
+
+    Raises:
+        HariContractError: If the contract cannot be generated or written.
+        ValueError: If the path is not local.
+
+    Examples:
+        >>> generate_contract_table('sales', 1_000_000, '/tmp/sales') # doctest: +SKIP
+        {'path': '/tmp/sales', 'num_rows': 1000000, 'num_partitions': 1}
+    """
+    if not is_local_path(path):
+        raise ValueError(f"Generated data must be written locally: '{path}'.")
+
+    dataframe = generate_contract_data(
+        contract_name,
+        num_rows,
+        contracts_dir=contracts_dir,
+        null_ratio=null_ratio,
+        seed=seed,
+    )['dataframe']
+
+    result = write_contract_table(
+        dataframe,
+        contract_name,
+        contracts_dir=contracts_dir,
+        load_strategy='overwrite',
+        target_file_size_mb=target_file_size_mb,
+        path=path,
+    )
+    return {
+        'path': result['path'],
+        'num_rows': num_rows,
+        'num_partitions': result['num_partitions'],
+    }
@@ -0,0 +1,286 @@
+"""
+Module for inferring data contracts from existing Parquet datasets by
+reading file footers only.
+
+Reading footers requires the optional `pyarrow` package
+(`pip install 'hari-data[parquet]'`).
+"""
+
+import os
+import re
+from typing import Any, Dict, List, Optional
+
+from hari_data.contract.contract_parquet import (
+    HIVE_DEFAULT_PARTITION,
+    _import_parquet,
+    list_parquet_files,
+    read_parquet_footers,
+    summarize_parquet_statistics,
+)
+from hari_data.contract.contract_partitions import is_local_path, to_local_path
+
+_INT_VALUE = re.compile(r'^-?\d+$')
+_FLOAT_VALUE = re.compile(r'^-?(\d+\.\d*|\.\d+|\d+)([eE][-+]?\d+)?$')
+_DATE_VALUE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+_INT_MAX = 2**31 - 1
+
+
+def arrow_type_to_contract_type(arrow_type: Any) -> Dict[str, Any]:
+    """
+    Convert an Arrow data type into a contract column type.
+
+    Types are mapped the way Spark reads them from Parquet: unsigned
+    integers are widened and 'uint64' becomes 'decimal(20,0)'.
+
+    Parameters:
+        arrow_type (pyarrow.DataType): The Arrow data type.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the key 'type', plus 'precision'
+            and 'scale' for decimals.
+
+    Raises:
+        ValueError: If the type has no contract equivalent, e.g. nested
+            types, or Spark cannot read it, e.g. TIME.
+
+    Examples:
+        >>> import pyarrow as pa # doctest: +SKIP
+        >>> arrow_type_to_contract_type(pa.int64()) # doctest: +SKIP
+        {'type': 'bigint'}
+        >>> arrow_type_to_contract_type(pa.decimal128(12, 2)) # doctest: +SKIP
+        {'type': 'decimal', 'precision': 12, 'scale': 2}
+    """
+    _import_parquet()
+    import pyarrow as pa
+
+    types = pa.types
+    if types.is_time(arrow_type):
+        raise ValueError(
+            f"Unsupported Parquet type '{arrow_type}': Spark cannot read "
+            'TIME columns.'
+        )
+    if types.is_decimal(arrow_type):
+        return {
+            'type': 'decimal',
+            'precision': arrow_type.precision,
+            'scale': arrow_type.scale,
+        }
+    if types.is_uint64(arrow_type):
+        return {'type': 'decimal', 'precision': 20, 'scale': 0}
+
+    checks = [
+        (types.is_boolean, 'boolean'),
+        (types.is_int8, 'byte'),
+        (types.is_int16, 'short'),
+        (types.is_uint8, 'short'),
+        (types.is_int32, 'int'),
+        (types.is_uint16, 'int'),
+        (types.is_int64, 'bigint'),
+        (types.is_uint32, 'bigint'),
+        (types.is_float16, 'float'),
+        (types.is_float32, 'float'),
+        (types.is_float64, 'double'),
+        (types.is_string, 'string'),
+        (types.is_large_string, 'string'),
+        (types.is_binary, 'binary'),
+        (types.is_large_binary, 'binary'),
+        (types.is_fixed_size_binary, 'binary'),
+        (types.is_date, 'date'),
+        (types.is_timestamp, 'timestamp'),
+    ]
+    for check, contract_type in checks:
+        if check(arrow_type):
+            return {'type': contract_type}
+
+    raise ValueError(f"Unsupported Parquet type '{arrow_type}'.")
+
+
+def infer_partition_type(values: List[str]) -> Dict[str, Any]:
+    """
+    Infer the type of a partition column from its directory values, like
+    Spark partition discovery does.
+
+    Parameters:
+        values (List[str]): The values of the 'column=value' directories.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'type' ('int',
+            'bigint', 'double', 'date' or 'string') and 'is_nullable'
+            (True when a '__HIVE_DEFAULT_PARTITION__' directory exists).
+
+    Examples:
+        >>> infer_partition_type(['2025', '2026'])
+        {'type': 'int', 'is_nullable': False}
+        >>> infer_partition_type(['2025-08-01', '__HIVE_DEFAULT_PARTITION__'])
+        {'type': 'date', 'is_nullable': True}
+        >>> infer_partition_type(['Recife', '10'])
+        {'type': 'string', 'is_nullable': False}
+    """
+    present = [value for value in values if value != HIVE_DEFAULT_PARTITION]
+    is_nullable = len(present) != len(values)
+
+    if present and all(_INT_VALUE.match(v) for v in present):
+        fits_int = all(abs(int(v)) <= _INT_MAX for v in present)
+        column_type = 'int' if fits_int else 'bigint'
+    elif present and all(_FLOAT_VALUE.match(v) for v in present):
+        column_type = 'double'
+    elif present and all(_DATE_VALUE.match(v) for v in present):
+        column_type = 'date'
+    else:
+        column_type = 'string'
+
+    return {'type': column_type, 'is_nullable': is_nullable}
+
+
+def _detect_partitions(
+    files: List[str], table_path: str
+) -> Dict[str, List[str]]:
+    """
+    Detect the partition columns from the 'column=value' directories
+    between the table path and its files, and collect their values.
+    """
+    partitions: Optional[List[str]] = None
+    values: Dict[str, List[str]] = {}
+
+    for file_path in files:
+        relative = os.path.relpath(os.path.dirname(file_path), table_path)
+        parts = [] if relative == os.curdir else relative.split(os.sep)
+        columns = []
+        for part in parts:
+            column, sep, value = part.partition('=')
+            if not sep or not column:
+                raise ValueError(
+                    f"Directory '{part}' is not a 'column=value' partition: "
+                    f'{file_path}'
+                )
+            columns.append(column)
+            values.setdefault(column, []).append(value)
+        if partitions is None:
+            partitions = columns
+        elif columns != partitions:
+            raise ValueError(
+                f'Inconsistent partition directories: {partitions} and '
+                f'{columns} ({file_path})'
+            )
+
+    return {column: values[column] for column in partitions or []}
+
+
+def infer_contract(
+    table_path: str,
+    table_name: Optional[str] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Infer the output table and columns of a contract from a Parquet
+    dataset on a local filesystem.
+
+    The footers of all files are read in parallel; no data pages are
+    read and Spark is not started. Columns follow the order of the first
+    file, with columns found only in later files appended. A column is
+    inferred as not nullable when every file has it and it is required in
+    the Parquet schema, or the statistics of every row group show that it
+    holds no nulls; rows of files without the column are read as nulls.
+    Partition columns are detected from 'column=value' directories, and
+    their types from the directory values.
+
+    Parameters:
+        table_path (str): The local path of the dataset.
+        table_name (Optional[str]): The output table name. Default is the
+            last component of the path.
+        max_workers (Optional[int]): Number of footer reader threads.
+            Default is the ThreadPoolExecutor default.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'output_table' and
+            'columns', ready to be passed to `contract()`.
+
+    Raises:
+        ValueError: If the path is not local, holds no Parquet files, has
+            inconsistent partition directories, or a column has an
+            unsupported or conflicting type across files.
+        ImportError: If pyarrow is not installed.
+
+    Examples:
+        >>> infer_contract('/data/sales') # doctest: +SKIP
+        {'output_table': {'name': 'sales', 'path': '/data/sales', 'format': 'parquet', 'partitioned_by': ['sale_date']}, 'columns': [{'name': 'sale_id', 'type': 'int', 'is_nullable': False, 'is_unique': False}, ...]}
+    """
+    if not is_local_path(table_path):
+        raise ValueError(f"Only local paths can be inferred: '{table_path}'.")
+
+    local_path = os.path.normpath(to_local_path(table_path))
+    files = list_parquet_files(local_path)['files']
+    if not files:
+        raise ValueError(f"No Parquet files found under '{table_path}'.")
+
+    footers = read_parquet_footers(files, max_workers=max_workers)['footers']
+    partitions = _detect_partitions(files, local_path)
+
+    fields: Dict[str, Any] = {}
+    for file_path, footer in zip(files, footers):
+        for field in footer.schema.to_arrow_schema():
+            if field.name in partitions:
+                continue
+            try:
+                column_type = arrow_type_to_contract_type(field.type)
+            except ValueError as e:
+                raise ValueError(f"Column '{field.name}': {e}") from None
+
+            known = fields.get(field.name)
+            if known is None:
+                # Required Parquet columns are read as non-nullable fields.
+                fields[field.name] = {
+                    'type': column_type,
+                    'required': not field.nullable,
+                    'files': 1,
+                }
+            elif known['type'] != column_type:
+                raise ValueError(
+                    f"Column '{field.name}' has conflicting types "
+                    f"{known['type']} and {column_type} ({file_path})"
+                )
+            else:
+                known['required'] = known['required'] and not field.nullable
+                known['files'] += 1
+
+    statistics = summarize_parquet_statistics(
+        files, footers, list(fields), local_path
+    )['columns']
+
+    columns = []
+    for name, field in fields.items():
+        stats = statistics[name]
+        no_nulls = stats['nulls_complete'] and stats['null_count'] == 0
+        in_every_file = field['files'] == len(files)
+        columns.append(
+            {
+                'name': name,
+                **field['type'],
+                'is_nullable': not (
+                    in_every_file and (field['required'] or no_nulls)
+                ),
+                'is_unique': False,
+            }
+        )
+
+    for name, values in partitions.items():
+        partition_type = infer_partition_type(values)
+        columns.append(
+            {
+                'name': name,
+                'type': partition_type['type'],
+                'is_nullable': partition_type['is_nullable'],
+                'is_unique': False,
+            }
+        )
+
+    return {
+        'output_table': {
+            'name': table_name or os.path.basename(local_path),
+            'path': table_path,
+            'format': 'parquet',
+            'partitioned_by': list(partitions),
+        },
+        'columns': columns,
+    }
@@ -0,0 +1,201 @@
+"""
+Module for reading Parquet footers of contract tables without starting
+Spark.
+
+Reading footers requires the optional `pyarrow` package
+(`pip install 'hari-data[parquet]'`).
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from hari_data.contract.contract_partitions import is_data_file, to_local_path
+
+HIVE_DEFAULT_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+
+def _import_parquet():
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            'pyarrow is required to read Parquet footers. '
+            "Install it with: pip install 'hari-data[parquet]'"
+        ) from e
+    return pq
+
+
+def list_parquet_files(table_path: str) -> Dict[str, List[str]]:
+    """
+    List the Parquet data files under a table directory.
+
+    Hidden and metadata entries ('.', '_' prefixes) are skipped, as they
+    are by Spark.
+
+    Parameters:
+        table_path (str): The local path of the table.
+
+    Returns:
+        Dict[str, List[str]]: A dictionary with the key 'files', sorted.
+
+    Examples:
+        >>> list_parquet_files('/data/sales') # doctest: +SKIP
+        {'files': ['/data/sales/sale_date=2025-08-01/part-00000.snappy.parquet']}
+    """
+    files = []
+    for root, dirs, names in os.walk(to_local_path(table_path)):
+        dirs[:] = [name for name in dirs if is_data_file(name)]
+        files.extend(
+            os.path.join(root, name)
+            for name in names
+            if is_data_file(name) and name.endswith('.parquet')
+        )
+    return {'files': sorted(files)}
+
+
+def read_parquet_footers(
+    files: List[str], max_workers: Optional[int] = None
+) -> Dict[str, List[Any]]:
+    """
+    Read the footers of Parquet files in parallel.
+
+    Only the footer of each file is read, never its data pages.
+
+    Parameters:
+        files (List[str]): The Parquet files to read.
+        max_workers (Optional[int]): Number of reader threads. Default is
+            the ThreadPoolExecutor default.
+
+    Returns:
+        Dict[str, List[Any]]: A dictionary with the key 'footers', the
+            `pyarrow.parquet.FileMetaData` of each file in the same order.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+
+    Examples:
+        >>> read_parquet_footers(['/data/sales/part-0.parquet']) # doctest: +SKIP
+        {'footers': [<pyarrow._parquet.FileMetaData object at 0x...>]}
+    """
+    pq = _import_parquet()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        footers = list(executor.map(pq.read_metadata, files))
+    return {'footers': footers}
+
+
+def _partition_values(
+    file_path: str, table_path: str, partitioned_by: List[str]
+) -> Dict[str, str]:
+    relative = os.path.relpath(os.path.dirname(file_path), table_path)
+    values = {}
+    for part in relative.split(os.sep):
+        column, sep, value = part.partition('=')
+        if sep and column in partitioned_by:
+            values[column] = value
+    return values
+
+
+def _merge_bound(current: Any, value: Any, pick: Any) -> Any:
+    if current is None:
+        return value
+    return pick(current, value)
+
+
+def summarize_parquet_statistics(
+    files: List[str],
+    footers: List[Any],
+    columns: List[str],
+    table_path: str,
+    partitioned_by: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Aggregate the row-group statistics of Parquet footers per column.
+
+    A statistic is marked incomplete when any row group does not record
+    it, in which case it cannot be trusted for the whole table. Columns
+    absent from a file count all of its rows as nulls. Partition columns
+    take their null counts from the '__HIVE_DEFAULT_PARTITION__'
+    directories and have no min/max.
+
+    Parameters:
+        files (List[str]): The Parquet files, in the order of `footers`.
+        footers (List[Any]): The footers returned by
+            `read_parquet_footers()`.
+        columns (List[str]): The columns to summarize.
+        table_path (str): The local path of the table.
+        partitioned_by (Optional[List[str]]): The partition columns.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'row_count' and
+            'columns', a mapping from column name to a dictionary with the
+            keys 'null_count', 'min', 'max', 'nulls_complete' and
+            'min_max_complete'.
+
+    Examples:
+        >>> summarize_parquet_statistics(files, footers, ['sale_id'], '/data/sales') # doctest: +SKIP
+        {'row_count': 1000, 'columns': {'sale_id': {'null_count': 0, 'min': 1, 'max': 1000, 'nulls_complete': True, 'min_max_complete': True}}}
+    """
+    partitioned_by = partitioned_by or []
+    table_path = to_local_path(table_path)
+    summary = {
+        column: {
+            'null_count': 0,
+            'min': None,
+            'max': None,
+            'nulls_complete': True,
+            'min_max_complete': column not in partitioned_by,
+        }
+        for column in columns
+    }
+    row_count = 0
+
+    for file_path, footer in zip(files, footers):
+        row_count += footer.num_rows
+        partition_values = _partition_values(
+            file_path, table_path, partitioned_by
+        )
+        column_indexes = {
+            footer.schema.column(i).path: i for i in range(footer.num_columns)
+        }
+
+        for column in partitioned_by:
+            if column not in summary:
+                continue
+            if partition_values.get(column) == HIVE_DEFAULT_PARTITION:
+                summary[column]['null_count'] += footer.num_rows
+
+        for group_index in range(footer.num_row_groups):
+            row_group = footer.row_group(group_index)
+
+            for column in columns:
+                if column in partitioned_by:
+                    continue
+
+                stats = summary[column]
+                if column not in column_indexes:
+                    stats['null_count'] += row_group.num_rows
+                    continue
+
+                statistics = row_group.column(
+                    column_indexes[column]
+                ).statistics
+                if statistics is None or not statistics.has_null_count:
+                    stats['nulls_complete'] = False
+                else:
+                    stats['null_count'] += statistics.null_count
+
+                if statistics is None or not statistics.has_min_max:
+                    # A row group with only nulls has no min/max to merge.
+                    if (
+                        statistics is None
+                        or not statistics.has_null_count
+                        or statistics.null_count != row_group.num_rows
+                    ):
+                        stats['min_max_complete'] = False
+                    continue
+
+                stats['min'] = _merge_bound(stats['min'], statistics.min, min)
+                stats['max'] = _merge_bound(stats['max'], statistics.max, max)
+
+    return {'row_count': row_count, 'columns': summary}
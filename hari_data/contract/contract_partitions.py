@@ -0,0 +1,263 @@
+"""
+Module for inspecting and replacing the partitions of contract tables on a
+local filesystem without starting Spark.
+"""
+
+import hashlib
+import os
+import shutil
+from typing import Any, Dict, List
+from urllib.parse import urlparse
+
+# Backup directories start with '_' so Spark never reads them as part of
+# the table.
+BACKUP_PREFIX = '_hari_backup_'
+
+
+def sibling_path(path: str, prefix: str) -> str:
+    """
+    Build the path of a directory next to `path`, named after it with a
+    prefix, e.g. for the staging or backup copy of a partition.
+
+    Parameters:
+        path (str): The local path of the directory.
+        prefix (str): The prefix of the sibling name.
+
+    Returns:
+        str: The path of the sibling directory.
+
+    Examples:
+        >>> sibling_path('/data/sales/city=Recife', '_hari_backup_')
+        '/data/sales/_hari_backup_city=Recife'
+    """
+    path = os.path.normpath(path)
+    return os.path.join(
+        os.path.dirname(path), f'{prefix}{os.path.basename(path)}'
+    )
+
+
+def recover_directory(target: str) -> bool:
+    """
+    Finish a `swap_directories` of `target` that was interrupted, e.g. by
+    a crash of the driver. When only the backup is left, it is renamed
+    back to `target`; when both exist, the leftover backup is removed.
+
+    Parameters:
+        target (str): The local path of the swapped directory.
+
+    Returns:
+        bool: True if an interrupted swap was found.
+
+    Examples:
+        >>> recover_directory('/data/sales/city=Recife') # doctest: +SKIP
+        False
+    """
+    backup = sibling_path(target, BACKUP_PREFIX)
+    if not os.path.isdir(backup):
+        return False
+    if os.path.exists(target):
+        shutil.rmtree(backup)
+    else:
+        os.rename(backup, target)
+    return True
+
+
+def recover_swaps(table_path: str) -> Dict[str, List[str]]:
+    """
+    Recover the interrupted swaps of a table and of its partitions. See
+    `recover_directory`.
+
+    Parameters:
+        table_path (str): The local path of the table.
+
+    Returns:
+        Dict[str, List[str]]: A dictionary with the key 'recovered', the
+            paths of the directories whose swap was interrupted.
+
+    Examples:
+        >>> recover_swaps('/data/sales') # doctest: +SKIP
+        {'recovered': ['/data/sales/city=Recife']}
+    """
+    table_path = os.path.normpath(to_local_path(table_path))
+    targets = [table_path]
+    for root, dirs, _ in os.walk(table_path):
+        targets += [
+            os.path.join(root, name[len(BACKUP_PREFIX) :])
+            for name in dirs
+            if name.startswith(BACKUP_PREFIX)
+        ]
+        # Hidden, staging and backup directories are not table data.
+        dirs[:] = [name for name in dirs if is_data_file(name)]
+    return {'recovered': [t for t in targets if recover_directory(t)]}
+
+
+def swap_directories(target: str, staging: str) -> None:
+    """
+    Replace the directory `target` with the directory `staging` using two
+    renames. Each rename is atomic, but `target` does not exist between
+    them: if the second rename fails, the original directory is restored,
+    and if the process dies in between, the backup is restored by
+    `recover_directory` on the next swap, upsert or compaction.
+
+    Parameters:
+        target (str): The local path of the directory to replace.
+        staging (str): The local path of the directory replacing it.
+
+    Examples:
+        >>> swap_directories('/data/sales/city=Recife', '/data/sales/_hari_compaction_city=Recife') # doctest: +SKIP
+    """
+    recover_directory(target)
+    backup = sibling_path(target, BACKUP_PREFIX)
+    os.rename(target, backup)
+    try:
+        os.rename(staging, target)
+    except OSError:
+        os.rename(backup, target)
+        raise
+    shutil.rmtree(backup, ignore_errors=True)
+
+
+def is_local_path(path: str) -> bool:
+    """
+    Check if a table path points to the local filesystem.
+
+    Parameters:
+        path (str): The table path or URI.
+
+    Returns:
+        bool: True for plain paths and 'file://' URIs, False otherwise.
+
+    Examples:
+        >>> is_local_path('/data/sales')
+        True
+        >>> is_local_path('file:///data/sales')
+        True
+        >>> is_local_path('s3a://bucket/sales')
+        False
+    """
+    return urlparse(path).scheme in ('', 'file')
+
+
+def to_local_path(path: str) -> str:
+    """
+    Convert a local table path or 'file://' URI into a filesystem path.
+
+    Parameters:
+        path (str): The table path or URI.
+
+    Returns:
+        str: The filesystem path.
+
+    Examples:
+        >>> to_local_path('file:///data/sales')
+        '/data/sales'
+        >>> to_local_path('./data/sales')
+        './data/sales'
+    """
+    parsed = urlparse(path)
+    if parsed.scheme == 'file':
+        return parsed.path
+    return path
+
+
+def is_data_file(name: str) -> bool:
+    """
+    Check if a file name is a data file, skipping the hidden and metadata
+    files that Spark also ignores (e.g. '_SUCCESS', '.part-0.crc').
+
+    Examples:
+        >>> is_data_file('part-00000.parquet')
+        True
+        >>> is_data_file('_SUCCESS')
+        False
+    """
+    return not name.startswith(('.', '_'))
+
+
+def list_partitions(
+    table_path: str, partitioned_by: List[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    List the leaf partition directories of a table.
+
+    Only directories named 'column=value' that follow the order of
+    `partitioned_by` are returned.
+
+    Parameters:
+        table_path (str): The local path of the table.
+        partitioned_by (List[str]): The partition columns of the table.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: A dictionary with the key
+            'partitions', a list sorted by name of dictionaries with the
+            keys 'name' (e.g. 'year=2025/month=1'), 'path' and 'values'.
+
+    Examples:
+        >>> list_partitions('/data/sales', ['sale_date']) # doctest: +SKIP
+        {'partitions': [{'name': 'sale_date=2025-08-01', 'path': '/data/sales/sale_date=2025-08-01', 'values': {'sale_date': '2025-08-01'}}]}
+    """
+    if not partitioned_by:
+        return {'partitions': []}
+
+    table_path = to_local_path(table_path)
+    level = [{'name': '', 'path': table_path, 'values': {}}]
+
+    for column in partitioned_by:
+        next_level = []
+        prefix = f'{column}='
+        for partition in level:
+            try:
+                entries = list(os.scandir(partition['path']))
+            except FileNotFoundError:
+                continue
+            for entry in entries:
+                if entry.is_dir() and entry.name.startswith(prefix):
+                    next_level.append(
+                        {
+                            'name': os.path.join(
+                                partition['name'], entry.name
+                            ),
+                            'path': entry.path,
+                            'values': {
+                                **partition['values'],
+                                column: entry.name[len(prefix) :],
+                            },
+                        }
+                    )
+        level = next_level
+
+    return {'partitions': sorted(level, key=lambda p: p['name'])}
+
+
+def partition_fingerprint(partition_path: str) -> Dict[str, Any]:
+    """
+    Compute a fingerprint of the data files of a partition directory from
+    their names, sizes and modification times.
+
+    Parameters:
+        partition_path (str): The local path of the partition directory.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'fingerprint',
+            'files' (number of data files) and 'size' (bytes).
+
+    Examples:
+        >>> partition_fingerprint('/data/sales/sale_date=2025-08-01') # doctest: +SKIP
+        {'fingerprint': '9f86d0...', 'files': 2, 'size': 20480}
+    """
+    digest = hashlib.sha256()
+    files = 0
+    size = 0
+
+    entries = sorted(os.scandir(partition_path), key=lambda e: e.name)
+    for entry in entries:
+        if not entry.is_file() or not is_data_file(entry.name):
+            continue
+        stat = entry.stat()
+        digest.update(
+            f'{entry.name}:{stat.st_size}:{stat.st_mtime_ns}\n'.encode()
+        )
+        files += 1
+        size += stat.st_size
+
+    return {'fingerprint': digest.hexdigest(), 'files': files, 'size': size}
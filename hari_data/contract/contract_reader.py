@@ -0,0 +1,112 @@
+"""
+Module for reading the output table of a data contract.
+"""
+
+from typing import Dict, List, Optional
+
+from pyspark.sql import DataFrame
+
+from hari_data.contract.contract_schema import (
+    CONTRACTS_DIR,
+    compile_contract,
+    get_contract_path,
+)
+from hari_data.exceptions import HariContractError
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+# File formats whose readers accept a user-defined schema. Table formats
+# such as delta keep the schema in their own log and reject it.
+SCHEMA_ON_READ_FORMATS = ('csv', 'json', 'parquet', 'orc', 'avro')
+
+DEFAULT_FORMAT_OPTIONS: Dict[str, Dict[str, str]] = {
+    'csv': {'header': 'true'},
+}
+
+
+def read_contract_table(
+    contract_name: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    columns: Optional[List[str]] = None,
+    options: Optional[Dict[str, str]] = None,
+    paths: Optional[List[str]] = None,
+    path: Optional[str] = None,
+) -> Dict[str, DataFrame]:
+    """
+    Read the output table of a contract with its compiled schema.
+
+    The contract schema is given to the reader, so CSV and JSON sources
+    are not scanned to infer it, and only the contract columns are
+    selected, so columnar formats read only those columns from disk.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        columns (Optional[List[str]]): Subset of the contract columns to
+            select. Default is every contract column.
+        options (Optional[Dict[str, str]]): Extra reader options, e.g.
+            {'delimiter': ';'} for CSV files.
+        paths (Optional[List[str]]): Read only these partition directories
+            of the table instead of the whole output path. Partition
+            columns are still discovered relative to the output path.
+        path (Optional[str]): Read from this path instead of
+            `output_table.path`.
+
+    Returns:
+        Dict[str, DataFrame]: A dictionary with the key 'dataframe'.
+
+    Raises:
+        HariContractError: If the contract is invalid, has no output path
+            or a requested column is not part of the contract.
+        ValueError: If the Spark session has not been configured.
+
+    Examples:
+        >>> read_contract_table('sales') # doctest: +SKIP
+        {'dataframe': DataFrame[sale_id: int, sale_date: date]}
+
+        >>> read_contract_table('sales', columns=['sale_id']) # doctest: +SKIP
+        {'dataframe': DataFrame[sale_id: int]}
+
+        >>> read_contract_table( # doctest: +SKIP
+        ...     'sales', paths=['/data/sales/sale_date=2025-08-01']
+        ... )
+        {'dataframe': DataFrame[sale_id: int, sale_date: date]}
+    """
+    spark = HariSparkSessionManager().get_spark_session()['spark_session']
+
+    contract_path = get_contract_path(contract_name, contracts_dir)[
+        'contract_path'
+    ]
+    compiled = compile_contract(contract_path)
+    output_table = compiled['contract'].get('output_table') or {}
+    schema = compiled['schema']
+
+    path = path or output_table.get('path')
+    if not path:
+        raise HariContractError(contract_path, 'Output table has no path')
+
+    table_format = str(output_table.get('format') or 'delta').lower()
+
+    selected = columns or schema.fieldNames()
+    unknown = [col for col in selected if col not in schema.fieldNames()]
+    if unknown:
+        raise HariContractError(
+            contract_path, f'Columns not in the contract: {unknown}'
+        )
+
+    reader = spark.read.format(table_format)
+    if table_format in SCHEMA_ON_READ_FORMATS:
+        reader = reader.schema(schema)
+
+    reader_options = dict(DEFAULT_FORMAT_OPTIONS.get(table_format, {}))
+    reader_options.update(options or {})
+    if paths:
+        reader_options.setdefault('basePath', path)
+    if reader_options:
+        reader = reader.options(**reader_options)
+
+    dataframe = reader.load(paths or path).select(*selected)
+    return {'dataframe': dataframe}
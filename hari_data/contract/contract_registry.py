@@ -0,0 +1,302 @@
+"""
+Module for looking up data contracts through a compiled on-disk index
+instead of parsing every contract file.
+"""
+
+import copy
+import json
+import os
+from threading import Lock
+from typing import Any, Dict, List, Optional
+
+from hari_data.utils.helpers import CONTRACTS_DIR, read_yaml_to_dict
+
+REGISTRY_INDEX_FILE = '.hari_index.json'
+
+# Bump when the layout of the index entries changes, so that old index
+# files are rebuilt instead of being read with missing keys.
+REGISTRY_INDEX_VERSION = 1
+
+# Registries shared by the lookups of a process, by contracts directory.
+_registries: Dict[str, 'HariContractRegistry'] = {}
+_registries_lock = Lock()
+
+
+def _normalize_path(path: Optional[str]) -> Optional[str]:
+    if not path:
+        return path
+    return str(path).rstrip('/') or '/'
+
+
+def _index_entry(file_path: str, stat: os.stat_result) -> Dict[str, Any]:
+    entry = {
+        'name': os.path.basename(file_path)[: -len('.yaml')],
+        'file': file_path,
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'table': None,
+        'path': None,
+        'format': None,
+        'partitioned_by': [],
+        'columns': [],
+        'sla': None,
+        'error': None,
+    }
+    try:
+        contract_data = read_yaml_to_dict(file_path)
+        output_table = contract_data.get('output_table') or {}
+        entry.update(
+            {
+                'name': contract_data.get('name') or entry['name'],
+                'table': output_table.get('name'),
+                'path': _normalize_path(output_table.get('path')),
+                'format': output_table.get('format'),
+                'partitioned_by': list(
+                    output_table.get('partitioned_by') or []
+                ),
+                'columns': [
+                    column.get('name')
+                    for column in output_table.get('columns') or []
+                    if isinstance(column, dict) and column.get('name')
+                ],
+                'sla': copy.deepcopy(contract_data.get('sla')),
+            }
+        )
+    except Exception as e:
+        # Broken contracts stay indexed with their error, so they are not
+        # parsed again until the file changes.
+        entry['error'] = str(e)
+    return entry
+
+
+class HariContractRegistry:
+    """
+    Registry of the contracts of a project backed by a JSON index.
+
+    The index keeps the name, output table, path, format, partition
+    columns, column names and SLA of every contract file, along with the
+    modification time and size of the file. On refresh, only the files
+    whose modification time or size changed are parsed again; deleted
+    files are dropped. The first lookup refreshes the index, and later
+    lookups are served from memory until `refresh()` is called again.
+    A name declared by several contract files is an error, instead of
+    one of the files being picked.
+
+    Examples:
+        >>> registry = HariContractRegistry('contracts') # doctest: +SKIP
+        >>> registry.find_contracts(column='customer_id') # doctest: +SKIP
+        {'contracts': [{'name': 'sales', 'table': 'sales', 'path': '/data/sales', ...}]}
+    """
+
+    def __init__(
+        self,
+        contracts_dir: str = CONTRACTS_DIR,
+        index_file: str = REGISTRY_INDEX_FILE,
+    ):
+        self._contracts_dir = contracts_dir
+        self._index_path = os.path.join(contracts_dir, index_file)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._by_name: Dict[str, Dict[str, Any]] = {}
+        self._duplicates: Dict[str, List[str]] = {}
+        self._lock = Lock()
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._index_path, 'r') as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if index.get('version') != REGISTRY_INDEX_VERSION:
+            return {}
+        return index.get('contracts') or {}
+
+    def _save_index(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        tmp_path = f'{self._index_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as file:
+            json.dump(
+                {'version': REGISTRY_INDEX_VERSION, 'contracts': entries},
+                file,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self._index_path)
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the contract files.
+
+        Returns:
+            Dict[str, int]: A dictionary with the keys 'parsed' (files
+                parsed again), 'removed' (files no longer present) and
+                'total' (contracts in the index).
+
+        Examples:
+            >>> HariContractRegistry('contracts').refresh() # doctest: +SKIP
+            {'parsed': 2, 'removed': 0, 'total': 3000}
+        """
+        with self._lock:
+            cached = (
+                self._entries
+                if self._entries is not None
+                else self._load_index()
+            )
+            entries = {}
+            parsed = 0
+
+            try:
+                files = list(os.scandir(self._contracts_dir))
+            except FileNotFoundError:
+                files = []
+
+            for item in files:
+                if not item.name.endswith('.yaml') or not item.is_file():
+                    continue
+                stat = item.stat()
+                entry = cached.get(item.name)
+                if (
+                    entry is None
+                    or entry.get('mtime_ns') != stat.st_mtime_ns
+                    or entry.get('size') != stat.st_size
+                ):
+                    entry = _index_entry(item.path, stat)
+                    parsed += 1
+                entries[item.name] = entry
+
+            removed = len(set(cached) - set(entries))
+            if (parsed or removed) and os.path.isdir(self._contracts_dir):
+                self._save_index(entries)
+
+            files_by_name: Dict[str, List[str]] = {}
+            for _, entry in sorted(entries.items()):
+                if not entry.get('error'):
+                    files_by_name.setdefault(entry['name'], []).append(
+                        entry['file']
+                    )
+            self._entries = entries
+            self._duplicates = {
+                name: files
+                for name, files in files_by_name.items()
+                if len(files) > 1
+            }
+            self._by_name = {
+                entry['name']: entry
+                for entry in entries.values()
+                if not entry.get('error')
+                and entry['name'] not in self._duplicates
+            }
+            return {
+                'parsed': parsed,
+                'removed': removed,
+                'total': len(entries),
+            }
+
+    def _ensure_loaded(self) -> None:
+        if self._entries is None:
+            self.refresh()
+
+    def list_contracts(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        List every indexed contract, including those that failed to parse.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: A dictionary with the key
+                'contracts', sorted by file name. Broken contracts have
+                their message under 'error'.
+
+        Examples:
+            >>> HariContractRegistry('contracts').list_contracts() # doctest: +SKIP
+            {'contracts': [{'name': 'sales', 'file': 'contracts/sales.yaml', ...}]}
+        """
+        self._ensure_loaded()
+        return {
+            'contracts': [entry for _, entry in sorted(self._entries.items())]
+        }
+
+    def get_contract(self, name: str) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get a contract by name.
+
+        Parameters:
+            name (str): The contract name.
+
+        Returns:
+            Dict[str, Optional[Dict[str, Any]]]: A dictionary with the key
+                'contract', or None under it if no contract has that name.
+
+        Raises:
+            ValueError: If several contract files declare that name.
+
+        Examples:
+            >>> HariContractRegistry('contracts').get_contract('sales') # doctest: +SKIP
+            {'contract': {'name': 'sales', 'file': 'contracts/sales.yaml', 'table': 'sales', ...}}
+        """
+        self._ensure_loaded()
+        if name in self._duplicates:
+            raise ValueError(
+                f"Contract '{name}' is declared by several files: "
+                f'{self._duplicates[name]}'
+            )
+        return {'contract': self._by_name.get(name)}
+
+    def find_contracts(
+        self,
+        table: Optional[str] = None,
+        path: Optional[str] = None,
+        column: Optional[str] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Find the contracts matching every given filter.
+
+        Parameters:
+            table (Optional[str]): The output table name.
+            path (Optional[str]): The output table path. Trailing slashes
+                are ignored.
+            column (Optional[str]): A column name of the output table.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: A dictionary with the key
+                'contracts', sorted by name.
+
+        Examples:
+            >>> HariContractRegistry('contracts').find_contracts(path='/data/sales/') # doctest: +SKIP
+            {'contracts': [{'name': 'sales', 'path': '/data/sales', ...}]}
+        """
+        self._ensure_loaded()
+        path = _normalize_path(path)
+        contracts = [
+            entry
+            for entry in self._entries.values()
+            if not entry.get('error')
+            and (table is None or entry['table'] == table)
+            and (path is None or entry['path'] == path)
+            and (column is None or column in entry['columns'])
+        ]
+        return {
+            'contracts': sorted(
+                contracts, key=lambda e: (e['name'], e['file'])
+            )
+        }
+
+
+def get_contract_registry(
+    contracts_dir: str = CONTRACTS_DIR,
+) -> HariContractRegistry:
+    """
+    Get the registry of a contracts directory shared by the process, so
+    its index is loaded once.
+
+    Parameters:
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+
+    Returns:
+        HariContractRegistry: The registry of the directory.
+
+    Examples:
+        >>> get_contract_registry('contracts').refresh() # doctest: +SKIP
+        {'parsed': 0, 'removed': 0, 'total': 3000}
+    """
+    key = os.path.abspath(contracts_dir)
+    with _registries_lock:
+        if key not in _registries:
+            _registries[key] = HariContractRegistry(contracts_dir)
+        return _registries[key]
@@ -0,0 +1,233 @@
+"""
+Module for compiling data contracts into Spark schemas.
+"""
+
+import copy
+import hashlib
+import os
+import re
+from threading import Lock
+from typing import Any, Dict, Tuple
+
+import yaml
+from pyspark.sql.types import (
+    BinaryType,
+    BooleanType,
+    ByteType,
+    DataType,
+    DateType,
+    DecimalType,
+    DoubleType,
+    FloatType,
+    IntegerType,
+    LongType,
+    ShortType,
+    StringType,
+    StructField,
+    StructType,
+    TimestampType,
+)
+
+from hari_data.exceptions import HariContractError
+from hari_data.utils.helpers import (
+    CONTRACTS_DIR,
+    YamlLoader,
+    get_contract_path,
+)
+
+# Spark has no TIME type, so 'time' and 'json' columns are kept as strings.
+SPARK_TYPES: Dict[str, type] = {
+    'string': StringType,
+    'boolean': BooleanType,
+    'byte': ByteType,
+    'short': ShortType,
+    'int': IntegerType,
+    'integer': IntegerType,
+    'bigint': LongType,
+    'long': LongType,
+    'float': FloatType,
+    'double': DoubleType,
+    'date': DateType,
+    'timestamp': TimestampType,
+    'binary': BinaryType,
+    'json': StringType,
+    'time': StringType,
+}
+
+_DECIMAL_PATTERN = re.compile(r'^decimal\s*\(\s*(\d+)\s*,\s*(\d+)\s*\)$')
+
+_contract_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+_contract_cache_lock: Lock = Lock()
+
+
+def get_column_type(column: Dict[str, Any], contract: str) -> DataType:
+    """
+    Convert the type of a contract column into a Spark data type.
+
+    Parameters:
+        column (Dict[str, Any]): The column definition of the contract.
+        contract (str): The contract name or path, used in error messages.
+
+    Returns:
+        DataType: The Spark data type of the column.
+
+    Raises:
+        HariContractError: If the column type is not supported.
+
+    Examples:
+        >>> get_column_type({'name': 'id', 'type': 'bigint'}, 'sales')
+        LongType()
+
+        >>> get_column_type(
+        ...     {'name': 'price', 'type': 'decimal', 'precision': 12, 'scale': 2},
+        ...     'sales',
+        ... )
+        DecimalType(12,2)
+
+        >>> get_column_type({'name': 'price', 'type': 'decimal(8, 3)'}, 'sales')
+        DecimalType(8,3)
+
+        >>> get_column_type({'name': 'id', 'type': 'uuid'}, 'sales')
+        Traceback (most recent call last):
+            ...
+        hari_data.exceptions.HariContractError: Unsupported type 'uuid' for column 'id': sales
+    """
+    column_type = str(column.get('type', '')).strip().lower()
+
+    if column_type == 'decimal':
+        return DecimalType(
+            precision=int(column.get('precision', 10)),
+            scale=int(column.get('scale', 0)),
+        )
+
+    decimal_match = _DECIMAL_PATTERN.match(column_type)
+    if decimal_match:
+        return DecimalType(
+            precision=int(decimal_match.group(1)),
+            scale=int(decimal_match.group(2)),
+        )
+
+    spark_type = SPARK_TYPES.get(column_type)
+    if spark_type is None:
+        raise HariContractError(
+            contract,
+            f"Unsupported type '{column_type}' for column "
+            f"'{column.get('name')}'",
+        )
+    return spark_type()
+
+
+def contract_to_schema(contract_data: Dict[str, Any]) -> Dict[str, StructType]:
+    """
+    Build the Spark schema of the output table described by a contract.
+
+    Parameters:
+        contract_data (Dict[str, Any]): The contract as returned by
+            `contract()` or read from its YAML file.
+
+    Returns:
+        Dict[str, StructType]: A dictionary with the key 'schema'.
+
+    Raises:
+        HariContractError: If the contract has no columns or a column is
+            invalid.
+
+    Examples:
+        >>> contract_to_schema({
+        ...     'name': 'sales',
+        ...     'output_table': {
+        ...         'columns': [
+        ...             {'name': 'id', 'type': 'int', 'is_nullable': False},
+        ...             {'name': 'city', 'type': 'string'},
+        ...         ]
+        ...     },
+        ... })
+        {'schema': StructType([StructField('id', IntegerType(), False), StructField('city', StringType(), True)])}
+    """
+    name = contract_data.get('name', '<unnamed>')
+    columns = (contract_data.get('output_table') or {}).get('columns') or []
+
+    if not columns:
+        raise HariContractError(name, 'Contract has no columns')
+
+    fields = []
+    for column in columns:
+        if not column.get('name'):
+            raise HariContractError(name, 'Contract column without a name')
+        fields.append(
+            StructField(
+                column['name'],
+                get_column_type(column, name),
+                nullable=bool(column.get('is_nullable', True)),
+            )
+        )
+
+    return {'schema': StructType(fields)}
+
+
+def compile_contract(contract_path: str) -> Dict[str, Any]:
+    """
+    Load a contract YAML file and compile its Spark schema.
+
+    The result is memoized by file path and content hash, so the YAML is
+    parsed and the schema built only once while the file is unchanged.
+
+    Parameters:
+        contract_path (str): The path to the contract YAML file.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'contract' (the contract
+            data) and 'schema' (the Spark StructType of the output table).
+
+    Raises:
+        HariContractError: If the file is missing or the contract is invalid.
+
+    Examples:
+        >>> compile_contract('contracts/sales.yaml') # doctest: +SKIP
+        {'contract': {...}, 'schema': StructType([...])}
+    """
+    try:
+        with open(contract_path, 'rb') as file:
+            content = file.read()
+    except OSError as e:
+        raise HariContractError(
+            contract_path, f'Contract file could not be read ({e})'
+        )
+
+    key = (
+        os.path.abspath(contract_path),
+        hashlib.sha256(content).hexdigest(),
+    )
+
+    with _contract_cache_lock:
+        cached = _contract_cache.get(key)
+
+    if cached is None:
+        try:
+            contract_data = yaml.load(content, Loader=YamlLoader) or {}
+        except yaml.YAMLError as e:
+            raise HariContractError(
+                contract_path, f'Invalid contract YAML ({e})'
+            )
+        cached = {
+            'contract': contract_data,
+            'schema': contract_to_schema(contract_data)['schema'],
+        }
+        with _contract_cache_lock:
+            _contract_cache[key] = cached
+
+    return {
+        'contract': copy.deepcopy(cached['contract']),
+        'schema': cached['schema'],
+    }
+
+
+def clear_contract_cache() -> None:
+    """
+    Remove every compiled contract from the in-process cache.
+
+    Examples:
+        >>> clear_contract_cache()
+    """
+    with _contract_cache_lock:
+        _contract_cache.clear()
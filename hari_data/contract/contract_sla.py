@@ -0,0 +1,295 @@
+"""
+Module for checking the freshness SLA of contract tables from filesystem
+metadata, without starting Spark or reading data.
+"""
+
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from hari_data.contract.contract_partitions import (
+    is_data_file,
+    is_local_path,
+    list_partitions,
+    to_local_path,
+)
+from hari_data.contract.contract_registry import (
+    HariContractRegistry,
+    get_contract_registry,
+)
+from hari_data.utils.helpers import (
+    CONTRACTS_DIR,
+    get_contract_path,
+    read_yaml_to_dict,
+)
+
+FREQUENCIES: Dict[str, timedelta] = {
+    'hourly': timedelta(hours=1),
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+    'monthly': timedelta(days=31),
+    'yearly': timedelta(days=366),
+}
+
+_UNITS: Dict[str, str] = {
+    'second': 'seconds',
+    'minute': 'minutes',
+    'hour': 'hours',
+    'day': 'days',
+    'week': 'weeks',
+}
+
+_DURATION = re.compile(
+    r'^(\d+(?:\.\d+)?)\s*(second|minute|hour|day|week)s?$', re.IGNORECASE
+)
+_CLOCK = re.compile(r'^(\d+):([0-5]\d)(?::([0-5]\d))?$')
+
+
+def parse_duration(value: str) -> timedelta:
+    """
+    Parse an SLA frequency or tolerance into a duration.
+
+    Accepted forms are the frequency names 'hourly', 'daily', 'weekly',
+    'monthly' (31 days) and 'yearly' (366 days), '<n> <unit>' with units
+    from seconds to weeks, and 'HH:MM[:SS]'.
+
+    Parameters:
+        value (str): The value to parse.
+
+    Returns:
+        timedelta: The parsed duration.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+
+    Examples:
+        >>> parse_duration('daily')
+        datetime.timedelta(days=1)
+        >>> parse_duration('30 minutes')
+        datetime.timedelta(seconds=1800)
+        >>> parse_duration('02:30:00')
+        datetime.timedelta(seconds=9000)
+    """
+    text = str(value).strip().lower()
+    if text in FREQUENCIES:
+        return FREQUENCIES[text]
+
+    match = _DURATION.match(text)
+    if match:
+        amount, unit = match.groups()
+        return timedelta(**{_UNITS[unit]: float(amount)})
+
+    match = _CLOCK.match(text)
+    if match:
+        hours, minutes, seconds = match.groups()
+        return timedelta(
+            hours=int(hours), minutes=int(minutes), seconds=int(seconds or 0)
+        )
+
+    raise ValueError(f"Invalid SLA duration '{value}'.")
+
+
+def latest_modification_time(
+    table_path: str, partitioned_by: Optional[List[str]] = None
+) -> Optional[float]:
+    """
+    Get the newest modification time of a table from the filesystem.
+
+    For partitioned tables, only the leaf partition directories are
+    stat'ed: adding or replacing a file updates the modification time of
+    its directory. For unpartitioned tables, the data files are stat'ed.
+
+    Parameters:
+        table_path (str): The local path of the table.
+        partitioned_by (Optional[List[str]]): The partition columns.
+
+    Returns:
+        Optional[float]: The newest modification time as a POSIX
+            timestamp, or None if the table has no partitions or files.
+
+    Raises:
+        OSError: If a partition or file cannot be stat'ed.
+
+    Examples:
+        >>> latest_modification_time('/data/sales', ['sale_date']) # doctest: +SKIP
+        1754063400.0
+    """
+    if partitioned_by:
+        partitions = list_partitions(table_path, partitioned_by)['partitions']
+        mtimes = [os.stat(p['path']).st_mtime for p in partitions]
+    else:
+        try:
+            entries = list(os.scandir(to_local_path(table_path)))
+        except FileNotFoundError:
+            return None
+        mtimes = [
+            entry.stat().st_mtime
+            for entry in entries
+            if entry.is_file() and is_data_file(entry.name)
+        ]
+    return max(mtimes, default=None)
+
+
+def check_contract_sla(
+    contract_name: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    now: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Check the freshness of a contract table against its SLA.
+
+    A table is fresh when its newest modification is more recent than
+    `sla.frequency` plus `sla.tolerance`.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        now (Optional[float]): The reference POSIX timestamp. Default is
+            the current time.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'contract', 'path',
+            'status', 'last_modified', 'age', 'max_age' and 'message'.
+            'status' is one of 'fresh', 'stale', 'missing' (no data),
+            'skipped' (no SLA or not a local path) or 'error'.
+
+    Examples:
+        >>> check_contract_sla('sales') # doctest: +SKIP
+        {'contract': 'sales', 'path': '/data/sales', 'status': 'fresh', 'last_modified': datetime.datetime(2025, 8, 1, 6, 0), 'age': datetime.timedelta(seconds=7200), 'max_age': datetime.timedelta(days=1, seconds=3600), 'message': ''}
+    """
+    registry = get_contract_registry(contracts_dir)
+    registry.refresh()
+    return _check_contract_sla(contract_name, contracts_dir, now, registry)
+
+
+def _check_contract_sla(
+    contract_name: str,
+    contracts_dir: str,
+    now: Optional[float],
+    registry: HariContractRegistry,
+) -> Dict[str, Any]:
+    now = time.time() if now is None else now
+    result = {
+        'contract': contract_name,
+        'path': None,
+        'status': 'error',
+        'last_modified': None,
+        'age': None,
+        'max_age': None,
+        'message': '',
+    }
+
+    try:
+        contract = None
+        if not contract_name.endswith(('.yaml', '.yml')):
+            contract = registry.get_contract(contract_name)['contract']
+        if contract is None:
+            contract_path = get_contract_path(contract_name, contracts_dir)[
+                'contract_path'
+            ]
+            contract_data = read_yaml_to_dict(contract_path)
+            output_table = contract_data.get('output_table') or {}
+            contract = {
+                'path': output_table.get('path'),
+                'partitioned_by': output_table.get('partitioned_by') or [],
+                'sla': contract_data.get('sla'),
+            }
+        sla = contract['sla'] or {}
+        result['path'] = contract['path']
+
+        if not sla.get('frequency'):
+            result['status'] = 'skipped'
+            result['message'] = 'Contract has no SLA'
+            return result
+
+        max_age = parse_duration(sla['frequency'])
+        if sla.get('tolerance'):
+            max_age += parse_duration(sla['tolerance'])
+        result['max_age'] = max_age
+    except Exception as e:
+        result['message'] = str(e)
+        return result
+
+    if not result['path'] or not is_local_path(result['path']):
+        result['status'] = 'skipped'
+        result['message'] = 'Output table is not a local path'
+        return result
+
+    try:
+        mtime = latest_modification_time(
+            result['path'], contract['partitioned_by']
+        )
+    except OSError as e:
+        # e.g. a partition removed while it is scanned or not readable.
+        result['message'] = str(e)
+        return result
+    if mtime is None:
+        result['status'] = 'missing'
+        result['message'] = 'Output table has no data'
+        return result
+
+    result['last_modified'] = datetime.fromtimestamp(mtime)
+    result['age'] = timedelta(seconds=max(0.0, now - mtime))
+    result['status'] = 'fresh' if result['age'] <= max_age else 'stale'
+    return result
+
+
+def check_contracts_sla(
+    contract_names: Optional[List[str]] = None,
+    contracts_dir: str = CONTRACTS_DIR,
+    max_workers: Optional[int] = None,
+    now: Optional[float] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Check the freshness SLA of many contracts concurrently.
+
+    The SLA, path and partition columns of the contracts come from the
+    contract registry index, which is refreshed once, so only the
+    contract files changed since the last check are parsed.
+
+    The checks only stat files, so they run in a thread pool.
+
+    Parameters:
+        contract_names (Optional[List[str]]): The contracts to check.
+            Default is every '.yaml' file in `contracts_dir`.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        max_workers (Optional[int]): Number of threads. Default is the
+            ThreadPoolExecutor default.
+        now (Optional[float]): The reference POSIX timestamp. Default is
+            the current time.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: A dictionary with the key
+            'results', the result of `check_contract_sla()` for each
+            contract, in order. Empty when `contract_names` is not given
+            and `contracts_dir` does not exist.
+
+    Examples:
+        >>> check_contracts_sla(['sales', 'customers']) # doctest: +SKIP
+        {'results': [{'contract': 'sales', 'status': 'fresh', ...}, {'contract': 'customers', 'status': 'stale', ...}]}
+    """
+    now = time.time() if now is None else now
+    registry = get_contract_registry(contracts_dir)
+    registry.refresh()
+    if contract_names is None:
+        contract_names = [
+            os.path.basename(contract['file'])[: -len('.yaml')]
+            for contract in registry.list_contracts()['contracts']
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(
+            executor.map(
+                lambda name: _check_contract_sla(
+                    name, contracts_dir, now, registry
+                ),
+                contract_names,
+            )
+        )
+    return {'results': results}
@@ -0,0 +1,573 @@
+"""
+Module for validating DataFrames against data contracts.
+"""
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from pyspark.sql import Column, DataFrame
+from pyspark.sql import functions as F
+
+from hari_data.contract.contract_parquet import (
+    list_parquet_files,
+    read_parquet_footers,
+    summarize_parquet_statistics,
+)
+from hari_data.contract.contract_partitions import (
+    is_local_path,
+    list_partitions,
+    partition_fingerprint,
+)
+from hari_data.contract.contract_reader import read_contract_table
+from hari_data.contract.contract_schema import (
+    CONTRACTS_DIR,
+    compile_contract,
+    get_contract_path,
+)
+
+_ROW_COUNT = '__hari_row_count'
+
+VALIDATION_MODES = ('exact', 'approx')
+
+VALIDATION_STATE_FILE = 'hari.state.json'
+
+
+def _column(name: str) -> Column:
+    return F.col('`{}`'.format(name.replace('`', '``')))
+
+
+def _column_report(
+    column: Dict[str, Any], exists: bool = True
+) -> Dict[str, Any]:
+    return {
+        'name': column['name'],
+        'exists': exists,
+        'is_nullable': bool(column.get('is_nullable', True)),
+        'is_unique': bool(column.get('is_unique', False)),
+        'null_count': None,
+        'distinct_count': None,
+        'uniqueness_check': None,
+        'min': None,
+        'max': None,
+        'nullable_passed': exists,
+        'unique_passed': exists,
+        'range_passed': exists,
+        'passed': exists,
+        'source': 'scan',
+    }
+
+
+def _has_range(column: Dict[str, Any]) -> bool:
+    return (
+        column.get('min_value') is not None
+        or column.get('max_value') is not None
+    )
+
+
+def _range_passed(
+    column: Dict[str, Any], minimum: Any, maximum: Any
+) -> Optional[bool]:
+    """
+    Check observed bounds against the 'min_value'/'max_value' of a column.
+    Returns None when the values cannot be compared.
+    """
+    try:
+        if column.get('min_value') is not None and minimum is not None:
+            if minimum < column['min_value']:
+                return False
+        if column.get('max_value') is not None and maximum is not None:
+            if maximum > column['max_value']:
+                return False
+    except TypeError:
+        return None
+    return True
+
+
+def _validate_mode(mode: str, rsd: float) -> None:
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            f"Unsupported validation mode '{mode}'. "
+            f'Supported modes: {list(VALIDATION_MODES)}.'
+        )
+    if not 0 < rsd <= 0.39:
+        raise ValueError('rsd must be greater than 0 and at most 0.39.')
+
+
+def validate_dataframe(
+    dataframe: DataFrame,
+    contract_data: Dict[str, Any],
+    mode: str = 'exact',
+    rsd: float = 0.01,
+) -> Dict[str, Any]:
+    """
+    Validate the nullability, uniqueness and range rules of a contract.
+
+    Range rules are the optional 'min_value' and 'max_value' keys of a
+    column. Every null count, distinct count and min/max is computed in a
+    single aggregation, so the whole contract is checked with one Spark
+    job instead of one action per column.
+
+    In 'approx' mode the distinct counts are HyperLogLog estimates from
+    `approx_count_distinct`, which avoid the shuffle of an exact
+    `count(distinct)`. A unique column passes when its estimate is within
+    the relative error `rsd` of its non-null row count; the remaining
+    unique columns are escalated to an exact count, all of them in one
+    extra aggregation.
+
+    Parameters:
+        dataframe (DataFrame): The data to validate.
+        contract_data (Dict[str, Any]): The contract, as returned by
+            `compile_contract()['contract']`.
+        mode (str): 'exact' or 'approx'. Default is 'exact'.
+        rsd (float): Maximum relative standard deviation of the estimates
+            in 'approx' mode. Default is 0.01.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'passed', 'row_count' and
+            'columns', a list with one report per contract column.
+
+    Raises:
+        ValueError: If the mode is not supported or rsd is out of range.
+
+    Examples:
+        >>> validate_dataframe(df, contract_data) # doctest: +SKIP
+        {
+            'passed': False,
+            'row_count': 3,
+            'columns': [
+                {
+                    'name': 'sale_id',
+                    'exists': True,
+                    'is_nullable': False,
+                    'is_unique': True,
+                    'null_count': 0,
+                    'distinct_count': 2,
+                    'uniqueness_check': 'exact',
+                    'min': None,
+                    'max': None,
+                    'nullable_passed': True,
+                    'unique_passed': False,
+                    'range_passed': True,
+                    'passed': False,
+                    'source': 'scan',
+                },
+            ],
+        }
+
+        >>> validate_dataframe(df, contract_data, mode='approx') # doctest: +SKIP
+        {'passed': True, 'row_count': 1000000000, 'columns': [...]}
+    """
+    _validate_mode(mode, rsd)
+
+    columns: List[Dict[str, Any]] = (
+        contract_data.get('output_table') or {}
+    ).get('columns') or []
+
+    reports: List[Dict[str, Any]] = []
+    checked: List[Tuple[int, Dict[str, Any]]] = []
+    expressions: List[Column] = [F.count(F.lit(1)).alias(_ROW_COUNT)]
+
+    for index, column in enumerate(columns):
+        if column['name'] not in dataframe.columns:
+            reports.append(_column_report(column, exists=False))
+            continue
+
+        report = _column_report(column)
+        reports.append(report)
+        checked.append((index, report))
+        expressions.append(
+            F.count(F.when(_column(column['name']).isNull(), 1)).alias(
+                f'__hari_nulls_{index}'
+            )
+        )
+        if report['is_unique']:
+            if mode == 'approx':
+                distinct = F.approx_count_distinct(
+                    _column(column['name']), rsd
+                )
+            else:
+                distinct = F.countDistinct(_column(column['name']))
+            expressions.append(distinct.alias(f'__hari_distinct_{index}'))
+        if _has_range(column):
+            expressions.append(
+                F.min(_column(column['name'])).alias(f'__hari_min_{index}')
+            )
+            expressions.append(
+                F.max(_column(column['name'])).alias(f'__hari_max_{index}')
+            )
+
+    metrics = dataframe.agg(*expressions).collect()[0].asDict()
+    row_count = metrics[_ROW_COUNT]
+    suspicious: List[Tuple[int, Dict[str, Any]]] = []
+
+    for index, report in checked:
+        report['null_count'] = metrics[f'__hari_nulls_{index}']
+        report['nullable_passed'] = (
+            report['is_nullable'] or report['null_count'] == 0
+        )
+
+        column = columns[index]
+        if _has_range(column):
+            report['min'] = metrics[f'__hari_min_{index}']
+            report['max'] = metrics[f'__hari_max_{index}']
+            report['range_passed'] = bool(
+                _range_passed(column, report['min'], report['max'])
+            )
+
+        if not report['is_unique']:
+            continue
+
+        non_null_count = row_count - report['null_count']
+        report['distinct_count'] = metrics[f'__hari_distinct_{index}']
+
+        if mode == 'exact':
+            report['uniqueness_check'] = 'exact'
+            report['unique_passed'] = (
+                report['distinct_count'] == non_null_count
+            )
+        elif report['distinct_count'] >= non_null_count * (1 - rsd):
+            report['uniqueness_check'] = 'approx'
+            report['unique_passed'] = True
+        else:
+            suspicious.append((index, report))
+
+    if suspicious:
+        exact_metrics = (
+            dataframe.agg(
+                *[
+                    F.countDistinct(_column(report['name'])).alias(
+                        f'__hari_distinct_{index}'
+                    )
+                    for index, report in suspicious
+                ]
+            )
+            .collect()[0]
+            .asDict()
+        )
+        for index, report in suspicious:
+            report['uniqueness_check'] = 'exact'
+            report['distinct_count'] = exact_metrics[
+                f'__hari_distinct_{index}'
+            ]
+            report['unique_passed'] = (
+                report['distinct_count'] == row_count - report['null_count']
+            )
+
+    for _, report in checked:
+        report['passed'] = (
+            report['nullable_passed']
+            and report['unique_passed']
+            and report['range_passed']
+        )
+
+    return {
+        'passed': all(report['passed'] for report in reports),
+        'row_count': row_count,
+        'columns': reports,
+    }
+
+
+def validate_contract_table(
+    contract_name: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    mode: str = 'exact',
+    rsd: float = 0.01,
+) -> Dict[str, Any]:
+    """
+    Read the output table of a contract and validate it.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        mode (str): 'exact' or 'approx'. Default is 'exact'.
+        rsd (float): Maximum relative standard deviation of the estimates
+            in 'approx' mode. Default is 0.01.
+
+    Returns:
+        Dict[str, Any]: The report returned by `validate_dataframe()`.
+
+    Examples:
+        >>> validate_contract_table('sales') # doctest: +SKIP
+        {'passed': True, 'row_count': 1000, 'columns': [...]}
+    """
+    contract_path = get_contract_path(contract_name, contracts_dir)[
+        'contract_path'
+    ]
+    contract_data = compile_contract(contract_path)['contract']
+    dataframe = read_contract_table(contract_path)['dataframe']
+    return validate_dataframe(dataframe, contract_data, mode=mode, rsd=rsd)
+
+
+def validate_contract_metadata(
+    contract_name: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    mode: str = 'exact',
+    rsd: float = 0.01,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Validate a Parquet contract table from its footer statistics.
+
+    The footers of every file are read in parallel and their row-group
+    statistics answer the row count, the nullability rules and the
+    'min_value'/'max_value' rules without reading any data page. Only the
+    columns whose statistics are missing or inconclusive, and the
+    `is_unique` columns, are validated with a data scan that selects just
+    those columns.
+
+    Tables that are not local Parquet tables, or environments without
+    pyarrow, are validated with a full scan.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        mode (str): 'exact' or 'approx', used by the data scan. Default is
+            'exact'.
+        rsd (float): Maximum relative standard deviation of the estimates
+            in 'approx' mode. Default is 0.01.
+        max_workers (Optional[int]): Number of threads reading footers.
+
+    Returns:
+        Dict[str, Any]: The report returned by `validate_dataframe()`. The
+            'source' of each column report is 'metadata' or 'scan'.
+
+    Examples:
+        >>> validate_contract_metadata('sales') # doctest: +SKIP
+        {'passed': True, 'row_count': 1000000, 'columns': [{'name': 'sale_id', ..., 'source': 'scan'}, {'name': 'city', ..., 'source': 'metadata'}]}
+    """
+    _validate_mode(mode, rsd)
+
+    contract_path = get_contract_path(contract_name, contracts_dir)[
+        'contract_path'
+    ]
+    contract_data = compile_contract(contract_path)['contract']
+    output_table = contract_data.get('output_table') or {}
+    table_path = output_table.get('path') or ''
+    table_format = str(output_table.get('format') or '').lower()
+
+    if table_format != 'parquet' or not is_local_path(table_path):
+        return validate_contract_table(contract_path, mode=mode, rsd=rsd)
+
+    try:
+        files = list_parquet_files(table_path)['files']
+        footers = read_parquet_footers(files, max_workers)['footers']
+    except ImportError:
+        return validate_contract_table(contract_path, mode=mode, rsd=rsd)
+
+    columns = output_table.get('columns') or []
+    summary = summarize_parquet_statistics(
+        files,
+        footers,
+        [column['name'] for column in columns],
+        table_path,
+        output_table.get('partitioned_by'),
+    )
+
+    reports: Dict[str, Dict[str, Any]] = {}
+    pending: List[Dict[str, Any]] = []
+
+    for column in columns:
+        stats = summary['columns'][column['name']]
+        range_passed = True
+        if _has_range(column):
+            range_passed = (
+                _range_passed(column, stats['min'], stats['max'])
+                if stats['min_max_complete']
+                else None
+            )
+
+        if (
+            column.get('is_unique')
+            or not stats['nulls_complete']
+            or range_passed is None
+        ):
+            pending.append(column)
+            continue
+
+        report = _column_report(column)
+        report['source'] = 'metadata'
+        report['null_count'] = stats['null_count']
+        report['nullable_passed'] = (
+            report['is_nullable'] or report['null_count'] == 0
+        )
+        if _has_range(column):
+            report['min'] = stats['min']
+            report['max'] = stats['max']
+        report['range_passed'] = range_passed
+        report['passed'] = report['nullable_passed'] and range_passed
+        reports[column['name']] = report
+
+    if pending:
+        dataframe = read_contract_table(
+            contract_path, columns=[column['name'] for column in pending]
+        )['dataframe']
+        scan_contract = dict(contract_data)
+        scan_contract['output_table'] = dict(output_table, columns=pending)
+        scan_report = validate_dataframe(dataframe, scan_contract, mode, rsd)
+        for report in scan_report['columns']:
+            reports[report['name']] = report
+
+    ordered = [reports[column['name']] for column in columns]
+    return {
+        'passed': all(report['passed'] for report in ordered),
+        'row_count': summary['row_count'],
+        'columns': ordered,
+    }
+
+
+def load_validation_state(state_path: str) -> Dict[str, Any]:
+    """
+    Load the incremental validation state of a project.
+
+    Parameters:
+        state_path (str): The path to the state file.
+
+    Returns:
+        Dict[str, Any]: The state, with one entry per contract under the key
+            'contracts'. An empty state is returned if the file is missing.
+
+    Examples:
+        >>> load_validation_state('hari.state.json') # doctest: +SKIP
+        {'contracts': {'sales': {'path': '/data/sales', 'validated_at': '...', 'partitions': {...}}}}
+    """
+    if not os.path.exists(state_path):
+        return {'contracts': {}}
+    with open(state_path, 'r') as file:
+        state = json.load(file)
+    state.setdefault('contracts', {})
+    return state
+
+
+def save_validation_state(state_path: str, state: Dict[str, Any]) -> None:
+    """
+    Save the incremental validation state of a project.
+
+    The file is written next to it first and then renamed, so an
+    interrupted run never leaves a truncated state behind.
+
+    Parameters:
+        state_path (str): The path to the state file.
+        state (Dict[str, Any]): The state to save.
+
+    Examples:
+        >>> save_validation_state('hari.state.json', {'contracts': {}}) # doctest: +SKIP
+    """
+    tmp_path = f'{state_path}.tmp'
+    with open(tmp_path, 'w') as file:
+        json.dump(state, file, indent=2, sort_keys=True)
+    os.replace(tmp_path, state_path)
+
+
+def validate_contract_incremental(
+    contract_name: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    state_path: str = VALIDATION_STATE_FILE,
+    mode: str = 'exact',
+    rsd: float = 0.01,
+) -> Dict[str, Any]:
+    """
+    Validate only the partitions written since the last successful
+    validation of a contract.
+
+    Each partition directory under the output path is fingerprinted from
+    the names, sizes and modification times of its files. Partitions whose
+    fingerprint matches the state file are skipped and the others are read
+    and validated together. The state is updated only when the validation
+    passes, so failing partitions are checked again on the next run.
+
+    Uniqueness is checked within the validated partitions only. Contracts
+    without `partitioned_by` or with a non-local output path are validated
+    in full.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        state_path (str): The path to the state file. Default is
+            'hari.state.json', next to the project 'hari.lock'.
+        mode (str): 'exact' or 'approx'. Default is 'exact'.
+        rsd (float): Maximum relative standard deviation of the estimates
+            in 'approx' mode. Default is 0.01.
+
+    Returns:
+        Dict[str, Any]: The report returned by `validate_dataframe()` with
+            the extra keys 'incremental', 'partitions_validated' and
+            'partitions_skipped'.
+
+    Examples:
+        >>> validate_contract_incremental('sales') # doctest: +SKIP
+        {
+            'passed': True,
+            'row_count': 1200,
+            'columns': [...],
+            'incremental': True,
+            'partitions_validated': ['sale_date=2025-08-03'],
+            'partitions_skipped': 730,
+        }
+    """
+    contract_path = get_contract_path(contract_name, contracts_dir)[
+        'contract_path'
+    ]
+    contract_data = compile_contract(contract_path)['contract']
+    output_table = contract_data.get('output_table') or {}
+    table_path = output_table.get('path') or ''
+    partitioned_by = output_table.get('partitioned_by') or []
+
+    if not partitioned_by or not is_local_path(table_path):
+        report = validate_contract_table(contract_path, mode=mode, rsd=rsd)
+        report['incremental'] = False
+        report['partitions_validated'] = []
+        report['partitions_skipped'] = 0
+        return report
+
+    partitions = list_partitions(table_path, partitioned_by)['partitions']
+    fingerprints = {
+        partition['name']: partition_fingerprint(partition['path'])[
+            'fingerprint'
+        ]
+        for partition in partitions
+    }
+
+    state = load_validation_state(state_path)
+    state_key = contract_data.get('name') or contract_path
+    contract_state = state['contracts'].get(state_key, {})
+    if contract_state.get('path') != table_path:
+        contract_state = {}
+    known = contract_state.get('partitions', {})
+
+    changed = [
+        partition
+        for partition in partitions
+        if known.get(partition['name']) != fingerprints[partition['name']]
+    ]
+
+    if changed:
+        dataframe = read_contract_table(
+            contract_path, paths=[partition['path'] for partition in changed]
+        )['dataframe']
+        report = validate_dataframe(dataframe, contract_data, mode, rsd)
+    else:
+        report = {'passed': True, 'row_count': 0, 'columns': []}
+
+    report['incremental'] = True
+    report['partitions_validated'] = [
+        partition['name'] for partition in changed
+    ]
+    report['partitions_skipped'] = len(partitions) - len(changed)
+
+    if report['passed']:
+        state['contracts'][state_key] = {
+            'path': table_path,
+            'validated_at': datetime.now().isoformat(timespec='seconds'),
+            'partitions': fingerprints,
+        }
+        save_validation_state(state_path, state)
+
+    return report
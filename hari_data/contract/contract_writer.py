@@ -0,0 +1,404 @@
+"""
+Module for writing DataFrames to the output table of a data contract.
+"""
+
+import math
+import os
+import shutil
+from functools import reduce
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+
+from pyspark.errors import AnalysisException
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql import functions as F
+from pyspark.sql.utils import is_remote
+
+from hari_data.contract.contract_partitions import (
+    is_local_path,
+    list_partitions,
+    recover_directory,
+    sibling_path,
+    swap_directories,
+    to_local_path,
+)
+from hari_data.contract.contract_reader import (
+    DEFAULT_FORMAT_OPTIONS,
+    SCHEMA_ON_READ_FORMATS,
+    read_contract_table,
+)
+from hari_data.contract.contract_schema import (
+    CONTRACTS_DIR,
+    compile_contract,
+    get_contract_path,
+)
+from hari_data.exceptions import HariContractError
+
+DEFAULT_TARGET_FILE_SIZE_MB = 128
+
+LOAD_STRATEGIES = ('append', 'overwrite', 'upsert')
+
+# Unpartitioned upserts are written here, next to the table, before being
+# swapped in. The '_' prefix keeps Spark from reading it as table data.
+UPSERT_PREFIX = '_hari_upsert_'
+
+# Spark reports Long.MaxValue when it cannot estimate the size of a plan.
+_UNKNOWN_SIZE = 2**63 - 1
+
+
+def estimate_dataframe_size(dataframe: DataFrame) -> Dict[str, Optional[int]]:
+    """
+    Estimate the size of a DataFrame and of its rows from the statistics
+    of its optimized plan, without running a Spark job.
+
+    The row size is the plan size divided by its row count when Spark
+    knows the row count, and otherwise the default size of the schema,
+    an uncompressed width that Spark also uses for its own estimates.
+
+    Parameters:
+        dataframe (DataFrame): The DataFrame to estimate.
+
+    Returns:
+        Dict[str, Optional[int]]: A dictionary with the keys
+            'size_in_bytes' and 'row_size_in_bytes', or None when Spark
+            has no estimate, e.g. for the size of DataFrames created from
+            Python objects, or with Spark Connect, whose DataFrames have no
+            JVM plan.
+
+    Examples:
+        >>> estimate_dataframe_size(spark.read.parquet('/data/sales')) # doctest: +SKIP
+        {'size_in_bytes': 734003200, 'row_size_in_bytes': 48}
+    """
+    if is_remote():
+        return {'size_in_bytes': None, 'row_size_in_bytes': None}
+    stats = dataframe._jdf.queryExecution().optimizedPlan().stats()
+    size = int(str(stats.sizeInBytes()))
+    if size >= _UNKNOWN_SIZE:
+        size = None
+
+    row_count = stats.rowCount()
+    rows = int(str(row_count.get())) if row_count.isDefined() else 0
+    if size is not None and rows > 0:
+        row_size = max(1, math.ceil(size / rows))
+    else:
+        row_size = int(dataframe._jdf.schema().defaultSize())
+    return {'size_in_bytes': size, 'row_size_in_bytes': row_size}
+
+
+def _partitions_filter(
+    partition_values: List[Dict[str, Any]]
+) -> Optional[Column]:
+    conditions = [
+        reduce(
+            lambda left, right: left & right,
+            [F.col(col).eqNullSafe(value) for col, value in values.items()],
+        )
+        for values in partition_values
+    ]
+    if not conditions:
+        return None
+    return reduce(lambda left, right: left | right, conditions)
+
+
+def _table_exists(spark: SparkSession, path: str) -> bool:
+    """
+    Check if a table path exists, on the local filesystem or through the
+    Hadoop FileSystem of the session. Reads are lazy with Spark Connect,
+    so a missing table cannot be detected by reading it.
+    """
+    if is_local_path(path):
+        return os.path.exists(to_local_path(path))
+    if is_remote():
+        # Spark Connect sessions have no JVM on the client: resolving the
+        # schema of a read on the server fails when the path is missing.
+        try:
+            spark.read.format('binaryFile').load(path).schema
+        except AnalysisException:
+            return False
+        return True
+    hadoop_path = spark._jvm.org.apache.hadoop.fs.Path(path)
+    file_system = hadoop_path.getFileSystem(spark._jsc.hadoopConfiguration())
+    return bool(file_system.exists(hadoop_path))
+
+
+def _upsert_dataframe(
+    dataframe: DataFrame,
+    contract_path: str,
+    path: str,
+    keys: List[str],
+    partitioned_by: List[str],
+) -> Optional[Dict[str, Any]]:
+    """
+    Merge new rows with the existing rows of the partitions they touch,
+    and of the partitions that hold their keys. Returns None when the
+    table does not exist yet, otherwise a dictionary with the keys
+    'dataframe' and 'emptied' (the values of the partitions left without
+    rows, which dynamic partition overwrite does not remove).
+    """
+    if not _table_exists(dataframe.sparkSession, path):
+        return None
+    existing = read_contract_table(contract_path, path=path)['dataframe']
+    new_keys = dataframe.select(*keys).distinct()
+
+    moved_from: List[Dict[str, Any]] = []
+    emptied: List[Dict[str, Any]] = []
+    if partitioned_by:
+        # A key whose partition values change must also be removed from
+        # the partition that holds it, so the partitions holding the new
+        # keys are merged too. Only the key and partition columns of the
+        # table are read to find them.
+        new_partitions = [
+            row.asDict()
+            for row in dataframe.select(*partitioned_by).distinct().collect()
+        ]
+        moved_from = [
+            row.asDict()
+            for row in existing.join(new_keys, on=keys, how='left_semi')
+            .select(*partitioned_by)
+            .distinct()
+            .collect()
+            if row.asDict() not in new_partitions
+        ]
+        condition = _partitions_filter(new_partitions + moved_from)
+        if condition is None:
+            return {'dataframe': dataframe, 'emptied': []}
+        existing = existing.where(condition)
+
+    kept = existing.join(new_keys, on=keys, how='left_anti')
+
+    if moved_from:
+        remaining = [
+            row.asDict()
+            for row in kept.where(_partitions_filter(moved_from))
+            .select(*partitioned_by)
+            .distinct()
+            .collect()
+        ]
+        emptied = [v for v in moved_from if v not in remaining]
+
+    return {'dataframe': kept.unionByName(dataframe), 'emptied': emptied}
+
+
+def _remove_partitions(
+    table_path: str,
+    partitioned_by: List[str],
+    partition_values: List[Dict[str, Any]],
+) -> None:
+    names = [
+        {
+            col: '__HIVE_DEFAULT_PARTITION__' if value is None else str(value)
+            for col, value in values.items()
+        }
+        for values in partition_values
+    ]
+    for partition in list_partitions(table_path, partitioned_by)['partitions']:
+        values = {
+            col: unquote(value) for col, value in partition['values'].items()
+        }
+        if values in names:
+            shutil.rmtree(partition['path'])
+
+
+def write_contract_table(
+    dataframe: DataFrame,
+    contract_name: str,
+    contracts_dir: str = CONTRACTS_DIR,
+    load_strategy: str = 'append',
+    target_file_size_mb: int = DEFAULT_TARGET_FILE_SIZE_MB,
+    num_partitions: Optional[int] = None,
+    path: Optional[str] = None,
+    options: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Write a DataFrame to the output table of a contract.
+
+    The contract columns are selected in contract order and the data is
+    written to `output_table.path` in `output_table.format`, partitioned
+    by `output_table.partitioned_by`. Before writing, the data is
+    repartitioned by the partition columns into a number of tasks
+    estimated from the plan size and the target file size, so each table
+    partition is written by a single task instead of by every input task.
+    That task splits its files with `maxRecordsPerFile`, set from the
+    target file size and the estimated row size.
+
+    Load strategies:
+
+    - 'append' adds the rows to the table.
+    - 'overwrite' uses dynamic partition overwrite: only the partitions
+      present in the new data are replaced. Unpartitioned tables are
+      replaced entirely.
+    - 'upsert' merges on the `is_unique` columns of the contract. Only
+      the partitions touched by the new data, and the partitions that
+      already hold its keys, are merged: their rows whose keys appear in
+      the new data are replaced, and those partitions are rewritten with
+      dynamic partition overwrite, so a key whose partition values change
+      moves to its new partition. Finding those partitions reads the key
+      and partition columns of the whole table. A partition left without
+      rows is removed, which requires a local table in a file format.
+      Unpartitioned tables are merged in full; file formats are
+      written to a staging directory next to the table and swapped in,
+      so a failed write leaves the table as it was, which requires a
+      local path; a swap interrupted by a crash is recovered by the next
+      upsert. Transactional formats, e.g. Delta, are overwritten in
+      place.
+
+    Parameters:
+        dataframe (DataFrame): The data to write.
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+        load_strategy (str): 'append', 'overwrite' or 'upsert'. Default is
+            'append'.
+        target_file_size_mb (int): Target size of each output file, in MB.
+            Default is 128.
+        num_partitions (Optional[int]): Number of write tasks. Default is
+            estimated from `target_file_size_mb`; when Spark has no size
+            estimate, `spark.sql.shuffle.partitions` is used.
+        path (Optional[str]): Write to this path instead of
+            `output_table.path`.
+        options (Optional[Dict[str, str]]): Extra writer options, e.g.
+            {'compression': 'zstd'}.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'path' and
+            'num_partitions'.
+
+    Raises:
+        HariContractError: If the contract has no output path, the
+            DataFrame lacks contract columns, an upsert is requested for a
+            contract without `is_unique` columns, an unpartitioned table
+            in a file format is upserted on a non-local path, or an upsert
+            empties a partition it cannot remove.
+        ValueError: If the load strategy is not supported.
+
+    Examples:
+        >>> write_contract_table(df, 'sales') # doctest: +SKIP
+        {'path': '/data/sales', 'num_partitions': 6}
+
+        >>> write_contract_table(df, 'sales', load_strategy='upsert') # doctest: +SKIP
+        {'path': '/data/sales', 'num_partitions': 1}
+    """
+    if load_strategy not in LOAD_STRATEGIES:
+        raise ValueError(
+            f"Unsupported load strategy '{load_strategy}'. "
+            f'Supported strategies: {list(LOAD_STRATEGIES)}.'
+        )
+
+    contract_path = get_contract_path(contract_name, contracts_dir)[
+        'contract_path'
+    ]
+    compiled = compile_contract(contract_path)
+    output_table = compiled['contract'].get('output_table') or {}
+    columns = compiled['schema'].fieldNames()
+    partitioned_by = output_table.get('partitioned_by') or []
+
+    path = path or output_table.get('path')
+    if not path:
+        raise HariContractError(contract_path, 'Output table has no path')
+
+    missing = [col for col in columns if col not in dataframe.columns]
+    if missing:
+        raise HariContractError(
+            contract_path, f'Columns missing from the DataFrame: {missing}'
+        )
+
+    unknown = [col for col in partitioned_by if col not in columns]
+    if unknown:
+        raise HariContractError(
+            contract_path, f'Partition columns not in the contract: {unknown}'
+        )
+
+    dataframe = dataframe.select(*columns)
+    table_format = str(output_table.get('format') or 'delta').lower()
+    mode = 'append'
+    writer_options = {}
+    staging = None
+    emptied: List[Dict[str, Any]] = []
+
+    if load_strategy == 'upsert':
+        keys = [
+            column['name']
+            for column in output_table.get('columns') or []
+            if column.get('is_unique')
+        ]
+        if not keys:
+            raise HariContractError(
+                contract_path, 'Upsert requires is_unique columns'
+            )
+        if is_local_path(path):
+            recover_directory(to_local_path(path))
+        merged = _upsert_dataframe(
+            dataframe, contract_path, path, keys, partitioned_by
+        )
+        if merged is not None:
+            dataframe = merged['dataframe']
+            emptied = merged['emptied']
+            load_strategy = 'overwrite'
+            if emptied and (
+                table_format not in SCHEMA_ON_READ_FORMATS
+                or not is_local_path(path)
+            ):
+                raise HariContractError(
+                    contract_path,
+                    'Upsert moves every row out of the partitions '
+                    f'{emptied}, which can only be removed from a local '
+                    'table in a file format',
+                )
+            if not partitioned_by and table_format in SCHEMA_ON_READ_FORMATS:
+                # The table is read by the write that replaces it, so the
+                # result is written aside and swapped in once complete.
+                if not is_local_path(path):
+                    raise HariContractError(
+                        contract_path,
+                        'Upsert of an unpartitioned table requires a local '
+                        'output path',
+                    )
+                staging = sibling_path(to_local_path(path), UPSERT_PREFIX)
+
+    if load_strategy == 'overwrite':
+        mode = 'overwrite'
+        if partitioned_by:
+            writer_options['partitionOverwriteMode'] = 'dynamic'
+
+    estimate = estimate_dataframe_size(dataframe)
+    target_bytes = target_file_size_mb * 1024 * 1024
+    if num_partitions is None and estimate['size_in_bytes'] is not None:
+        num_partitions = max(
+            1, math.ceil(estimate['size_in_bytes'] / target_bytes)
+        )
+    if partitioned_by and estimate['row_size_in_bytes']:
+        # Each table partition is written by a single task, so its files
+        # are split by row count to stay near the target size.
+        writer_options['maxRecordsPerFile'] = str(
+            max(1, int(target_bytes // estimate['row_size_in_bytes']))
+        )
+
+    if partitioned_by:
+        if num_partitions:
+            dataframe = dataframe.repartition(num_partitions, *partitioned_by)
+        else:
+            dataframe = dataframe.repartition(*partitioned_by)
+    elif num_partitions:
+        dataframe = dataframe.repartition(num_partitions)
+
+    writer_options.update(DEFAULT_FORMAT_OPTIONS.get(table_format, {}))
+    writer_options.update(options or {})
+
+    writer = dataframe.write.format(table_format).mode(mode)
+    if partitioned_by:
+        writer = writer.partitionBy(*partitioned_by)
+    if writer_options:
+        writer = writer.options(**writer_options)
+    if staging is None:
+        writer.save(path)
+        if emptied:
+            _remove_partitions(to_local_path(path), partitioned_by, emptied)
+    else:
+        try:
+            writer.save(staging)
+            swap_directories(to_local_path(path), staging)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    return {'path': path, 'num_partitions': num_partitions}
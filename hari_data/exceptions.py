@@ -37,3 +37,15 @@ class HariLoggerNotConfigured(HariError):
 
     def __str__(self):
         return self.message
+
+
+class HariContractError(HariError):
+    """Exception raised when a data contract is invalid or cannot be used."""
+
+    def __init__(self, contract: str, message: str):
+        self.contract = contract
+        full_message = f'{message}: {contract}'
+        super().__init__(full_message)
+
+    def __str__(self):
+        return self.message
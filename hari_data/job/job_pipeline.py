@@ -0,0 +1,357 @@
+"""
+Module for declaring a job as a pipeline of steps, whose shared
+DataFrames are persisted while they are needed and released afterwards.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from pyspark import StorageLevel
+from pyspark.sql import DataFrame, SparkSession
+
+
+class HariPipeline:
+    """
+    A pipeline of steps that declare the DataFrames they read and produce.
+
+    A step is a function called with the Spark session and its inputs as
+    keyword arguments. It returns its output DataFrame, a dictionary of
+    DataFrames when it has several outputs, or nothing when it only writes.
+    Steps run in dependency order, then in declaration order.
+
+    A DataFrame read by more than one step is persisted at `storage_level`,
+    so its lineage is computed once. It is unpersisted as soon as every
+    step that reads it, and every DataFrame derived from it, is done, so
+    the cache does not grow for the rest of the job. When a step fails,
+    the next run resumes from it, reusing the completed steps.
+
+    Parameters:
+        storage_level (StorageLevel): The storage level of the shared
+            DataFrames. Default is MEMORY_AND_DISK.
+
+    Examples:
+        >>> pipeline = HariPipeline()
+        >>> @pipeline.step(outputs=['sales'])
+        ... def extract(spark):
+        ...     return spark.read.parquet('/data/sales')
+        >>> @pipeline.step(inputs=['sales'])
+        ... def load_by_city(spark, sales):
+        ...     sales.groupBy('city').count().write.parquet('/data/by_city')
+        >>> @pipeline.step(inputs=['sales'])
+        ... def load_by_day(spark, sales):
+        ...     sales.groupBy('sale_date').count().write.parquet('/data/by_day')
+        >>> pipeline.plan()
+        {'order': ['extract', 'load_by_city', 'load_by_day'], 'persisted': ['sales']}
+    """
+
+    def __init__(
+        self, storage_level: StorageLevel = StorageLevel.MEMORY_AND_DISK
+    ):
+        self._storage_level = storage_level
+        self._steps: List[Dict[str, Any]] = []
+        # Progress of a failed run, resumed by the next run.
+        self._state: Optional[Dict[str, Any]] = None
+
+    def add_step(
+        self,
+        name: str,
+        func: Callable[..., Any],
+        inputs: Optional[List[str]] = None,
+        outputs: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Add a step to the pipeline.
+
+        Parameters:
+            name (str): The name of the step.
+            func (Callable[..., Any]): The function of the step.
+            inputs (Optional[List[str]]): The DataFrames the step reads,
+                passed to `func` as keyword arguments.
+            outputs (Optional[List[str]]): The DataFrames the step produces.
+
+        Raises:
+            ValueError: If the step name or one of its outputs is already
+                declared.
+
+        Examples:
+            >>> HariPipeline().add_step( # doctest: +SKIP
+            ...     'clean', clean_sales, inputs=['sales'], outputs=['clean_sales']
+            ... )
+        """
+        if any(step['name'] == name for step in self._steps):
+            raise ValueError(f"Step '{name}' is already declared.")
+        outputs = list(outputs or [])
+        declared = {
+            output for step in self._steps for output in step['outputs']
+        }
+        duplicated = sorted(declared.intersection(outputs))
+        if duplicated or len(set(outputs)) != len(outputs):
+            raise ValueError(
+                f"Outputs of step '{name}' are already declared: "
+                f'{duplicated or outputs}.'
+            )
+        self._steps.append(
+            {
+                'name': name,
+                'func': func,
+                'inputs': list(inputs or []),
+                'outputs': outputs,
+            }
+        )
+
+    def step(
+        self,
+        name: Optional[str] = None,
+        inputs: Optional[List[str]] = None,
+        outputs: Optional[List[str]] = None,
+    ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """
+        Decorator that adds a function as a step, named after the function
+        unless `name` is given. See `add_step`.
+        """
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            self.add_step(name or func.__name__, func, inputs, outputs)
+            return func
+
+        return decorator
+
+    def plan(self, inputs: Optional[List[str]] = None) -> Dict[str, List[str]]:
+        """
+        Resolve the order of the steps and the DataFrames to persist.
+
+        Parameters:
+            inputs (Optional[List[str]]): DataFrames given to `run` instead
+                of being produced by a step.
+
+        Returns:
+            Dict[str, List[str]]: A dictionary with the keys 'order' (the
+                step names, in execution order) and 'persisted' (the
+                DataFrames read by more than one step).
+
+        Raises:
+            ValueError: If a step reads a DataFrame that nothing produces,
+                or the steps depend on each other in a cycle.
+        """
+        producers = {
+            output: step['name']
+            for step in self._steps
+            for output in step['outputs']
+        }
+        given = set(inputs or [])
+        for step in self._steps:
+            missing = [
+                i
+                for i in step['inputs']
+                if i not in producers and i not in given
+            ]
+            if missing:
+                raise ValueError(
+                    f"Step '{step['name']}' reads DataFrames that no step "
+                    f'produces: {missing}.'
+                )
+
+        order: List[str] = []
+        done: Set[str] = set()
+        pending = list(self._steps)
+        while pending:
+            ready = next(
+                (
+                    step
+                    for step in pending
+                    if all(
+                        producers.get(i) in done or i in given
+                        for i in step['inputs']
+                    )
+                ),
+                None,
+            )
+            if ready is None:
+                raise ValueError(
+                    'Steps depend on each other in a cycle: '
+                    f"{[step['name'] for step in pending]}."
+                )
+            order.append(ready['name'])
+            done.add(ready['name'])
+            pending.remove(ready)
+
+        consumers = self._consumers()
+        persisted = [
+            name
+            for name in [*(inputs or []), *producers]
+            if consumers.get(name, 0) > 1
+        ]
+        return {'order': order, 'persisted': persisted}
+
+    def _consumers(self) -> Dict[str, int]:
+        consumers: Dict[str, int] = {}
+        for step in self._steps:
+            for name in set(step['inputs']):
+                consumers[name] = consumers.get(name, 0) + 1
+        return consumers
+
+    def run(
+        self,
+        spark: SparkSession,
+        inputs: Optional[Dict[str, DataFrame]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run the steps of the pipeline.
+
+        When a step fails, the outputs of the completed steps, and what
+        they persisted, are kept: the next call resumes from the failed
+        step, e.g. when `hari run` retries the job, instead of computing
+        the completed steps again. Call `reset` to release them instead.
+
+        Once every step is done, the DataFrames still persisted are
+        unpersisted. DataFrames that no step reads are returned, so the
+        DataFrames they derive from stay persisted until the last step.
+
+        Parameters:
+            spark (SparkSession): The Spark session passed to the steps.
+            inputs (Optional[Dict[str, DataFrame]]): DataFrames read by the
+                steps but not produced by any of them. Ignored when the run
+                resumes from a failed step.
+
+        Returns:
+            Dict[str, Any]: A dictionary with the keys 'outputs' (the
+                DataFrames no step reads, by name) and 'steps' (one
+                dictionary per step, with the keys 'step', 'duration_s',
+                'persisted' and 'unpersisted').
+
+        Raises:
+            ValueError: If the pipeline cannot be planned or a step does not
+                return its declared outputs.
+
+        Examples:
+            >>> pipeline.run(spark) # doctest: +SKIP
+            {'outputs': {}, 'steps': [{'step': 'extract', 'duration_s': 0.05, 'persisted': ['sales'], 'unpersisted': []}, ...]}
+        """
+        inputs = dict(inputs or {})
+        plan = self.plan(list(inputs))
+        steps = {step['name']: step for step in self._steps}
+        to_persist = set(plan['persisted'])
+
+        state = self._state
+        if state is None or state['inputs'] != set(inputs):
+            self.reset()
+            state = self._state = {
+                'inputs': set(inputs),
+                'frames': {},
+                'remaining': self._consumers(),
+                # A lazy DataFrame derived from a persisted one still reads
+                # its cache when it is evaluated, so a DataFrame is only
+                # released once the DataFrames derived from it are too.
+                'parents': {},
+                'live_children': {},
+                'persisted': set(),
+                'released': set(),
+                'results': [],
+            }
+            for name, frame in inputs.items():
+                self._register(name, frame, to_persist)
+
+        remaining = state['remaining']
+        live_children = state['live_children']
+        done = {result['step'] for result in state['results']}
+
+        for step_name in plan['order']:
+            if step_name in done:
+                continue
+            step = steps[step_name]
+            start = time.perf_counter()
+            output = step['func'](
+                spark, **{i: state['frames'][i] for i in step['inputs']}
+            )
+            outputs = self._outputs(step, output)
+
+            step_persisted: List[str] = []
+            unpersisted: List[str] = []
+            for name, frame in outputs.items():
+                step_persisted += self._register(name, frame, to_persist)
+                state['parents'][name] = list(set(step['inputs']))
+                for parent in state['parents'][name]:
+                    live_children[parent] = live_children.get(parent, 0) + 1
+            for name in set(step['inputs']):
+                remaining[name] -= 1
+                self._release(name, unpersisted)
+
+            state['results'].append(
+                {
+                    'step': step_name,
+                    'duration_s': round(time.perf_counter() - start, 4),
+                    'persisted': step_persisted,
+                    'unpersisted': unpersisted,
+                }
+            )
+
+        consumers = self._consumers()
+        result = {
+            'outputs': {
+                name: frame
+                for name, frame in state['frames'].items()
+                if name not in consumers
+            },
+            'steps': state['results'],
+        }
+        self.reset()
+        return result
+
+    def reset(self) -> None:
+        """
+        Unpersist the DataFrames kept by a failed run, so the next run
+        starts from the first step.
+
+        Examples:
+            >>> HariPipeline().reset()
+        """
+        state, self._state = self._state, None
+        if state is None:
+            return
+        for name in state['persisted']:
+            state['frames'][name].unpersist()
+
+    def _register(
+        self, name: str, frame: DataFrame, to_persist: Set[str]
+    ) -> List[str]:
+        state = self._state
+        state['frames'][name] = frame
+        # DataFrames cached by the caller are left to the caller.
+        if name in to_persist and not frame.is_cached:
+            frame.persist(self._storage_level)
+            state['persisted'].add(name)
+            return [name]
+        return []
+
+    def _release(self, name: str, unpersisted: List[str]) -> None:
+        state = self._state
+        if (
+            name in state['released']
+            or state['remaining'].get(name, 0)
+            or state['live_children'].get(name, 0)
+        ):
+            return
+        state['released'].add(name)
+        if name in state['persisted']:
+            state['frames'][name].unpersist()
+            state['persisted'].discard(name)
+            unpersisted.append(name)
+        for parent in state['parents'].get(name, []):
+            state['live_children'][parent] -= 1
+            self._release(parent, unpersisted)
+
+    def _outputs(self, step: Dict[str, Any], output: Any) -> Dict[str, Any]:
+        names = step['outputs']
+        if not names:
+            return {}
+        if len(names) == 1 and not isinstance(output, dict):
+            output = {names[0]: output}
+        if (
+            not isinstance(output, dict)
+            or set(output) != set(names)
+            or any(frame is None for frame in output.values())
+        ):
+            raise ValueError(
+                f"Step '{step['name']}' must return the DataFrames {names}."
+            )
+        return output
@@ -0,0 +1,487 @@
+"""
+Module for running Hari jobs, concurrently or one after another, in a
+single Spark application.
+"""
+
+import builtins
+import importlib.abc
+import importlib.machinery
+import importlib.util
+import inspect
+import itertools
+import os
+import sys
+import tempfile
+import time
+import traceback
+from threading import Lock
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+from xml.sax.saxutils import quoteattr
+
+from pyspark import InheritableThread
+from pyspark.sql import SparkSession
+from pyspark.sql.utils import is_remote
+
+from hari_data.job.job_pipeline import HariPipeline
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+from hari_data.utils.helpers import is_hari_project, read_yaml_to_dict
+from hari_data.utils.logger import logger_manager
+
+# FAIR scheduler pool of each job_priority. The weight is the share of the
+# cluster a pool gets relative to the others once all are busy; minShare is
+# the number of cores it gets before any weight is applied.
+JOB_PRIORITY_POOLS: Dict[str, Dict[str, int]] = {
+    'low': {'weight': 1, 'min_share': 0},
+    'normal': {'weight': 2, 'min_share': 1},
+    'high': {'weight': 4, 'min_share': 2},
+}
+DEFAULT_JOB_PRIORITY = 'normal'
+
+# Seconds to wait for a job to return after its Spark jobs were cancelled,
+# e.g. while it finishes driver-side code between two Spark actions.
+CANCEL_GRACE_S = 30
+
+
+class _ProjectLoader(importlib.machinery.SourceFileLoader):
+    """
+    Loader of the modules of a project, which run with the project's
+    `__import__`.
+    """
+
+    def __init__(self, fullname: str, path: str, builtins_: Dict[str, Any]):
+        super().__init__(fullname, path)
+        self._builtins = builtins_
+
+    def exec_module(self, module: ModuleType) -> None:
+        module.__builtins__ = self._builtins
+        super().exec_module(module)
+
+
+class _ProjectFinder(importlib.abc.MetaPathFinder):
+    """
+    Finder of the modules of the loaded projects, e.g. 'hari_job_1.utils'.
+    """
+
+    def __init__(self):
+        self.builtins: Dict[str, Dict[str, Any]] = {}
+
+    def find_spec(self, fullname, path, target=None):
+        package = fullname.partition('.')[0]
+        if package not in self.builtins or '.' not in fullname:
+            return None
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path)
+        if spec is not None and isinstance(
+            spec.loader, importlib.machinery.SourceFileLoader
+        ):
+            spec.loader = _ProjectLoader(
+                fullname, spec.origin, self.builtins[package]
+            )
+        return spec
+
+
+_project_finder = _ProjectFinder()
+_project_ids = itertools.count(1)
+_project_lock = Lock()
+
+
+def _is_project_module(project_dir: str, name: str) -> bool:
+    path = os.path.join(project_dir, name)
+    if os.path.isfile(f'{path}.py'):
+        return True
+    return os.path.isdir(path) and any(
+        entry.endswith('.py') for entry in os.listdir(path)
+    )
+
+
+def _project_builtins(package: str, project_dir: str) -> Dict[str, Any]:
+    def project_import(name, globals=None, locals=None, fromlist=(), level=0):
+        top = name.partition('.')[0]
+        if level == 0 and top and _is_project_module(project_dir, top):
+            module = builtins.__import__(
+                f'{package}.{name}', globals, locals, fromlist, 0
+            )
+            return module if fromlist else getattr(module, top)
+        return builtins.__import__(name, globals, locals, fromlist, level)
+
+    return {**vars(builtins), '__import__': project_import}
+
+
+def _load_module(job_file: str) -> ModuleType:
+    """
+    Load job.py as the module 'hari_job_<n>.job' of a package of its own.
+
+    Every scaffolded project has the same module names, e.g. utils.helpers,
+    so the absolute imports of a project, at load time or inside `main`,
+    resolve to 'hari_job_<n>.<name>' instead of a shared 'sys.modules'
+    entry that the first project loaded would own.
+    """
+    project_dir = os.path.dirname(job_file)
+    with _project_lock:
+        package = f'hari_job_{next(_project_ids)}'
+        if _project_finder not in sys.meta_path:
+            sys.meta_path.insert(0, _project_finder)
+        _project_finder.builtins[package] = _project_builtins(
+            package, project_dir
+        )
+
+    package_module = ModuleType(package)
+    package_module.__path__ = [project_dir]
+    sys.modules[package] = package_module
+
+    name = f'{package}.job'
+    loader = _ProjectLoader(name, job_file, _project_finder.builtins[package])
+    spec = importlib.util.spec_from_file_location(
+        name, job_file, loader=loader
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_job(job_path: str) -> Dict[str, Any]:
+    """
+    Load the configs and the `main` function of a Hari project job.
+
+    The job name is the 'job_name' of configs.yaml, or the name of the
+    project directory when it is empty.
+
+    Parameters:
+        job_path (str): The directory of the Hari project.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'name', 'path',
+            'configs_path', 'configs', 'priority', 'timeout' (the
+            job_timeout in seconds, None without one), 'retry_limit',
+            'main' and 'pipelines' (the `HariPipeline` objects of job.py).
+
+    Raises:
+        ValueError: If the directory is not a Hari project, its job.py has
+            no `main` function, its job_priority is unknown or its
+            job_timeout or job_retry_limit is not a non-negative integer.
+
+    Examples:
+        >>> load_job('./sales') # doctest: +SKIP
+        {'name': 'sales', 'path': '/jobs/sales', 'configs_path': '/jobs/sales/configs/configs.yaml', 'configs': {...}, 'priority': 'normal', 'timeout': 3600, 'retry_limit': 3, 'main': <function main at 0x...>, 'pipelines': [...]}
+    """
+    path = os.path.abspath(job_path)
+    if not is_hari_project(path):
+        raise ValueError(f"'{job_path}' is not a Hari project.")
+
+    configs_path = os.path.join(path, 'configs', 'configs.yaml')
+    configs = {}
+    if os.path.exists(configs_path):
+        configs = read_yaml_to_dict(configs_path) or {}
+
+    name = configs.get('job_name') or os.path.basename(path)
+    priority = str(configs.get('job_priority') or DEFAULT_JOB_PRIORITY).lower()
+    if priority not in JOB_PRIORITY_POOLS:
+        raise ValueError(
+            f"Unsupported job_priority '{priority}' in job '{name}'. "
+            f'Supported priorities: {list(JOB_PRIORITY_POOLS)}.'
+        )
+
+    limits = {}
+    for key in ('job_timeout', 'job_retry_limit'):
+        value = configs.get(key) or 0
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ValueError(
+                f"{key} of job '{name}' must be a non-negative integer."
+            )
+        limits[key] = value
+
+    module = _load_module(os.path.join(path, 'job.py'))
+    main = getattr(module, 'main', None)
+    if not callable(main):
+        raise ValueError(f"job.py of job '{name}' has no main function.")
+
+    return {
+        'name': name,
+        'path': path,
+        'configs_path': configs_path,
+        'configs': configs,
+        'priority': priority,
+        'timeout': limits['job_timeout'] or None,
+        'retry_limit': limits['job_retry_limit'],
+        'main': main,
+        'pipelines': [
+            value
+            for value in vars(module).values()
+            if isinstance(value, HariPipeline)
+        ],
+    }
+
+
+def build_fair_scheduler_xml(jobs: List[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Build the FAIR scheduler allocation file with a pool per job.
+
+    Each pool runs the Spark jobs of its Hari job in order, with the weight
+    and minShare of its job_priority (see `JOB_PRIORITY_POOLS`).
+
+    Parameters:
+        jobs (List[Dict[str, Any]]): Jobs with the keys 'name' and 'priority'.
+
+    Returns:
+        Dict[str, str]: A dictionary with the key 'xml'.
+
+    Examples:
+        >>> print(build_fair_scheduler_xml(
+        ...     [{'name': 'sales', 'priority': 'high'}]
+        ... )['xml'])
+        <?xml version="1.0"?>
+        <allocations>
+          <pool name="sales">
+            <schedulingMode>FIFO</schedulingMode>
+            <weight>4</weight>
+            <minShare>2</minShare>
+          </pool>
+        </allocations>
+    """
+    lines = ['<?xml version="1.0"?>', '<allocations>']
+    for job in jobs:
+        pool = JOB_PRIORITY_POOLS[job['priority']]
+        lines += [
+            f"  <pool name={quoteattr(job['name'])}>",
+            '    <schedulingMode>FIFO</schedulingMode>',
+            f"    <weight>{pool['weight']}</weight>",
+            f"    <minShare>{pool['min_share']}</minShare>",
+            '  </pool>',
+        ]
+    lines.append('</allocations>')
+    return {'xml': '\n'.join(lines)}
+
+
+def call_job_main(main: Callable[..., Any], spark: SparkSession) -> Any:
+    """
+    Call the `main` function of a job, passing the Spark session when it
+    takes a parameter.
+
+    Examples:
+        >>> call_job_main(lambda: 'done', spark=None)
+        'done'
+        >>> call_job_main(lambda spark: spark, spark='spark_session')
+        'spark_session'
+    """
+    if inspect.signature(main).parameters:
+        return main(spark)
+    return main()
+
+
+def _run_attempt(
+    job: Dict[str, Any], spark: SparkSession, outcome: Dict[str, Any]
+) -> None:
+    if is_remote():
+        # Spark Connect has no SparkContext; operations are tagged instead.
+        spark.addTag(outcome['group_id'])
+    else:
+        spark.sparkContext.setJobGroup(
+            outcome['group_id'],
+            f"hari run {job['name']} (attempt {outcome['attempt']})",
+            interruptOnCancel=True,
+        )
+    try:
+        call_job_main(job['main'], spark)
+    except Exception as e:
+        outcome['error'] = e
+        outcome['traceback'] = traceback.format_exc()
+
+
+def _run_job(
+    job: Dict[str, Any],
+    manager: HariSparkSessionManager,
+    result: Dict[str, Any],
+) -> None:
+    logger = logger_manager.get_logger()['logger']
+    spark = manager.get_named_session(job['name'])['spark_session']
+    remote = is_remote()
+    if not remote:
+        spark.sparkContext.setLocalProperty(
+            'spark.scheduler.pool', job['name']
+        )
+    group_id = f"hari-run-{job['name']}"
+
+    start = time.perf_counter()
+    deadline = start + job['timeout'] if job['timeout'] else None
+    still_running = False
+    try:
+        for attempt in range(1, job['retry_limit'] + 2):
+            result['attempts'] = attempt
+            outcome = {'group_id': group_id, 'attempt': attempt, 'error': None}
+            # The attempt runs in its own thread, so a timeout cancels its
+            # Spark jobs while this thread keeps control of the run.
+            thread = InheritableThread(
+                target=_run_attempt, args=(job, spark, outcome), daemon=True
+            )
+            thread.start()
+            thread.join(
+                None
+                if deadline is None
+                else max(0, deadline - time.perf_counter())
+            )
+
+            if thread.is_alive():
+                if remote:
+                    spark.interruptTag(group_id)
+                else:
+                    spark.sparkContext.cancelJobGroup(group_id)
+                thread.join(CANCEL_GRACE_S)
+                still_running = thread.is_alive()
+                error = f"Timed out after {job['timeout']}s"
+                if still_running:
+                    # Cancelling only stops Spark jobs: the attempt may
+                    # still be running Python code and submitting jobs.
+                    error += '; the job is still running'
+                logger.error(
+                    f"Job {job['name']}: {error}. Its Spark jobs were "
+                    'cancelled.'
+                )
+                result.update({'status': 'timeout', 'error': f'{error}.'})
+                break
+
+            if outcome['error'] is None:
+                result.update({'status': 'success', 'error': None})
+                break
+
+            logger.error(
+                f"Job {job['name']} failed on attempt {attempt}: "
+                f"{outcome['error']}\n{outcome['traceback']}"
+            )
+            result.update({'status': 'failed', 'error': str(outcome['error'])})
+    finally:
+        result['duration_s'] = round(time.perf_counter() - start, 4)
+        if not remote:
+            spark.sparkContext.setLocalProperty('spark.scheduler.pool', None)
+        # A timed out attempt that is still running keeps using its session
+        # and pipelines, so they are left to it.
+        if not still_running:
+            for pipeline in job['pipelines']:
+                pipeline.reset()
+            manager.close_named_session(job['name'])
+
+
+def run_jobs(
+    job_paths: List[str],
+    parallel: bool = False,
+    env: str = 'local',
+    configs_path: Optional[str] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run Hari jobs in a single Spark application.
+
+    Each job runs in a named session of `HariSparkSessionManager`, so jobs
+    share the JVM and executors but not their SQL settings or temporary
+    views. The Spark jobs of a job are tagged with a job group (an
+    operation tag with Spark Connect): when the job runs longer than its
+    job_timeout, the group is cancelled instead of the process being
+    killed. A failed job is retried up to its job_retry_limit in the same
+    session by calling its `main` again; a `HariPipeline` resumes from its
+    failed step, reusing the DataFrames of the completed steps, which are
+    released after the last attempt. Timeouts are not retried.
+
+    With `parallel`, jobs run as threads and the application uses the FAIR
+    scheduler with a pool per job, weighted by its job_priority, so small
+    jobs are not queued behind large ones. Spark Connect sessions have no
+    scheduler pools, so job_priority is ignored there.
+
+    The `main` function of job.py receives its named session when it takes
+    a parameter; otherwise it uses the shared session of the manager.
+
+    Parameters:
+        job_paths (List[str]): Directories of the Hari projects to run.
+        parallel (bool): Run the jobs concurrently. Default is False.
+        env (str): The environment of the Spark session. Default is 'local'.
+        configs_path (Optional[str]): configs.yaml of the Spark application.
+            Default is the configs.yaml of the job when running one job.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: A dictionary with the key 'results',
+            one dictionary per job, in the given order, with the keys 'job',
+            'priority', 'status' ('success', 'failed' or 'timeout'),
+            'attempts', 'duration_s' and 'error'.
+
+    Raises:
+        ValueError: If a job cannot be loaded or two jobs have the same name.
+
+    Examples:
+        >>> run_jobs(['./sales', './stock'], parallel=True) # doctest: +SKIP
+        {'results': [{'job': 'sales', 'priority': 'high', 'status': 'success', 'attempts': 1, 'duration_s': 12.4, 'error': None}, ...]}
+    """
+    jobs = [load_job(path) for path in job_paths]
+    names = [job['name'] for job in jobs]
+    duplicated = sorted({name for name in names if names.count(name) > 1})
+    if duplicated:
+        raise ValueError(f'Duplicated job names: {duplicated}.')
+
+    if configs_path is None and len(jobs) == 1:
+        configs_path = jobs[0]['configs_path']
+
+    spark_extras = None
+    if parallel:
+        with tempfile.NamedTemporaryFile(
+            'w', prefix='hari_fair_', suffix='.xml', delete=False
+        ) as file:
+            file.write(build_fair_scheduler_xml(jobs)['xml'])
+        spark_extras = {
+            'spark.scheduler.mode': 'FAIR',
+            'spark.scheduler.allocation.file': file.name,
+        }
+
+    manager = HariSparkSessionManager()
+    try:
+        manager.configure(
+            env=env,
+            configs_path=configs_path,
+            app_name=names[0] if len(jobs) == 1 else 'HARI_RUN',
+            spark_extras=spark_extras,
+        )
+    finally:
+        # The allocation file is only read when the SparkContext starts.
+        if spark_extras:
+            os.remove(spark_extras['spark.scheduler.allocation.file'])
+    logger = logger_manager.get_logger()['logger']
+    spark = manager.get_spark_session()['spark_session']
+    if parallel and is_remote():
+        logger.warning(
+            'Spark Connect sessions have no scheduler pools; job_priority '
+            'is ignored.'
+        )
+    elif (
+        parallel
+        and spark.sparkContext.getConf().get('spark.scheduler.mode') != 'FAIR'
+    ):
+        logger.warning(
+            'The Spark session was created before the run without the FAIR '
+            'scheduler; job_priority is ignored.'
+        )
+
+    results = [
+        {
+            'job': job['name'],
+            'priority': job['priority'],
+            'status': None,
+            'attempts': 0,
+            'duration_s': None,
+            'error': None,
+        }
+        for job in jobs
+    ]
+    if parallel:
+        # InheritableThread pins each thread to a JVM thread, so the pool of
+        # a job only applies to the Spark jobs of its thread.
+        threads = [
+            InheritableThread(target=_run_job, args=(job, manager, result))
+            for job, result in zip(jobs, results)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    else:
+        for job, result in zip(jobs, results):
+            _run_job(job, manager, result)
+
+    return {'results': results}
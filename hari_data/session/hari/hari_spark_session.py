@@ -1,9 +1,15 @@
+import logging
 import os
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
 
+from pyspark import SparkConf, SparkContext
 from pyspark.sql import SparkSession
 
+from hari_data.session.hari_jar_manifest import resolve_jars
 from hari_data.utils.logger import logger_manager
 from hari_data.utils.validators import (
     validate_non_empty_string,
@@ -31,14 +37,113 @@ class BaseHariSparkSession(ABC):
             jars_path = validate_path_exists(jars_path, 'jars_path')['value']
         self._jars_path: Optional[str] = jars_path
         self._spark_log_level: str = spark_log_level
+        self._startup_metrics: Dict[str, float] = {}
 
     @abstractmethod
     def configure_spark_session(self) -> None:  # pragma: no cover
         pass
 
+    @contextmanager
+    def time_phase(self, phase: str) -> Iterator[None]:
+        """
+        Time a phase of the session startup, recorded as '<phase>_s' in
+        `get_startup_metrics()`.
+
+        Parameters:
+            phase (str): The name of the phase.
+
+        Examples:
+            >>> with hari_spark_session.time_phase('jar_discovery'):  # doctest: +SKIP
+            ...     hari_spark_session.get_jars_list()
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._startup_metrics[f'{phase}_s'] = round(
+                time.perf_counter() - start, 4
+            )
+
+    def get_startup_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the duration of each startup phase, in seconds.
+
+        Returns:
+            Dict[str, Dict[str, float]]: A dictionary with the key
+            'startup_metrics'.
+
+        Examples:
+            >>> hari_spark_session.get_startup_metrics()  # doctest: +SKIP
+            {'startup_metrics': {'jar_discovery_s': 0.0004, 'jvm_gateway_s': 2.81, 'get_or_create_s': 1.93, 'first_action_s': 0.62}}
+        """
+        return {'startup_metrics': dict(self._startup_metrics)}
+
+    def launch_gateway(self, builder: SparkSession.Builder) -> None:
+        """
+        Launch the JVM gateway with the settings of a builder, unless it is
+        already running, so its startup is timed apart from `getOrCreate`.
+
+        `getOrCreate` launches the gateway with the same settings when it
+        is not running, so calling this method first changes nothing else.
+
+        Parameters:
+            builder (SparkSession.Builder): The configured builder.
+
+        Examples:
+            >>> hari_spark_session.launch_gateway(builder)  # doctest: +SKIP
+        """
+        if SparkContext._gateway is not None:
+            return
+        conf = SparkConf()
+        for key, value in builder._options.items():
+            conf.set(key, value)
+        SparkContext._ensure_initialized(conf=conf)
+
+    def get_default_configs(self) -> Dict[str, str]:
+        """
+        Get the Spark settings applied by this factory before `spark_extras`.
+
+        Subclasses override it to provide tuned defaults; any setting in
+        `spark_extras` takes precedence.
+
+        Returns:
+            Dict[str, str]: The default Spark settings.
+
+        Examples:
+            >>> BaseHariSparkSession.get_default_configs()  # doctest: +SKIP
+            {}
+        """
+        return {}
+
+    def get_local_cores(self) -> int:
+        """
+        Get the number of cores used by a local master URL.
+
+        Returns:
+            int: N for 'local[N]', 1 for 'local', and the number of CPUs of
+            the machine for 'local[*]' or any other master URL.
+
+        Examples:
+            >>> hari_spark_session.get_local_cores()  # doctest: +SKIP
+            8
+        """
+        match = re.match(
+            r'^local(?:\[(\d+|\*)(?:,\s*\d+)?\])?$', self._master_url
+        )
+        if match and match.group(1) is None:
+            return 1
+        if match and match.group(1) != '*':
+            return int(match.group(1))
+        return os.cpu_count() or 1
+
     def get_jars_list(self) -> Optional[Dict[str, str]]:
         """
-        Get a comma-separated string of all JAR files in the jars_path directory.
+        Get a comma-separated string of the JAR files in the jars_path directory.
+
+        Duplicated jars are resolved to a single version of each artifact
+        with `resolve_jars`, and the dropped jars are logged as warnings.
+        The jar manifest is cached in the directory, so unchanged jars are
+        not read again on each session start.
 
         Returns:
             Optional[Dict[str, str]]: A dictionary with the key 'jars_str' containing
@@ -53,12 +158,13 @@ class BaseHariSparkSession(ABC):
         if not self._jars_path:
             return
 
-        jars = [
-            os.path.join(self._jars_path, jar)
-            for jar in os.listdir(self._jars_path)
-            if jar.endswith('.jar')
-        ]
-        jars_str = ','.join(jars)
+        resolved = resolve_jars(self._jars_path)
+        for skipped in resolved['skipped']:
+            self._logger.warning(
+                f"Skipping jar {skipped['jar']} ({skipped['reason']}), "
+                f"using {skipped['kept']}"
+            )
+        jars_str = ','.join(resolved['jars'])
         return {'jars_str': jars_str}
 
     def get_spark_builder(
@@ -69,6 +175,7 @@ class BaseHariSparkSession(ABC):
 
         Parameters:
             spark_extras: Additional Spark configuration options as keyword arguments.
+                They take precedence over `get_default_configs()`.
 
         Returns:
             Dict[str, SparkSession.Builder]: A dictionary containing the SparkSession.Builder instance.
@@ -86,21 +193,25 @@ class BaseHariSparkSession(ABC):
             self._app_name
         ).master(self._master_url)
 
-        if spark_extras:
-            for key, value in spark_extras.items():
-                builder = builder.config(key, value)
+        spark_configs = {**self.get_default_configs(), **(spark_extras or {})}
+        for key, value in spark_configs.items():
+            builder = builder.config(key, value)
 
         return {'spark_builder': builder}
 
     def create_spark_session(
         self,
         spark_extras: Optional[Dict[str, Any]] = None,
+        measure_first_action: bool = False,
     ) -> Dict[str, SparkSession]:  # pragma: no cover
         """
         Create and return a SparkSession.
 
         Parameters:
             spark_extras: Keyword arguments to pass to the configure_spark_session method.
+            measure_first_action (bool): Run a one-row Spark job and record its
+                duration as 'first_action_s'. Default is False, as it adds a
+                job to every startup.
 
         Returns:
             Dict[str, SparkSession]: A dictionary containing the SparkSession instance.
@@ -115,15 +226,24 @@ class BaseHariSparkSession(ABC):
 
         spark.sparkContext.setLogLevel(self._spark_log_level)
 
+        # Lazy initialisation left in Spark (executors, code generation)
+        # shows up in the first job, so it is run and timed on request.
+        if measure_first_action:
+            with self.time_phase('first_action'):
+                spark.range(0, 1, 1, 1).collect()
+
         self._logger.info('Spark session configured successfully.')
         self._logger.info(f'Spark version: {spark.version}')
         self._logger.info(
             f'Spark UI available at: {spark.sparkContext.uiWebUrl}'
         )
-        self._logger.info(
-            f'Spark Config: {spark.sparkContext.getConf().getAll()}'
-        )
-        self._logger.info(
-            f'Jars: {spark.sparkContext.getConf().get("spark.jars", None)}'
-        )
+        # Serialising the whole configuration is not free; only do it when
+        # it will be logged.
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(
+                f'Spark Config: {spark.sparkContext.getConf().getAll()}'
+            )
+            self._logger.debug(
+                f'Jars: {spark.sparkContext.getConf().get("spark.jars", None)}'
+            )
         return {'spark_session': spark}
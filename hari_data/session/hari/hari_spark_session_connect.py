@@ -0,0 +1,145 @@
+import os
+from typing import Any, Dict, Optional
+
+from pyspark.sql import SparkSession
+
+from hari_data.session.hari.hari_spark_session import BaseHariSparkSession
+from hari_data.session.hari_spark_connect import DEFAULT_CONNECT_URL
+
+# Only runtime SQL settings can be changed on a session of a running
+# server; static and core settings belong to `hari session serve`.
+_RUNTIME_PREFIX = 'spark.sql.'
+
+
+class HariSparkSessionConnect(BaseHariSparkSession):
+    """
+    Spark session attached to a running Spark Connect server, started with
+    `hari session serve`, instead of launching a JVM.
+
+    The server URL is the master URL when it starts with 'sc://', then the
+    SPARK_REMOTE environment variable, then 'sc://localhost:15002'. Jars
+    and the Spark log level belong to the server, so `jars_path` and
+    `spark_log_level` are ignored.
+
+    Examples:
+        >>> HariSparkSessionManager().configure(env='connect') # doctest: +SKIP
+        Spark session configured for environment: connect
+    """
+
+    def __init__(
+        self,
+        app_name: str,
+        master_url: str,
+        spark_log_level: str,
+        jars_path: Optional[str],
+    ):
+        super().__init__(app_name, master_url, spark_log_level, None)
+        self._logger.warning(
+            f"Spark log level '{spark_log_level}' is ignored: the log level "
+            'of a Spark Connect session is set on the server.'
+        )
+        if master_url.startswith('sc://'):
+            self._remote_url = master_url
+        else:
+            self._remote_url = os.environ.get(
+                'SPARK_REMOTE', DEFAULT_CONNECT_URL
+            )
+
+    def configure_spark_session(
+        self, spark_extras: Optional[Dict[str, Any]]
+    ) -> Dict[str, SparkSession]:
+        """
+        Attach to the Spark Connect server and return a SparkSession.
+
+        Settings of `spark_extras` that are not runtime SQL settings are
+        skipped, since the server is already running.
+
+        Parameters:
+            spark_extras : Additional Spark configuration options as keyword arguments.
+
+        Returns:
+            Dict[str, SparkSession]: A dictionary containing the SparkSession instance.
+
+        Raises:
+            ImportError: If the Spark Connect client dependencies are missing.
+
+        Examples:
+            >>> HariSparkSessionConnect( # doctest: +SKIP
+            ...     app_name='MyApp',
+            ...     master_url='sc://localhost:15002',
+            ...     spark_log_level='INFO',
+            ...     jars_path=None,
+            ... ).configure_spark_session(spark_extras=None)
+            {'spark_session': <pyspark.sql.connect.session.SparkSession object at 0x...>}
+        """
+        try:
+            spark_configs = {
+                **self.get_default_configs(),
+                **(spark_extras or {}),
+            }
+            skipped = [
+                key
+                for key in spark_configs
+                if not key.startswith(_RUNTIME_PREFIX)
+            ]
+            if skipped:
+                self._logger.debug(
+                    f'Settings managed by the Spark Connect server: {skipped}'
+                )
+
+            self._logger.info(
+                f'Connecting to Spark Connect at {self._remote_url}'
+            )
+            builder = SparkSession.builder.remote(self._remote_url).appName(
+                self._app_name
+            )
+            for key, value in spark_configs.items():
+                if key.startswith(_RUNTIME_PREFIX):
+                    builder = builder.config(key, value)
+
+            with self.time_phase('get_or_create'):
+                spark = builder.getOrCreate()
+
+            if not spark:
+                raise RuntimeError('Failed to create Spark session.')
+
+            return {'spark_session': spark}
+
+        except Exception:
+            self._logger.exception('Error creating Spark session.')
+            raise
+
+    def create_spark_session(
+        self,
+        spark_extras: Optional[Dict[str, Any]] = None,
+        measure_first_action: bool = False,
+    ) -> Dict[str, SparkSession]:
+        """
+        Create and return a SparkSession attached to the server.
+
+        Spark Connect sessions have no SparkContext, so the log level is
+        set on the server.
+
+        Parameters:
+            spark_extras: Keyword arguments to pass to the configure_spark_session method.
+            measure_first_action (bool): Run a one-row Spark job and record its
+                duration as 'first_action_s'. Default is False.
+
+        Returns:
+            Dict[str, SparkSession]: A dictionary containing the SparkSession instance.
+
+        Examples:
+            >>> HariSparkSessionConnect.create_spark_session()  # doctest: +SKIP
+            {'spark_session': <pyspark.sql.connect.session.SparkSession object at 0x...>}
+        """
+        spark: SparkSession = self.configure_spark_session(
+            spark_extras=spark_extras
+        ).get('spark_session')
+
+        if measure_first_action:
+            with self.time_phase('first_action'):
+                spark.range(0, 1, 1, 1).collect()
+
+        self._logger.info('Spark session configured successfully.')
+        self._logger.info(f'Spark version: {spark.version}')
+        return {'spark_session': spark}
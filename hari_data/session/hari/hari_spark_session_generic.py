@@ -47,7 +47,8 @@ class HariSparkSessionGeneric(BaseHariSparkSession):
             {'spark_session': <pyspark.sql.session.SparkSession object at 0x...>}
         """
         try:
-            jars: Optional[Dict[str, str]] = self.get_jars_list()
+            with self.time_phase('jar_discovery'):
+                jars: Optional[Dict[str, str]] = self.get_jars_list()
 
             if jars:
                 jars_str: Optional[str] = jars.get('jars_str', None)
@@ -60,7 +61,11 @@ class HariSparkSessionGeneric(BaseHariSparkSession):
                 spark_extras
             ).get('spark_builder')
 
-            spark = builder.getOrCreate()
+            with self.time_phase('jvm_gateway'):
+                self.launch_gateway(builder)
+
+            with self.time_phase('get_or_create'):
+                spark = builder.getOrCreate()
 
             if not spark:
                 raise RuntimeError('Failed to create Spark session.')
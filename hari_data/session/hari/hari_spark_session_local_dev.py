@@ -0,0 +1,51 @@
+from typing import Dict, Optional
+
+from hari_data.session.hari.hari_spark_session_generic import (
+    HariSparkSessionGeneric,
+)
+
+
+class HariSparkSessionLocalDev(HariSparkSessionGeneric):
+    """
+    Spark session tuned for small local development runs.
+
+    The Spark UI is disabled, shuffles use one partition per core instead
+    of Spark's default of 200, and Arrow is enabled for conversions
+    between Spark and pandas.
+
+    Examples:
+        >>> HariSparkSessionManager().configure(env='local-dev') # doctest: +SKIP
+        Spark session configured for environment: local-dev
+    """
+
+    def __init__(
+        self,
+        app_name: str,
+        master_url: str,
+        spark_log_level: str,
+        jars_path: Optional[str],
+    ):
+        super().__init__(app_name, master_url, spark_log_level, jars_path)
+
+    def get_default_configs(self) -> Dict[str, str]:
+        """
+        Get the default Spark settings for local development.
+
+        Returns:
+            Dict[str, str]: The default Spark settings.
+
+        Examples:
+            >>> HariSparkSessionLocalDev( # doctest: +SKIP
+            ...     'MyApp', 'local[4]', 'INFO', None
+            ... ).get_default_configs()
+            {'spark.ui.enabled': 'false', 'spark.sql.shuffle.partitions': '4', ...}
+        """
+        cores = str(self.get_local_cores())
+        return {
+            'spark.ui.enabled': 'false',
+            'spark.ui.showConsoleProgress': 'false',
+            'spark.sql.shuffle.partitions': cores,
+            'spark.default.parallelism': cores,
+            'spark.sql.execution.arrow.pyspark.enabled': 'true',
+            'spark.sql.execution.arrow.pyspark.fallback.enabled': 'true',
+        }
@@ -0,0 +1,87 @@
+import os
+from typing import Dict, Optional
+
+from hari_data.session.hari.hari_spark_session_generic import (
+    HariSparkSessionGeneric,
+)
+
+# Comma-separated directories for shuffle and spill files, ideally one
+# per physical disk.
+LOCAL_DIRS_ENV = 'HARI_LOCAL_DIRS'
+
+GB = 1024**3
+
+
+def _physical_memory() -> Optional[int]:
+    try:
+        return os.sysconf('SC_PHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class HariSparkSessionSingleNode(HariSparkSessionGeneric):
+    """
+    Spark session tuned for large batch jobs on a single machine.
+
+    - AQE coalesces shuffle partitions and splits skewed joins, starting
+      from three shuffle partitions per core.
+    - Kryo replaces Java serialization for shuffled and cached data.
+    - Off-heap memory, an eighth of the physical memory (1 to 16GB),
+      keeps Tungsten buffers out of the garbage-collected heap.
+    - Larger shuffle and spill buffers reduce disk seeks.
+    - Shuffle and spill files are spread over the directories listed in
+      the HARI_LOCAL_DIRS environment variable, when set.
+
+    Examples:
+        >>> HariSparkSessionManager().configure(env='single-node') # doctest: +SKIP
+        Spark session configured for environment: single-node
+    """
+
+    def __init__(
+        self,
+        app_name: str,
+        master_url: str,
+        spark_log_level: str,
+        jars_path: Optional[str],
+    ):
+        super().__init__(app_name, master_url, spark_log_level, jars_path)
+
+    def get_default_configs(self) -> Dict[str, str]:
+        """
+        Get the default Spark settings for single-node batch jobs.
+
+        Returns:
+            Dict[str, str]: The default Spark settings.
+
+        Examples:
+            >>> HariSparkSessionSingleNode( # doctest: +SKIP
+            ...     'MyApp', 'local[32]', 'INFO', None
+            ... ).get_default_configs()
+            {'spark.sql.adaptive.enabled': 'true', 'spark.sql.shuffle.partitions': '96', ...}
+        """
+        cores = self.get_local_cores()
+        memory = _physical_memory() or 8 * GB
+        off_heap = max(GB, min(memory // 8, 16 * GB))
+
+        configs = {
+            'spark.sql.adaptive.enabled': 'true',
+            'spark.sql.adaptive.coalescePartitions.enabled': 'true',
+            'spark.sql.adaptive.skewJoin.enabled': 'true',
+            'spark.sql.shuffle.partitions': str(3 * cores),
+            'spark.default.parallelism': str(cores),
+            'spark.serializer': 'org.apache.spark.serializer.KryoSerializer',
+            'spark.kryoserializer.buffer.max': '512m',
+            'spark.memory.offHeap.enabled': 'true',
+            'spark.memory.offHeap.size': f'{off_heap // 1024**2}m',
+            'spark.shuffle.file.buffer': '1m',
+            'spark.unsafe.sorter.spill.reader.buffer.size': '1m',
+        }
+
+        local_dirs = [
+            path.strip()
+            for path in os.environ.get(LOCAL_DIRS_ENV, '').split(',')
+            if path.strip()
+        ]
+        if local_dirs:
+            configs['spark.local.dir'] = ','.join(local_dirs)
+        return configs
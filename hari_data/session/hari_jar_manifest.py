@@ -0,0 +1,284 @@
+"""
+Module for resolving the jars of a project into a deterministic,
+duplicate-free classpath, backed by a manifest cached in the jars
+directory.
+"""
+
+import hashlib
+import json
+import os
+import re
+import zipfile
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+JAR_MANIFEST_FILE = '.hari_jars.json'
+
+# Bump when the layout of the manifest entries changes, so that old
+# manifests are rebuilt instead of being read with missing keys.
+JAR_MANIFEST_VERSION = 1
+
+# Number of top-level packages recorded for each jar.
+MAX_PACKAGES = 3
+
+_FILE_VERSION = re.compile(
+    r'^(?P<name>.+?)-(?P<version>\d+(?:\.\d+)*(?:[-.][\w.-]+)?)\.jar$'
+)
+_VERSION_PART = re.compile(r'\d+|[a-zA-Z]+')
+_POM_PROPERTIES = re.compile(r'^META-INF/maven/[^/]+/[^/]+/pom\.properties$')
+
+
+def _file_hash(jar_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(jar_path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_properties(text: str) -> Dict[str, str]:
+    properties = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith(('#', '!')) or '=' not in line:
+            continue
+        key, value = line.split('=', 1)
+        properties[key.strip()] = value.strip()
+    return properties
+
+
+def read_jar_metadata(jar_path: str) -> Dict[str, Any]:
+    """
+    Read the artifact, version, hash and main packages of a jar.
+
+    The artifact and version come from the Maven 'pom.properties' of the
+    jar that matches its file name (or its only one), then from the file
+    name, e.g. 'postgresql-42.7.1.jar'. Files that are not valid zip
+    archives are still described from their name.
+
+    Parameters:
+        jar_path (str): The path of the jar.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'file', 'artifact',
+            'version' (None if unknown), 'sha256' and 'packages' (the
+            top-level packages with the most classes).
+
+    Examples:
+        >>> read_jar_metadata('jars/postgresql-42.7.1.jar') # doctest: +SKIP
+        {'file': 'postgresql-42.7.1.jar', 'artifact': 'org.postgresql:postgresql', 'version': '42.7.1', 'sha256': '…', 'packages': ['org.postgresql']}
+    """
+    name = os.path.basename(jar_path)
+    match = _FILE_VERSION.match(name)
+    artifact = match.group('name') if match else name[: -len('.jar')]
+    version = match.group('version') if match else None
+    packages: List[str] = []
+
+    try:
+        with zipfile.ZipFile(jar_path) as archive:
+            entries = archive.namelist()
+            poms = [
+                _parse_properties(
+                    archive.read(entry).decode('utf-8', 'ignore')
+                )
+                for entry in entries
+                if _POM_PROPERTIES.match(entry)
+            ]
+            matching = [
+                pom for pom in poms if pom.get('artifactId') == artifact
+            ]
+            pom = (
+                matching[0]
+                if matching
+                else (poms[0] if len(poms) == 1 else None)
+            )
+            if pom and pom.get('artifactId'):
+                artifact = f"{pom.get('groupId', '')}:{pom['artifactId']}"
+                version = pom.get('version') or version
+
+            counts = Counter(
+                '.'.join(entry.split('/')[:-1][:2])
+                for entry in entries
+                if entry.endswith('.class')
+                and not entry.startswith('META-INF/')
+                and '/' in entry
+            )
+            packages = [
+                package
+                for package, _ in sorted(
+                    counts.items(), key=lambda item: (-item[1], item[0])
+                )[:MAX_PACKAGES]
+            ]
+    except (zipfile.BadZipFile, OSError):
+        pass
+
+    return {
+        'file': name,
+        'artifact': artifact,
+        'version': version,
+        'sha256': _file_hash(jar_path),
+        'packages': packages,
+    }
+
+
+def _version_key(version: Optional[str]) -> Tuple:
+    """
+    Order versions numerically, with qualifiers such as 'SNAPSHOT' or 'rc1'
+    before the release they precede.
+    """
+    if not version:
+        return ()
+    key = []
+    for part in _VERSION_PART.findall(version):
+        key.append((1, int(part), '') if part.isdigit() else (0, 0, part))
+    return tuple(key) + ((1, 0, ''),)
+
+
+def _load_manifest(manifest_path: str) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(manifest_path, 'r') as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != JAR_MANIFEST_VERSION:
+        return {}
+    return manifest.get('jars') or {}
+
+
+def _save_manifest(
+    manifest_path: str, entries: Dict[str, Dict[str, Any]]
+) -> None:
+    tmp_path = f'{manifest_path}.{os.getpid()}.tmp'
+    try:
+        with open(tmp_path, 'w') as file:
+            json.dump(
+                {'version': JAR_MANIFEST_VERSION, 'jars': entries},
+                file,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, manifest_path)
+    except OSError:
+        # Read-only jar directories still resolve, just without a cache.
+        pass
+
+
+def build_jar_manifest(jars_path: str) -> Dict[str, Any]:
+    """
+    Build the manifest of the jars of a directory.
+
+    The manifest is cached in '.hari_jars.json' inside the directory. Only
+    jars whose modification time or size changed since the cached
+    manifest are read again; removed jars are dropped.
+
+    Parameters:
+        jars_path (str): The directory of the jars.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'jars' (the metadata of
+            each jar, sorted by file name) and 'read' (the number of jars
+            read again).
+
+    Examples:
+        >>> build_jar_manifest('./jars') # doctest: +SKIP
+        {'jars': [{'file': 'postgresql-42.7.1.jar', 'artifact': 'org.postgresql:postgresql', ...}], 'read': 0}
+    """
+    manifest_path = os.path.join(jars_path, JAR_MANIFEST_FILE)
+    cached = _load_manifest(manifest_path)
+
+    entries = {}
+    read = 0
+    for item in os.scandir(jars_path):
+        if not item.name.endswith('.jar') or not item.is_file():
+            continue
+        stat = item.stat()
+        entry = cached.get(item.name)
+        if (
+            entry is None
+            or entry.get('mtime_ns') != stat.st_mtime_ns
+            or entry.get('size') != stat.st_size
+        ):
+            entry = {
+                **read_jar_metadata(item.path),
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+            }
+            read += 1
+        entries[item.name] = entry
+
+    if read or set(cached) != set(entries):
+        _save_manifest(manifest_path, entries)
+
+    return {
+        'jars': [entries[name] for name in sorted(entries)],
+        'read': read,
+    }
+
+
+def resolve_jars(jars_path: str) -> Dict[str, List[Any]]:
+    """
+    Resolve the jars of a directory into a classpath with a single
+    version of each artifact.
+
+    Jars with the same content are kept once, under the first file name.
+    Among jars of the same artifact, the highest version is kept; equal
+    versions are broken by file name. The result only depends on the
+    jars, not on the directory listing order.
+
+    Parameters:
+        jars_path (str): The directory of the jars.
+
+    Returns:
+        Dict[str, List[Any]]: A dictionary with the keys 'jars' (the paths
+            to use, sorted by file name) and 'skipped' (one dictionary per
+            dropped jar, with the keys 'jar', 'kept' and 'reason').
+
+    Examples:
+        >>> resolve_jars('./jars') # doctest: +SKIP
+        {'jars': ['./jars/postgresql-42.7.1.jar'], 'skipped': [{'jar': 'postgresql-42.2.0.jar', 'kept': 'postgresql-42.7.1.jar', 'reason': 'older version'}]}
+    """
+    manifest = build_jar_manifest(jars_path)['jars']
+
+    skipped = []
+    by_hash: Dict[str, Dict[str, Any]] = {}
+    for entry in manifest:
+        kept = by_hash.setdefault(entry['sha256'], entry)
+        if kept is not entry:
+            skipped.append(
+                {
+                    'jar': entry['file'],
+                    'kept': kept['file'],
+                    'reason': 'same content',
+                }
+            )
+
+    by_artifact: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in by_hash.values():
+        by_artifact.setdefault(entry['artifact'], []).append(entry)
+
+    selected = []
+    for entries in by_artifact.values():
+        entries.sort(
+            key=lambda e: (_version_key(e['version']), e['file']),
+            reverse=True,
+        )
+        kept = entries[0]
+        selected.append(kept)
+        skipped.extend(
+            {
+                'jar': entry['file'],
+                'kept': kept['file'],
+                'reason': 'older version'
+                if entry['version'] != kept['version']
+                else 'same version',
+            }
+            for entry in entries[1:]
+        )
+
+    return {
+        'jars': [
+            os.path.join(jars_path, entry['file'])
+            for entry in sorted(selected, key=lambda e: e['file'])
+        ],
+        'skipped': sorted(skipped, key=lambda s: s['jar']),
+    }
@@ -0,0 +1,169 @@
+"""
+Module for running a local Spark Connect server, so that short jobs attach
+to a running JVM instead of launching their own.
+
+Attaching to the server requires the Spark Connect client dependencies
+(`pip install "pyspark[connect]"`).
+"""
+
+import os
+import re
+import subprocess
+from typing import Any, Dict, List, Optional
+
+import pyspark
+
+from hari_data.session.hari_jar_manifest import resolve_jars
+from hari_data.session.hari_spark_tuning import (
+    derive_spark_configs_from_configs,
+)
+from hari_data.utils.helpers import read_yaml_to_dict
+
+DEFAULT_CONNECT_PORT = 15002
+DEFAULT_CONNECT_URL = f'sc://localhost:{DEFAULT_CONNECT_PORT}'
+
+CONNECT_SERVER_CLASS = (
+    'org.apache.spark.sql.connect.service.SparkConnectServer'
+)
+
+_SCALA_VERSION = re.compile(r'^spark-core_(\d+\.\d+)-.*\.jar$')
+
+
+def get_spark_submit() -> str:
+    """
+    Get the path of the spark-submit script, from SPARK_HOME or the
+    pyspark installation.
+
+    Examples:
+        >>> get_spark_submit() # doctest: +SKIP
+        '/usr/lib/python3.11/site-packages/pyspark/bin/spark-submit'
+    """
+    spark_home = os.environ.get('SPARK_HOME') or os.path.dirname(
+        pyspark.__file__
+    )
+    return os.path.join(spark_home, 'bin', 'spark-submit')
+
+
+def _scala_version() -> str:
+    jars_dir = os.path.join(os.path.dirname(pyspark.__file__), 'jars')
+    try:
+        for name in os.listdir(jars_dir):
+            match = _SCALA_VERSION.match(name)
+            if match:
+                return match.group(1)
+    except FileNotFoundError:
+        pass
+    return '2.12'
+
+
+def build_connect_server_command(
+    port: int = DEFAULT_CONNECT_PORT,
+    master_url: str = 'local[*]',
+    jars_path: Optional[str] = None,
+    spark_extras: Optional[Dict[str, str]] = None,
+) -> Dict[str, List[str]]:
+    """
+    Build the spark-submit command that starts a Spark Connect server.
+
+    The jars in `jars_path`, resolved with `resolve_jars`, are added to
+    the server, so jobs attached to it can use them. The Spark Connect
+    plugin is taken from a 'spark-connect_*.jar' in `jars_path` when
+    present; otherwise it is resolved with `--packages` for the installed
+    Spark version.
+
+    Parameters:
+        port (int): The gRPC port of the server. Default is 15002.
+        master_url (str): The Spark master URL. Default is 'local[*]'.
+        jars_path (Optional[str]): Directory of the project jars.
+        spark_extras (Optional[Dict[str, str]]): Spark settings of the
+            server.
+
+    Returns:
+        Dict[str, List[str]]: A dictionary with the key 'command'.
+
+    Examples:
+        >>> build_connect_server_command()['command'][1:5] # doctest: +SKIP
+        ['--class', 'org.apache.spark.sql.connect.service.SparkConnectServer', '--master', 'local[*]']
+    """
+    jars = []
+    if jars_path and os.path.isdir(jars_path):
+        jars = resolve_jars(jars_path)['jars']
+
+    command = [
+        get_spark_submit(),
+        '--class',
+        CONNECT_SERVER_CLASS,
+        '--master',
+        master_url,
+        '--name',
+        'HARI_CONNECT_SERVER',
+    ]
+    if jars:
+        command += ['--jars', ','.join(jars)]
+    if not any(
+        os.path.basename(jar).startswith('spark-connect_') for jar in jars
+    ):
+        command += [
+            '--packages',
+            f'org.apache.spark:spark-connect_{_scala_version()}:'
+            f'{pyspark.__version__}',
+        ]
+
+    configs = {
+        **(spark_extras or {}),
+        'spark.connect.grpc.binding.port': str(port),
+    }
+    for key, value in configs.items():
+        command += ['--conf', f'{key}={value}']
+
+    # spark-submit needs a primary resource; 'spark-internal' tells it the
+    # main class is already on the classpath, as the Thrift server does.
+    command.append('spark-internal')
+    return {'command': command}
+
+
+def serve_connect_server(
+    configs_path: Optional[str] = './configs/configs.yaml',
+    port: int = DEFAULT_CONNECT_PORT,
+    spark_extras: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Run a Spark Connect server in the foreground until it stops.
+
+    The master URL, jars and settings derived from `job_resources` are
+    read from configs.yaml, as in `HariSparkSessionManager.configure`.
+    Jobs attach to the server with the 'connect' environment.
+
+    Parameters:
+        configs_path (Optional[str]): Path to configs.yaml. Default is
+            './configs/configs.yaml'.
+        port (int): The gRPC port of the server. Default is 15002.
+        spark_extras (Optional[Dict[str, str]]): Spark settings of the
+            server. They take precedence over the derived settings.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'command' and
+            'returncode'.
+
+    Examples:
+        >>> serve_connect_server() # doctest: +SKIP
+        {'command': ['.../spark-submit', '--class', ...], 'returncode': 0}
+    """
+    configs = {}
+    if configs_path and os.path.exists(configs_path):
+        configs = read_yaml_to_dict(configs_path) or {}
+
+    master_url = configs.get('master_url') or 'local[*]'
+    spark_extras = {
+        **derive_spark_configs_from_configs(configs, master_url=master_url),
+        **(spark_extras or {}),
+    }
+    command = build_connect_server_command(
+        port=port,
+        master_url=master_url,
+        jars_path=configs.get('jars_path'),
+        spark_extras=spark_extras,
+    )['command']
+
+    process = subprocess.run(command)
+    return {'command': command, 'returncode': process.returncode}
@@ -1,12 +1,26 @@
+import time
 from threading import Lock
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Type
 
 from pyspark.sql import SparkSession
+from pyspark.sql.utils import is_remote
 
 from hari_data.session.hari.hari_spark_session import BaseHariSparkSession
+from hari_data.session.hari.hari_spark_session_connect import (
+    HariSparkSessionConnect,
+)
 from hari_data.session.hari.hari_spark_session_generic import (
     HariSparkSessionGeneric,
 )
+from hari_data.session.hari.hari_spark_session_local_dev import (
+    HariSparkSessionLocalDev,
+)
+from hari_data.session.hari.hari_spark_session_single_node import (
+    HariSparkSessionSingleNode,
+)
+from hari_data.session.hari_spark_tuning import (
+    derive_spark_configs_from_configs,
+)
 from hari_data.utils.helpers import read_yaml_to_dict
 from hari_data.utils.logger import logger_manager
 from hari_data.utils.validators import (
@@ -20,9 +34,17 @@ class HariSparkSessionManager:
     _spark_session: Optional[SparkSession] = None
     _logger = None
     _lock: Lock = Lock()
+    _startup_metrics: Dict[str, float] = {}
+    # Replaced, never mutated, so the class default stays empty.
+    _sessions: Dict[str, SparkSession] = {}
+    # URL of the Spark Connect server, when env='connect'.
+    _remote_url: Optional[str] = None
 
-    __factories: Dict[str, BaseHariSparkSession] = {
+    __factories: Dict[str, Type[BaseHariSparkSession]] = {
         'local': HariSparkSessionGeneric,
+        'local-dev': HariSparkSessionLocalDev,
+        'single-node': HariSparkSessionSingleNode,
+        'connect': HariSparkSessionConnect,
     }
 
     def __new__(cls):
@@ -34,6 +56,59 @@ class HariSparkSessionManager:
                     ).__new__(cls)
         return cls._instance
 
+    @classmethod
+    def register_factory(
+        cls, env: str, factory_class: Type[BaseHariSparkSession]
+    ) -> None:
+        """
+        Register a Spark session factory for an environment.
+
+        Registering an existing environment replaces its factory.
+
+        Parameters:
+            env (str): The environment name passed to `configure`.
+            factory_class (Type[BaseHariSparkSession]): A subclass of
+                BaseHariSparkSession, usually overriding `get_default_configs`.
+
+        Raises:
+            ValueError: If the environment is empty or the factory is not a
+                BaseHariSparkSession subclass.
+
+        Examples:
+            >>> class HariSparkSessionNightly(HariSparkSessionGeneric): # doctest: +SKIP
+            ...     def get_default_configs(self):
+            ...         return {'spark.sql.shuffle.partitions': '400'}
+            >>> HariSparkSessionManager.register_factory( # doctest: +SKIP
+            ...     'nightly', HariSparkSessionNightly
+            ... )
+            >>> HariSparkSessionManager().configure(env='nightly') # doctest: +SKIP
+            Spark session configured for environment: nightly
+        """
+        env = validate_non_empty_string(env, 'env')['value'].lower()
+        if not (
+            isinstance(factory_class, type)
+            and issubclass(factory_class, BaseHariSparkSession)
+        ):
+            raise ValueError(
+                'factory_class must be a subclass of BaseHariSparkSession.'
+            )
+        with cls._lock:
+            cls.__factories[env] = factory_class
+
+    @classmethod
+    def get_factories(cls) -> Dict[str, Type[BaseHariSparkSession]]:
+        """
+        Get the registered Spark session factories.
+
+        Returns:
+            Dict[str, Type[BaseHariSparkSession]]: The factories by environment.
+
+        Examples:
+            >>> list(HariSparkSessionManager.get_factories())
+            ['local', 'local-dev', 'single-node', 'connect']
+        """
+        return dict(cls.__factories)
+
     @property
     def is_configured(self) -> bool:
         """
@@ -64,14 +139,19 @@ class HariSparkSessionManager:
         master_url: Optional[str] = 'local[*]',
         jars_path: Optional[str] = None,
         spark_extras: Optional[Dict[str, str]] = None,
+        measure_first_action: bool = False,
     ) -> None:
         """
         Configure the Spark session based on the specified environment.
 
         Parameters:
-            env (str): The environment to configure the Spark session for (e.g., 'local').
+            env (str): The environment to configure the Spark session for: 'local', 'local-dev'
+                       (small local runs), 'single-node' (large single-machine batch jobs), 'connect'
+                       (attach to `hari session serve`) or one added with `register_factory`.
             configs_path (str): Path to a YAML configuration file that may contain
                                 'app_name', 'log_level', 'master_url', and 'jars_path' settings.
+                                When it declares 'job_resources', Spark settings are derived
+                                from them, 'job_type' and the size of 'input_datasets'.
                                 Default is './configs/configs.yaml'.
             app_name (Optional[str]): The name of the Spark application. Default is 'HARI_JOB_DEFAULT'.
             log_level (Optional[str]): The logging level for Spark (e.g., 'DEBUG', 'INFO', 'WARNING', 'ERROR',
@@ -80,6 +160,10 @@ class HariSparkSessionManager:
             jars_path (Optional[str]): Path to the directory containing JAR files to include in the Spark session.
                                     Default is None.
             spark_extras: Additional Spark configuration options as keyword arguments.
+                          They take precedence over the derived settings.
+            measure_first_action (bool): Run a one-row Spark job after the session
+                                         starts and record its duration as 'first_action_s'
+                                         in `get_startup_metrics()`. Default is False.
 
         Raises:
             ValueError: If the specified environment is not supported or if configuration parameters are invalid.
@@ -96,68 +180,112 @@ class HariSparkSessionManager:
             >>> HariSparkSessionManager().configure(env='123')
             Traceback (most recent call last):
                 ...
-            ValueError: Unsupported environment '123'. Supported environments: ['local'].
+            ValueError: Unsupported environment '123'. Supported environments: ['local', 'local-dev', 'single-node', 'connect'].
 
         """
 
-        if self.is_configured:
-            print(
-                'Spark session is already configured. Skipping reconfiguration.'
+        # Concurrent callers wait for the first one and then skip, instead of
+        # each creating a SparkSession.
+        with self._lock:
+            if self.is_configured:
+                print(
+                    'Spark session is already configured. Skipping reconfiguration.'
+                )
+                return
+
+            start = time.perf_counter()
+            configs = {}
+
+            if configs_path:
+                try:
+                    configs_path = validate_path_exists(
+                        configs_path, 'configs_path'
+                    )['value']
+                    configs = read_yaml_to_dict(configs_path)
+
+                except Exception as e:
+                    print(
+                        f'Error reading configs from {configs_path}: {e}. Using Provided Parameters.'
+                    )
+
+            app_name = configs.get('app_name', app_name)
+            log_level = configs.get('log_level', log_level)
+            master_url = configs.get('master_url', master_url)
+            jars_path = configs.get('jars_path', jars_path)
+
+            if not self._logger:
+                logger_manager.configure(
+                    app_name=app_name,
+                    log_level=log_level,
+                )
+
+            self._logger = logger_manager.get_logger()['logger']
+
+            tuned_configs = derive_spark_configs_from_configs(
+                configs, master_url=master_url
             )
-            return
+            if tuned_configs:
+                self._logger.info(
+                    f'Spark settings derived from job_resources: {tuned_configs}'
+                )
+                spark_extras = {**tuned_configs, **(spark_extras or {})}
+            config_load_s = round(time.perf_counter() - start, 4)
 
-        configs = {}
+            env: Dict[str, str] = validate_non_empty_string(env, 'env')[
+                'value'
+            ].lower()
 
-        if configs_path:
-            try:
-                configs_path = validate_path_exists(
-                    configs_path, 'configs_path'
-                )['value']
-                configs = read_yaml_to_dict(configs_path)
+            factory_class = self.__factories.get(
+                validate_non_empty_string(env, 'env')['value'].lower()
+            )
 
-            except Exception as e:
-                print(
-                    f'Error reading configs from {configs_path}: {e}. Using Provided Parameters.'
+            if not factory_class:
+                raise ValueError(
+                    f"Unsupported environment '{env}'. Supported environments: {list(self.__factories.keys())}."
                 )
 
-        app_name = configs.get('app_name', app_name)
-        log_level = configs.get('log_level', log_level)
-        master_url = configs.get('master_url', master_url)
-        jars_path = configs.get('jars_path', jars_path)
-
-        if not self._logger:
-            logger_manager.configure(
+            factory: BaseHariSparkSession = factory_class(
                 app_name=app_name,
-                log_level=log_level,
+                master_url=master_url,
+                spark_log_level=log_level,
+                jars_path=jars_path,
             )
 
-        self._logger = logger_manager.get_logger()['logger']
-        env: Dict[str, str] = validate_non_empty_string(env, 'env')[
-            'value'
-        ].lower()
-
-        factory_class = self.__factories.get(
-            validate_non_empty_string(env, 'env')['value'].lower()
-        )
+            spark: Dict[str, SparkSession] = factory.create_spark_session(
+                spark_extras=spark_extras,
+                measure_first_action=measure_first_action,
+            )
 
-        if not factory_class:
-            raise ValueError(
-                f"Unsupported environment '{env}'. Supported environments: {list(self.__factories.keys())}."
+            self._spark_session = spark.get('spark_session')
+            self._remote_url = getattr(factory, '_remote_url', None)
+            self._startup_metrics = {
+                'config_load_s': config_load_s,
+                **factory.get_startup_metrics()['startup_metrics'],
+                'total_s': round(time.perf_counter() - start, 4),
+            }
+            self._logger.info(
+                f'Spark startup metrics: {self._startup_metrics}'
             )
+            print(f'Spark session configured for environment: {env}')
 
-        factory: BaseHariSparkSession = factory_class(
-            app_name=app_name,
-            master_url=master_url,
-            spark_log_level=log_level,
-            jars_path=jars_path,
-        )
+    def get_startup_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get the duration, in seconds, of each phase of the last `configure`
+        call: 'config_load_s' (configs.yaml and derived settings),
+        'jar_discovery_s', 'jvm_gateway_s', 'get_or_create_s',
+        'first_action_s' (only with `measure_first_action`) and 'total_s'.
+        Phases a factory does not have, e.g. the JVM gateway of 'connect',
+        are missing.
 
-        spark: Dict[str, SparkSession] = factory.create_spark_session(
-            spark_extras=spark_extras
-        )
+        Returns:
+            Dict[str, Dict[str, float]]: A dictionary with the key
+            'startup_metrics', empty if the session was not configured.
 
-        self._spark_session = spark.get('spark_session')
-        print(f'Spark session configured for environment: {env}')
+        Examples:
+            >>> HariSparkSessionManager().get_startup_metrics() # doctest: +SKIP
+            {'startup_metrics': {'config_load_s': 0.0031, 'jar_discovery_s': 0.0002, 'jvm_gateway_s': 2.7415, 'get_or_create_s': 1.8812, 'first_action_s': 0.6127, 'total_s': 5.2436}}
+        """
+        return {'startup_metrics': dict(self._startup_metrics)}
 
     def get_spark_session(self) -> Dict[str, SparkSession]:
         """
@@ -187,9 +315,118 @@ class HariSparkSessionManager:
             )
         return {'spark_session': self._spark_session}
 
+    def get_named_session(
+        self, name: str, spark_conf: Optional[Dict[str, str]] = None
+    ) -> Dict[str, SparkSession]:
+        """
+        Get a named Spark session, creating it on the first call.
+
+        Named sessions are created with `SparkSession.newSession()`: they
+        share the SparkContext, executors and cached data of the configured
+        session, but have their own SQL settings, temporary views and
+        registered functions. Independent job steps can therefore run
+        concurrently in one driver, each in its own session. With Spark
+        Connect, which has no `newSession()`, a new session of the server
+        is created instead. Creation is thread-safe; every caller of the
+        same name gets the same session.
+
+        Parameters:
+            name (str): The name of the session.
+            spark_conf (Optional[Dict[str, str]]): Runtime SQL settings of
+                the session, e.g. 'spark.sql.shuffle.partitions'. Applied
+                only when the session is created.
+
+        Returns:
+            Dict[str, SparkSession]: A dictionary containing the SparkSession instance.
+
+        Raises:
+            ValueError: If the name is empty or the Spark session has not been configured.
+
+        Examples:
+            >>> sales = HariSparkSessionManager().get_named_session( # doctest: +SKIP
+            ...     'sales', spark_conf={'spark.sql.shuffle.partitions': '8'}
+            ... )['spark_session']
+            >>> sales.sparkContext is HariSparkSessionManager().get_spark_session()['spark_session'].sparkContext # doctest: +SKIP
+            True
+        """
+        name = validate_non_empty_string(name, 'name')['value']
+        if not self.is_configured:
+            raise ValueError(
+                "Spark session is not configured. Please call 'configure' first."
+            )
+
+        session = self._sessions.get(name)
+        if session is not None:
+            return {'spark_session': session}
+
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is None:
+                if is_remote():
+                    session = SparkSession.builder.remote(
+                        self._remote_url
+                    ).create()
+                else:
+                    session = self._spark_session.newSession()
+                for key, value in (spark_conf or {}).items():
+                    session.conf.set(key, value)
+                self._sessions = {**self._sessions, name: session}
+                if self._logger:
+                    self._logger.info(f"Spark session '{name}' created.")
+        return {'spark_session': session}
+
+    def list_named_sessions(self) -> Dict[str, List[str]]:
+        """
+        List the names of the named Spark sessions.
+
+        Returns:
+            Dict[str, List[str]]: A dictionary with the key 'sessions'.
+
+        Examples:
+            >>> HariSparkSessionManager().list_named_sessions() # doctest: +SKIP
+            {'sessions': ['sales', 'stock']}
+        """
+        return {'sessions': sorted(self._sessions)}
+
+    def close_named_session(self, name: str) -> None:
+        """
+        Drop the temporary views of a named Spark session and forget it.
+
+        The session is not stopped, since stopping it would stop the shared
+        SparkContext; use `stop_spark_session` for that.
+
+        Parameters:
+            name (str): The name of the session. Unknown names are ignored.
+
+        Examples:
+            >>> HariSparkSessionManager().close_named_session('sales') # doctest: +SKIP
+        """
+        with self._lock:
+            session = self._sessions.get(name)
+            if session is None:
+                return
+            self._sessions = {
+                key: value
+                for key, value in self._sessions.items()
+                if key != name
+            }
+
+        if is_remote():
+            # Spark Connect sessions have no JVM handle to reach the
+            # session catalog, so the views are dropped through the server.
+            for table in session.catalog.listTables():
+                if table.isTemporary:
+                    session.catalog.dropTempView(table.name)
+            return
+
+        # Listing the tables through session.catalog would also query the
+        # metastore; the temporary views only live in the session catalog.
+        session._jsparkSession.sessionState().catalog().clearTempTables()
+
     def stop_spark_session(self) -> None:
         """
-        Stop the Spark session and reset the manager.
+        Stop the Spark session and reset the manager, including its named
+        sessions.
 
         Examples:
             >>> HariSparkSessionManager._instance = None; HariSparkSessionManager._spark_session = None
@@ -203,6 +440,8 @@ class HariSparkSessionManager:
             return
         self._spark_session.stop()
         self._spark_session = None
+        self._sessions = {}
+        self._remote_url = None
         self._instance = None
         print('Spark session stopped and manager reset.')
 
@@ -0,0 +1,315 @@
+"""
+Module for deriving Spark settings from the job resources declared in
+configs.yaml, so that jobs do not run with Spark's untuned defaults.
+"""
+
+import math
+import os
+import re
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+from hari_data.contract.contract_partitions import (
+    is_data_file,
+    is_local_path,
+    to_local_path,
+)
+
+MB = 1024**2
+GB = 1024**3
+
+# Target size of a shuffle partition, as recommended by the Spark tuning
+# guide and used by AQE as its default advisory size.
+TARGET_PARTITION_BYTES = 128 * MB
+
+# Cores per executor in cluster mode; more cores per JVM hurt HDFS and
+# object store throughput.
+MAX_EXECUTOR_CORES = 5
+
+# JVM overhead kept out of the heap: 10% with a floor of 384MB, like the
+# default of spark.executor.memoryOverhead.
+MEMORY_OVERHEAD_FACTOR = 0.1
+MIN_MEMORY_OVERHEAD = 384 * MB
+
+# Files listed when measuring the input datasets, so that configuring a
+# session over large local tables does not walk all of their files.
+MAX_LISTED_FILES = 10000
+
+_MEMORY = re.compile(r'^(\d+(?:\.\d+)?)\s*([kmgt]?)i?b?$', re.IGNORECASE)
+_UNITS = {'': MB, 'k': 1024, 'm': MB, 'g': GB, 't': 1024**4}
+
+
+def parse_memory(value: Union[int, float, str]) -> int:
+    """
+    Parse a memory size into bytes.
+
+    Numbers without a unit are megabytes, as in Spark memory settings.
+
+    Parameters:
+        value (Union[int, float, str]): The size, e.g. '4GB', '512m' or 2048.
+
+    Returns:
+        int: The size in bytes.
+
+    Raises:
+        ValueError: If the value cannot be parsed.
+
+    Examples:
+        >>> parse_memory('4GB')
+        4294967296
+        >>> parse_memory('512m')
+        536870912
+        >>> parse_memory(1024)
+        1073741824
+    """
+    match = _MEMORY.match(str(value).strip())
+    if not match:
+        raise ValueError(f"Invalid memory size '{value}'.")
+    amount, unit = match.groups()
+    return int(float(amount) * _UNITS[unit.lower()])
+
+
+def format_memory(size: int) -> str:
+    """
+    Format a size in bytes as a Spark memory setting, rounded down to
+    whole megabytes.
+
+    Examples:
+        >>> format_memory(4 * 1024**3)
+        '4096m'
+    """
+    return f'{max(1, size // MB)}m'
+
+
+def _data_files(local_path: str) -> Iterator[str]:
+    if os.path.isfile(local_path):
+        yield local_path
+        return
+    for root, dirs, files in os.walk(local_path):
+        dirs[:] = [name for name in dirs if is_data_file(name)]
+        for name in files:
+            if is_data_file(name):
+                yield os.path.join(root, name)
+
+
+def estimate_input_size(
+    input_datasets: Optional[List[Dict[str, Any]]],
+    max_files: int = MAX_LISTED_FILES,
+) -> Dict[str, Any]:
+    """
+    Estimate the size of the input datasets from the filesystem.
+
+    Only local paths are measured; the sizes of remote datasets are
+    unknown without a Spark session and are reported separately. At most
+    `max_files` files are listed over all the datasets: once the limit
+    is reached the size is a lower bound and the remaining datasets are
+    reported as truncated.
+
+    Parameters:
+        input_datasets (Optional[List[Dict[str, Any]]]): The
+            `input_datasets` of configs.yaml, each with a 'dataset_path'.
+        max_files (int): Maximum number of files to list. Default is
+            `MAX_LISTED_FILES`.
+
+    Returns:
+        Dict[str, Any]: A dictionary with the keys 'input_bytes',
+            'unknown' (the paths that could not be measured) and
+            'truncated' (the paths only partially measured or skipped
+            because of `max_files`).
+
+    Examples:
+        >>> estimate_input_size([{'dataset_path': '/data/sales'}]) # doctest: +SKIP
+        {'input_bytes': 53687091200, 'unknown': [], 'truncated': []}
+    """
+    input_bytes = 0
+    unknown = []
+    truncated = []
+    listed = 0
+    for dataset in input_datasets or []:
+        path = (dataset or {}).get('dataset_path')
+        if not path:
+            continue
+        if not is_local_path(path):
+            unknown.append(path)
+            continue
+
+        local_path = to_local_path(path)
+        if not os.path.exists(local_path):
+            unknown.append(path)
+            continue
+        remaining = max_files - listed
+        files = list(islice(_data_files(local_path), remaining + 1))
+        if len(files) > remaining:
+            files = files[:remaining]
+            truncated.append(path)
+        input_bytes += sum(os.path.getsize(name) for name in files)
+        listed += len(files)
+    return {
+        'input_bytes': input_bytes,
+        'unknown': unknown,
+        'truncated': truncated,
+    }
+
+
+def _heap(memory: int) -> int:
+    overhead = max(MIN_MEMORY_OVERHEAD, int(memory * MEMORY_OVERHEAD_FACTOR))
+    return max(memory - overhead, MIN_MEMORY_OVERHEAD)
+
+
+def _clamp(value: int, low: int, high: int) -> int:
+    return max(low, min(value, high))
+
+
+def derive_spark_configs(
+    cpu: int,
+    memory: Union[int, float, str],
+    job_type: str = 'batch',
+    input_bytes: int = 0,
+    master_url: str = 'local[*]',
+) -> Dict[str, str]:
+    """
+    Derive Spark settings from the resources of a job.
+
+    - In local mode the driver runs every task, so it gets the whole
+      memory minus the JVM overhead. In cluster mode the driver gets an
+      eighth of the memory (1 to 8GB) and the rest is split between
+      executors of up to 5 cores each.
+    - Batch jobs get one shuffle partition per 128MB of input, rounded up
+      to a multiple of the cores and never fewer than twice the cores.
+      Streaming jobs get one shuffle partition per core, since every
+      micro-batch pays for each partition.
+    - The AQE advisory partition size spreads the input over at least
+      two partitions per core, between 16MB and 128MB.
+    - The broadcast join threshold is 1/64 of the smallest heap, between
+      10MB and 256MB, so broadcast tables fit on the driver and executors.
+
+    Parameters:
+        cpu (int): The number of cores of the job.
+        memory (Union[int, float, str]): The memory of the job, e.g. '4GB'.
+        job_type (str): 'batch' or 'streaming'. Default is 'batch'.
+        input_bytes (int): The estimated size of the input. Default is 0
+            (unknown).
+        master_url (str): The Spark master URL. Default is 'local[*]'.
+
+    Returns:
+        Dict[str, str]: The Spark settings, ready to be passed as
+            `spark_extras`.
+
+    Raises:
+        ValueError: If `cpu` or `memory` is not positive, or `job_type` is
+            not supported.
+
+    Examples:
+        >>> derive_spark_configs(cpu=2, memory='4GB')['spark.sql.shuffle.partitions']
+        '4'
+        >>> derive_spark_configs(cpu=8, memory='16GB', input_bytes=10 * 1024**3)['spark.sql.shuffle.partitions']
+        '80'
+    """
+    cpu = int(cpu)
+    memory = parse_memory(memory)
+    job_type = str(job_type).strip().lower()
+    if cpu < 1:
+        raise ValueError('job_resources.cpu must be greater than 0.')
+    if memory <= 0:
+        raise ValueError('job_resources.memory must be greater than 0.')
+    if job_type not in ('batch', 'streaming'):
+        raise ValueError(
+            f"Unsupported job_type '{job_type}'. "
+            "Supported job types: ['batch', 'streaming']."
+        )
+
+    configs: Dict[str, str] = {}
+    if str(master_url).startswith('local'):
+        cores = cpu
+        driver_heap = _heap(memory)
+        smallest_heap = driver_heap
+        configs['spark.driver.memory'] = format_memory(driver_heap)
+    else:
+        driver_memory = _clamp(memory // 8, GB, 8 * GB)
+        executor_cores = min(cpu, MAX_EXECUTOR_CORES)
+        executors = max(1, cpu // executor_cores)
+        cores = executor_cores * executors
+        executor_memory = max(memory - driver_memory, GB) // executors
+        driver_heap = _heap(driver_memory)
+        executor_heap = _heap(executor_memory)
+        smallest_heap = min(driver_heap, executor_heap)
+        configs.update(
+            {
+                'spark.driver.memory': format_memory(driver_heap),
+                'spark.driver.cores': '1',
+                'spark.executor.instances': str(executors),
+                'spark.executor.cores': str(executor_cores),
+                'spark.executor.memory': format_memory(executor_heap),
+            }
+        )
+
+    if job_type == 'streaming':
+        shuffle_partitions = cores
+    else:
+        needed = math.ceil(input_bytes / TARGET_PARTITION_BYTES)
+        shuffle_partitions = max(2 * cores, math.ceil(needed / cores) * cores)
+
+    advisory = TARGET_PARTITION_BYTES
+    if input_bytes:
+        advisory = _clamp(
+            input_bytes // (2 * cores), 16 * MB, TARGET_PARTITION_BYTES
+        )
+
+    configs.update(
+        {
+            'spark.default.parallelism': str(cores),
+            'spark.sql.shuffle.partitions': str(shuffle_partitions),
+            'spark.sql.adaptive.enabled': 'true',
+            'spark.sql.adaptive.coalescePartitions.enabled': 'true',
+            'spark.sql.adaptive.advisoryPartitionSizeInBytes': str(advisory),
+            'spark.sql.autoBroadcastJoinThreshold': str(
+                _clamp(smallest_heap // 64 // MB * MB, 10 * MB, 256 * MB)
+            ),
+        }
+    )
+    return configs
+
+
+def derive_spark_configs_from_configs(
+    configs: Dict[str, Any], master_url: str = 'local[*]'
+) -> Dict[str, str]:
+    """
+    Derive Spark settings from the contents of configs.yaml.
+
+    Parameters:
+        configs (Dict[str, Any]): The parsed configs.yaml, with
+            'job_resources' ('cpu' and 'memory'), 'job_type' and
+            'input_datasets'.
+        master_url (str): The Spark master URL. Default is 'local[*]'.
+
+    Returns:
+        Dict[str, str]: The settings of `derive_spark_configs()`, or an
+            empty dictionary if 'job_resources' is missing or incomplete.
+
+    Raises:
+        ValueError: If the resources or job type are invalid.
+
+    Examples:
+        >>> derive_spark_configs_from_configs({'job_type': 'batch'})
+        {}
+        >>> derive_spark_configs_from_configs(
+        ...     {'job_resources': {'cpu': 2, 'memory': '4GB'}}
+        ... )['spark.driver.memory']
+        '3686m'
+    """
+    resources = configs.get('job_resources') or {}
+    if not isinstance(resources, dict):
+        return {}
+    if resources.get('cpu') is None or resources.get('memory') is None:
+        return {}
+
+    input_bytes = estimate_input_size(configs.get('input_datasets'))[
+        'input_bytes'
+    ]
+    return derive_spark_configs(
+        cpu=resources['cpu'],
+        memory=resources['memory'],
+        job_type=configs.get('job_type') or 'batch',
+        input_bytes=input_bytes,
+        master_url=master_url,
+    )
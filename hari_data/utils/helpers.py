@@ -1,13 +1,37 @@
 import os
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# The LibYAML bindings are much faster than the pure-Python ones, but are
+# only available when PyYAML was built against LibYAML.
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
 
-def is_hari_project() -> bool:
+YAML_CACHE_SIZE = 256
+
+CONTRACTS_DIR = 'contracts'
+
+# Parsed documents by absolute path, with the (mtime_ns, size) of the file
+# they were parsed from.
+_yaml_cache: 'OrderedDict[str, Tuple[int, int, Any]]' = OrderedDict()
+_yaml_cache_lock = Lock()
+
+
+def is_hari_project(path: str = '.') -> bool:
     """
-    Check if the current directory is a Hari project by looking for the
+    Check if a directory is a Hari project by looking for the
     presence of a 'hari.lock' file.
 
+    Parameters:
+        path (str): The directory to check. Default is the current directory.
+
     Returns:
         bool: True if 'hari.lock' exists, indicating a Hari project; False otherwise.
 
@@ -15,7 +39,54 @@ def is_hari_project() -> bool:
         >>> is_hari_project() # doctest: +SKIP
         True
     """
-    return os.path.exists('hari.lock')
+    return os.path.exists(os.path.join(path, 'hari.lock'))
+
+
+def get_contract_path(
+    contract_name: str, contracts_dir: str = CONTRACTS_DIR
+) -> Dict[str, str]:
+    """
+    Resolve the YAML file of a contract.
+
+    The file is '<contracts_dir>/<contract_name>.yaml'. When there is no
+    such file, the contract is looked up by the name it declares in the
+    contract registry index, so contract files need not be named after
+    their contract.
+
+    Parameters:
+        contract_name (str): The name of the contract or the path to its
+            YAML file.
+        contracts_dir (str): The directory where contracts are stored.
+            Default is 'contracts'.
+
+    Returns:
+        Dict[str, str]: A dictionary with the key 'contract_path'.
+
+    Raises:
+        ValueError: If several contract files declare the name.
+
+    Examples:
+        >>> get_contract_path('sales')
+        {'contract_path': 'contracts/sales.yaml'}
+
+        >>> get_contract_path('/data/contracts/sales.yaml')
+        {'contract_path': '/data/contracts/sales.yaml'}
+    """
+    if contract_name.endswith(('.yaml', '.yml')):
+        return {'contract_path': contract_name}
+    contract_path = os.path.join(contracts_dir, f'{contract_name}.yaml')
+    if not os.path.exists(contract_path) and os.path.isdir(contracts_dir):
+        # Imported here, since the registry reads contracts with helpers.
+        from hari_data.contract.contract_registry import (
+            get_contract_registry,
+        )
+
+        registry = get_contract_registry(contracts_dir)
+        registry.refresh()
+        contract = registry.get_contract(contract_name)['contract']
+        if contract is not None:
+            contract_path = contract['file']
+    return {'contract_path': contract_path}
 
 
 def create_yaml_from_dict(data: dict, dir: str, file_name: str) -> None:
@@ -47,6 +118,7 @@ def create_yaml_from_dict(data: dict, dir: str, file_name: str) -> None:
             yaml.dump(
                 data,
                 file,
+                Dumper=YamlDumper,
                 default_flow_style=False,
                 sort_keys=False,
                 allow_unicode=True,
@@ -58,15 +130,41 @@ def create_yaml_from_dict(data: dict, dir: str, file_name: str) -> None:
         raise yaml.YAMLError(f'Error writing YAML file: {e}')
 
 
+def _yaml_cache_key(file_path: str) -> Optional[Tuple[str, int, int]]:
+    try:
+        stat = os.stat(file_path)
+    except (OSError, TypeError, ValueError):
+        return None
+    return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+
+def clear_yaml_cache() -> None:
+    """
+    Clear the cache of parsed YAML documents.
+
+    Examples:
+        >>> clear_yaml_cache()
+    """
+    with _yaml_cache_lock:
+        _yaml_cache.clear()
+
+
 def read_yaml_to_dict(file_path: str) -> dict:
     """
     Read a YAML file and convert its contents to a dictionary.
 
+    Parsed documents are kept in an in-process LRU cache keyed by the
+    path, modification time and size of the file, so reading an unchanged
+    file again only costs a stat. The cached document itself is returned
+    and shared by every caller reading the file, so callers must not
+    modify it; copy it first (e.g. with `copy.deepcopy`) to change it.
+
     Parameters:
         file_path (str): The path to the YAML file.
 
     Returns:
-        dict: The contents of the YAML file as a dictionary.
+        dict: The contents of the YAML file as a dictionary, shared with
+            the cache.
 
     Examples:
         >>> read_yaml_to_dict('/path/to/file.yaml') # doctest: +SKIP
@@ -76,11 +174,29 @@ def read_yaml_to_dict(file_path: str) -> dict:
         FileNotFoundError: If the specified file does not exist.
         yaml.YAMLError: If there is an error in reading the YAML file.
     """
+    key = _yaml_cache_key(file_path)
+    if key is not None:
+        path, mtime_ns, size = key
+        with _yaml_cache_lock:
+            cached = _yaml_cache.get(path)
+            if cached is not None and cached[:2] == (mtime_ns, size):
+                _yaml_cache.move_to_end(path)
+                return cached[2]
+
     try:
         with open(file_path, 'r') as file:
-            data = yaml.safe_load(file)
-            return data if data is not None else {}
+            data = yaml.load(file, Loader=YamlLoader)
+            data = data if data is not None else {}
     except FileNotFoundError as e:
         raise FileNotFoundError(f'YAML file not found: {e}')
     except yaml.YAMLError as e:
         raise yaml.YAMLError(f'Error reading YAML file: {e}')
+
+    if key is not None:
+        with _yaml_cache_lock:
+            _yaml_cache[path] = (mtime_ns, size, data)
+            _yaml_cache.move_to_end(path)
+            while len(_yaml_cache) > YAML_CACHE_SIZE:
+                _yaml_cache.popitem(last=False)
+
+    return data
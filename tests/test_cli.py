@@ -1,8 +1,13 @@
+import json
 import re
+import subprocess
+import sys
+from datetime import datetime, timedelta
 
 from typer.testing import CliRunner
 
 from hari_data.cli.commands.cli import add_columns, app
+from hari_data.exceptions import HariContractError
 
 runner = CliRunner()
 
@@ -413,3 +418,831 @@ def test_contract_with_sla(mocker):
         ],
         sla={'frequency': 'daily', 'tolerance': '1 hour'},
     )
+
+
+def test_compact_success(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_manager = mocker.patch(
+        'hari_data.session.hari_spark_session_manager.HariSparkSessionManager'
+    )
+    mock_compact = mocker.patch(
+        'hari_data.contract.contract_compaction.compact_contract_table'
+    )
+    mock_compact.return_value = {
+        'path': '/data/sales',
+        'partitions': [
+            {
+                'name': 'city=Recife',
+                'files_before': 12,
+                'files_after': 1,
+                'compacted': True,
+            },
+            {
+                'name': 'city=Natal',
+                'files_before': 1,
+                'files_after': 1,
+                'compacted': False,
+            },
+        ],
+    }
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        ['compact', 'sales', '--sort-by', 'sale_id', '--sort-by', 'amount'],
+        env={'NO_COLOR': '1', 'COLUMNS': '120'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    mock_manager.return_value.configure.assert_called_once_with(
+        env='local', configs_path='./configs/configs.yaml'
+    )
+    mock_compact.assert_called_once_with(
+        'sales', target_file_size_mb=128, sort_by=['sale_id', 'amount']
+    )
+    assert 'city=Recife │ 12 │ 1 │ compacted' in result_cleaned
+    assert 'city=Natal │ 1 │ 1 │ skipped' in result_cleaned
+    assert '1 of 2 partitions rewritten' in result_cleaned
+
+
+def test_compact_contract_error(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.session.hari_spark_session_manager.HariSparkSessionManager'
+    )
+    mocker.patch(
+        'hari_data.contract.contract_compaction.compact_contract_table',
+        side_effect=HariContractError(
+            'contracts/sales.yaml', 'Compaction requires a local output path'
+        ),
+    )
+
+    # ---- Act ----
+    result = runner.invoke(app, ['compact', 'sales'], env={'NO_COLOR': '1'})
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    assert 'Compaction requires a local output path' in result.output
+
+
+def benchmark_results(wall_time_s):
+    return {
+        'results': [
+            {
+                'workload': 'read',
+                'rows': 1000,
+                'wall_time_s': wall_time_s,
+                'stages': 1,
+                'tasks': 4,
+                'input_bytes': 2**20,
+                'output_bytes': 0,
+            }
+        ]
+    }
+
+
+def test_bench_success(mocker, tmp_path):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.session.hari_spark_session_manager.HariSparkSessionManager'
+    )
+    mock_run = mocker.patch(
+        'hari_data.contract.contract_benchmark.run_benchmarks',
+        return_value=benchmark_results(1.0),
+    )
+    output = str(tmp_path / 'bench.json')
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        [
+            'bench',
+            '--scales',
+            '1000',
+            '--workloads',
+            'read',
+            '--output',
+            output,
+        ],
+        env={'NO_COLOR': '1', 'COLUMNS': '160'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    mock_run.assert_called_once_with(
+        scales=[1000], workloads=['read'], work_dir=None, repeat=1
+    )
+    assert 'read │ 1000 │ 1.000 │ 1 │ 4 │ 1.0 │ 0.0 │ - │ -' in result_cleaned
+    with open(output) as file:
+        assert json.load(file) == benchmark_results(1.0)
+
+
+def test_bench_without_stage_metrics(mocker, tmp_path):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.session.hari_spark_session_manager.HariSparkSessionManager'
+    )
+    results = benchmark_results(1.0)
+    # Spark Connect sessions only report the wall time.
+    results['results'][0].update(
+        {'stages': None, 'tasks': None, 'input_bytes': None}
+    )
+    results['results'][0]['output_bytes'] = None
+    mocker.patch(
+        'hari_data.contract.contract_benchmark.run_benchmarks',
+        return_value=results,
+    )
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        ['bench', '--env', 'connect', '--output', str(tmp_path / 'b.json')],
+        env={'NO_COLOR': '1', 'COLUMNS': '160'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    assert 'read │ 1000 │ 1.000 │ - │ - │ - │ - │ - │ -' in result_cleaned
+
+
+def test_bench_regression_exits_with_error(mocker, tmp_path):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.session.hari_spark_session_manager.HariSparkSessionManager'
+    )
+    mocker.patch(
+        'hari_data.contract.contract_benchmark.run_benchmarks',
+        return_value=benchmark_results(1.5),
+    )
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(benchmark_results(1.0)))
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        [
+            'bench',
+            '--output',
+            str(tmp_path / 'bench.json'),
+            '--baseline',
+            str(baseline),
+        ],
+        env={'NO_COLOR': '1', 'COLUMNS': '160'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    assert '1.000 │ +50.0%' in result_cleaned
+    assert '1 workloads regressed by more than 10%' in result_cleaned
+
+
+def test_contract_sla_stale_exits_with_error(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_check = mocker.patch('hari_data.cli.commands.cli.check_contracts_sla')
+    mock_check.return_value = {
+        'results': [
+            {
+                'contract': 'sales',
+                'path': '/data/sales',
+                'status': 'fresh',
+                'last_modified': datetime(2025, 8, 1, 6, 0, 0),
+                'age': timedelta(hours=2),
+                'max_age': timedelta(days=1),
+                'message': '',
+            },
+            {
+                'contract': 'customers',
+                'path': '/data/customers',
+                'status': 'stale',
+                'last_modified': datetime(2025, 7, 30, 6, 0, 0),
+                'age': timedelta(days=2, seconds=0.5),
+                'max_age': timedelta(days=1),
+                'message': '',
+            },
+        ]
+    }
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        ['contract', 'sla', 'sales', 'customers'],
+        env={'NO_COLOR': '1', 'COLUMNS': '160'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    mock_check.assert_called_once_with(
+        ['sales', 'customers'], max_workers=None
+    )
+    assert (
+        'sales │ fresh │ 2025-08-01 06:00:00 │ 2:00:00 │ 1 day, 0:00:00'
+        in result_cleaned
+    )
+    assert 'customers │ stale │ 2025-07-30 06:00:00 │ 2 days, 0:00:00' in (
+        result_cleaned
+    )
+
+
+def test_contract_sla_all_fresh(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_check = mocker.patch('hari_data.cli.commands.cli.check_contracts_sla')
+    mock_check.return_value = {
+        'results': [
+            {
+                'contract': 'events',
+                'path': 's3a://bucket/events',
+                'status': 'skipped',
+                'last_modified': None,
+                'age': None,
+                'max_age': timedelta(hours=1),
+                'message': 'Output table is not a local path',
+            },
+        ]
+    }
+
+    # ---- Act ----
+    result = runner.invoke(
+        app, ['contract', 'sla'], env={'NO_COLOR': '1', 'COLUMNS': '160'}
+    )
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    mock_check.assert_called_once_with(None, max_workers=None)
+    assert 'Output table is not a local path' in result.output
+
+
+def test_contract_new_from_spec(mocker, tmp_path):
+    # ---- Arrange ----
+    spec_path = tmp_path / 'columns.csv'
+    spec_path.write_text('name,type,is_unique\nid,int,true\ncity,string,\n')
+    args = [
+        'contract',
+        'new',
+        'test_contract',
+        '--output-table-name',
+        'test',
+        '--output-table-format',
+        'parquet',
+        '--output-table-path',
+        '/tmp',
+        '--sla',
+        'n',
+        '--description',
+        '',
+        '--owner-email',
+        '',
+        '--from-spec',
+        str(spec_path),
+        '--partitioned-by',
+        'city',
+    ]
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_add_columns = mocker.patch('hari_data.cli.commands.cli.add_columns')
+    mock_contract = mocker.patch('hari_data.cli.commands.cli.contract')
+    mock_create_yaml = mocker.patch(
+        'hari_data.cli.commands.cli.create_yaml_from_dict'
+    )
+
+    # ---- Act ----
+    result = runner.invoke(app, args, env={'NO_COLOR': '1'})
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    assert 'Read 2 columns from' in result.output
+    mock_add_columns.assert_not_called()
+    mock_create_yaml.assert_called_once()
+    mock_contract.assert_called_once_with(
+        version=mocker.ANY,
+        created_at=mocker.ANY,
+        name='test_contract',
+        description='',
+        owner_email='',
+        output_table={
+            'name': 'test',
+            'path': '/tmp',
+            'format': 'parquet',
+            'partitioned_by': ['city'],
+        },
+        columns=[
+            {
+                'name': 'id',
+                'type': 'int',
+                'is_nullable': True,
+                'is_unique': True,
+            },
+            {
+                'name': 'city',
+                'type': 'string',
+                'is_nullable': True,
+                'is_unique': False,
+            },
+        ],
+        sla=None,
+    )
+
+
+def test_contract_new_from_spec_unknown_partition(mocker, tmp_path):
+    # ---- Arrange ----
+    spec_path = tmp_path / 'columns.json'
+    spec_path.write_text('[{"name": "id", "type": "int"}]')
+    args = [
+        'contract',
+        'new',
+        'test_contract',
+        '--output-table-name',
+        'test',
+        '--output-table-format',
+        'parquet',
+        '--output-table-path',
+        '/tmp',
+        '--sla',
+        'n',
+        '--description',
+        '',
+        '--owner-email',
+        '',
+        '--from-spec',
+        str(spec_path),
+        '--partitioned-by',
+        'city',
+    ]
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_create_yaml = mocker.patch(
+        'hari_data.cli.commands.cli.create_yaml_from_dict'
+    )
+
+    # ---- Act ----
+    result = runner.invoke(app, args, env={'NO_COLOR': '1'})
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    assert "Partition columns not in the spec: ['city']" in result.output
+    mock_create_yaml.assert_not_called()
+
+
+def test_contract_new_from_spec_skips_prompts(mocker, tmp_path):
+    # ---- Arrange ----
+    spec_path = tmp_path / 'columns.json'
+    spec_path.write_text('[{"name": "id", "type": "int"}]')
+    args = [
+        'contract',
+        'new',
+        'test_contract',
+        '--output-table-name',
+        'test',
+        '--output-table-format',
+        'parquet',
+        '--output-table-path',
+        '/tmp',
+        '--from-spec',
+        str(spec_path),
+    ]
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_prompt = mocker.patch('hari_data.cli.commands.cli.prompt')
+    mock_contract = mocker.patch('hari_data.cli.commands.cli.contract')
+    mocker.patch('hari_data.cli.commands.cli.create_yaml_from_dict')
+
+    # ---- Act ----
+    result = runner.invoke(app, args, env={'NO_COLOR': '1'})
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    mock_prompt.assert_not_called()
+    kwargs = mock_contract.call_args.kwargs
+    assert kwargs['description'] == ''
+    assert kwargs['owner_email'] == ''
+    assert kwargs['sla'] is None
+
+
+def test_contract_new_from_spec_with_sla(mocker, tmp_path):
+    # ---- Arrange ----
+    spec_path = tmp_path / 'columns.json'
+    spec_path.write_text('[{"name": "id", "type": "int"}]')
+    args = [
+        'contract',
+        'new',
+        'test_contract',
+        '--output-table-name',
+        'test',
+        '--output-table-format',
+        'parquet',
+        '--output-table-path',
+        '/tmp',
+        '--from-spec',
+        str(spec_path),
+        '--sla',
+        'y',
+    ]
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_prompt = mocker.patch('hari_data.cli.commands.cli.prompt')
+    mock_contract = mocker.patch('hari_data.cli.commands.cli.contract')
+    mock_create_yaml = mocker.patch(
+        'hari_data.cli.commands.cli.create_yaml_from_dict'
+    )
+
+    # ---- Act ----
+    missing = runner.invoke(app, args, env={'NO_COLOR': '1'})
+    result = runner.invoke(
+        app,
+        args + ['--sla-frequency', 'daily', '--sla-tolerance', '1 hour'],
+        env={'NO_COLOR': '1'},
+    )
+
+    # ---- Assert ----
+    assert missing.exit_code == 1
+    assert (
+        'Missing options with --from-spec: --sla-frequency, --sla-tolerance'
+        in missing.output
+    )
+    assert result.exit_code == 0
+    mock_prompt.assert_not_called()
+    mock_create_yaml.assert_called_once()
+    assert mock_contract.call_args.kwargs['sla'] == {
+        'frequency': 'daily',
+        'tolerance': '1 hour',
+    }
+
+
+def test_contract_new_from_spec_missing_output_table(mocker, tmp_path):
+    # ---- Arrange ----
+    spec_path = tmp_path / 'columns.json'
+    spec_path.write_text('[{"name": "id", "type": "int"}]')
+    args = [
+        'contract',
+        'new',
+        'test_contract',
+        '--output-table-name',
+        'test',
+        '--from-spec',
+        str(spec_path),
+    ]
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_create_yaml = mocker.patch(
+        'hari_data.cli.commands.cli.create_yaml_from_dict'
+    )
+
+    # ---- Act ----
+    result = runner.invoke(app, args, env={'NO_COLOR': '1'})
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    assert (
+        'Missing options with --from-spec: --output-table-format, '
+        '--output-table-path' in result.output
+    )
+    mock_create_yaml.assert_not_called()
+
+
+def test_contract_import_with_errors(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_import = mocker.patch('hari_data.cli.commands.cli.import_contracts')
+    mock_import.return_value = {
+        'contracts_created': ['contracts/sales.yaml'],
+        'errors': {'broken': 'Contract has no columns.'},
+    }
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        ['contract', 'import', 'manifest.yaml', '--max-workers', '8'],
+        env={'NO_COLOR': '1', 'COLUMNS': '120'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    mock_import.assert_called_once_with(
+        'manifest.yaml',
+        version=mocker.ANY,
+        created_at=mocker.ANY,
+        overwrite=False,
+        max_workers=8,
+    )
+    assert 'broken │ Contract has no columns.' in result_cleaned
+    assert '1 contracts imported, 1 failed.' in result_cleaned
+
+
+def test_contract_infer(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_infer = mocker.patch('hari_data.cli.commands.cli.infer_contract')
+    mock_infer.return_value = {
+        'output_table': {
+            'name': 'sales',
+            'path': '/data/sales',
+            'format': 'parquet',
+            'partitioned_by': ['city'],
+        },
+        'columns': [
+            {
+                'name': 'amount',
+                'type': 'decimal',
+                'precision': 12,
+                'scale': 2,
+                'is_nullable': False,
+                'is_unique': False,
+            },
+            {
+                'name': 'city',
+                'type': 'string',
+                'is_nullable': True,
+                'is_unique': False,
+            },
+        ],
+    }
+    mock_create_yaml = mocker.patch(
+        'hari_data.cli.commands.cli.create_yaml_from_dict'
+    )
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        ['contract', 'infer', '/data/sales', '--name', 'legacy_sales'],
+        env={'NO_COLOR': '1', 'COLUMNS': '120'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    mock_infer.assert_called_once_with('/data/sales', max_workers=None)
+    assert 'amount │ decimal(12,2) │ no │' in result_cleaned
+    assert 'city │ string │ yes │ yes' in result_cleaned
+    assert 'Contract legacy_sales created successfully!' in result_cleaned
+    kwargs = mock_create_yaml.call_args.kwargs
+    assert kwargs['dir'] == 'contracts'
+    assert kwargs['file_name'] == 'legacy_sales'
+    assert kwargs['data']['name'] == 'legacy_sales'
+    assert kwargs['data']['output_table']['partitioned_by'] == ['city']
+
+
+def test_contract_infer_existing_contract(mocker, tmp_path, monkeypatch):
+    # ---- Arrange ----
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'contracts').mkdir()
+    (tmp_path / 'contracts' / 'sales.yaml').write_text('name: sales\n')
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.cli.commands.cli.infer_contract',
+        return_value={
+            'output_table': {
+                'name': 'sales',
+                'path': '/data/sales',
+                'format': 'parquet',
+                'partitioned_by': [],
+            },
+            'columns': [
+                {
+                    'name': 'id',
+                    'type': 'int',
+                    'is_nullable': False,
+                    'is_unique': False,
+                }
+            ],
+        },
+    )
+    mock_create_yaml = mocker.patch(
+        'hari_data.cli.commands.cli.create_yaml_from_dict'
+    )
+
+    # ---- Act ----
+    refused = runner.invoke(
+        app, ['contract', 'infer', '/data/sales'], env={'NO_COLOR': '1'}
+    )
+    forced = runner.invoke(
+        app,
+        ['contract', 'infer', '/data/sales', '--force'],
+        env={'NO_COLOR': '1'},
+    )
+
+    # ---- Assert ----
+    assert refused.exit_code == 1
+    assert 'Use --force to replace it' in result_cleaned_norm(refused.output)
+    assert forced.exit_code == 0
+    mock_create_yaml.assert_called_once()
+
+
+def test_contract_infer_error(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.cli.commands.cli.infer_contract',
+        side_effect=ValueError("No Parquet files found under '/data/x'."),
+    )
+
+    # ---- Act ----
+    result = runner.invoke(
+        app, ['contract', 'infer', '/data/x'], env={'NO_COLOR': '1'}
+    )
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    assert 'No Parquet files found' in result.output
+
+
+def test_contract_generate(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.session.hari_spark_session_manager.HariSparkSessionManager'
+    )
+    mock_generate = mocker.patch(
+        'hari_data.contract.contract_generator.generate_contract_table'
+    )
+    mock_generate.return_value = {
+        'path': '/tmp/sales',
+        'num_rows': 1000,
+        'num_partitions': 1,
+    }
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        [
+            'contract',
+            'generate',
+            'sales',
+            '--rows',
+            '1000',
+            '--path',
+            '/tmp/sales',
+            '--null-ratio',
+            '0.2',
+        ],
+        env={'NO_COLOR': '1'},
+    )
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    mock_generate.assert_called_once_with(
+        'sales', 1000, '/tmp/sales', null_ratio=0.2, seed=42
+    )
+    assert '1000 rows of sales written to /tmp/sales.' in result.output
+
+
+def test_session_serve(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mock_serve = mocker.patch(
+        'hari_data.session.hari_spark_connect.serve_connect_server',
+        return_value={'command': [], 'returncode': 0},
+    )
+
+    # ---- Act ----
+    result = runner.invoke(
+        app, ['session', 'serve', '--port', '15010'], env={'NO_COLOR': '1'}
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 0
+    mock_serve.assert_called_once_with(
+        configs_path='./configs/configs.yaml', port=15010
+    )
+    assert 'sc://localhost:15010' in result_cleaned
+    assert 'Spark Connect server stopped.' in result_cleaned
+
+
+def test_session_serve_failure(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=True
+    )
+    mocker.patch(
+        'hari_data.session.hari_spark_connect.serve_connect_server',
+        return_value={'command': [], 'returncode': 2},
+    )
+
+    # ---- Act ----
+    result = runner.invoke(app, ['session', 'serve'], env={'NO_COLOR': '1'})
+
+    # ---- Assert ----
+    assert result.exit_code == 2
+    assert 'exited with code 2' in result.output
+
+
+def test_run_parallel_jobs(mocker):
+    # ---- Arrange ----
+    mock_run = mocker.patch(
+        'hari_data.job.job_runner.run_jobs',
+        return_value={
+            'results': [
+                {
+                    'job': 'sales',
+                    'priority': 'high',
+                    'status': 'success',
+                    'attempts': 1,
+                    'duration_s': 1.5,
+                    'error': None,
+                },
+                {
+                    'job': 'stock',
+                    'priority': 'low',
+                    'status': 'failed',
+                    'attempts': 3,
+                    'duration_s': 0.25,
+                    'error': 'boom',
+                },
+            ]
+        },
+    )
+
+    # ---- Act ----
+    result = runner.invoke(
+        app,
+        ['run', './sales', './stock', '--parallel'],
+        env={'NO_COLOR': '1', 'COLUMNS': '160'},
+    )
+    result_cleaned = result_cleaned_norm(result.output)
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    mock_run.assert_called_once_with(
+        ['./sales', './stock'], parallel=True, env='local', configs_path=None
+    )
+    assert 'sales │ high │ success │ 1 │ 1.500 │' in result_cleaned
+    assert 'stock │ low │ failed │ 3 │ 0.250 │ boom' in result_cleaned
+
+
+def test_run_outside_hari_project(mocker):
+    # ---- Arrange ----
+    mocker.patch(
+        'hari_data.cli.commands.cli.is_hari_project', return_value=False
+    )
+    mock_run = mocker.patch('hari_data.job.job_runner.run_jobs')
+
+    # ---- Act ----
+    result = runner.invoke(app, ['run'], env={'NO_COLOR': '1'})
+
+    # ---- Assert ----
+    assert result.exit_code == 1
+    mock_run.assert_not_called()
+    assert 'must be run inside a Hari project' in result_cleaned_norm(
+        result.output
+    )
+
+
+def test_cli_imports_without_pyspark():
+    # ---- Act ----
+    result = subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys, hari_data.cli.commands.cli; '
+            "print('pyspark' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+    )
+
+    # ---- Assert ----
+    assert result.stdout.strip() == 'False'
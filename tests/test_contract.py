@@ -1,4 +1,14 @@
-from hari_data.cli.commands.contract import contract
+import json
+import os
+
+import pytest
+import yaml
+
+from hari_data.cli.commands.contract import (
+    contract,
+    import_contracts,
+    read_columns_spec,
+)
 
 
 def test_contract_basic_params():
@@ -112,3 +122,268 @@ def test_contract_with_sla_incomplete():
 
 def test_contract_with_empty_column():
     pass
+
+
+def test_read_columns_spec_csv(tmp_path):
+    # Arrange
+    spec_path = tmp_path / 'columns.csv'
+    spec_path.write_text(
+        'name,type,is_nullable,is_unique,precision,scale\n'
+        'id,int,false,true,,\n'
+        'amount,decimal,,,12,2\n'
+        'city,STRING,yes,no,,\n'
+    )
+
+    # Act
+    result = read_columns_spec(str(spec_path))
+
+    # Assert
+    assert result == {
+        'columns': [
+            {
+                'name': 'id',
+                'type': 'int',
+                'is_nullable': False,
+                'is_unique': True,
+            },
+            {
+                'name': 'amount',
+                'type': 'decimal',
+                'is_nullable': True,
+                'is_unique': False,
+                'precision': 12,
+                'scale': 2,
+            },
+            {
+                'name': 'city',
+                'type': 'string',
+                'is_nullable': True,
+                'is_unique': False,
+            },
+        ]
+    }
+
+
+def test_read_columns_spec_json(tmp_path):
+    # Arrange
+    spec_path = tmp_path / 'columns.json'
+    spec_path.write_text(
+        json.dumps(
+            {
+                'columns': [
+                    {'name': 'id', 'type': 'bigint', 'is_nullable': False},
+                    {'name': 'note', 'type': 'string', 'description': 'x'},
+                ]
+            }
+        )
+    )
+
+    # Act
+    result = read_columns_spec(str(spec_path))
+
+    # Assert
+    assert result['columns'] == [
+        {
+            'name': 'id',
+            'type': 'bigint',
+            'is_nullable': False,
+            'is_unique': False,
+        },
+        {
+            'name': 'note',
+            'type': 'string',
+            'is_nullable': True,
+            'is_unique': False,
+            'description': 'x',
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    'content, message',
+    [
+        ('name,type\nid,uuid\n', "Invalid type 'uuid'.*line 2"),
+        ('name,type,is_unique\nid,int,maybe\n', "Invalid is_unique 'maybe'"),
+        ('name,type\nid,int\nid,string\n', "Duplicated columns.*'id'"),
+        ('name,type\n', 'No columns found'),
+    ],
+)
+def test_read_columns_spec_invalid(tmp_path, content, message):
+    # Arrange
+    spec_path = tmp_path / 'columns.csv'
+    spec_path.write_text(content)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match=message):
+        read_columns_spec(str(spec_path))
+
+
+@pytest.mark.parametrize(
+    'content, message',
+    [
+        ('["id"]', 'item 1 is not an object'),
+        ('{"columns": {"name": "id"}}', 'must hold a list of columns'),
+    ],
+)
+def test_read_columns_spec_invalid_json(tmp_path, content, message):
+    # Arrange
+    spec_path = tmp_path / 'columns.json'
+    spec_path.write_text(content)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match=message):
+        read_columns_spec(str(spec_path))
+
+
+def test_read_columns_spec_unsupported_format(tmp_path):
+    # Act / Assert
+    with pytest.raises(ValueError, match='Use a .csv or .json file'):
+        read_columns_spec(str(tmp_path / 'columns.xlsx'))
+
+
+def test_import_contracts(tmp_path):
+    # Arrange
+    (tmp_path / 'specs').mkdir()
+    (tmp_path / 'specs' / 'sales.csv').write_text(
+        'name,type,is_unique\nsale_id,int,true\ncity,string,\n'
+    )
+    manifest = {
+        'contracts': [
+            {
+                'name': 'sales',
+                'owner_email': 'data@mail.com',
+                'output_table': {
+                    'name': 'sales',
+                    'path': '/data/sales',
+                    'format': 'parquet',
+                    'partitioned_by': ['city'],
+                },
+                'columns_spec': 'specs/sales.csv',
+                'sla': {'frequency': 'daily', 'tolerance': '1 hour'},
+            },
+            {
+                'name': 'customers',
+                'output_table': {'name': 'customers', 'path': '/data/c'},
+                'columns': [{'name': 'id', 'type': 'int'}],
+            },
+            {
+                'name': 'broken',
+                'output_table': {'partitioned_by': ['missing']},
+                'columns': [{'name': 'id', 'type': 'int'}],
+            },
+        ]
+    }
+    manifest_path = tmp_path / 'manifest.yaml'
+    manifest_path.write_text(yaml.dump(manifest))
+    contracts_dir = str(tmp_path / 'contracts')
+
+    # Act
+    result = import_contracts(
+        str(manifest_path), '0.1.0', '2025-08-01', contracts_dir=contracts_dir
+    )
+
+    # Assert
+    assert sorted(result['contracts_created']) == [
+        os.path.join(contracts_dir, 'customers.yaml'),
+        os.path.join(contracts_dir, 'sales.yaml'),
+    ]
+    assert list(result['errors']) == ['broken']
+    assert 'Partition columns' in result['errors']['broken']
+    with open(os.path.join(contracts_dir, 'sales.yaml')) as file:
+        sales = yaml.safe_load(file)
+    assert sales['output_table']['partitioned_by'] == ['city']
+    assert sales['output_table']['columns'][0] == {
+        'name': 'sale_id',
+        'type': 'int',
+        'is_nullable': True,
+        'is_unique': True,
+    }
+    assert sales['sla'] == {'frequency': 'daily', 'tolerance': '1 hour'}
+
+
+def test_import_contracts_keeps_existing(tmp_path):
+    # Arrange
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir()
+    (contracts_dir / 'sales.yaml').write_text('name: sales\n')
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(
+        json.dumps(
+            {
+                'contracts': [
+                    {
+                        'name': 'sales',
+                        'columns': [{'name': 'id', 'type': 'int'}],
+                    }
+                ]
+            }
+        )
+    )
+
+    # Act
+    result = import_contracts(
+        str(manifest_path),
+        '0.1.0',
+        '2025-08-01',
+        contracts_dir=str(contracts_dir),
+    )
+
+    # Assert
+    assert result['contracts_created'] == []
+    assert 'already exists' in result['errors']['sales']
+    assert (contracts_dir / 'sales.yaml').read_text() == 'name: sales\n'
+
+
+def test_import_contracts_invalid_manifest(tmp_path):
+    # Arrange
+    manifest_path = tmp_path / 'manifest.yaml'
+    manifest_path.write_text('- name: sales\n')
+
+    # Act / Assert
+    with pytest.raises(ValueError, match="no 'contracts' list"):
+        import_contracts(str(manifest_path), '0.1.0', '2025-08-01')
+
+
+def test_import_contracts_rejects_duplicated_names(tmp_path):
+    # Arrange
+    manifest_path = tmp_path / 'manifest.json'
+    manifest_path.write_text(
+        json.dumps(
+            {
+                'contracts': [
+                    {
+                        'name': 'sales',
+                        'columns': [{'name': 'a', 'type': 'int'}],
+                    },
+                    {
+                        'name': 'sales',
+                        'columns': [{'name': 'b', 'type': 'int'}],
+                    },
+                    {
+                        'name': 'orders',
+                        'columns': [{'name': 'id', 'type': 'int'}],
+                    },
+                    'not an object',
+                ]
+            }
+        )
+    )
+    contracts_dir = tmp_path / 'contracts'
+
+    # Act
+    result = import_contracts(
+        str(manifest_path),
+        '0.1.0',
+        '2025-08-01',
+        contracts_dir=str(contracts_dir),
+    )
+
+    # Assert
+    assert result['contracts_created'] == [
+        os.path.join(str(contracts_dir), 'orders.yaml')
+    ]
+    assert result['errors'] == {
+        'sales': 'Duplicated contract name in the manifest.',
+        'entry 4': 'Manifest entry is not an object.',
+    }
+    assert not (contracts_dir / 'sales.yaml').exists()
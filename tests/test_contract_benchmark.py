@@ -0,0 +1,175 @@
+import json
+import os
+
+import pytest
+
+from hari_data.contract.contract_benchmark import (
+    compare_benchmarks,
+    load_benchmark_results,
+    measure_workload,
+    run_benchmarks,
+    save_benchmark_results,
+)
+from hari_data.contract.contract_schema import clear_contract_cache
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+
+@pytest.fixture
+def spark(spark_session, monkeypatch):
+    monkeypatch.setattr(
+        HariSparkSessionManager, '_spark_session', spark_session
+    )
+    clear_contract_cache()
+    yield spark_session
+    clear_contract_cache()
+
+
+def test_measure_workload_collects_stage_metrics(spark):
+    # ---- Arrange ----
+    dataframe = spark.range(0, 1000, 1, 4)
+    calls = []
+
+    # ---- Act ----
+    result = measure_workload(
+        'count',
+        lambda: dataframe.groupBy((dataframe.id % 3).alias('k'))
+        .count()
+        .collect(),
+        repeat=2,
+        setup=lambda: calls.append('setup'),
+    )
+
+    # ---- Assert ----
+    assert result['workload'] == 'count'
+    assert calls == ['setup', 'setup']
+    assert len(result['wall_times_s']) == 2
+    assert result['jobs'] >= 1
+    assert result['stages'] >= 2
+    assert result['tasks'] >= 4
+    assert result['shuffle_write_bytes'] > 0
+    assert result['driver_jvm_heap_used_bytes'] > 0
+    assert result['driver_python_max_rss_bytes'] > 0
+
+
+def test_measure_workload_with_spark_connect(monkeypatch, mocker):
+    # ---- Arrange ----
+    monkeypatch.setenv('SPARK_CONNECT_MODE_ENABLED', '1')
+    # Spark Connect sessions have no SparkContext nor JVM handles.
+    monkeypatch.setattr(
+        HariSparkSessionManager,
+        '_spark_session',
+        mocker.MagicMock(spec=['version']),
+    )
+
+    # ---- Act ----
+    result = measure_workload('noop', lambda: None)
+
+    # ---- Assert ----
+    assert len(result['wall_times_s']) == 1
+    assert result['stages'] is None
+    assert result['input_bytes'] is None
+    assert result['driver_jvm_heap_used_bytes'] is None
+    assert result['driver_python_max_rss_bytes'] > 0
+
+
+def test_measure_workload_invalid_repeat(spark):
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='repeat'):
+        measure_workload('noop', lambda: None, repeat=0)
+
+
+def test_run_benchmarks_all_workloads(spark, tmp_path):
+    # ---- Arrange ----
+    work_dir = str(tmp_path / 'bench')
+
+    # ---- Act ----
+    results = run_benchmarks(scales=[500], work_dir=work_dir)
+
+    # ---- Assert ----
+    assert results['spark_version'] == spark.version
+    assert [(r['workload'], r['rows']) for r in results['results']] == [
+        ('read', 500),
+        ('validate', 500),
+        ('write', 500),
+        ('compact', 500),
+    ]
+    assert all(r['wall_time_s'] > 0 for r in results['results'])
+    assert os.path.isdir(os.path.join(work_dir, 'hari_bench_500', 'write'))
+
+
+def test_run_benchmarks_removes_temporary_work_dir(spark, mocker, tmp_path):
+    # ---- Arrange ----
+    work_dir = tmp_path / 'temporary'
+    work_dir.mkdir()
+    mocker.patch(
+        'hari_data.contract.contract_benchmark.tempfile.mkdtemp',
+        return_value=str(work_dir),
+    )
+
+    # ---- Act ----
+    results = run_benchmarks(scales=[100], workloads=['read'])
+
+    # ---- Assert ----
+    assert len(results['results']) == 1
+    assert not work_dir.exists()
+
+
+def test_run_benchmarks_unknown_workload(spark):
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='Unknown workloads'):
+        run_benchmarks(scales=[10], workloads=['sort'])
+
+
+def test_save_and_load_benchmark_results(tmp_path):
+    # ---- Arrange ----
+    results_path = str(tmp_path / 'out' / 'bench.json')
+    results = {'results': [{'workload': 'read', 'rows': 10}]}
+
+    # ---- Act ----
+    save_benchmark_results(results_path, results)
+
+    # ---- Assert ----
+    assert load_benchmark_results(results_path) == results
+    with open(results_path) as file:
+        assert json.load(file) == results
+
+
+def test_compare_benchmarks_thresholds():
+    # ---- Arrange ----
+    baseline = {
+        'results': [
+            {'workload': 'read', 'rows': 10, 'wall_time_s': 1.0},
+            {'workload': 'write', 'rows': 10, 'wall_time_s': 1.0},
+            {'workload': 'compact', 'rows': 10, 'wall_time_s': 0.1},
+        ]
+    }
+    results = {
+        'results': [
+            {'workload': 'read', 'rows': 10, 'wall_time_s': 1.05},
+            {'workload': 'write', 'rows': 10, 'wall_time_s': 1.5},
+            {'workload': 'compact', 'rows': 10, 'wall_time_s': 0.14},
+            {'workload': 'validate', 'rows': 10, 'wall_time_s': 3.0},
+        ]
+    }
+
+    # ---- Act ----
+    comparison = compare_benchmarks(results, baseline, threshold=0.1)
+
+    # ---- Assert ----
+    assert [c['workload'] for c in comparison['comparisons']] == [
+        'read',
+        'write',
+        'compact',
+    ]
+    assert comparison['regressions'] == [
+        {
+            'workload': 'write',
+            'rows': 10,
+            'baseline_s': 1.0,
+            'current_s': 1.5,
+            'ratio': 1.5,
+            'regressed': True,
+        }
+    ]
@@ -0,0 +1,136 @@
+import os
+
+import pytest
+import yaml
+
+from hari_data.contract.contract_compaction import compact_contract_table
+from hari_data.contract.contract_schema import clear_contract_cache
+from hari_data.exceptions import HariContractError
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+
+@pytest.fixture
+def spark(spark_session, monkeypatch):
+    monkeypatch.setattr(
+        HariSparkSessionManager, '_spark_session', spark_session
+    )
+    clear_contract_cache()
+    yield spark_session
+    clear_contract_cache()
+
+
+def write_contract(tmp_path, partitioned_by, **output_table):
+    contract_data = {
+        'name': 'sales',
+        'output_table': {
+            'name': 'sales',
+            'path': str(tmp_path / 'sales'),
+            'format': 'parquet',
+            'partitioned_by': partitioned_by,
+            'columns': [
+                {'name': 'sale_id', 'type': 'int'},
+                {'name': 'city', 'type': 'string'},
+            ],
+            **output_table,
+        },
+    }
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir(exist_ok=True)
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(contract_data, file)
+    return str(contracts_dir)
+
+
+def data_files(path):
+    return sorted(
+        name for name in os.listdir(path) if not name.startswith(('.', '_'))
+    )
+
+
+def test_compact_contract_table_partitioned(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, ['city'])
+    spark.createDataFrame(
+        [(i, 'Recife' if i % 2 else 'Natal') for i in range(40)],
+        'sale_id int, city string',
+    ).repartition(4).write.partitionBy('city').parquet(str(tmp_path / 'sales'))
+    spark.createDataFrame(
+        [(100, 'Olinda')], 'sale_id int, city string'
+    ).write.mode('append').partitionBy('city').parquet(str(tmp_path / 'sales'))
+    olinda_files = data_files(tmp_path / 'sales' / 'city=Olinda')
+
+    # ---- Act ----
+    result = compact_contract_table('sales', contracts_dir=contracts_dir)
+
+    # ---- Assert ----
+    assert result['partitions'] == [
+        {
+            'name': 'city=Natal',
+            'files_before': 4,
+            'files_after': 1,
+            'compacted': True,
+        },
+        {
+            'name': 'city=Olinda',
+            'files_before': 1,
+            'files_after': 1,
+            'compacted': False,
+        },
+        {
+            'name': 'city=Recife',
+            'files_before': 4,
+            'files_after': 1,
+            'compacted': True,
+        },
+    ]
+    assert data_files(tmp_path / 'sales' / 'city=Olinda') == olinda_files
+    assert data_files(tmp_path / 'sales') == [
+        'city=Natal',
+        'city=Olinda',
+        'city=Recife',
+    ]
+    written = spark.read.parquet(str(tmp_path / 'sales'))
+    assert written.count() == 41
+    assert written.where("city = 'Recife'").count() == 20
+
+
+def test_compact_contract_table_sorted_unpartitioned(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [], sort_by=['sale_id'])
+    spark.createDataFrame(
+        [(i, 'Recife') for i in range(50, 0, -1)], 'sale_id int, city string'
+    ).repartition(5).write.parquet(str(tmp_path / 'sales'))
+
+    # ---- Act ----
+    result = compact_contract_table('sales', contracts_dir=contracts_dir)
+
+    # ---- Assert ----
+    assert result['partitions'] == [
+        {'name': '', 'files_before': 5, 'files_after': 1, 'compacted': True}
+    ]
+    (file_name,) = data_files(tmp_path / 'sales')
+    rows = spark.read.parquet(str(tmp_path / 'sales' / file_name)).collect()
+    assert [row['sale_id'] for row in rows] == list(range(1, 51))
+    assert not any(name.startswith('_hari_') for name in os.listdir(tmp_path))
+
+
+def test_compact_contract_table_remote_path(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [], path='s3a://bucket/sales')
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='local output path'):
+        compact_contract_table('sales', contracts_dir=contracts_dir)
+
+
+def test_compact_contract_table_unknown_sort_column(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [])
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='Sort columns not in'):
+        compact_contract_table(
+            'sales', contracts_dir=contracts_dir, sort_by=['amount']
+        )
@@ -0,0 +1,285 @@
+import pytest
+import yaml
+from pyspark.sql import functions as F
+
+from hari_data.contract.contract_generator import (
+    generate_contract_data,
+    generate_contract_table,
+)
+from hari_data.contract.contract_schema import clear_contract_cache
+from hari_data.exceptions import HariContractError
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+
+@pytest.fixture
+def spark(spark_session, monkeypatch):
+    monkeypatch.setattr(
+        HariSparkSessionManager, '_spark_session', spark_session
+    )
+    clear_contract_cache()
+    yield spark_session
+    clear_contract_cache()
+
+
+def write_contract(tmp_path, columns, partitioned_by=None):
+    contract_data = {
+        'name': 'sales',
+        'output_table': {
+            'name': 'sales',
+            'path': str(tmp_path / 'sales'),
+            'format': 'parquet',
+            'partitioned_by': partitioned_by or [],
+            'columns': columns,
+        },
+    }
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir(exist_ok=True)
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(contract_data, file)
+    return str(contracts_dir)
+
+
+def test_generate_contract_data_matches_contract(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path,
+        [
+            {
+                'name': 'sale_id',
+                'type': 'int',
+                'is_nullable': False,
+                'is_unique': True,
+            },
+            {'name': 'city', 'type': 'string', 'is_nullable': False},
+            {
+                'name': 'quantity',
+                'type': 'int',
+                'min_value': 1,
+                'max_value': 5,
+            },
+            {'name': 'amount', 'type': 'decimal', 'precision': 10, 'scale': 2},
+            {'name': 'sale_date', 'type': 'date'},
+            {'name': 'sold_at', 'type': 'timestamp'},
+            {'name': 'sold_time', 'type': 'time'},
+            {'name': 'paid', 'type': 'boolean', 'null_ratio': 0.5},
+        ],
+    )
+
+    # ---- Act ----
+    dataframe = generate_contract_data(
+        'sales', 2000, contracts_dir=contracts_dir, null_ratio=0.1
+    )['dataframe']
+    stats = dataframe.agg(
+        F.count('*').alias('rows'),
+        F.countDistinct('sale_id').alias('distinct_ids'),
+        F.sum(F.col('city').isNull().cast('int')).alias('city_nulls'),
+        F.sum(F.col('quantity').isNull().cast('int')).alias('qty_nulls'),
+        F.sum(F.col('paid').isNull().cast('int')).alias('paid_nulls'),
+        F.min('quantity').alias('min_qty'),
+        F.max('quantity').alias('max_qty'),
+    ).first()
+
+    # ---- Assert ----
+    assert dataframe.schema.simpleString() == (
+        'struct<sale_id:int,city:string,quantity:int,amount:decimal(10,2),'
+        'sale_date:date,sold_at:timestamp,sold_time:string,paid:boolean>'
+    )
+    assert stats['rows'] == 2000
+    assert stats['distinct_ids'] == 2000
+    assert stats['city_nulls'] == 0
+    assert 100 < stats['qty_nulls'] < 300
+    assert 850 < stats['paid_nulls'] < 1150
+    assert (stats['min_qty'], stats['max_qty']) == (1, 5)
+
+
+def test_generate_contract_data_is_deterministic(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path, [{'name': 'city', 'type': 'string'}]
+    )
+
+    # ---- Act ----
+    first = generate_contract_data('sales', 50, contracts_dir, seed=7)
+    second = generate_contract_data('sales', 50, contracts_dir, seed=7)
+    other = generate_contract_data('sales', 50, contracts_dir, seed=8)
+
+    # ---- Assert ----
+    rows = first['dataframe'].collect()
+    assert rows == second['dataframe'].collect()
+    assert rows != other['dataframe'].collect()
+
+
+def test_generate_contract_data_unique_overflow(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path, [{'name': 'code', 'type': 'byte', 'is_unique': True}]
+    )
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match="Unique column 'code'"):
+        generate_contract_data('sales', 1000, contracts_dir=contracts_dir)
+
+
+@pytest.mark.parametrize(
+    'bound, num_rows',
+    [({'min_value': 100}, 29), ({'max_value': -100}, 30)],
+)
+def test_generate_contract_data_unique_integral_bound_overflow(
+    spark, tmp_path, bound, num_rows
+):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path,
+        [{'name': 'code', 'type': 'byte', 'is_unique': True, **bound}],
+    )
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match="Unique column 'code'"):
+        generate_contract_data('sales', num_rows, contracts_dir=contracts_dir)
+
+
+@pytest.mark.parametrize(
+    'bound, num_rows, expected',
+    [
+        ({'min_value': 100}, 28, (100, 127)),
+        ({'max_value': -100}, 29, (-128, -100)),
+    ],
+)
+def test_generate_contract_data_unique_integral_bound(
+    spark, tmp_path, bound, num_rows, expected
+):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path,
+        [{'name': 'code', 'type': 'byte', 'is_unique': True, **bound}],
+    )
+
+    # ---- Act ----
+    result = generate_contract_data(
+        'sales', num_rows, contracts_dir=contracts_dir, null_ratio=0
+    )
+
+    # ---- Assert ----
+    row = (
+        result['dataframe']
+        .agg(F.min('code'), F.max('code'), F.countDistinct('code'))
+        .first()
+    )
+    assert (row[0], row[1]) == expected
+    assert row[2] == num_rows
+
+
+def test_generate_contract_data_unique_fractional_range(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path,
+        [
+            {
+                'name': 'ratio',
+                'type': 'float',
+                'is_unique': True,
+                'min_value': 0,
+                'max_value': 1,
+            },
+            {
+                'name': 'amount',
+                'type': 'decimal',
+                'precision': 10,
+                'scale': 2,
+                'is_unique': True,
+                'is_nullable': False,
+                'min_value': 10,
+                'max_value': 200,
+            },
+        ],
+    )
+
+    # ---- Act ----
+    dataframe = generate_contract_data(
+        'sales', 5000, contracts_dir=contracts_dir, null_ratio=0
+    )['dataframe']
+    stats = dataframe.agg(
+        F.countDistinct('ratio').alias('distinct_ratios'),
+        F.min('ratio').alias('min_ratio'),
+        F.max('ratio').alias('max_ratio'),
+        F.countDistinct('amount').alias('distinct_amounts'),
+        F.min('amount').alias('min_amount'),
+        F.max('amount').alias('max_amount'),
+    ).first()
+
+    # ---- Assert ----
+    assert stats['distinct_ratios'] == 5000
+    assert 0 <= stats['min_ratio'] and stats['max_ratio'] <= 1
+    assert stats['distinct_amounts'] == 5000
+    assert 10 <= stats['min_amount'] and stats['max_amount'] <= 200
+
+
+@pytest.mark.parametrize(
+    'column, num_rows',
+    [
+        (
+            {'type': 'float', 'min_value': 0, 'max_value': 1},
+            5_000_000,
+        ),
+        (
+            {
+                'type': 'decimal',
+                'precision': 10,
+                'scale': 2,
+                'min_value': 0,
+                'max_value': 10,
+            },
+            1000,
+        ),
+        ({'type': 'float'}, 100_000_000),
+    ],
+)
+def test_generate_contract_data_unique_fractional_overflow(
+    spark, tmp_path, column, num_rows
+):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path, [{'name': 'value', 'is_unique': True, **column}]
+    )
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match="Unique column 'value'"):
+        generate_contract_data('sales', num_rows, contracts_dir=contracts_dir)
+
+
+def test_generate_contract_table_partitioned(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(
+        tmp_path,
+        [
+            {'name': 'sale_id', 'type': 'bigint', 'is_unique': True},
+            {'name': 'city', 'type': 'string', 'is_nullable': False},
+        ],
+        partitioned_by=['city'],
+    )
+    target = str(tmp_path / 'fixtures' / 'sales')
+
+    # ---- Act ----
+    result = generate_contract_table(
+        'sales', 500, target, contracts_dir=contracts_dir
+    )
+
+    # ---- Assert ----
+    assert result['path'] == target
+    assert result['num_rows'] == 500
+    written = spark.read.parquet(target)
+    assert written.count() == 500
+    assert written.select('city').distinct().count() == 10
+
+
+def test_generate_contract_table_remote_path(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [{'name': 'a', 'type': 'int'}])
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='must be written locally'):
+        generate_contract_table(
+            'sales', 10, 's3a://bucket/sales', contracts_dir=contracts_dir
+        )
@@ -0,0 +1,181 @@
+import os
+
+import pytest
+
+from hari_data.contract.contract_infer import (
+    arrow_type_to_contract_type,
+    infer_contract,
+)
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def write_parquet(path, table):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(table, path)
+
+
+@pytest.mark.parametrize(
+    'arrow_type, expected',
+    [
+        (pa.int32(), {'type': 'int'}),
+        (pa.uint32(), {'type': 'bigint'}),
+        (pa.uint64(), {'type': 'decimal', 'precision': 20, 'scale': 0}),
+        (pa.large_string(), {'type': 'string'}),
+        (pa.timestamp('us'), {'type': 'timestamp'}),
+        (pa.date32(), {'type': 'date'}),
+        (
+            pa.decimal128(12, 2),
+            {'type': 'decimal', 'precision': 12, 'scale': 2},
+        ),
+    ],
+)
+def test_arrow_type_to_contract_type(arrow_type, expected):
+    # ---- Act / Assert ----
+    assert arrow_type_to_contract_type(arrow_type) == expected
+
+
+def test_arrow_type_to_contract_type_nested():
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='Unsupported Parquet type'):
+        arrow_type_to_contract_type(pa.list_(pa.int32()))
+
+
+def test_arrow_type_to_contract_type_time():
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='Spark cannot read TIME columns'):
+        arrow_type_to_contract_type(pa.time64('us'))
+
+
+def test_infer_contract_partitioned(tmp_path):
+    # ---- Arrange ----
+    table_path = tmp_path / 'sales'
+    schema = pa.schema(
+        [
+            pa.field('sale_id', pa.int64(), nullable=False),
+            pa.field('amount', pa.float64()),
+            pa.field('note', pa.string()),
+        ]
+    )
+    write_parquet(
+        table_path / 'year=2025' / 'city=Recife' / 'part-0.parquet',
+        pa.table(
+            {'sale_id': [1, 2], 'amount': [1.5, 2.0], 'note': ['a', None]},
+            schema=schema,
+        ),
+    )
+    write_parquet(
+        table_path
+        / 'year=2026'
+        / 'city=__HIVE_DEFAULT_PARTITION__'
+        / 'part-0.parquet',
+        pa.table(
+            {
+                'sale_id': pa.array([3], pa.int64()),
+                'amount': [3.0],
+                'channel': ['web'],
+            }
+        ),
+    )
+    (table_path / '_SUCCESS').touch()
+
+    # ---- Act ----
+    result = infer_contract(str(table_path))
+
+    # ---- Assert ----
+    assert result['output_table'] == {
+        'name': 'sales',
+        'path': str(table_path),
+        'format': 'parquet',
+        'partitioned_by': ['year', 'city'],
+    }
+    assert result['columns'] == [
+        {
+            'name': 'sale_id',
+            'type': 'bigint',
+            'is_nullable': False,
+            'is_unique': False,
+        },
+        {
+            'name': 'amount',
+            'type': 'double',
+            'is_nullable': False,
+            'is_unique': False,
+        },
+        {
+            'name': 'note',
+            'type': 'string',
+            'is_nullable': True,
+            'is_unique': False,
+        },
+        {
+            'name': 'channel',
+            'type': 'string',
+            'is_nullable': True,
+            'is_unique': False,
+        },
+        {
+            'name': 'year',
+            'type': 'int',
+            'is_nullable': False,
+            'is_unique': False,
+        },
+        {
+            'name': 'city',
+            'type': 'string',
+            'is_nullable': True,
+            'is_unique': False,
+        },
+    ]
+
+
+def test_infer_contract_column_missing_from_files(tmp_path):
+    # ---- Arrange ----
+    schema = pa.schema([pa.field('code', pa.int32(), nullable=False)])
+    write_parquet(
+        tmp_path / 'part-0.parquet', pa.table({'code': [1]}, schema=schema)
+    )
+    write_parquet(tmp_path / 'part-1.parquet', pa.table({'id': [2]}))
+
+    # ---- Act ----
+    columns = infer_contract(str(tmp_path))['columns']
+
+    # ---- Assert ----
+    assert {c['name']: c['is_nullable'] for c in columns} == {
+        'code': True,
+        'id': True,
+    }
+
+
+def test_infer_contract_conflicting_types(tmp_path):
+    # ---- Arrange ----
+    write_parquet(
+        tmp_path / 'part-0.parquet',
+        pa.table({'id': pa.array([1], pa.int32())}),
+    )
+    write_parquet(tmp_path / 'part-1.parquet', pa.table({'id': ['a']}))
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match="Column 'id' has conflicting types"):
+        infer_contract(str(tmp_path))
+
+
+def test_infer_contract_inconsistent_partitions(tmp_path):
+    # ---- Arrange ----
+    write_parquet(
+        tmp_path / 'year=2025' / 'part-0.parquet', pa.table({'id': [1]})
+    )
+    write_parquet(tmp_path / 'part-1.parquet', pa.table({'id': [2]}))
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='Inconsistent partition'):
+        infer_contract(str(tmp_path))
+
+
+def test_infer_contract_no_files(tmp_path):
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='No Parquet files'):
+        infer_contract(str(tmp_path))
+    with pytest.raises(ValueError, match='Only local paths'):
+        infer_contract('s3a://bucket/sales')
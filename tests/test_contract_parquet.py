@@ -0,0 +1,93 @@
+import os
+
+import pytest
+
+from hari_data.contract.contract_parquet import (
+    list_parquet_files,
+    read_parquet_footers,
+    summarize_parquet_statistics,
+)
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def write_parquet(path, columns, row_group_size=None, write_statistics=True):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(
+        pa.table(columns),
+        path,
+        row_group_size=row_group_size,
+        write_statistics=write_statistics,
+    )
+    return str(path)
+
+
+def test_list_parquet_files_skips_metadata(tmp_path):
+    # ---- Arrange ----
+    first = write_parquet(
+        tmp_path / 'year=2025' / 'part-0.parquet', {'a': [1]}
+    )
+    write_parquet(tmp_path / '_temporary' / 'part-0.parquet', {'a': [1]})
+    (tmp_path / '_SUCCESS').touch()
+
+    # ---- Act ----
+    result = list_parquet_files(str(tmp_path))
+
+    # ---- Assert ----
+    assert result == {'files': [first]}
+
+
+def test_summarize_parquet_statistics(tmp_path):
+    # ---- Arrange ----
+    files = [
+        write_parquet(
+            tmp_path / 'city=Recife' / 'part-0.parquet',
+            {'id': [1, 2, None, 4], 'amount': [10.0, 5.5, 3.0, 7.0]},
+            row_group_size=2,
+        ),
+        write_parquet(
+            tmp_path / 'city=__HIVE_DEFAULT_PARTITION__' / 'part-0.parquet',
+            {'id': [9]},
+        ),
+    ]
+    footers = read_parquet_footers(files)['footers']
+
+    # ---- Act ----
+    result = summarize_parquet_statistics(
+        files, footers, ['id', 'amount', 'city'], str(tmp_path), ['city']
+    )
+
+    # ---- Assert ----
+    assert result['row_count'] == 5
+    assert result['columns']['id'] == {
+        'null_count': 1,
+        'min': 1,
+        'max': 9,
+        'nulls_complete': True,
+        'min_max_complete': True,
+    }
+    # amount is missing from the second file, so its row is a null
+    assert result['columns']['amount']['null_count'] == 1
+    assert result['columns']['amount']['max'] == 10.0
+    assert result['columns']['city']['null_count'] == 1
+    assert result['columns']['city']['min_max_complete'] is False
+
+
+def test_summarize_parquet_statistics_without_statistics(tmp_path):
+    # ---- Arrange ----
+    files = [
+        write_parquet(
+            tmp_path / 'part-0.parquet', {'id': [1, 2]}, write_statistics=False
+        )
+    ]
+    footers = read_parquet_footers(files)['footers']
+
+    # ---- Act ----
+    result = summarize_parquet_statistics(
+        files, footers, ['id'], str(tmp_path)
+    )
+
+    # ---- Assert ----
+    assert result['columns']['id']['nulls_complete'] is False
+    assert result['columns']['id']['min_max_complete'] is False
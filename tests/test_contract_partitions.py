@@ -0,0 +1,119 @@
+import os
+
+from hari_data.contract.contract_partitions import (
+    BACKUP_PREFIX,
+    list_partitions,
+    partition_fingerprint,
+    recover_swaps,
+    swap_directories,
+)
+
+
+def make_file(path, content='data'):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write(content)
+
+
+def test_list_partitions_nested(tmp_path):
+    # ---- Arrange ----
+    make_file(tmp_path / 'year=2025' / 'month=2' / 'part-0.parquet')
+    make_file(tmp_path / 'year=2025' / 'month=1' / 'part-0.parquet')
+    make_file(tmp_path / 'year=2024' / 'month=12' / 'part-0.parquet')
+    make_file(tmp_path / 'year=2025' / '_temporary' / 'part-0.parquet')
+    make_file(tmp_path / 'other' / 'part-0.parquet')
+
+    # ---- Act ----
+    result = list_partitions(f'file://{tmp_path}', ['year', 'month'])
+
+    # ---- Assert ----
+    assert [p['name'] for p in result['partitions']] == [
+        'year=2024/month=12',
+        'year=2025/month=1',
+        'year=2025/month=2',
+    ]
+    assert result['partitions'][0]['values'] == {
+        'year': '2024',
+        'month': '12',
+    }
+    assert result['partitions'][0]['path'] == str(
+        tmp_path / 'year=2024' / 'month=12'
+    )
+
+
+def test_list_partitions_without_partition_columns(tmp_path):
+    # ---- Act ----
+    result = list_partitions(str(tmp_path), [])
+    # ---- Assert ----
+    assert result == {'partitions': []}
+
+
+def test_list_partitions_missing_table(tmp_path):
+    # ---- Act ----
+    result = list_partitions(str(tmp_path / 'missing'), ['year'])
+    # ---- Assert ----
+    assert result == {'partitions': []}
+
+
+def test_partition_fingerprint_ignores_metadata_files(tmp_path):
+    # ---- Arrange ----
+    make_file(tmp_path / 'part-0.parquet', 'abc')
+    before = partition_fingerprint(str(tmp_path))
+    make_file(tmp_path / '_SUCCESS', '')
+    make_file(tmp_path / '.part-0.parquet.crc', 'crc')
+
+    # ---- Act ----
+    after = partition_fingerprint(str(tmp_path))
+
+    # ---- Assert ----
+    assert after == before
+    assert after['files'] == 1
+    assert after['size'] == 3
+
+
+def test_partition_fingerprint_changes_with_new_files(tmp_path):
+    # ---- Arrange ----
+    make_file(tmp_path / 'part-0.parquet')
+    before = partition_fingerprint(str(tmp_path))
+    make_file(tmp_path / 'part-1.parquet')
+
+    # ---- Act ----
+    after = partition_fingerprint(str(tmp_path))
+
+    # ---- Assert ----
+    assert after['fingerprint'] != before['fingerprint']
+    assert after['files'] == 2
+
+
+def test_swap_directories(tmp_path):
+    # ---- Arrange ----
+    make_file(tmp_path / 'city=Recife' / 'part-0.parquet', 'old')
+    make_file(tmp_path / '_staging' / 'part-0.parquet', 'new')
+
+    # ---- Act ----
+    swap_directories(str(tmp_path / 'city=Recife'), str(tmp_path / '_staging'))
+
+    # ---- Assert ----
+    assert sorted(os.listdir(tmp_path)) == ['city=Recife']
+    assert (tmp_path / 'city=Recife' / 'part-0.parquet').read_text() == 'new'
+
+
+def test_recover_swaps_after_interrupted_swap(tmp_path):
+    # ---- Arrange ----
+    table = tmp_path / 'sales'
+    # crashed between the two renames: only the backup is left
+    make_file(table / 'year=2025' / f'{BACKUP_PREFIX}month=1' / 'part-0')
+    # crashed after the swap: the backup is left over
+    make_file(table / 'year=2025' / 'month=2' / 'part-0', 'new')
+    make_file(table / 'year=2025' / f'{BACKUP_PREFIX}month=2' / 'part-0')
+
+    # ---- Act ----
+    result = recover_swaps(f'file://{table}')
+
+    # ---- Assert ----
+    assert sorted(result['recovered']) == [
+        str(table / 'year=2025' / 'month=1'),
+        str(table / 'year=2025' / 'month=2'),
+    ]
+    assert sorted(os.listdir(table / 'year=2025')) == ['month=1', 'month=2']
+    assert (table / 'year=2025' / 'month=2' / 'part-0').read_text() == 'new'
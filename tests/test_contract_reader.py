@@ -0,0 +1,105 @@
+import pytest
+import yaml
+
+from hari_data.contract.contract_reader import read_contract_table
+from hari_data.contract.contract_schema import clear_contract_cache
+from hari_data.exceptions import HariContractError
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+
+@pytest.fixture
+def spark(spark_session, monkeypatch):
+    """
+    Share the pytest-spark session with the Hari session manager.
+    """
+    monkeypatch.setattr(
+        HariSparkSessionManager, '_spark_session', spark_session
+    )
+    clear_contract_cache()
+    yield spark_session
+    clear_contract_cache()
+
+
+def write_contract(contracts_dir, name, table_format, path):
+    contract_data = {
+        'name': name,
+        'output_table': {
+            'name': name,
+            'path': str(path),
+            'format': table_format,
+            'partitioned_by': [],
+            'columns': [
+                {'name': 'id', 'type': 'int', 'is_nullable': False},
+                {'name': 'city', 'type': 'string', 'is_nullable': True},
+            ],
+        },
+    }
+    contracts_dir.mkdir(exist_ok=True)
+    with open(contracts_dir / f'{name}.yaml', 'w') as file:
+        yaml.dump(contract_data, file)
+
+
+def test_read_contract_table_csv_uses_contract_schema(spark, tmp_path):
+    # ---- Arrange ----
+    data_dir = tmp_path / 'cities'
+    data_dir.mkdir()
+    (data_dir / 'part-0.csv').write_text('id,city,extra\n1,Recife,x\n2,,y\n')
+    write_contract(tmp_path / 'contracts', 'cities', 'csv', data_dir)
+
+    # ---- Act ----
+    result = read_contract_table(
+        'cities', contracts_dir=str(tmp_path / 'contracts')
+    )
+
+    # ---- Assert ----
+    dataframe = result['dataframe']
+    assert dataframe.columns == ['id', 'city']
+    assert dataframe.schema['id'].dataType.typeName() == 'integer'
+    assert sorted(row['id'] for row in dataframe.collect()) == [1, 2]
+
+
+def test_read_contract_table_parquet_projects_columns(spark, tmp_path):
+    # ---- Arrange ----
+    data_dir = tmp_path / 'cities_parquet'
+    spark.createDataFrame(
+        [(1, 'Recife', 'x')], 'id int, city string, extra string'
+    ).write.parquet(str(data_dir))
+    write_contract(tmp_path / 'contracts', 'cities', 'parquet', data_dir)
+
+    # ---- Act ----
+    result = read_contract_table(
+        'cities', contracts_dir=str(tmp_path / 'contracts'), columns=['city']
+    )
+
+    # ---- Assert ----
+    dataframe = result['dataframe']
+    assert dataframe.columns == ['city']
+    assert 'ReadSchema: struct<city:string>' in (
+        dataframe._jdf.queryExecution().executedPlan().toString()
+    )
+
+
+def test_read_contract_table_unknown_column(spark, tmp_path):
+    # ---- Arrange ----
+    write_contract(tmp_path / 'contracts', 'cities', 'csv', tmp_path)
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='Columns not in the contract'):
+        read_contract_table(
+            'cities',
+            contracts_dir=str(tmp_path / 'contracts'),
+            columns=['country'],
+        )
+
+
+def test_read_contract_table_without_path(spark, tmp_path):
+    # ---- Arrange ----
+    write_contract(tmp_path / 'contracts', 'cities', 'csv', '')
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='Output table has no path'):
+        read_contract_table(
+            'cities', contracts_dir=str(tmp_path / 'contracts')
+        )
@@ -0,0 +1,133 @@
+import json
+import os
+
+import pytest
+import yaml
+
+from hari_data.contract import contract_registry
+from hari_data.contract.contract_registry import (
+    REGISTRY_INDEX_FILE,
+    HariContractRegistry,
+)
+
+
+def write_contract(contracts_dir, name, table, path, columns):
+    contract_data = {
+        'name': name,
+        'output_table': {
+            'name': table,
+            'path': path,
+            'format': 'parquet',
+            'columns': [{'name': col, 'type': 'string'} for col in columns],
+        },
+    }
+    os.makedirs(contracts_dir, exist_ok=True)
+    file_path = os.path.join(contracts_dir, f'{name}.yaml')
+    with open(file_path, 'w') as file:
+        yaml.dump(contract_data, file)
+    return file_path
+
+
+def test_registry_lookups(tmp_path):
+    # ---- Arrange ----
+    contracts_dir = str(tmp_path / 'contracts')
+    write_contract(
+        contracts_dir, 'sales', 'sales', '/data/sales/', ['id', 'customer']
+    )
+    write_contract(
+        contracts_dir,
+        'customers',
+        'customers',
+        '/data/customers',
+        ['customer'],
+    )
+    registry = HariContractRegistry(contracts_dir)
+
+    # ---- Act ----
+    sales = registry.get_contract('sales')['contract']
+    by_column = registry.find_contracts(column='customer')['contracts']
+    by_path = registry.find_contracts(path='/data/sales')['contracts']
+    by_table = registry.find_contracts(table='customers')['contracts']
+
+    # ---- Assert ----
+    assert sales['file'] == os.path.join(contracts_dir, 'sales.yaml')
+    assert sales['columns'] == ['id', 'customer']
+    assert registry.get_contract('missing') == {'contract': None}
+    assert [c['name'] for c in by_column] == ['customers', 'sales']
+    assert [c['name'] for c in by_path] == ['sales']
+    assert [c['name'] for c in by_table] == ['customers']
+    assert registry.find_contracts(table='sales', column='missing') == {
+        'contracts': []
+    }
+
+
+def test_registry_refresh_is_incremental(tmp_path, mocker):
+    # ---- Arrange ----
+    contracts_dir = str(tmp_path / 'contracts')
+    write_contract(contracts_dir, 'sales', 'sales', '/data/sales', ['id'])
+    orders = write_contract(
+        contracts_dir, 'orders', 'orders', '/data/orders', ['id']
+    )
+    assert HariContractRegistry(contracts_dir).refresh() == {
+        'parsed': 2,
+        'removed': 0,
+        'total': 2,
+    }
+    spy = mocker.spy(
+        __import__('hari_data.contract.contract_registry', fromlist=['_']),
+        'read_yaml_to_dict',
+    )
+
+    # ---- Act ----
+    unchanged = HariContractRegistry(contracts_dir).refresh()
+    write_contract(
+        contracts_dir, 'sales', 'sales', '/data/sales', ['id', 'amount']
+    )
+    os.remove(orders)
+    registry = HariContractRegistry(contracts_dir)
+    changed = registry.refresh()
+
+    # ---- Assert ----
+    assert unchanged == {'parsed': 0, 'removed': 0, 'total': 2}
+    assert changed == {'parsed': 1, 'removed': 1, 'total': 1}
+    assert spy.call_count == 1
+    assert registry.get_contract('sales')['contract']['columns'] == [
+        'id',
+        'amount',
+    ]
+    with open(os.path.join(contracts_dir, REGISTRY_INDEX_FILE)) as file:
+        assert list(json.load(file)['contracts']) == ['sales.yaml']
+
+
+def test_registry_keeps_broken_contracts_out_of_lookups(tmp_path):
+    # ---- Arrange ----
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir()
+    (contracts_dir / 'broken.yaml').write_text('name: [unclosed')
+    (contracts_dir / REGISTRY_INDEX_FILE).write_text('not json')
+    registry = HariContractRegistry(str(contracts_dir))
+
+    # ---- Act ----
+    contracts = registry.list_contracts()['contracts']
+
+    # ---- Assert ----
+    assert len(contracts) == 1
+    assert contracts[0]['error']
+    assert registry.get_contract('broken') == {'contract': None}
+
+
+def test_registry_rejects_duplicated_names(tmp_path):
+    # ---- Arrange ----
+    contracts_dir = str(tmp_path / 'contracts')
+    write_contract(contracts_dir, 'sales', 'sales', '/data/sales', ['id'])
+    legacy = write_contract(
+        contracts_dir, 'legacy', 'sales', '/data/sales_v1', ['id']
+    )
+    with open(legacy, 'w') as file:
+        yaml.dump({'name': 'sales', 'output_table': {'name': 'sales'}}, file)
+    registry = HariContractRegistry(contracts_dir)
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match="'sales' is declared by several"):
+        registry.get_contract('sales')
+    assert len(registry.find_contracts(table='sales')['contracts']) == 2
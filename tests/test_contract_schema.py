@@ -0,0 +1,181 @@
+import pytest
+import yaml
+from pyspark.sql.types import (
+    DecimalType,
+    IntegerType,
+    StringType,
+    StructField,
+    StructType,
+)
+
+import hari_data.contract.contract_schema as contract_schema
+from hari_data.cli.commands.cli import spark_type_options
+from hari_data.contract.contract_schema import (
+    SPARK_TYPES,
+    clear_contract_cache,
+    compile_contract,
+    contract_to_schema,
+    get_contract_path,
+)
+from hari_data.exceptions import HariContractError
+
+contract_data = {
+    'hari_version': '0.1.5',
+    'created_at': '2025-08-03',
+    'name': 'sales',
+    'output_table': {
+        'name': 'sales.daily',
+        'path': '/data/sales',
+        'format': 'parquet',
+        'partitioned_by': ['sale_date'],
+        'columns': [
+            {
+                'name': 'sale_id',
+                'type': 'int',
+                'is_nullable': False,
+                'is_unique': True,
+            },
+            {
+                'name': 'amount',
+                'type': 'decimal',
+                'precision': 12,
+                'scale': 2,
+                'is_nullable': True,
+                'is_unique': False,
+            },
+            {
+                'name': 'sale_date',
+                'type': 'date',
+                'is_nullable': False,
+                'is_unique': False,
+            },
+        ],
+    },
+}
+
+
+@pytest.fixture
+def contract_file(tmp_path):
+    clear_contract_cache()
+    path = tmp_path / 'sales.yaml'
+    path.write_text(yaml.dump(contract_data, sort_keys=False))
+    yield str(path)
+    clear_contract_cache()
+
+
+def test_every_cli_type_is_supported():
+    # ---- Arrange / Act ----
+    missing = [
+        option
+        for option in spark_type_options
+        if option not in SPARK_TYPES and option != 'decimal'
+    ]
+    # ---- Assert ----
+    assert missing == []
+
+
+def test_get_contract_path_from_name():
+    # ---- Act ----
+    result = get_contract_path('sales', contracts_dir='my_contracts')
+    # ---- Assert ----
+    assert result == {'contract_path': 'my_contracts/sales.yaml'}
+
+
+def test_contract_to_schema():
+    # ---- Act ----
+    result = contract_to_schema(contract_data)
+    # ---- Assert ----
+    assert result['schema'] == StructType(
+        [
+            StructField('sale_id', IntegerType(), False),
+            StructField('amount', DecimalType(12, 2), True),
+            StructField('sale_date', contract_schema.DateType(), False),
+        ]
+    )
+
+
+def test_contract_to_schema_default_nullable():
+    # ---- Arrange ----
+    data = {'output_table': {'columns': [{'name': 'a', 'type': 'json'}]}}
+    # ---- Act ----
+    result = contract_to_schema(data)
+    # ---- Assert ----
+    assert result['schema'] == StructType([StructField('a', StringType())])
+
+
+def test_contract_to_schema_without_columns():
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='Contract has no columns'):
+        contract_to_schema({'name': 'empty', 'output_table': {}})
+
+
+def test_contract_to_schema_column_without_name():
+    # ---- Arrange ----
+    data = {'name': 'bad', 'output_table': {'columns': [{'type': 'int'}]}}
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='column without a name'):
+        contract_to_schema(data)
+
+
+def test_compile_contract(contract_file):
+    # ---- Act ----
+    result = compile_contract(contract_file)
+    # ---- Assert ----
+    assert result['contract'] == contract_data
+    assert result['schema'] == contract_to_schema(contract_data)['schema']
+
+
+def test_compile_contract_is_memoized(contract_file, monkeypatch):
+    # ---- Arrange ----
+    compile_contract(contract_file)
+    calls = []
+    monkeypatch.setattr(
+        contract_schema.yaml,
+        'safe_load',
+        lambda *args: calls.append(args) or {},
+    )
+    # ---- Act ----
+    result = compile_contract(contract_file)
+    # ---- Assert ----
+    assert calls == []
+    assert result['contract']['name'] == 'sales'
+
+
+def test_compile_contract_recompiles_when_content_changes(contract_file):
+    # ---- Arrange ----
+    compile_contract(contract_file)
+    changed = {
+        'name': 'sales',
+        'output_table': {'columns': [{'name': 'id', 'type': 'bigint'}]},
+    }
+    with open(contract_file, 'w') as file:
+        yaml.dump(changed, file)
+    # ---- Act ----
+    result = compile_contract(contract_file)
+    # ---- Assert ----
+    assert result['schema'].fieldNames() == ['id']
+
+
+def test_compile_contract_returns_a_copy(contract_file):
+    # ---- Arrange ----
+    first = compile_contract(contract_file)
+    first['contract']['name'] = 'changed'
+    # ---- Act ----
+    second = compile_contract(contract_file)
+    # ---- Assert ----
+    assert second['contract']['name'] == 'sales'
+
+
+def test_compile_contract_missing_file(tmp_path):
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='could not be read'):
+        compile_contract(str(tmp_path / 'missing.yaml'))
+
+
+def test_compile_contract_invalid_yaml(tmp_path):
+    # ---- Arrange ----
+    path = tmp_path / 'invalid.yaml'
+    path.write_text('name: [unclosed')
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='Invalid contract YAML'):
+        compile_contract(str(path))
@@ -0,0 +1,196 @@
+import os
+from datetime import timedelta
+
+import pytest
+import yaml
+
+from hari_data.contract.contract_sla import (
+    check_contract_sla,
+    check_contracts_sla,
+    latest_modification_time,
+    parse_duration,
+)
+
+NOW = 1_754_000_000.0
+
+
+def write_contract(contracts_dir, name, path, partitioned_by=None, sla=None):
+    contract_data = {
+        'name': name,
+        'output_table': {
+            'name': name,
+            'path': path,
+            'format': 'parquet',
+            'partitioned_by': partitioned_by or [],
+            'columns': [{'name': 'sale_id', 'type': 'int'}],
+        },
+    }
+    if sla:
+        contract_data['sla'] = sla
+    os.makedirs(contracts_dir, exist_ok=True)
+    with open(os.path.join(contracts_dir, f'{name}.yaml'), 'w') as file:
+        yaml.dump(contract_data, file)
+
+
+def touch(path, mtime):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write('data')
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('hourly', timedelta(hours=1)),
+        ('Weekly', timedelta(weeks=1)),
+        ('1 hour', timedelta(hours=1)),
+        ('45 Minutes', timedelta(minutes=45)),
+        ('2 days', timedelta(days=2)),
+        ('22:00:00', timedelta(hours=22)),
+        ('01:30', timedelta(hours=1, minutes=30)),
+    ],
+)
+def test_parse_duration(value, expected):
+    # ---- Act / Assert ----
+    assert parse_duration(value) == expected
+
+
+def test_parse_duration_invalid():
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match="Invalid SLA duration 'soon'"):
+        parse_duration('soon')
+
+
+def test_latest_modification_time_partitioned(tmp_path):
+    # ---- Arrange ----
+    table = tmp_path / 'sales'
+    old = table / 'sale_date=2025-07-31'
+    new = table / 'sale_date=2025-08-01'
+    touch(str(old / 'part-0.parquet'), NOW - 500)
+    touch(str(new / 'part-0.parquet'), NOW - 100)
+    os.utime(old, (NOW - 500, NOW - 500))
+    os.utime(new, (NOW - 100, NOW - 100))
+
+    # ---- Act ----
+    result = latest_modification_time(str(table), ['sale_date'])
+
+    # ---- Assert ----
+    assert result == NOW - 100
+
+
+def test_latest_modification_time_unpartitioned_skips_metadata(tmp_path):
+    # ---- Arrange ----
+    table = tmp_path / 'sales'
+    touch(str(table / 'part-0.parquet'), NOW - 300)
+    touch(str(table / '_SUCCESS'), NOW)
+
+    # ---- Act ----
+    result = latest_modification_time(str(table))
+
+    # ---- Assert ----
+    assert result == NOW - 300
+
+
+def test_latest_modification_time_missing_table(tmp_path):
+    # ---- Act / Assert ----
+    assert latest_modification_time(str(tmp_path / 'missing')) is None
+    assert (
+        latest_modification_time(str(tmp_path / 'missing'), ['sale_date'])
+        is None
+    )
+
+
+def test_check_contract_sla_fresh_and_stale(tmp_path):
+    # ---- Arrange ----
+    contracts_dir = str(tmp_path / 'contracts')
+    table = str(tmp_path / 'sales')
+    touch(os.path.join(table, 'part-0.parquet'), NOW - 3 * 3600)
+    write_contract(
+        contracts_dir,
+        'sales',
+        table,
+        sla={'frequency': 'hourly', 'tolerance': '1 hour'},
+    )
+
+    # ---- Act ----
+    stale = check_contract_sla('sales', contracts_dir, now=NOW)
+    fresh = check_contract_sla('sales', contracts_dir, now=NOW - 3600)
+
+    # ---- Assert ----
+    assert stale['status'] == 'stale'
+    assert stale['age'] == timedelta(hours=3)
+    assert stale['max_age'] == timedelta(hours=2)
+    assert fresh['status'] == 'fresh'
+
+
+def test_check_contracts_sla_statuses(tmp_path):
+    # ---- Arrange ----
+    contracts_dir = str(tmp_path / 'contracts')
+    sla = {'frequency': 'daily', 'tolerance': '30 minutes'}
+    touch(str(tmp_path / 'sales' / 'part-0.parquet'), NOW - 60)
+    write_contract(contracts_dir, 'sales', str(tmp_path / 'sales'), sla=sla)
+    write_contract(contracts_dir, 'empty', str(tmp_path / 'empty'), sla=sla)
+    write_contract(contracts_dir, 'no_sla', str(tmp_path / 'sales'))
+    write_contract(contracts_dir, 'remote', 's3a://bucket/remote', sla=sla)
+    write_contract(
+        contracts_dir,
+        'invalid',
+        str(tmp_path / 'sales'),
+        sla={'frequency': 'sometimes'},
+    )
+
+    # ---- Act ----
+    result = check_contracts_sla(contracts_dir=contracts_dir, now=NOW)
+
+    # ---- Assert ----
+    statuses = {r['contract']: r['status'] for r in result['results']}
+    assert statuses == {
+        'empty': 'missing',
+        'invalid': 'error',
+        'no_sla': 'skipped',
+        'remote': 'skipped',
+        'sales': 'fresh',
+    }
+    assert [r['contract'] for r in result['results']] == sorted(statuses)
+
+
+def test_check_contracts_sla_stat_error(tmp_path, mocker):
+    # ---- Arrange ----
+    contracts_dir = str(tmp_path / 'contracts')
+    sla = {'frequency': 'daily'}
+    touch(str(tmp_path / 'sales' / 'sale_date=1' / 'part-0.parquet'), NOW)
+    touch(str(tmp_path / 'stock' / 'part-0.parquet'), NOW - 60)
+    write_contract(
+        contracts_dir,
+        'sales',
+        str(tmp_path / 'sales'),
+        partitioned_by=['sale_date'],
+        sla=sla,
+    )
+    write_contract(contracts_dir, 'stock', str(tmp_path / 'stock'), sla=sla)
+    stat = os.stat
+
+    def removed_partition(path, *args, **kwargs):
+        if 'sale_date=1' in str(path):
+            raise FileNotFoundError(2, 'No such file or directory', path)
+        return stat(path, *args, **kwargs)
+
+    mocker.patch('os.stat', side_effect=removed_partition)
+
+    # ---- Act ----
+    result = check_contracts_sla(contracts_dir=contracts_dir, now=NOW)
+
+    # ---- Assert ----
+    sales, stock = result['results']
+    assert sales['status'] == 'error'
+    assert 'No such file or directory' in sales['message']
+    assert stock['status'] == 'fresh'
+
+
+def test_check_contracts_sla_missing_contracts_dir(tmp_path):
+    # ---- Act ----
+    result = check_contracts_sla(contracts_dir=str(tmp_path / 'contracts'))
+
+    # ---- Assert ----
+    assert result == {'results': []}
@@ -0,0 +1,395 @@
+import pytest
+import yaml
+
+from hari_data.contract.contract_schema import clear_contract_cache
+from hari_data.contract.contract_validator import (
+    load_validation_state,
+    validate_contract_incremental,
+    validate_contract_metadata,
+    validate_contract_table,
+    validate_dataframe,
+)
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+contract_data = {
+    'name': 'sales',
+    'output_table': {
+        'name': 'sales',
+        'path': '',
+        'format': 'parquet',
+        'partitioned_by': [],
+        'columns': [
+            {
+                'name': 'sale_id',
+                'type': 'int',
+                'is_nullable': False,
+                'is_unique': True,
+            },
+            {
+                'name': 'city',
+                'type': 'string',
+                'is_nullable': True,
+                'is_unique': False,
+            },
+            {
+                'name': 'seller',
+                'type': 'string',
+                'is_nullable': False,
+                'is_unique': False,
+            },
+        ],
+    },
+}
+
+
+@pytest.fixture
+def spark(spark_session, monkeypatch):
+    monkeypatch.setattr(
+        HariSparkSessionManager, '_spark_session', spark_session
+    )
+    clear_contract_cache()
+    yield spark_session
+    clear_contract_cache()
+
+
+def get_report(result, name):
+    return next(col for col in result['columns'] if col['name'] == name)
+
+
+def test_validate_dataframe_passes(spark):
+    # ---- Arrange ----
+    dataframe = spark.createDataFrame(
+        [(1, 'Recife', 'ana'), (2, None, 'bia')],
+        'sale_id int, city string, seller string',
+    )
+
+    # ---- Act ----
+    result = validate_dataframe(dataframe, contract_data)
+
+    # ---- Assert ----
+    assert result['passed'] is True
+    assert result['row_count'] == 2
+    assert get_report(result, 'city')['null_count'] == 1
+    assert get_report(result, 'sale_id')['distinct_count'] == 2
+    assert get_report(result, 'city')['distinct_count'] is None
+
+
+def test_validate_dataframe_detects_nulls_and_duplicates(spark):
+    # ---- Arrange ----
+    dataframe = spark.createDataFrame(
+        [(1, 'Recife', None), (1, 'Natal', 'bia'), (None, None, 'caio')],
+        'sale_id int, city string, seller string',
+    )
+
+    # ---- Act ----
+    result = validate_dataframe(dataframe, contract_data)
+
+    # ---- Assert ----
+    assert result['passed'] is False
+    sale_id = get_report(result, 'sale_id')
+    assert sale_id['nullable_passed'] is False
+    assert sale_id['unique_passed'] is False
+    assert get_report(result, 'seller')['passed'] is False
+    assert get_report(result, 'city')['passed'] is True
+
+
+def test_validate_dataframe_missing_column(spark):
+    # ---- Arrange ----
+    dataframe = spark.createDataFrame(
+        [(1, 'Recife')], 'sale_id int, city string'
+    )
+
+    # ---- Act ----
+    result = validate_dataframe(dataframe, contract_data)
+
+    # ---- Assert ----
+    seller = get_report(result, 'seller')
+    assert seller['exists'] is False
+    assert seller['passed'] is False
+    assert result['passed'] is False
+
+
+def test_validate_dataframe_uses_one_aggregation(spark, mocker):
+    # ---- Arrange ----
+    dataframe = spark.createDataFrame(
+        [(1, 'Recife', 'ana')], 'sale_id int, city string, seller string'
+    )
+    agg = mocker.spy(type(dataframe), 'agg')
+
+    # ---- Act ----
+    validate_dataframe(dataframe, contract_data)
+
+    # ---- Assert ----
+    assert agg.call_count == 1
+    # row count + 3 null counts + 1 distinct count
+    assert len(agg.call_args.args) == 6
+
+
+def test_validate_contract_table(spark, tmp_path):
+    # ---- Arrange ----
+    data_dir = tmp_path / 'sales'
+    spark.createDataFrame(
+        [(1, 'Recife', 'ana'), (2, 'Natal', 'bia')],
+        'sale_id int, city string, seller string',
+    ).write.parquet(str(data_dir))
+    data = dict(contract_data)
+    data['output_table'] = dict(contract_data['output_table'])
+    data['output_table']['path'] = str(data_dir)
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir()
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(data, file)
+
+    # ---- Act ----
+    result = validate_contract_table('sales', contracts_dir=str(contracts_dir))
+
+    # ---- Assert ----
+    assert result['passed'] is True
+    assert result['row_count'] == 2
+
+
+def test_validate_dataframe_approx_mode_skips_exact_count(spark, mocker):
+    # ---- Arrange ----
+    dataframe = spark.range(1000).selectExpr(
+        'cast(id as int) as sale_id', "'Recife' as city", "'ana' as seller"
+    )
+    agg = mocker.spy(type(dataframe), 'agg')
+
+    # ---- Act ----
+    result = validate_dataframe(dataframe, contract_data, mode='approx')
+
+    # ---- Assert ----
+    sale_id = get_report(result, 'sale_id')
+    assert result['passed'] is True
+    assert sale_id['uniqueness_check'] == 'approx'
+    assert agg.call_count == 1
+
+
+def test_validate_dataframe_approx_mode_escalates_suspicious(spark, mocker):
+    # ---- Arrange ----
+    dataframe = spark.range(1000).selectExpr(
+        'cast(id % 500 as int) as sale_id',
+        "'Recife' as city",
+        "'ana' as seller",
+    )
+    agg = mocker.spy(type(dataframe), 'agg')
+
+    # ---- Act ----
+    result = validate_dataframe(dataframe, contract_data, mode='approx')
+
+    # ---- Assert ----
+    sale_id = get_report(result, 'sale_id')
+    assert result['passed'] is False
+    assert sale_id['uniqueness_check'] == 'exact'
+    assert sale_id['distinct_count'] == 500
+    assert agg.call_count == 2
+
+
+@pytest.mark.parametrize(
+    'mode,rsd,message',
+    [
+        ('fast', 0.01, "Unsupported validation mode 'fast'"),
+        ('approx', 0, 'rsd must be greater than 0'),
+        ('approx', 0.5, 'rsd must be greater than 0'),
+    ],
+)
+def test_validate_dataframe_invalid_arguments(spark, mode, rsd, message):
+    # ---- Arrange ----
+    dataframe = spark.createDataFrame([(1,)], 'sale_id int')
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match=message):
+        validate_dataframe(dataframe, contract_data, mode=mode, rsd=rsd)
+
+
+def write_partitioned_contract(spark, tmp_path, rows):
+    data_dir = tmp_path / 'sales'
+    spark.createDataFrame(
+        rows, 'sale_id int, city string, seller string'
+    ).write.mode('append').partitionBy('city').parquet(str(data_dir))
+    data = dict(contract_data)
+    data['output_table'] = dict(contract_data['output_table'])
+    data['output_table']['path'] = str(data_dir)
+    data['output_table']['partitioned_by'] = ['city']
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir(exist_ok=True)
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(data, file)
+    return str(contracts_dir)
+
+
+def test_validate_contract_incremental_skips_validated_partitions(
+    spark, tmp_path
+):
+    # ---- Arrange ----
+    state_path = str(tmp_path / 'hari.state.json')
+    contracts_dir = write_partitioned_contract(
+        spark, tmp_path, [(1, 'Recife', 'ana'), (2, 'Natal', 'bia')]
+    )
+    first = validate_contract_incremental(
+        'sales', contracts_dir=contracts_dir, state_path=state_path
+    )
+    write_partitioned_contract(spark, tmp_path, [(3, 'Olinda', 'caio')])
+
+    # ---- Act ----
+    second = validate_contract_incremental(
+        'sales', contracts_dir=contracts_dir, state_path=state_path
+    )
+    third = validate_contract_incremental(
+        'sales', contracts_dir=contracts_dir, state_path=state_path
+    )
+
+    # ---- Assert ----
+    assert first['partitions_validated'] == ['city=Natal', 'city=Recife']
+    assert second['partitions_validated'] == ['city=Olinda']
+    assert second['partitions_skipped'] == 2
+    assert second['row_count'] == 1
+    assert third['partitions_validated'] == []
+    assert third['passed'] is True
+    state = load_validation_state(state_path)
+    assert sorted(state['contracts']['sales']['partitions']) == [
+        'city=Natal',
+        'city=Olinda',
+        'city=Recife',
+    ]
+
+
+def test_validate_contract_incremental_keeps_failed_partitions(
+    spark, tmp_path
+):
+    # ---- Arrange ----
+    state_path = str(tmp_path / 'hari.state.json')
+    contracts_dir = write_partitioned_contract(
+        spark, tmp_path, [(1, 'Recife', None)]
+    )
+
+    # ---- Act ----
+    first = validate_contract_incremental(
+        'sales', contracts_dir=contracts_dir, state_path=state_path
+    )
+    second = validate_contract_incremental(
+        'sales', contracts_dir=contracts_dir, state_path=state_path
+    )
+
+    # ---- Assert ----
+    assert first['passed'] is False
+    assert second['partitions_validated'] == ['city=Recife']
+    assert load_validation_state(state_path) == {'contracts': {}}
+
+
+def test_validate_contract_incremental_unpartitioned_runs_full(
+    spark, tmp_path
+):
+    # ---- Arrange ----
+    data_dir = tmp_path / 'sales'
+    spark.createDataFrame(
+        [(1, 'Recife', 'ana')], 'sale_id int, city string, seller string'
+    ).write.parquet(str(data_dir))
+    data = dict(contract_data)
+    data['output_table'] = dict(contract_data['output_table'])
+    data['output_table']['path'] = str(data_dir)
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir()
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(data, file)
+
+    # ---- Act ----
+    result = validate_contract_incremental(
+        'sales',
+        contracts_dir=str(contracts_dir),
+        state_path=str(tmp_path / 'hari.state.json'),
+    )
+
+    # ---- Assert ----
+    assert result['incremental'] is False
+    assert result['row_count'] == 1
+
+
+def write_metadata_contract(tmp_path, columns):
+    data = dict(contract_data)
+    data['output_table'] = dict(contract_data['output_table'])
+    data['output_table']['path'] = str(tmp_path / 'sales')
+    data['output_table']['columns'] = columns
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir(exist_ok=True)
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(data, file)
+    return str(contracts_dir)
+
+
+def test_validate_contract_metadata_without_scan(spark, tmp_path, mocker):
+    # ---- Arrange ----
+    pytest.importorskip('pyarrow')
+    spark.createDataFrame(
+        [(1, 'Recife', 'ana'), (2, None, 'bia')],
+        'sale_id int, city string, seller string',
+    ).write.parquet(str(tmp_path / 'sales'))
+    columns = [
+        {'name': 'sale_id', 'type': 'int', 'is_nullable': False},
+        {'name': 'city', 'type': 'string', 'is_nullable': False},
+        {'name': 'seller', 'type': 'string', 'max_value': 'b'},
+    ]
+    contracts_dir = write_metadata_contract(tmp_path, columns)
+    scan = mocker.patch(
+        'hari_data.contract.contract_validator.read_contract_table'
+    )
+
+    # ---- Act ----
+    result = validate_contract_metadata('sales', contracts_dir=contracts_dir)
+
+    # ---- Assert ----
+    scan.assert_not_called()
+    assert result['row_count'] == 2
+    assert result['passed'] is False
+    assert get_report(result, 'sale_id')['passed'] is True
+    assert get_report(result, 'city')['null_count'] == 1
+    assert get_report(result, 'city')['nullable_passed'] is False
+    assert get_report(result, 'seller')['max'] == 'bia'
+    assert get_report(result, 'seller')['range_passed'] is False
+    assert all(col['source'] == 'metadata' for col in result['columns'])
+
+
+def test_validate_contract_metadata_scans_unique_columns(spark, tmp_path):
+    # ---- Arrange ----
+    pytest.importorskip('pyarrow')
+    spark.createDataFrame(
+        [(1, 'Recife', 'ana'), (1, 'Natal', 'bia')],
+        'sale_id int, city string, seller string',
+    ).write.parquet(str(tmp_path / 'sales'))
+    contracts_dir = write_metadata_contract(
+        tmp_path, contract_data['output_table']['columns']
+    )
+
+    # ---- Act ----
+    result = validate_contract_metadata('sales', contracts_dir=contracts_dir)
+
+    # ---- Assert ----
+    sale_id = get_report(result, 'sale_id')
+    assert sale_id['source'] == 'scan'
+    assert sale_id['unique_passed'] is False
+    assert get_report(result, 'city')['source'] == 'metadata'
+    assert [col['name'] for col in result['columns']] == [
+        'sale_id',
+        'city',
+        'seller',
+    ]
+
+
+def test_validate_dataframe_range_rules(spark):
+    # ---- Arrange ----
+    data = dict(contract_data)
+    data['output_table'] = {
+        'columns': [{'name': 'amount', 'type': 'int', 'min_value': 0}]
+    }
+    dataframe = spark.createDataFrame([(5,), (-1,)], 'amount int')
+
+    # ---- Act ----
+    result = validate_dataframe(dataframe, data)
+
+    # ---- Assert ----
+    amount = get_report(result, 'amount')
+    assert amount['min'] == -1
+    assert amount['range_passed'] is False
+    assert result['passed'] is False
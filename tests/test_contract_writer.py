@@ -0,0 +1,424 @@
+import os
+
+import pytest
+import yaml
+
+from hari_data.contract.contract_schema import clear_contract_cache
+from hari_data.contract.contract_writer import (
+    estimate_dataframe_size,
+    write_contract_table,
+)
+from hari_data.exceptions import HariContractError
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+
+
+@pytest.fixture
+def spark(spark_session, monkeypatch):
+    monkeypatch.setattr(
+        HariSparkSessionManager, '_spark_session', spark_session
+    )
+    clear_contract_cache()
+    yield spark_session
+    clear_contract_cache()
+
+
+def write_contract(tmp_path, partitioned_by, table_format='parquet'):
+    contract_data = {
+        'name': 'sales',
+        'output_table': {
+            'name': 'sales',
+            'path': str(tmp_path / 'sales'),
+            'format': table_format,
+            'partitioned_by': partitioned_by,
+            'columns': [
+                {'name': 'sale_id', 'type': 'int'},
+                {'name': 'city', 'type': 'string'},
+            ],
+        },
+    }
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir(exist_ok=True)
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(contract_data, file)
+    return str(contracts_dir)
+
+
+def data_files(path):
+    return [
+        name for name in os.listdir(path) if not name.startswith(('.', '_'))
+    ]
+
+
+def test_write_contract_table_partitioned(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, ['city'])
+    dataframe = spark.createDataFrame(
+        [(i, 'Recife' if i % 2 else 'Natal', 'x') for i in range(100)],
+        'sale_id int, city string, extra string',
+    ).repartition(8)
+
+    # ---- Act ----
+    result = write_contract_table(
+        dataframe, 'sales', contracts_dir=contracts_dir, num_partitions=2
+    )
+
+    # ---- Assert ----
+    assert result == {'path': str(tmp_path / 'sales'), 'num_partitions': 2}
+    for city in ('Recife', 'Natal'):
+        assert len(data_files(tmp_path / 'sales' / f'city={city}')) == 1
+    written = spark.read.parquet(str(tmp_path / 'sales'))
+    assert sorted(written.columns) == ['city', 'sale_id']
+    assert written.count() == 100
+
+
+def test_write_contract_table_estimates_partitions(spark, tmp_path):
+    # ---- Arrange ----
+    source = str(tmp_path / 'source')
+    spark.range(1000).selectExpr(
+        'cast(id as int) as sale_id', 'cast(id % 3 as string) as city'
+    ).write.parquet(source)
+    contracts_dir = write_contract(tmp_path, ['city'])
+    dataframe = spark.read.parquet(source)
+    size = estimate_dataframe_size(dataframe)['size_in_bytes']
+
+    # ---- Act ----
+    result = write_contract_table(
+        dataframe,
+        'sales',
+        contracts_dir=contracts_dir,
+        target_file_size_mb=size / (1024 * 1024) / 2,
+    )
+
+    # ---- Assert ----
+    assert size > 0
+    assert result['num_partitions'] == 2
+
+
+def test_write_contract_table_splits_large_partitions(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, ['city'])
+    dataframe = spark.createDataFrame(
+        [(i, 'Recife' if i < 900 else 'Natal') for i in range(1000)],
+        'sale_id int, city string',
+    ).rdd.toDF()
+    row_size = estimate_dataframe_size(dataframe)['row_size_in_bytes']
+
+    # ---- Act ----
+    write_contract_table(
+        dataframe,
+        'sales',
+        contracts_dir=contracts_dir,
+        target_file_size_mb=row_size * 300 / (1024 * 1024),
+        num_partitions=2,
+    )
+
+    # ---- Assert ----
+    assert len(data_files(tmp_path / 'sales' / 'city=Recife')) == 3
+    assert len(data_files(tmp_path / 'sales' / 'city=Natal')) == 1
+
+
+def test_estimate_dataframe_size_unknown(spark):
+    # ---- Arrange ----
+    dataframe = spark.createDataFrame([(1,)], 'a int').rdd.toDF()
+
+    # ---- Act ----
+    result = estimate_dataframe_size(dataframe)
+
+    # ---- Assert ----
+    # the row size falls back to the default size of the schema (bigint)
+    assert result == {'size_in_bytes': None, 'row_size_in_bytes': 8}
+
+
+def test_estimate_dataframe_size_spark_connect(monkeypatch, mocker):
+    # ---- Arrange ----
+    monkeypatch.setenv('SPARK_CONNECT_MODE_ENABLED', '1')
+    # Spark Connect DataFrames have no _jdf.
+    dataframe = mocker.MagicMock(spec=['columns'])
+
+    # ---- Act / Assert ----
+    assert estimate_dataframe_size(dataframe) == {
+        'size_in_bytes': None,
+        'row_size_in_bytes': None,
+    }
+
+
+def test_write_contract_table_path_override(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [], table_format='csv')
+    dataframe = spark.createDataFrame(
+        [(1, 'Recife')], 'sale_id int, city string'
+    )
+    target = str(tmp_path / 'elsewhere')
+
+    # ---- Act ----
+    write_contract_table(
+        dataframe, 'sales', contracts_dir=contracts_dir, path=target
+    )
+
+    # ---- Assert ----
+    written = spark.read.option('header', 'true').csv(target)
+    assert written.columns == ['sale_id', 'city']
+
+
+def test_write_contract_table_missing_columns(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [])
+    dataframe = spark.createDataFrame([(1,)], 'sale_id int')
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='Columns missing'):
+        write_contract_table(dataframe, 'sales', contracts_dir=contracts_dir)
+
+
+def write_unique_contract(tmp_path, partitioned_by):
+    contract_data = {
+        'name': 'sales',
+        'output_table': {
+            'name': 'sales',
+            'path': str(tmp_path / 'sales'),
+            'format': 'parquet',
+            'partitioned_by': partitioned_by,
+            'columns': [
+                {'name': 'sale_id', 'type': 'int', 'is_unique': True},
+                {'name': 'city', 'type': 'string'},
+                {'name': 'amount', 'type': 'int'},
+            ],
+        },
+    }
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir(exist_ok=True)
+    with open(contracts_dir / 'sales.yaml', 'w') as file:
+        yaml.dump(contract_data, file)
+    return str(contracts_dir)
+
+
+def read_rows(spark, tmp_path):
+    return sorted(
+        (row['sale_id'], row['city'], row['amount'])
+        for row in spark.read.parquet(str(tmp_path / 'sales')).collect()
+    )
+
+
+def test_write_contract_table_dynamic_overwrite(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_unique_contract(tmp_path, ['city'])
+    schema = 'sale_id int, city string, amount int'
+    write_contract_table(
+        spark.createDataFrame([(1, 'Recife', 10), (2, 'Natal', 20)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+    )
+
+    # ---- Act ----
+    write_contract_table(
+        spark.createDataFrame([(3, 'Recife', 30)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+        load_strategy='overwrite',
+    )
+
+    # ---- Assert ----
+    assert read_rows(spark, tmp_path) == [(2, 'Natal', 20), (3, 'Recife', 30)]
+
+
+def test_write_contract_table_upsert_partitioned(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_unique_contract(tmp_path, ['city'])
+    schema = 'sale_id int, city string, amount int'
+    write_contract_table(
+        spark.createDataFrame(
+            [(1, 'Recife', 10), (2, 'Recife', 20), (3, 'Natal', 30)], schema
+        ),
+        'sales',
+        contracts_dir=contracts_dir,
+    )
+    natal_files = data_files(tmp_path / 'sales' / 'city=Natal')
+
+    # ---- Act ----
+    write_contract_table(
+        spark.createDataFrame([(2, 'Recife', 25), (4, 'Recife', 40)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+        load_strategy='upsert',
+    )
+
+    # ---- Assert ----
+    assert read_rows(spark, tmp_path) == [
+        (1, 'Recife', 10),
+        (2, 'Recife', 25),
+        (3, 'Natal', 30),
+        (4, 'Recife', 40),
+    ]
+    # untouched partitions are not rewritten
+    assert data_files(tmp_path / 'sales' / 'city=Natal') == natal_files
+
+
+def test_write_contract_table_upsert_unpartitioned(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_unique_contract(tmp_path, [])
+    schema = 'sale_id int, city string, amount int'
+
+    # ---- Act ----
+    write_contract_table(
+        spark.createDataFrame([(1, 'Recife', 10), (2, 'Natal', 20)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+        load_strategy='upsert',
+    )
+    write_contract_table(
+        spark.createDataFrame([(2, 'Natal', 25)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+        load_strategy='upsert',
+    )
+
+    # ---- Assert ----
+    assert read_rows(spark, tmp_path) == [(1, 'Recife', 10), (2, 'Natal', 25)]
+    assert sorted(os.listdir(tmp_path)) == ['contracts', 'sales']
+
+
+def test_write_contract_table_first_upsert_with_spark_connect(
+    spark, tmp_path, monkeypatch, mocker
+):
+    # ---- Arrange ----
+    contracts_dir = write_unique_contract(tmp_path, ['city'])
+    schema = 'sale_id int, city string, amount int'
+    monkeypatch.setenv('SPARK_CONNECT_MODE_ENABLED', '1')
+    # Spark Connect reads are lazy: reading a missing table does not fail.
+    mock_read = mocker.patch(
+        'hari_data.contract.contract_writer.read_contract_table'
+    )
+
+    # ---- Act ----
+    write_contract_table(
+        spark.createDataFrame([(1, 'Recife', 10)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+        load_strategy='upsert',
+    )
+    monkeypatch.delenv('SPARK_CONNECT_MODE_ENABLED')
+
+    # ---- Assert ----
+    mock_read.assert_not_called()
+    assert read_rows(spark, tmp_path) == [(1, 'Recife', 10)]
+
+
+def test_write_contract_table_upsert_unpartitioned_failure(
+    spark, tmp_path, mocker
+):
+    # ---- Arrange ----
+    contracts_dir = write_unique_contract(tmp_path, [])
+    schema = 'sale_id int, city string, amount int'
+    write_contract_table(
+        spark.createDataFrame([(1, 'Recife', 10), (2, 'Natal', 20)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+    )
+    mocker.patch(
+        'hari_data.contract.contract_writer.swap_directories',
+        side_effect=OSError('rename failed'),
+    )
+
+    # ---- Act ----
+    with pytest.raises(OSError, match='rename failed'):
+        write_contract_table(
+            spark.createDataFrame([(2, 'Natal', 25)], schema),
+            'sales',
+            contracts_dir=contracts_dir,
+            load_strategy='upsert',
+        )
+
+    # ---- Assert ----
+    assert read_rows(spark, tmp_path) == [(1, 'Recife', 10), (2, 'Natal', 20)]
+    assert sorted(os.listdir(tmp_path)) == ['contracts', 'sales']
+
+
+def test_write_contract_table_upsert_moves_key_to_new_partition(
+    spark, tmp_path
+):
+    # ---- Arrange ----
+    contracts_dir = write_unique_contract(tmp_path, ['city'])
+    schema = 'sale_id int, city string, amount int'
+    write_contract_table(
+        spark.createDataFrame(
+            [(1, 'Recife', 10), (2, 'Natal', 20), (3, 'Natal', 30)], schema
+        ),
+        'sales',
+        contracts_dir=contracts_dir,
+    )
+
+    # ---- Act ----
+    write_contract_table(
+        spark.createDataFrame([(2, 'Recife', 25)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+        load_strategy='upsert',
+    )
+
+    # ---- Assert ----
+    assert read_rows(spark, tmp_path) == [
+        (1, 'Recife', 10),
+        (2, 'Recife', 25),
+        (3, 'Natal', 30),
+    ]
+
+
+def test_write_contract_table_upsert_removes_emptied_partition(
+    spark, tmp_path
+):
+    # ---- Arrange ----
+    contracts_dir = write_unique_contract(tmp_path, ['city'])
+    schema = 'sale_id int, city string, amount int'
+    write_contract_table(
+        spark.createDataFrame([(1, 'Recife', 10), (2, 'Natal', 20)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+    )
+
+    # ---- Act ----
+    write_contract_table(
+        spark.createDataFrame([(2, 'Recife', 25)], schema),
+        'sales',
+        contracts_dir=contracts_dir,
+        load_strategy='upsert',
+    )
+
+    # ---- Assert ----
+    assert read_rows(spark, tmp_path) == [(1, 'Recife', 10), (2, 'Recife', 25)]
+    assert not os.path.exists(tmp_path / 'sales' / 'city=Natal')
+
+
+def test_write_contract_table_upsert_requires_unique_columns(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [])
+    dataframe = spark.createDataFrame(
+        [(1, 'Recife')], 'sale_id int, city string'
+    )
+
+    # ---- Act / Assert ----
+    with pytest.raises(HariContractError, match='Upsert requires'):
+        write_contract_table(
+            dataframe,
+            'sales',
+            contracts_dir=contracts_dir,
+            load_strategy='upsert',
+        )
+
+
+def test_write_contract_table_invalid_load_strategy(spark, tmp_path):
+    # ---- Arrange ----
+    contracts_dir = write_contract(tmp_path, [])
+    dataframe = spark.createDataFrame(
+        [(1, 'Recife')], 'sale_id int, city string'
+    )
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match="Unsupported load strategy 'merge'"):
+        write_contract_table(
+            dataframe,
+            'sales',
+            contracts_dir=contracts_dir,
+            load_strategy='merge',
+        )
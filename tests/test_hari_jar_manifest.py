@@ -0,0 +1,125 @@
+import json
+import os
+import zipfile
+
+from hari_data.session.hari_jar_manifest import (
+    JAR_MANIFEST_FILE,
+    build_jar_manifest,
+    read_jar_metadata,
+    resolve_jars,
+)
+
+
+def _write_jar(path, group='org.example', artifact=None, version=None):
+    with zipfile.ZipFile(path, 'w') as archive:
+        if artifact:
+            archive.writestr(
+                f'META-INF/maven/{group}/{artifact}/pom.properties',
+                f'groupId={group}\nartifactId={artifact}\nversion={version}\n',
+            )
+        archive.writestr('org/example/Main.class', f'{path}')
+        archive.writestr('org/example/util/Helper.class', '')
+        archive.writestr('com/other/Other.class', '')
+    return str(path)
+
+
+def test_read_jar_metadata_from_pom(tmp_path):
+    # ---- Arrange ----
+    jar = _write_jar(
+        tmp_path / 'example-1.0.jar', artifact='example', version='1.2.0'
+    )
+
+    # ---- Act ----
+    metadata = read_jar_metadata(jar)
+
+    # ---- Assert ----
+    assert metadata['file'] == 'example-1.0.jar'
+    assert metadata['artifact'] == 'org.example:example'
+    assert metadata['version'] == '1.2.0'
+    assert metadata['packages'] == ['org.example', 'com.other']
+    assert len(metadata['sha256']) == 64
+
+
+def test_read_jar_metadata_from_file_name(tmp_path):
+    # ---- Arrange ----
+    jar = tmp_path / 'spark-connect_2.12-3.5.0.jar'
+    jar.write_text('not a zip file')
+
+    # ---- Act ----
+    metadata = read_jar_metadata(str(jar))
+
+    # ---- Assert ----
+    assert metadata['artifact'] == 'spark-connect_2.12'
+    assert metadata['version'] == '3.5.0'
+    assert metadata['packages'] == []
+
+
+def test_build_jar_manifest_is_cached(tmp_path):
+    # ---- Arrange ----
+    _write_jar(tmp_path / 'a-1.0.jar')
+    _write_jar(tmp_path / 'b-1.0.jar')
+    (tmp_path / 'notes.txt').write_text('ignored')
+
+    # ---- Act ----
+    first = build_jar_manifest(str(tmp_path))
+    second = build_jar_manifest(str(tmp_path))
+    _write_jar(tmp_path / 'c-1.0.jar')
+    os.remove(tmp_path / 'a-1.0.jar')
+    third = build_jar_manifest(str(tmp_path))
+
+    # ---- Assert ----
+    assert first['read'] == 2
+    assert second['read'] == 0
+    assert second['jars'] == first['jars']
+    assert third['read'] == 1
+    assert [jar['file'] for jar in third['jars']] == ['b-1.0.jar', 'c-1.0.jar']
+    with open(tmp_path / JAR_MANIFEST_FILE) as file:
+        assert sorted(json.load(file)['jars']) == ['b-1.0.jar', 'c-1.0.jar']
+
+
+def test_resolve_jars_keeps_highest_version(tmp_path):
+    # ---- Arrange ----
+    _write_jar(tmp_path / 'postgresql-42.2.0.jar')
+    _write_jar(tmp_path / 'postgresql-42.10.0.jar')
+    _write_jar(tmp_path / 'postgresql-42.10.0-SNAPSHOT.jar')
+    _write_jar(tmp_path / 'delta-core_2.12-2.4.0.jar')
+
+    # ---- Act ----
+    result = resolve_jars(str(tmp_path))
+
+    # ---- Assert ----
+    assert result['jars'] == [
+        os.path.join(str(tmp_path), 'delta-core_2.12-2.4.0.jar'),
+        os.path.join(str(tmp_path), 'postgresql-42.10.0.jar'),
+    ]
+    assert result['skipped'] == [
+        {
+            'jar': 'postgresql-42.10.0-SNAPSHOT.jar',
+            'kept': 'postgresql-42.10.0.jar',
+            'reason': 'older version',
+        },
+        {
+            'jar': 'postgresql-42.2.0.jar',
+            'kept': 'postgresql-42.10.0.jar',
+            'reason': 'older version',
+        },
+    ]
+
+
+def test_resolve_jars_drops_same_content(tmp_path):
+    # ---- Arrange ----
+    (tmp_path / 'driver.jar').write_bytes(b'same')
+    (tmp_path / 'driver-copy.jar').write_bytes(b'same')
+
+    # ---- Act ----
+    result = resolve_jars(str(tmp_path))
+
+    # ---- Assert ----
+    assert result['jars'] == [os.path.join(str(tmp_path), 'driver-copy.jar')]
+    assert result['skipped'] == [
+        {
+            'jar': 'driver.jar',
+            'kept': 'driver-copy.jar',
+            'reason': 'same content',
+        }
+    ]
@@ -0,0 +1,87 @@
+import os
+
+import pyspark
+import yaml
+
+from hari_data.session.hari_spark_connect import (
+    CONNECT_SERVER_CLASS,
+    build_connect_server_command,
+    serve_connect_server,
+)
+
+
+def test_build_connect_server_command_resolves_plugin(tmp_path):
+    # ---- Arrange ----
+    (tmp_path / 'postgresql.jar').write_text('jar')
+    (tmp_path / 'README.md').write_text('docs')
+
+    # ---- Act ----
+    command = build_connect_server_command(
+        port=15010,
+        master_url='local[4]',
+        jars_path=str(tmp_path),
+        spark_extras={'spark.driver.memory': '4g'},
+    )['command']
+
+    # ---- Assert ----
+    assert command[0].endswith(os.path.join('bin', 'spark-submit'))
+    assert command[1:5] == [
+        '--class',
+        CONNECT_SERVER_CLASS,
+        '--master',
+        'local[4]',
+    ]
+    assert command[command.index('--jars') + 1] == str(
+        tmp_path / 'postgresql.jar'
+    )
+    assert command[command.index('--packages') + 1].endswith(
+        f':{pyspark.__version__}'
+    )
+    assert 'spark.driver.memory=4g' in command
+    assert 'spark.connect.grpc.binding.port=15010' in command
+    assert command[-1] == 'spark-internal'
+
+
+def test_build_connect_server_command_with_plugin_jar(tmp_path):
+    # ---- Arrange ----
+    (tmp_path / 'spark-connect_2.12-3.5.0.jar').write_text('jar')
+
+    # ---- Act ----
+    command = build_connect_server_command(jars_path=str(tmp_path))['command']
+
+    # ---- Assert ----
+    assert '--packages' not in command
+    assert command[command.index('--jars') + 1] == str(
+        tmp_path / 'spark-connect_2.12-3.5.0.jar'
+    )
+
+
+def test_serve_connect_server_uses_configs(tmp_path, mocker):
+    # ---- Arrange ----
+    configs_path = tmp_path / 'configs.yaml'
+    with open(configs_path, 'w') as file:
+        yaml.dump(
+            {
+                'master_url': 'local[2]',
+                'job_resources': {'cpu': 2, 'memory': '4GB'},
+            },
+            file,
+        )
+    mock_run = mocker.patch(
+        'hari_data.session.hari_spark_connect.subprocess.run'
+    )
+    mock_run.return_value.returncode = 0
+
+    # ---- Act ----
+    result = serve_connect_server(
+        configs_path=str(configs_path),
+        spark_extras={'spark.sql.shuffle.partitions': '7'},
+    )
+
+    # ---- Assert ----
+    command = mock_run.call_args.args[0]
+    assert result == {'command': command, 'returncode': 0}
+    assert command[command.index('--master') + 1] == 'local[2]'
+    assert 'spark.driver.memory=3686m' in command
+    assert 'spark.sql.shuffle.partitions=7' in command
+    assert 'spark.sql.shuffle.partitions=4' not in command
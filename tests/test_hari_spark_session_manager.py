@@ -1,3 +1,5 @@
+import pytest
+
 from hari_data.session.hari_spark_session_manager import (
     HariSparkSessionManager,
 )
@@ -57,3 +59,236 @@ def test_manager_logs_are_not_configured(monkeypatch):
 
     # ---- Assert ----
     assert manager._logger is not None
+
+
+def test_manager_configure_derives_spark_configs(tmp_path, mocker):
+    # ---- Arrange ----
+    import yaml
+
+    from hari_data.session.hari.hari_spark_session_generic import (
+        HariSparkSessionGeneric,
+    )
+
+    configs = {
+        'master_url': 'local[*]',
+        'job_type': 'batch',
+        'job_resources': {'cpu': 2, 'memory': '4GB'},
+    }
+    config_file = tmp_path / 'configs.yaml'
+    with open(config_file, 'w') as f:
+        yaml.dump(configs, f)
+
+    mock_create = mocker.patch.object(
+        HariSparkSessionGeneric,
+        'create_spark_session',
+        return_value={'spark_session': 'spark_session_mock'},
+    )
+    manager = HariSparkSessionManager()
+    previous = vars(manager).copy()
+    manager._spark_session = None
+
+    # ---- Act ----
+    try:
+        manager.configure(
+            env='local',
+            configs_path=str(config_file),
+            spark_extras={'spark.sql.shuffle.partitions': '7'},
+        )
+        metrics = manager.get_startup_metrics()['startup_metrics']
+    finally:
+        # Restore the instance state shared with the other tests.
+        vars(manager).clear()
+        vars(manager).update(previous)
+
+    # ---- Assert ----
+    assert set(metrics) == {'config_load_s', 'total_s'}
+    assert metrics['total_s'] >= metrics['config_load_s']
+    spark_extras = mock_create.call_args.kwargs['spark_extras']
+    assert spark_extras['spark.sql.shuffle.partitions'] == '7'
+    assert spark_extras['spark.driver.memory'] == '3686m'
+    assert spark_extras['spark.sql.adaptive.enabled'] == 'true'
+
+
+def test_manager_register_factory(monkeypatch, mocker):
+    # ---- Arrange ----
+    from hari_data.session.hari.hari_spark_session_generic import (
+        HariSparkSessionGeneric,
+    )
+
+    class HariSparkSessionNightly(HariSparkSessionGeneric):
+        def get_default_configs(self):
+            return {'spark.sql.shuffle.partitions': '400'}
+
+    monkeypatch.setattr(
+        HariSparkSessionManager,
+        '_HariSparkSessionManager__factories',
+        HariSparkSessionManager.get_factories(),
+    )
+    mock_create = mocker.patch.object(
+        HariSparkSessionNightly,
+        'create_spark_session',
+        return_value={'spark_session': 'spark_session_mock'},
+    )
+    manager = HariSparkSessionManager()
+    previous = vars(manager).copy()
+    manager._spark_session = None
+
+    # ---- Act ----
+    HariSparkSessionManager.register_factory(
+        'Nightly', HariSparkSessionNightly
+    )
+    try:
+        manager.configure(env='nightly', configs_path=None)
+    finally:
+        vars(manager).clear()
+        vars(manager).update(previous)
+
+    # ---- Assert ----
+    assert HariSparkSessionManager.get_factories()['nightly'] is (
+        HariSparkSessionNightly
+    )
+    mock_create.assert_called_once()
+
+
+def test_manager_register_factory_invalid():
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='subclass of BaseHariSparkSession'):
+        HariSparkSessionManager.register_factory('nightly', dict)
+    with pytest.raises(ValueError, match='env must be a non-empty string'):
+        HariSparkSessionManager.register_factory(' ', dict)
+
+
+def _has_temp_view(session, name):
+    # session.catalog would also query the metastore of the test session.
+    catalog = session._jsparkSession.sessionState().catalog()
+    return catalog.getTempView(name).isDefined()
+
+
+def test_manager_named_sessions_are_isolated():
+    # ---- Arrange ----
+    from pyspark.sql import SparkSession
+
+    manager = HariSparkSessionManager()
+    previous = vars(manager).copy()
+    manager._spark_session = SparkSession.builder.master(
+        'local[1]'
+    ).getOrCreate()
+    manager._sessions = {}
+
+    # ---- Act ----
+    try:
+        sales = manager.get_named_session(
+            'sales', spark_conf={'spark.sql.shuffle.partitions': '3'}
+        )['spark_session']
+        stock = manager.get_named_session('stock')['spark_session']
+        sales.range(2).createOrReplaceTempView('sales_view')
+        same = manager.get_named_session(
+            'sales', spark_conf={'spark.sql.shuffle.partitions': '9'}
+        )['spark_session']
+        names = manager.list_named_sessions()['sessions']
+        stock_views = _has_temp_view(stock, 'sales_view')
+        sales_views = _has_temp_view(sales, 'sales_view')
+        manager.close_named_session('sales')
+        closed_views = _has_temp_view(sales, 'sales_view')
+        names_after_close = manager.list_named_sessions()['sessions']
+    finally:
+        vars(manager).clear()
+        vars(manager).update(previous)
+
+    # ---- Assert ----
+    assert same is sales
+    assert sales is not stock
+    assert sales.sparkContext is stock.sparkContext
+    assert sales.conf.get('spark.sql.shuffle.partitions') == '3'
+    assert stock.conf.get('spark.sql.shuffle.partitions') != '3'
+    assert names == ['sales', 'stock']
+    assert sales_views is True
+    assert stock_views is False
+    assert closed_views is False
+    assert names_after_close == ['stock']
+
+
+def test_manager_named_session_concurrent_creation(mocker):
+    # ---- Arrange ----
+    from concurrent.futures import ThreadPoolExecutor
+
+    spark = mocker.MagicMock()
+    spark.newSession.side_effect = lambda: mocker.MagicMock()
+    manager = HariSparkSessionManager()
+    previous = vars(manager).copy()
+    manager._spark_session = spark
+    manager._sessions = {}
+
+    # ---- Act ----
+    try:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(
+                executor.map(
+                    lambda _: manager.get_named_session('sales')[
+                        'spark_session'
+                    ],
+                    range(32),
+                )
+            )
+    finally:
+        vars(manager).clear()
+        vars(manager).update(previous)
+
+    # ---- Assert ----
+    spark.newSession.assert_called_once()
+    assert all(session is sessions[0] for session in sessions)
+
+
+def test_manager_named_session_not_configured():
+    # ---- Arrange ----
+    manager = HariSparkSessionManager()
+    previous = vars(manager).copy()
+    manager._spark_session = None
+
+    # ---- Act / Assert ----
+    try:
+        with pytest.raises(ValueError, match='not configured'):
+            manager.get_named_session('sales')
+    finally:
+        vars(manager).clear()
+        vars(manager).update(previous)
+
+
+def test_manager_named_sessions_with_spark_connect(monkeypatch, mocker):
+    # ---- Arrange ----
+    from types import SimpleNamespace
+
+    monkeypatch.setenv('SPARK_CONNECT_MODE_ENABLED', '1')
+    session = mocker.MagicMock(spec=['catalog', 'conf'])
+    session.catalog.listTables.return_value = [
+        SimpleNamespace(name='sales_view', isTemporary=True),
+        SimpleNamespace(name='sales', isTemporary=False),
+    ]
+    mock_spark = mocker.patch(
+        'hari_data.session.hari_spark_session_manager.SparkSession'
+    )
+    mock_spark.builder.remote.return_value.create.return_value = session
+    manager = HariSparkSessionManager()
+    previous = vars(manager).copy()
+    # Spark Connect sessions have no newSession() nor JVM handles.
+    manager._spark_session = mocker.MagicMock(spec=['conf'])
+    manager._sessions = {}
+    manager._remote_url = 'sc://localhost:15002'
+
+    # ---- Act ----
+    try:
+        sales = manager.get_named_session(
+            'sales', spark_conf={'spark.sql.shuffle.partitions': '3'}
+        )['spark_session']
+        manager.close_named_session('sales')
+    finally:
+        vars(manager).clear()
+        vars(manager).update(previous)
+
+    # ---- Assert ----
+    assert sales is session
+    mock_spark.builder.remote.assert_called_once_with('sc://localhost:15002')
+    session.conf.set.assert_called_once_with(
+        'spark.sql.shuffle.partitions', '3'
+    )
+    session.catalog.dropTempView.assert_called_once_with('sales_view')
@@ -0,0 +1,168 @@
+import pytest
+
+from hari_data.session.hari_spark_tuning import (
+    GB,
+    MB,
+    derive_spark_configs,
+    derive_spark_configs_from_configs,
+    estimate_input_size,
+    parse_memory,
+)
+
+
+@pytest.mark.parametrize(
+    'value, expected',
+    [
+        ('4GB', 4 * GB),
+        ('4g', 4 * GB),
+        ('1.5 GiB', int(1.5 * GB)),
+        ('512MB', 512 * MB),
+        (2048, 2 * GB),
+    ],
+)
+def test_parse_memory(value, expected):
+    # ---- Act / Assert ----
+    assert parse_memory(value) == expected
+
+
+def test_parse_memory_invalid():
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match="Invalid memory size 'lots'"):
+        parse_memory('lots')
+
+
+def test_estimate_input_size(tmp_path):
+    # ---- Arrange ----
+    sales = tmp_path / 'sales' / 'city=Recife'
+    sales.mkdir(parents=True)
+    (sales / 'part-0.parquet').write_bytes(b'x' * 100)
+    (sales / '.part-0.parquet.crc').write_bytes(b'x' * 10)
+    (tmp_path / 'sales' / '_SUCCESS').write_bytes(b'')
+    (tmp_path / 'customers.csv').write_bytes(b'x' * 50)
+
+    # ---- Act ----
+    result = estimate_input_size(
+        [
+            {'dataset_path': str(tmp_path / 'sales')},
+            {'dataset_path': f"file://{tmp_path / 'customers.csv'}"},
+            {'dataset_path': 's3a://bucket/orders'},
+            {'dataset_path': ''},
+        ]
+    )
+
+    # ---- Assert ----
+    assert result == {
+        'input_bytes': 150,
+        'unknown': ['s3a://bucket/orders'],
+        'truncated': [],
+    }
+
+
+def test_estimate_input_size_stops_at_max_files(tmp_path):
+    # ---- Arrange ----
+    sales = tmp_path / 'sales'
+    sales.mkdir()
+    for index in range(3):
+        (sales / f'part-{index}.parquet').write_bytes(b'x' * 100)
+    (tmp_path / 'customers.csv').write_bytes(b'x' * 50)
+
+    # ---- Act ----
+    result = estimate_input_size(
+        [
+            {'dataset_path': str(sales)},
+            {'dataset_path': str(tmp_path / 'customers.csv')},
+        ],
+        max_files=2,
+    )
+
+    # ---- Assert ----
+    assert result == {
+        'input_bytes': 200,
+        'unknown': [],
+        'truncated': [str(sales), str(tmp_path / 'customers.csv')],
+    }
+
+
+def test_derive_spark_configs_local_batch():
+    # ---- Act ----
+    configs = derive_spark_configs(
+        cpu=8, memory='16GB', input_bytes=10 * GB, master_url='local[*]'
+    )
+
+    # ---- Assert ----
+    assert configs == {
+        'spark.driver.memory': '14745m',
+        'spark.default.parallelism': '8',
+        'spark.sql.shuffle.partitions': '80',
+        'spark.sql.adaptive.enabled': 'true',
+        'spark.sql.adaptive.coalescePartitions.enabled': 'true',
+        'spark.sql.adaptive.advisoryPartitionSizeInBytes': str(128 * MB),
+        'spark.sql.autoBroadcastJoinThreshold': str(230 * MB),
+    }
+
+
+def test_derive_spark_configs_small_input_and_streaming():
+    # ---- Act ----
+    batch = derive_spark_configs(cpu=4, memory='2GB', input_bytes=100 * MB)
+    streaming = derive_spark_configs(
+        cpu=4, memory='2GB', job_type='streaming', input_bytes=100 * MB
+    )
+
+    # ---- Assert ----
+    assert batch['spark.sql.shuffle.partitions'] == '8'
+    assert batch['spark.sql.adaptive.advisoryPartitionSizeInBytes'] == str(
+        16 * MB
+    )
+    assert batch['spark.sql.autoBroadcastJoinThreshold'] == str(26 * MB)
+    assert streaming['spark.sql.shuffle.partitions'] == '4'
+
+
+def test_derive_spark_configs_cluster():
+    # ---- Act ----
+    configs = derive_spark_configs(cpu=20, memory='64GB', master_url='yarn')
+
+    # ---- Assert ----
+    assert configs['spark.driver.memory'] == '7372m'
+    assert configs['spark.executor.instances'] == '4'
+    assert configs['spark.executor.cores'] == '5'
+    assert configs['spark.executor.memory'] == '12902m'
+    assert configs['spark.sql.shuffle.partitions'] == '40'
+
+
+@pytest.mark.parametrize(
+    'kwargs, message',
+    [
+        ({'cpu': 0, 'memory': '4GB'}, 'cpu must be greater than 0'),
+        ({'cpu': 2, 'memory': '0GB'}, 'memory must be greater than 0'),
+        (
+            {'cpu': 2, 'memory': '4GB', 'job_type': 'micro'},
+            "Unsupported job_type 'micro'",
+        ),
+    ],
+)
+def test_derive_spark_configs_invalid(kwargs, message):
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match=message):
+        derive_spark_configs(**kwargs)
+
+
+def test_derive_spark_configs_from_configs(tmp_path):
+    # ---- Arrange ----
+    (tmp_path / 'sales.parquet').write_bytes(b'x' * 1024)
+    configs = {
+        'job_type': 'batch',
+        'job_resources': {'cpu': 2, 'memory': '4GB'},
+        'input_datasets': [{'dataset_path': str(tmp_path / 'sales.parquet')}],
+    }
+
+    # ---- Act ----
+    result = derive_spark_configs_from_configs(configs)
+
+    # ---- Assert ----
+    assert result == derive_spark_configs(
+        cpu=2, memory='4GB', input_bytes=1024
+    )
+    assert derive_spark_configs_from_configs({'job_resources': None}) == {}
+    assert (
+        derive_spark_configs_from_configs({'job_resources': {'cpu': 2}}) == {}
+    )
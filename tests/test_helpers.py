@@ -5,7 +5,9 @@ import pytest
 import yaml
 
 from hari_data.utils.helpers import (
+    clear_yaml_cache,
     create_yaml_from_dict,
+    get_contract_path,
     is_hari_project,
     read_yaml_to_dict,
 )
@@ -150,12 +152,71 @@ def test_read_yaml_to_dict_yaml_error(monkeypatch):
         'builtins.open', lambda *args, **kwargs: StringIO('key: : value')
     )
 
-    # Mock yaml.safe_load to raise YAMLError
+    # Mock yaml.load to raise YAMLError
     def mock_yaml_error(*args, **kwargs):
         raise yaml.YAMLError('mapping values are not allowed here')
 
-    monkeypatch.setattr(yaml, 'safe_load', mock_yaml_error)
+    monkeypatch.setattr(yaml, 'load', mock_yaml_error)
 
     # Check that YAMLError is raised with proper message
     with pytest.raises(yaml.YAMLError, match='Error reading YAML file:.*'):
         read_yaml_to_dict('/test/invalid.yaml')
+
+
+def test_read_yaml_to_dict_cache(tmp_path, mocker):
+    """Test unchanged files are parsed once and changed files again."""
+    # ---- Arrange ----
+    clear_yaml_cache()
+    file_path = tmp_path / 'configs.yaml'
+    file_path.write_text('app_name: job\n')
+    spy = mocker.spy(yaml, 'load')
+
+    # ---- Act ----
+    first = read_yaml_to_dict(str(file_path))
+    second = read_yaml_to_dict(str(file_path))
+    file_path.write_text('app_name: other_job\n')
+    third = read_yaml_to_dict(str(file_path))
+
+    # ---- Assert ----
+    assert second == {'app_name': 'job'}
+    assert second is first
+    assert third == {'app_name': 'other_job'}
+    assert spy.call_count == 2
+    clear_yaml_cache()
+
+
+def test_read_yaml_to_dict_uses_libyaml_loader(tmp_path, mocker):
+    """Test the LibYAML loader is used when PyYAML provides it."""
+    # ---- Arrange ----
+    clear_yaml_cache()
+    file_path = tmp_path / 'contract.yaml'
+    file_path.write_text('name: sales\n')
+    spy = mocker.spy(yaml, 'load')
+
+    # ---- Act ----
+    read_yaml_to_dict(str(file_path))
+
+    # ---- Assert ----
+    expected = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    assert spy.call_args.kwargs['Loader'] is expected
+    clear_yaml_cache()
+
+
+def test_get_contract_path_from_declared_name(tmp_path):
+    # ---- Arrange ----
+    contracts_dir = tmp_path / 'contracts'
+    contracts_dir.mkdir()
+    (contracts_dir / 'sales.yaml').write_text('name: sales\n')
+    (contracts_dir / 'legacy_orders.yaml').write_text('name: orders\n')
+
+    # ---- Act ----
+    sales = get_contract_path('sales', str(contracts_dir))
+    orders = get_contract_path('orders', str(contracts_dir))
+    missing = get_contract_path('missing', str(contracts_dir))
+
+    # ---- Assert ----
+    assert sales == {'contract_path': str(contracts_dir / 'sales.yaml')}
+    assert orders == {
+        'contract_path': str(contracts_dir / 'legacy_orders.yaml')
+    }
+    assert missing == {'contract_path': str(contracts_dir / 'missing.yaml')}
@@ -0,0 +1,200 @@
+import pytest
+from pyspark import StorageLevel
+
+from hari_data.job.job_pipeline import HariPipeline
+
+
+def test_plan_orders_steps_by_dependencies():
+    # ---- Arrange ----
+    pipeline = HariPipeline()
+    pipeline.add_step('load', print, inputs=['clean', 'cities'])
+    pipeline.add_step('clean', print, inputs=['sales'], outputs=['clean'])
+    pipeline.add_step('extract', print, outputs=['sales'])
+    pipeline.add_step('report', print, inputs=['clean'])
+
+    # ---- Act ----
+    plan = pipeline.plan(inputs=['cities'])
+
+    # ---- Assert ----
+    assert plan == {
+        'order': ['extract', 'clean', 'load', 'report'],
+        'persisted': ['clean'],
+    }
+
+
+def test_plan_invalid():
+    # ---- Arrange ----
+    missing = HariPipeline()
+    missing.add_step('load', print, inputs=['sales'])
+    cycle = HariPipeline()
+    cycle.add_step('a', print, inputs=['b'], outputs=['a'])
+    cycle.add_step('b', print, inputs=['a'], outputs=['b'])
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match="no step produces: \\['sales'\\]"):
+        missing.plan()
+    with pytest.raises(ValueError, match="cycle: \\['a', 'b'\\]"):
+        cycle.plan()
+    with pytest.raises(ValueError, match="Step 'a' is already declared"):
+        cycle.add_step('a', print)
+    with pytest.raises(ValueError, match="already declared: \\['a'\\]"):
+        cycle.add_step('c', print, outputs=['a'])
+
+
+def test_run_persists_shared_dataframes(spark_session):
+    # ---- Arrange ----
+    pipeline = HariPipeline(storage_level=StorageLevel.DISK_ONLY)
+    seen = {}
+
+    @pipeline.step(outputs=['sales'])
+    def extract(spark):
+        seen['sales'] = spark.range(100).withColumnRenamed('id', 'amount')
+        return seen['sales']
+
+    @pipeline.step(inputs=['sales'], outputs=['big'])
+    def filter_big(spark, sales):
+        seen['filter_big'] = sales.storageLevel
+        return sales.where('amount > 50')
+
+    @pipeline.step(inputs=['sales'])
+    def total(spark, sales):
+        seen['total'] = sales.agg({'amount': 'sum'}).collect()[0][0]
+
+    @pipeline.step(inputs=['big'])
+    def count_big(spark, big):
+        seen['count_big'] = big.count()
+
+    # ---- Act ----
+    result = pipeline.run(spark_session)
+
+    # ---- Assert ----
+    assert seen == {
+        'sales': seen['sales'],
+        'filter_big': StorageLevel.DISK_ONLY,
+        'total': 4950,
+        'count_big': 49,
+    }
+    assert [
+        (s['step'], s['persisted'], s['unpersisted']) for s in result['steps']
+    ] == [
+        ('extract', ['sales'], []),
+        ('filter_big', [], []),
+        ('total', [], []),
+        ('count_big', [], ['sales']),
+    ]
+    assert result['outputs'] == {}
+    assert not seen['sales'].is_cached
+
+
+def test_run_resumes_from_failed_step(spark_session):
+    # ---- Arrange ----
+    pipeline = HariPipeline()
+    frames = {}
+    calls = {'extract': 0, 'first': 0, 'second': 0}
+
+    @pipeline.step(outputs=['sales'])
+    def extract(spark):
+        calls['extract'] += 1
+        frames['sales'] = spark.range(10)
+        return frames['sales']
+
+    @pipeline.step(inputs=['sales'])
+    def first(spark, sales):
+        calls['first'] += 1
+        sales.count()
+
+    @pipeline.step(inputs=['sales'])
+    def second(spark, sales):
+        calls['second'] += 1
+        if calls['second'] == 1:
+            raise RuntimeError('boom')
+        sales.count()
+
+    # ---- Act ----
+    with pytest.raises(RuntimeError, match='boom'):
+        pipeline.run(spark_session)
+    cached_after_failure = frames['sales'].is_cached
+    result = pipeline.run(spark_session)
+
+    # ---- Assert ----
+    assert cached_after_failure
+    assert calls == {'extract': 1, 'first': 1, 'second': 2}
+    assert [step['step'] for step in result['steps']] == [
+        'extract',
+        'first',
+        'second',
+    ]
+    assert result['steps'][2]['unpersisted'] == ['sales']
+    assert not frames['sales'].is_cached
+
+
+def test_reset_unpersists_after_failure(spark_session):
+    # ---- Arrange ----
+    pipeline = HariPipeline()
+    frames = {}
+
+    @pipeline.step(outputs=['sales'])
+    def extract(spark):
+        frames['sales'] = spark.range(10)
+        return frames['sales']
+
+    @pipeline.step(inputs=['sales'])
+    def first(spark, sales):
+        sales.count()
+
+    @pipeline.step(inputs=['sales'])
+    def second(spark, sales):
+        raise RuntimeError('boom')
+
+    cached = spark_session.range(3).cache()
+    pipeline.add_step('reuse', lambda spark, cached: None, inputs=['cached'])
+    pipeline.add_step(
+        'reuse_again', lambda spark, cached: None, inputs=['cached']
+    )
+
+    # ---- Act ----
+    with pytest.raises(RuntimeError, match='boom'):
+        pipeline.run(spark_session, inputs={'cached': cached})
+    pipeline.reset()
+
+    # ---- Assert ----
+    assert not frames['sales'].is_cached
+    assert cached.is_cached
+    cached.unpersist()
+
+
+def test_run_invalid_step_output(spark_session):
+    # ---- Arrange ----
+    pipeline = HariPipeline()
+    pipeline.add_step('wrong', lambda spark: None, outputs=['sales'])
+
+    # ---- Act / Assert ----
+    with pytest.raises(
+        ValueError, match="'wrong' must return the DataFrames \\['sales'\\]"
+    ):
+        pipeline.run(spark_session)
+
+
+def test_run_outputs(spark_session):
+    # ---- Arrange ----
+    pipeline = HariPipeline()
+    pipeline.add_step(
+        'split',
+        lambda spark, sales: {
+            'small': sales.where('id < 5'),
+            'large': sales.where('id >= 5'),
+        },
+        inputs=['sales'],
+        outputs=['small', 'large'],
+    )
+
+    # ---- Act ----
+    result = pipeline.run(
+        spark_session, inputs={'sales': spark_session.range(8)}
+    )
+
+    # ---- Assert ----
+    assert {name: df.count() for name, df in result['outputs'].items()} == {
+        'small': 5,
+        'large': 3,
+    }
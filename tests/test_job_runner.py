@@ -0,0 +1,375 @@
+import sys
+import textwrap
+
+import pytest
+from pyspark.sql import SparkSession
+
+from hari_data.job import job_runner
+from hari_data.job.job_runner import load_job, run_jobs
+from hari_data.session.hari_spark_session_manager import (
+    HariSparkSessionManager,
+)
+from hari_data.utils.logger import logger_manager
+
+JOB_TEMPLATE = """
+import time
+
+
+def main(spark):
+    spark.range(10).createOrReplaceTempView('numbers')
+    time.sleep(0.2)
+    pool = spark.sparkContext.getLocalProperty('spark.scheduler.pool')
+    catalog = spark._jsparkSession.sessionState().catalog()
+    views = catalog.getTempView('numbers').isDefined()
+    with open(__file__ + '.out', 'w') as file:
+        file.write(f'{{pool}},{{views}}')
+    {fail}
+"""
+
+
+RETRY_JOB = """
+import os
+
+
+def main(spark):
+    marker = __file__ + '.failed'
+    if not os.path.exists(marker):
+        open(marker, 'w').close()
+        spark.range(5).createOrReplaceTempView('numbers')
+        spark.catalog.cacheTable('numbers')
+        raise RuntimeError('transient')
+    with open(__file__ + '.out', 'w') as file:
+        file.write(str(spark.catalog.isCached('numbers')))
+"""
+
+PIPELINE_JOB = """
+import os
+
+from hari_data.job.job_pipeline import HariPipeline
+
+pipeline = HariPipeline()
+frames = {{}}
+
+
+def _count(name):
+    with open(f'{{__file__}}.{{name}}', 'a') as file:
+        file.write('x')
+
+
+@pipeline.step(outputs=['sales'])
+def extract(spark):
+    _count('extract')
+    frames['sales'] = spark.range(10)
+    return frames['sales']
+
+
+@pipeline.step(inputs=['sales'])
+def total(spark, sales):
+    sales.count()
+
+
+@pipeline.step(inputs=['sales'])
+def load(spark, sales):
+    _count('load')
+    frames['cached_on_load'] = sales.is_cached
+    if {fail} or os.path.getsize(f'{{__file__}}.load') == 1:
+        raise RuntimeError('transient')
+
+
+def main(spark):
+    pipeline.run(spark)
+"""
+
+SLEEPING_JOB = """
+import time
+
+
+def main(spark):
+    time.sleep(3)
+"""
+
+SLOW_JOB = """
+import time
+
+
+def main(spark):
+    spark.range(0, 600, 1, 1).rdd.foreach(lambda _: time.sleep(0.1))
+"""
+
+
+def _create_job(
+    tmp_path, name, priority='normal', fail=False, configs='', job=None
+):
+    path = tmp_path / name
+    (path / 'configs').mkdir(parents=True)
+    (path / 'hari.lock').write_text('')
+    (path / 'configs' / 'configs.yaml').write_text(
+        f'job_name: "{name}"\njob_priority: "{priority}"\n{configs}'
+    )
+    (path / 'job.py').write_text(
+        textwrap.dedent(
+            job
+            or JOB_TEMPLATE.format(
+                fail="raise RuntimeError('boom')" if fail else ''
+            )
+        )
+    )
+    return str(path)
+
+
+@pytest.fixture
+def manager():
+    if not logger_manager.is_configured:
+        logger_manager.configure()
+    manager = HariSparkSessionManager()
+    previous = vars(manager).copy()
+    manager._spark_session = SparkSession.builder.master(
+        'local[1]'
+    ).getOrCreate()
+    manager._sessions = {}
+    yield manager
+    vars(manager).clear()
+    vars(manager).update(previous)
+
+
+def test_load_job(tmp_path):
+    # ---- Arrange ----
+    path = _create_job(tmp_path, 'sales', priority='High')
+
+    # ---- Act ----
+    job = load_job(path)
+
+    # ---- Assert ----
+    assert job['name'] == 'sales'
+    assert job['priority'] == 'high'
+    assert callable(job['main'])
+
+
+def test_load_job_invalid(tmp_path):
+    # ---- Arrange ----
+    path = _create_job(tmp_path, 'sales', priority='urgent')
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='is not a Hari project'):
+        load_job(str(tmp_path))
+    with pytest.raises(ValueError, match="Unsupported job_priority 'urgent'"):
+        load_job(path)
+
+
+def test_run_jobs_parallel(tmp_path, manager):
+    # ---- Arrange ----
+    sales = _create_job(tmp_path, 'sales', priority='high')
+    stock = _create_job(tmp_path, 'stock', priority='low', fail=True)
+
+    # ---- Act ----
+    results = run_jobs([sales, stock], parallel=True)['results']
+
+    # ---- Assert ----
+    assert [(r['job'], r['priority'], r['status']) for r in results] == [
+        ('sales', 'high', 'success'),
+        ('stock', 'low', 'failed'),
+    ]
+    assert results[1]['error'] == 'boom'
+    with open(f'{sales}/job.py.out') as file:
+        assert file.read() == 'sales,True'
+    with open(f'{stock}/job.py.out') as file:
+        assert file.read() == 'stock,True'
+    assert manager.list_named_sessions()['sessions'] == []
+
+
+def test_run_jobs_duplicated_names(tmp_path):
+    # ---- Arrange ----
+    sales = _create_job(tmp_path, 'sales')
+
+    # ---- Act / Assert ----
+    with pytest.raises(
+        ValueError, match="Duplicated job names: \\['sales'\\]"
+    ):
+        run_jobs([sales, sales])
+
+
+def test_load_job_invalid_limits(tmp_path):
+    # ---- Arrange ----
+    path = _create_job(tmp_path, 'sales', configs='job_timeout: "1h"\n')
+
+    # ---- Act / Assert ----
+    with pytest.raises(ValueError, match='job_timeout .* non-negative'):
+        load_job(path)
+
+
+def test_run_jobs_retries_failed_job(tmp_path, manager):
+    # ---- Arrange ----
+    sales = _create_job(
+        tmp_path, 'sales', configs='job_retry_limit: 2\n', job=RETRY_JOB
+    )
+    stock = _create_job(
+        tmp_path, 'stock', fail=True, configs='job_retry_limit: 1\n'
+    )
+
+    # ---- Act ----
+    results = run_jobs([sales, stock])['results']
+
+    # ---- Assert ----
+    assert [(r['status'], r['attempts']) for r in results] == [
+        ('success', 2),
+        ('failed', 2),
+    ]
+    assert results[0]['error'] is None
+    assert results[1]['error'] == 'boom'
+    with open(f'{sales}/job.py.out') as file:
+        assert file.read() == 'True'
+
+
+def test_run_jobs_timeout_cancels_job_group(tmp_path, manager):
+    # ---- Arrange ----
+    sales = _create_job(
+        tmp_path,
+        'sales',
+        configs='job_timeout: 3\njob_retry_limit: 2\n',
+        job=SLOW_JOB,
+    )
+
+    # ---- Act ----
+    results = run_jobs([sales])['results']
+
+    # ---- Assert ----
+    assert results[0]['status'] == 'timeout'
+    assert results[0]['attempts'] == 1
+    assert results[0]['error'] == 'Timed out after 3s.'
+    assert results[0]['duration_s'] < 30
+    tracker = manager._spark_session.sparkContext.statusTracker()
+    assert tracker.getActiveJobsIds() == []
+
+
+def test_load_job_isolates_project_modules(tmp_path):
+    # ---- Arrange ----
+    paths = []
+    for name in ('sales', 'stock'):
+        path = _create_job(
+            tmp_path,
+            name,
+            job=(
+                'from utils.helpers import source\n\n\n'
+                'def main():\n'
+                '    from utils import validators\n\n'
+                '    return source(), validators.check()\n'
+            ),
+        )
+        utils = tmp_path / name / 'utils'
+        utils.mkdir()
+        (utils / 'helpers.py').write_text(
+            f"def source():\n    return '{name}'\n"
+        )
+        (utils / 'validators.py').write_text(
+            'from utils.helpers import source\n\n\n'
+            'def check():\n    return source() + "_checked"\n'
+        )
+        paths.append(path)
+
+    # ---- Act ----
+    jobs = [load_job(path) for path in paths]
+    results = [job['main']() for job in jobs]
+
+    # ---- Assert ----
+    assert results == [
+        ('sales', 'sales_checked'),
+        ('stock', 'stock_checked'),
+    ]
+    assert 'utils' not in sys.modules
+
+
+def test_run_jobs_resumes_pipeline(tmp_path, manager, monkeypatch):
+    # ---- Arrange ----
+    sales = _create_job(
+        tmp_path,
+        'sales',
+        configs='job_retry_limit: 1\n',
+        job=PIPELINE_JOB.format(fail=False),
+    )
+    stock = _create_job(
+        tmp_path,
+        'stock',
+        configs='job_retry_limit: 1\n',
+        job=PIPELINE_JOB.format(fail=True),
+    )
+    jobs = []
+    monkeypatch.setattr(
+        job_runner,
+        'load_job',
+        lambda path: jobs.append(load_job(path)) or jobs[-1],
+    )
+
+    # ---- Act ----
+    results = run_jobs([sales, stock])['results']
+
+    # ---- Assert ----
+    assert [(r['status'], r['attempts']) for r in results] == [
+        ('success', 2),
+        ('failed', 2),
+    ]
+    for job in jobs:
+        with open(f"{job['path']}/job.py.extract") as file:
+            assert file.read() == 'x'
+        with open(f"{job['path']}/job.py.load") as file:
+            assert file.read() == 'xx'
+        frames = job['main'].__globals__['frames']
+        assert frames['cached_on_load']
+        assert not frames['sales'].is_cached
+        assert job['pipelines'][0]._state is None
+
+
+def test_run_jobs_timeout_still_running(tmp_path, manager, monkeypatch):
+    # ---- Arrange ----
+    monkeypatch.setattr(job_runner, 'CANCEL_GRACE_S', 0.1)
+    sales = _create_job(
+        tmp_path, 'sales', configs='job_timeout: 1\n', job=SLEEPING_JOB
+    )
+
+    # ---- Act ----
+    results = run_jobs([sales])['results']
+
+    # ---- Assert ----
+    assert results[0]['status'] == 'timeout'
+    assert results[0]['error'] == (
+        'Timed out after 1s; the job is still running.'
+    )
+    assert manager.list_named_sessions()['sessions'] == ['sales']
+
+
+def test_run_jobs_with_spark_connect(tmp_path, manager, monkeypatch, mocker):
+    # ---- Arrange ----
+    monkeypatch.setenv('SPARK_CONNECT_MODE_ENABLED', '1')
+    monkeypatch.setattr(job_runner, 'CANCEL_GRACE_S', 0.1)
+    # Spark Connect sessions have no SparkContext nor JVM handles.
+    sessions = {}
+    mock_spark = mocker.patch(
+        'hari_data.session.hari_spark_session_manager.SparkSession'
+    )
+    mock_spark.builder.remote.return_value.create.side_effect = (
+        lambda: sessions.setdefault(
+            len(sessions),
+            mocker.MagicMock(spec=['addTag', 'interruptTag', 'catalog']),
+        )
+    )
+    sales = _create_job(tmp_path, 'sales', job='def main(spark):\n    pass\n')
+    stock = _create_job(
+        tmp_path, 'stock', configs='job_timeout: 1\n', job=SLEEPING_JOB
+    )
+
+    # ---- Act ----
+    results = run_jobs([sales, stock], parallel=True)['results']
+
+    # ---- Assert ----
+    assert [r['status'] for r in results] == ['success', 'timeout']
+    tagged = {
+        call.args[0]
+        for session in sessions.values()
+        for call in session.addTag.call_args_list
+    }
+    interrupted = [
+        call.args[0]
+        for session in sessions.values()
+        for call in session.interruptTag.call_args_list
+    ]
+    assert tagged == {'hari-run-sales', 'hari-run-stock'}
+    assert interrupted == ['hari-run-stock']
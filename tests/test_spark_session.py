@@ -1,9 +1,22 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
 from pyspark.sql import SparkSession
 
 from hari_data.session.hari.hari_spark_session import BaseHariSparkSession
+from hari_data.session.hari.hari_spark_session_connect import (
+    HariSparkSessionConnect,
+)
 from hari_data.session.hari.hari_spark_session_generic import (
     HariSparkSessionGeneric,
 )
+from hari_data.session.hari.hari_spark_session_local_dev import (
+    HariSparkSessionLocalDev,
+)
+from hari_data.session.hari.hari_spark_session_single_node import (
+    HariSparkSessionSingleNode,
+)
 from hari_data.utils.logger import Logger
 
 # Configura o logger para todos os testes deste arquivo
@@ -129,6 +142,7 @@ def test_hari_spark_local_get_spark_session(monkeypatch):
         raising=True,
     )
     monkeypatch.setattr(template._logger, 'info', lambda *args, **kwargs: None)
+    monkeypatch.setattr(template, 'launch_gateway', lambda builder: None)
 
     def fake_get_or_create(self):
         return 'fake_session'
@@ -143,6 +157,11 @@ def test_hari_spark_local_get_spark_session(monkeypatch):
 
     # ---- Assert ----
     assert result == expected_result
+    assert set(template.get_startup_metrics()['startup_metrics']) == {
+        'jar_discovery_s',
+        'jvm_gateway_s',
+        'get_or_create_s',
+    }
 
 
 def test_hari_spark_local_get_spark_session_with_errors(monkeypatch):
@@ -164,6 +183,7 @@ def test_hari_spark_local_get_spark_session_with_errors(monkeypatch):
         raising=True,
     )
     monkeypatch.setattr(template._logger, 'info', lambda *args, **kwargs: None)
+    monkeypatch.setattr(template, 'launch_gateway', lambda builder: None)
 
     def fake_get_or_create(self):
         return None  # Simulate failure to create session
@@ -178,3 +198,258 @@ def test_hari_spark_local_get_spark_session_with_errors(monkeypatch):
         assert False, 'Expected RuntimeError was not raised'
     except RuntimeError as e:
         assert str(e) == 'Failed to create Spark session.'
+
+
+# ---------- Tests for the preset factories ----------
+@pytest.mark.parametrize(
+    'master_url, expected',
+    [('local', 1), ('local[3]', 3), ('local[4, 2]', 4), ('yarn', None)],
+)
+def test_get_local_cores(master_url, expected):
+    # ---- Arrange ----
+    template = DummyTemplate(
+        app_name='TestApp',
+        master_url=master_url,
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+
+    # ---- Act ----
+    result = template.get_local_cores()
+
+    # ---- Assert ----
+    assert result == (expected or os.cpu_count())
+
+
+def test_local_dev_default_configs():
+    # ---- Arrange ----
+    template = HariSparkSessionLocalDev(
+        app_name='TestApp',
+        master_url='local[3]',
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+
+    # ---- Act ----
+    builder = template.get_spark_builder(
+        spark_extras={'spark.ui.enabled': 'true'}
+    )['spark_builder']
+
+    # ---- Assert ----
+    assert builder._options['spark.sql.shuffle.partitions'] == '3'
+    assert builder._options['spark.sql.execution.arrow.pyspark.enabled'] == (
+        'true'
+    )
+    assert builder._options['spark.ui.enabled'] == 'true'
+
+
+def test_single_node_default_configs(monkeypatch):
+    # ---- Arrange ----
+    monkeypatch.setenv('HARI_LOCAL_DIRS', '/mnt/disk1/spark, /mnt/disk2/spark')
+    monkeypatch.setattr(
+        'hari_data.session.hari.hari_spark_session_single_node.'
+        '_physical_memory',
+        lambda: 64 * 1024**3,
+    )
+    template = HariSparkSessionSingleNode(
+        app_name='TestApp',
+        master_url='local[16]',
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+
+    # ---- Act ----
+    configs = template.get_default_configs()
+
+    # ---- Assert ----
+    assert configs['spark.sql.shuffle.partitions'] == '48'
+    assert configs['spark.sql.adaptive.skewJoin.enabled'] == 'true'
+    assert configs['spark.serializer'] == (
+        'org.apache.spark.serializer.KryoSerializer'
+    )
+    assert configs['spark.memory.offHeap.size'] == '8192m'
+    assert configs['spark.local.dir'] == '/mnt/disk1/spark,/mnt/disk2/spark'
+
+
+def test_connect_session_attaches_to_server(monkeypatch):
+    # ---- Arrange ----
+    monkeypatch.delenv('SPARK_REMOTE', raising=False)
+    template = HariSparkSessionConnect(
+        app_name='TestApp',
+        master_url='local[*]',
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+    options = {}
+
+    def fake_get_or_create(self):
+        options.update(self._options)
+        return 'fake_session'
+
+    monkeypatch.setattr(
+        SparkSession.Builder, 'getOrCreate', fake_get_or_create, raising=True
+    )
+
+    # ---- Act ----
+    result = template.configure_spark_session(
+        spark_extras={
+            'spark.sql.shuffle.partitions': '8',
+            'spark.driver.memory': '4g',
+        }
+    )
+
+    # ---- Assert ----
+    assert result == {'spark_session': 'fake_session'}
+    assert options['spark.remote'] == 'sc://localhost:15002'
+    assert options['spark.app.name'] == 'TestApp'
+    assert options['spark.sql.shuffle.partitions'] == '8'
+    assert 'spark.driver.memory' not in options
+
+
+def test_connect_session_remote_url(monkeypatch):
+    # ---- Arrange ----
+    monkeypatch.setenv('SPARK_REMOTE', 'sc://spark-server:15002')
+
+    # ---- Act ----
+    from_env = HariSparkSessionConnect('TestApp', 'local[*]', 'INFO', None)
+    from_master = HariSparkSessionConnect(
+        'TestApp', 'sc://localhost:16000', 'INFO', None
+    )
+
+    # ---- Assert ----
+    assert from_env._remote_url == 'sc://spark-server:15002'
+    assert from_master._remote_url == 'sc://localhost:16000'
+
+
+def test_connect_session_logs_errors(monkeypatch, mocker):
+    # ---- Arrange ----
+    template = HariSparkSessionConnect(
+        'TestApp', 'sc://localhost:15002', 'DEBUG', None
+    )
+    mock_logger = mocker.patch.object(template, '_logger')
+    monkeypatch.setattr(
+        SparkSession.Builder,
+        'getOrCreate',
+        mocker.Mock(side_effect=RuntimeError('connection refused')),
+    )
+
+    # ---- Act / Assert ----
+    with pytest.raises(RuntimeError, match='connection refused'):
+        template.configure_spark_session(spark_extras=None)
+    mock_logger.exception.assert_called_once_with(
+        'Error creating Spark session.'
+    )
+
+
+def test_connect_session_warns_log_level_ignored(mocker):
+    # ---- Arrange ----
+    mock_logger = mocker.MagicMock()
+    mocker.patch(
+        'hari_data.session.hari.hari_spark_session.logger_manager.get_logger',
+        return_value={'logger': mock_logger},
+    )
+
+    # ---- Act ----
+    HariSparkSessionConnect('TestApp', 'sc://localhost:15002', 'DEBUG', None)
+
+    # ---- Assert ----
+    assert "Spark log level 'DEBUG' is ignored" in (
+        mock_logger.warning.call_args.args[0]
+    )
+
+
+# ---------- Tests for the startup metrics ----------
+def test_time_phase_records_duration():
+    # ---- Arrange ----
+    template = DummyTemplate(
+        app_name='TestApp',
+        master_url='local[*]',
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+
+    # ---- Act ----
+    with template.time_phase('jar_discovery'):
+        template.get_jars_list()
+    with pytest.raises(RuntimeError):
+        with template.time_phase('get_or_create'):
+            raise RuntimeError('failed')
+
+    # ---- Assert ----
+    metrics = template.get_startup_metrics()['startup_metrics']
+    assert set(metrics) == {'jar_discovery_s', 'get_or_create_s'}
+    assert all(value >= 0 for value in metrics.values())
+
+
+def test_launch_gateway_skips_running_gateway(monkeypatch, mocker):
+    # ---- Arrange ----
+    from pyspark import SparkContext
+
+    template = DummyTemplate(
+        app_name='TestApp',
+        master_url='local[*]',
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+    monkeypatch.setattr(SparkContext, '_gateway', object())
+    mock_init = mocker.patch.object(SparkContext, '_ensure_initialized')
+
+    # ---- Act ----
+    template.launch_gateway(SparkSession.builder)
+
+    # ---- Assert ----
+    mock_init.assert_not_called()
+
+
+def test_create_spark_session_does_not_dump_config_at_info(monkeypatch):
+    # ---- Arrange ----
+    template = HariSparkSessionGeneric(
+        app_name='TestApp',
+        master_url='local[*]',
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+    spark = MagicMock()
+    monkeypatch.setattr(
+        template,
+        'configure_spark_session',
+        lambda spark_extras: {'spark_session': spark},
+    )
+    monkeypatch.setattr(template._logger, 'isEnabledFor', lambda level: False)
+
+    # ---- Act ----
+    result = template.create_spark_session()
+
+    # ---- Assert ----
+    assert result == {'spark_session': spark}
+    spark.range.assert_not_called()
+    spark.sparkContext.getConf.assert_not_called()
+    assert (
+        'first_action_s'
+        not in template.get_startup_metrics()['startup_metrics']
+    )
+
+
+def test_create_spark_session_measures_first_action(monkeypatch):
+    # ---- Arrange ----
+    template = HariSparkSessionGeneric(
+        app_name='TestApp',
+        master_url='local[*]',
+        spark_log_level='INFO',
+        jars_path=None,
+    )
+    spark = MagicMock()
+    monkeypatch.setattr(
+        template,
+        'configure_spark_session',
+        lambda spark_extras: {'spark_session': spark},
+    )
+
+    # ---- Act ----
+    template.create_spark_session(measure_first_action=True)
+
+    # ---- Assert ----
+    spark.range.return_value.collect.assert_called_once()
+    assert (
+        'first_action_s' in template.get_startup_metrics()['startup_metrics']
+    )
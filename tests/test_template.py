@@ -3,6 +3,7 @@ import shutil
 import textwrap
 
 import pytest
+import yaml
 
 from hari_data.cli.templates.__templates__ import (
     HariTemplate,
@@ -72,15 +73,15 @@ def test_hari_template_configs_get_text(monkeypatch):
         job_timeout: 3600  # Timeout in seconds
         job_retry_limit: 3  # Number of retries on failure
         job_resources:
-        cpu: 2  # Number of CPU cores
-        memory: "4GB"  # Memory allocation
+          cpu: 2  # Number of CPU cores
+          memory: "4GB"  # Memory allocation, e.g. "512MB", "4GB"
         logging_level: "INFO"  # Options: 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'
         input_datasets:
-        - dataset_name: ""
+          - dataset_name: ""
             dataset_path: ""  # e.g. s3_path, local_path, catalog_uri
             dataset_format: "parquet"  # e.g. 'parquet', 'json', 'csv'
         output_datasets:
-        - dataset_name: ""
+          - dataset_name: ""
             dataset_path: ""  # e.g. s3_path, local_path, catalog_uri
             dataset_format: "parquet"  # e.g. 'parquet', 'json', 'csv'
             partition_by: []  # e.g. ['year', 'month']
@@ -143,12 +144,32 @@ def test_hari_template_job_get_text():
         # Used to define job configurations and execution logic
         # in data processing projects
 
-        def main():
+        from hari_data.job.job_pipeline import HariPipeline
+        from hari_data.session.hari_spark_session_manager import hari_spark_manager
+
+        # Declare the steps of the job with the DataFrames they read and
+        # produce. DataFrames read by more than one step are persisted
+        # while they are needed, e.g.:
+        #
+        # @pipeline.step(outputs=['sales'])
+        # def extract(spark):
+        #     return spark.read.parquet('/data/sales')
+        #
+        # @pipeline.step(inputs=['sales'])
+        # def load(spark, sales):
+        #     sales.write.parquet('/data/output')
+        pipeline = HariPipeline()
+
+
+        def main(spark=None):
             """
             Main function to execute the job logic.
-            This function should be implemented with the specific job requirements.
+            Runs the steps of the pipeline; `hari run` passes the Spark session.
             """
-            pass
+            if spark is None:
+                hari_spark_manager.configure(env='local')
+                spark = hari_spark_manager.get_spark_session()['spark_session']
+            pipeline.run(spark)
 
 
         if __name__ == '__main__':
@@ -358,3 +379,30 @@ def test_hari_template_save_to_file_error(tmp_dir_shared, monkeypatch):
     with pytest.raises(HariDirectoryCreationError) as exc_info:
         template.save_to_file()
     assert 'Failed to create directory' in str(exc_info.value)
+
+
+def test_hari_template_configs_is_valid_yaml():
+    # ---- Arrange ----
+    template = HariTemplateConfigs(project_name)
+
+    # ---- Act ----
+    configs = yaml.safe_load(textwrap.dedent(template.get_text())[1:])
+
+    # ---- Assert ----
+    assert configs['job_resources'] == {'cpu': 2, 'memory': '4GB'}
+    assert configs['input_datasets'][0]['dataset_format'] == 'parquet'
+    assert configs['output_datasets'][0]['load_strategy'] == 'overwrite'
+
+
+def test_hari_template_job_runs_pipeline(mocker):
+    # ---- Arrange ----
+    template = HariTemplateJob(project_name)
+    namespace = {}
+    exec(textwrap.dedent(template.get_text())[1:], namespace)
+    mock_run = mocker.patch.object(namespace['pipeline'], 'run')
+
+    # ---- Act ----
+    namespace['main']('spark_session_mock')
+
+    # ---- Assert ----
+    mock_run.assert_called_once_with('spark_session_mock')